@@ -66,6 +66,33 @@ class RAGAgent:
         )
         return result
 
+    async def aexecute(
+        self,
+        user_query: str,
+        profile: str = "chat",
+        kb_ids: list[str] | None = None,
+        top_k: int = 5,
+        metadata_filters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Async ``execute``; KBs are queried concurrently on the caller's event loop."""
+        logger.info(f"RAGAgent executing async query (profile={profile})")
+
+        if kb_ids and len(kb_ids) > 0:
+            return await self.query_service.aquery_specific_kbs(
+                question=user_query,
+                kb_ids=kb_ids,
+                top_k=top_k,
+                metadata_filters=metadata_filters,
+            )
+
+        qp = QueryProfile.CHAT if profile == "chat" else QueryProfile.PROPOSAL
+        return await self.query_service.aquery_profile(
+            question=user_query,
+            profile=qp,
+            top_k_per_kb=top_k,
+            metadata_filters=metadata_filters,
+        )
+
 
 def build_cited_reply(agent_result: dict[str, Any]) -> dict[str, Any]:
     """
@@ -10,14 +10,14 @@ from datetime import datetime, timezone
 from typing import Any, Protocol
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.agents_system.checklists.metrics import ChecklistMetricsService, severity_value
+from app.agents_system.checklists.metrics import severity_value
 from app.agents_system.checklists.read_assembler import ChecklistReadAssembler
 from app.agents_system.checklists.registry import ChecklistRegistry
-from app.agents_system.checklists.sync_writer import ChecklistSyncWriter
+from app.agents_system.checklists.sync_writer import ChecklistSyncTarget, ChecklistSyncWriter
 from app.agents_system.checklists.template_resolver import ChecklistTemplateResolver
 from app.models.checklist import (
     Checklist,
@@ -39,12 +39,13 @@ class _SessionFactory(Protocol):
 
 
 _FINAL_STATUSES = {EvaluationStatus.FIXED, EvaluationStatus.FALSE_POSITIVE}
-_SEVERITY_ORDER = {
-    SeverityLevel.CRITICAL.value: 0,
-    SeverityLevel.HIGH.value: 1,
-    SeverityLevel.MEDIUM.value: 2,
-    SeverityLevel.LOW.value: 3,
-}
+_SEVERITY_RANK = case(
+    (ChecklistItem.severity == SeverityLevel.CRITICAL, 0),
+    (ChecklistItem.severity == SeverityLevel.HIGH, 1),
+    (ChecklistItem.severity == SeverityLevel.MEDIUM, 2),
+    (ChecklistItem.severity == SeverityLevel.LOW, 3),
+    else_=99,
+)
 
 
 class ChecklistEngine:
@@ -65,7 +66,6 @@ class ChecklistEngine:
         self._resolver = ChecklistTemplateResolver(registry)
         self._writer = ChecklistSyncWriter(self._resolver, self.namespace_uuid)
         self._assembler = ChecklistReadAssembler(self._resolver)
-        self._metrics = ChecklistMetricsService()
 
     @staticmethod
     def _parse_project_state(project_state: dict[str, Any] | str) -> dict[str, Any] | None:
@@ -181,24 +181,13 @@ class ChecklistEngine:
         checklist = await self._writer.get_or_create_checklist(session, project_id, template_record)
 
         items = self._normalize_items_container(checklist_payload.get("items", []))
-        items_synced = 0
-        evaluations_synced = 0
-
-        for start in range(0, len(items), effective_chunk_size):
-            chunk = items[start : start + effective_chunk_size]
-            for item_payload in chunk:
-                evaluations_added = await self._writer.sync_item_from_payload(
-                    session=session,
-                    checklist=checklist,
-                    item_payload=item_payload,
-                    template=resolved_template,
-                    project_id=project_id,
-                )
-                items_synced += 1
-                evaluations_synced += evaluations_added
-            await session.flush()
-
-        return items_synced, evaluations_synced, str(checklist.id)
+        evaluations_synced = await self._writer.sync_items_bulk(
+            session=session,
+            target=ChecklistSyncTarget(checklist, resolved_template, project_id),
+            item_payloads=items,
+            chunk_size=effective_chunk_size,
+        )
+        return len(items), evaluations_synced, str(checklist.id)
 
     async def _sync_checklists(
         self,
@@ -279,6 +268,7 @@ class ChecklistEngine:
                 evaluation_payload.get("status", EvaluationStatus.OPEN.value)
             )
 
+            evaluated_at = datetime.now(timezone.utc)
             evaluation = ChecklistItemEvaluation(
                 item_id=item_id,
                 project_id=project_id,
@@ -287,8 +277,11 @@ class ChecklistEngine:
                 evidence=evaluation_payload.get("evidence"),
                 evaluator=str(evaluation_payload.get("evaluator", "user")),
                 source_type=str(evaluation_payload.get("source_type", "manual")),
+                created_at=evaluated_at,
             )
             session.add(evaluation)
+            item.latest_status = normalized_status
+            item.latest_evaluated_at = evaluated_at
 
             await session.commit()
             await session.refresh(evaluation)
@@ -301,60 +294,71 @@ class ChecklistEngine:
         severity: str | None = None,
     ) -> list[dict[str, Any]]:
         """List incomplete checklist items prioritized by severity."""
-        async with self.db_session_factory() as session:
-            stmt = select(ChecklistItem).join(Checklist).where(Checklist.project_id == project_id)
-            if severity:
-                normalized_severity = ChecklistSyncWriter._normalize_severity(severity)
-                stmt = stmt.where(ChecklistItem.severity == normalized_severity)
-            result = await session.execute(stmt.options(selectinload(ChecklistItem.evaluations)))
-            items = result.scalars().all()
-
-        pending: list[dict[str, Any]] = []
-        for item in items:
-            latest_status = self._metrics.latest_status(item.evaluations)
-            if latest_status in _FINAL_STATUSES:
-                continue
-            pending.append(
-                {
-                    "item_id": str(item.id),
-                    "template_item_id": item.template_item_id,
-                    "title": item.title,
-                    "pillar": item.pillar,
-                    "severity": severity_value(item.severity),
-                    "latest_status": latest_status.value,
-                    "last_evaluated": self._metrics.latest_timestamp(item.evaluations),
-                }
+        stmt = (
+            select(
+                ChecklistItem.id,
+                ChecklistItem.template_item_id,
+                ChecklistItem.title,
+                ChecklistItem.pillar,
+                ChecklistItem.severity,
+                ChecklistItem.latest_status,
+                ChecklistItem.latest_evaluated_at,
             )
+            .join(Checklist)
+            .where(Checklist.project_id == project_id)
+            .where(ChecklistItem.latest_status.not_in(list(_FINAL_STATUSES)))
+        )
+        if severity:
+            normalized_severity = ChecklistSyncWriter._normalize_severity(severity)
+            stmt = stmt.where(ChecklistItem.severity == normalized_severity)
+        stmt = stmt.order_by(_SEVERITY_RANK, ChecklistItem.template_item_id).limit(limit)
 
-        pending.sort(key=lambda i: _SEVERITY_ORDER.get(str(i["severity"]), 99))
-        return pending[:limit]
+        async with self.db_session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+
+        return [
+            {
+                "item_id": str(row.id),
+                "template_item_id": row.template_item_id,
+                "title": row.title,
+                "pillar": row.pillar,
+                "severity": severity_value(row.severity),
+                "latest_status": row.latest_status.value,
+                "last_evaluated": row.latest_evaluated_at.isoformat() if row.latest_evaluated_at else None,
+            }
+            for row in rows
+        ]
 
     async def compute_progress(self, project_id: str, checklist_id: UUID | None = None) -> dict[str, Any]:
         """Compute progress metrics for a project (or a specific checklist)."""
-        async with self.db_session_factory() as session:
-            stmt = select(ChecklistItem).join(Checklist).where(Checklist.project_id == project_id)
-            if checklist_id:
-                stmt = stmt.where(Checklist.id == checklist_id)
+        stmt = (
+            select(ChecklistItem.severity, ChecklistItem.latest_status, func.count())
+            .join(Checklist)
+            .where(Checklist.project_id == project_id)
+            .group_by(ChecklistItem.severity, ChecklistItem.latest_status)
+        )
+        if checklist_id:
+            stmt = stmt.where(Checklist.id == checklist_id)
 
-            result = await session.execute(stmt.options(selectinload(ChecklistItem.evaluations)))
-            items = result.scalars().all()
+        async with self.db_session_factory() as session:
+            rows = (await session.execute(stmt)).all()
 
-        total_items = len(items)
+        total_items = 0
         completed_items = 0
         severity_breakdown: dict[str, dict[str, int]] = {}
         status_breakdown: dict[str, int] = {}
 
-        for item in items:
-            severity_key = severity_value(item.severity)
-            severity_entry = severity_breakdown.setdefault(severity_key, {"total": 0, "completed": 0})
-            severity_entry["total"] += 1
+        for item_severity, latest_status, count in rows:
+            severity_entry = severity_breakdown.setdefault(
+                severity_value(item_severity), {"total": 0, "completed": 0}
+            )
+            severity_entry["total"] += count
+            total_items += count
 
-            latest_status = self._metrics.latest_status(item.evaluations)
-            latest_status_value = latest_status.value
-            status_breakdown[latest_status_value] = status_breakdown.get(latest_status_value, 0) + 1
+            status_breakdown[latest_status.value] = status_breakdown.get(latest_status.value, 0) + count
             if latest_status in _FINAL_STATUSES:
-                completed_items += 1
-                severity_entry["completed"] += 1
+                completed_items += count
+                severity_entry["completed"] += count
 
         percent_complete = (completed_items / total_items * 100) if total_items else 0.0
         return {
@@ -366,6 +370,40 @@ class ChecklistEngine:
             "last_updated": datetime.now(timezone.utc).isoformat(),
         }
 
+    async def reconcile_latest_status(self, project_id: str | None = None) -> int:
+        """Rebuild the denormalized latest status columns from evaluations.
+
+        Returns the number of item rows rewritten.
+        """
+        # Same rule as the read assembler: newest created_at, ties broken by the higher id.
+        latest = (
+            select(ChecklistItemEvaluation)
+            .where(ChecklistItemEvaluation.item_id == ChecklistItem.id)
+            .order_by(ChecklistItemEvaluation.created_at.desc(), ChecklistItemEvaluation.id.desc())
+            .limit(1)
+            .correlate(ChecklistItem)
+        )
+        stmt = update(ChecklistItem).values(
+            latest_status=func.coalesce(
+                latest.with_only_columns(ChecklistItemEvaluation.status).scalar_subquery(),
+                EvaluationStatus.OPEN,
+            ),
+            latest_evaluated_at=latest.with_only_columns(
+                ChecklistItemEvaluation.created_at
+            ).scalar_subquery(),
+        )
+        if project_id is not None:
+            stmt = stmt.where(
+                ChecklistItem.checklist_id.in_(
+                    select(Checklist.id).where(Checklist.project_id == project_id)
+                )
+            )
+
+        async with self.db_session_factory() as session:
+            result = await session.execute(stmt.execution_options(synchronize_session=False))
+            await session.commit()
+        return int(result.rowcount or 0)
+
     async def ensure_project_checklist(
         self,
         project_id: str,
@@ -397,17 +435,13 @@ class ChecklistEngine:
                     template_record = await self._writer.get_or_create_template_record(session, template)
                     checklist = await self._writer.get_or_create_checklist(session, project_id, template_record)
 
-                    for template_item in self._resolver.collect_template_items(template):
-                        template_item_id = str(template_item.get("id") or template_item.get("slug") or "").strip()
-                        if not template_item_id:
-                            continue
-                        await self._writer.get_or_create_item(
-                            session=session,
-                            checklist=checklist,
-                            template_item_id=template_item_id,
-                            template=template,
-                            legacy_item=template_item,
-                        )
+                    await self._writer.upsert_items(
+                        session=session,
+                        checklist=checklist,
+                        item_payloads=self._resolver.collect_template_items(template),
+                        template=template,
+                        chunk_size=self.chunk_size,
+                    )
                     created.append(checklist)
 
                 await session.commit()
@@ -416,3 +450,4 @@ class ChecklistEngine:
                 await session.rollback()
                 logger.exception("Failed to bootstrap checklists for project %s", project_id)
                 raise
+
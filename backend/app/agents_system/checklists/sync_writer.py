@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, bindparam, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +26,15 @@ from app.models.checklist import (
 )
 
 
+@dataclass(frozen=True)
+class ChecklistSyncTarget:
+    """Checklist being synchronized together with its template and owning project."""
+
+    checklist: Checklist
+    template: ChecklistTemplate
+    project_id: str
+
+
 class ChecklistSyncWriter:
     """Persistence helper for templates/checklists/items/evaluations."""
 
@@ -125,30 +138,14 @@ class ChecklistSyncWriter:
         if existing is not None:
             return existing
 
-        metadata = self.resolver.metadata_for_item(template, template_item_id)
-        item_payload = legacy_item or {}
-        title = str(
-            metadata.get("title")
-            or item_payload.get("topic")
-            or item_payload.get("title")
-            or template_item_id
-        )
-        pillar = str(metadata.get("pillar") or item_payload.get("pillar") or "General")
-        description = str(metadata.get("description") or "")
-        severity = self._normalize_severity(
-            metadata.get("severity") or metadata.get("priority") or item_payload.get("severity")
-        )
-
         item = ChecklistItem(
-            id=deterministic_id,
-            checklist_id=checklist.id,
-            template_item_id=template_item_id,
-            title=title,
-            description=description,
-            pillar=pillar,
-            severity=severity,
-            guidance=metadata.get("guidance"),
-            item_metadata=metadata if metadata else None,
+            **self._item_values(
+                checklist=checklist,
+                item_id=deterministic_id,
+                template_item_id=template_item_id,
+                template=template,
+                item_payload=legacy_item or {},
+            )
         )
         savepoint = await session.begin_nested()
         try:
@@ -163,6 +160,131 @@ class ChecklistSyncWriter:
                 raise
             return winner
 
+    async def upsert_items(
+        self,
+        session: AsyncSession,
+        checklist: Checklist,
+        item_payloads: Sequence[dict[str, Any]],
+        template: ChecklistTemplate,
+        chunk_size: int = 500,
+    ) -> dict[str, UUID]:
+        """Insert missing items with set-based statements.
+
+        Existing item ids for the checklist are prefetched in one query and new
+        rows go out as ``INSERT ... ON CONFLICT DO NOTHING`` batches. Returns
+        the deterministic item id per template item id.
+        """
+        item_ids: dict[str, UUID] = {}
+        new_rows: dict[UUID, dict[str, Any]] = {}
+        existing_ids = set(
+            (
+                await session.execute(
+                    select(ChecklistItem.id).where(ChecklistItem.checklist_id == checklist.id)
+                )
+            ).scalars()
+        )
+        for item_payload in item_payloads:
+            template_item_id = self._item_slug(item_payload)
+            if not template_item_id or template_item_id in item_ids:
+                continue
+            item_id = ChecklistItem.compute_deterministic_id(
+                project_id=checklist.project_id,
+                template_slug=checklist.template_slug or "general",
+                template_item_id=template_item_id,
+                namespace_uuid=self.namespace_uuid,
+            )
+            item_ids[template_item_id] = item_id
+            if item_id not in existing_ids:
+                new_rows[item_id] = self._item_values(
+                    checklist=checklist,
+                    item_id=item_id,
+                    template_item_id=template_item_id,
+                    template=template,
+                    item_payload=item_payload,
+                )
+
+        rows = list(new_rows.values())
+        for start in range(0, len(rows), chunk_size):
+            await session.execute(
+                sqlite_insert(ChecklistItem.__table__).on_conflict_do_nothing(index_elements=["id"]),
+                rows[start : start + chunk_size],
+            )
+        return item_ids
+
+    async def sync_items_bulk(
+        self,
+        session: AsyncSession,
+        target: ChecklistSyncTarget,
+        item_payloads: Sequence[dict[str, Any]],
+        chunk_size: int = 500,
+    ) -> int:
+        """Set-based equivalent of ``sync_item_from_payload`` for a whole checklist.
+
+        Evaluation fingerprints are prefetched in one query, the diff is computed
+        in memory and new evaluations are bulk inserted. Returns the number of
+        evaluations created.
+        """
+        item_ids = await self.upsert_items(
+            session,
+            target.checklist,
+            item_payloads,
+            target.template,
+            chunk_size=chunk_size,
+        )
+        if not item_ids:
+            return 0
+
+        fingerprints = await self._existing_checklist_eval_fingerprints(session, target.checklist.id)
+        written_at = datetime.now(timezone.utc)
+        new_evaluations: list[dict[str, Any]] = []
+        latest_by_item: dict[UUID, tuple[EvaluationStatus, datetime]] = {}
+        for item_payload in item_payloads:
+            item_id = item_ids.get(self._item_slug(item_payload))
+            if item_id is None:
+                continue
+            seen = fingerprints.setdefault(item_id, set())
+            for raw_eval in self._extract_item_evaluations(item_payload):
+                values = self._evaluation_values(item_id, target.project_id, raw_eval)
+                fingerprint = self._evaluation_fingerprint(values)
+                if fingerprint in seen:
+                    continue
+                seen.add(fingerprint)
+                # Strictly increasing in payload order so "latest" is never a tie.
+                values["created_at"] = written_at + timedelta(microseconds=len(new_evaluations))
+                new_evaluations.append(values)
+                latest_by_item[item_id] = (values["status"], values["created_at"])
+
+        for start in range(0, len(new_evaluations), chunk_size):
+            await session.execute(
+                insert(ChecklistItemEvaluation.__table__),
+                new_evaluations[start : start + chunk_size],
+            )
+        await self._update_latest_statuses(session, latest_by_item, chunk_size)
+        return len(new_evaluations)
+
+    async def _update_latest_statuses(
+        self,
+        session: AsyncSession,
+        latest_by_item: dict[UUID, tuple[EvaluationStatus, datetime]],
+        chunk_size: int,
+    ) -> None:
+        """Point items at their newest evaluation with one executemany UPDATE."""
+        table = ChecklistItem.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("b_item_id"))
+            .values(
+                latest_status=bindparam("b_latest_status"),
+                latest_evaluated_at=bindparam("b_latest_evaluated_at"),
+            )
+        )
+        rows = [
+            {"b_item_id": item_id, "b_latest_status": status, "b_latest_evaluated_at": evaluated_at}
+            for item_id, (status, evaluated_at) in latest_by_item.items()
+        ]
+        for start in range(0, len(rows), chunk_size):
+            await session.execute(statement, rows[start : start + chunk_size])
+
     async def sync_item_from_payload(
         self,
         session: AsyncSession,
@@ -171,7 +293,7 @@ class ChecklistSyncWriter:
         template: ChecklistTemplate,
         project_id: str,
     ) -> int:
-        item_slug = str(item_payload.get("id") or item_payload.get("slug") or "").strip()
+        item_slug = self._item_slug(item_payload)
         if not item_slug:
             return 0
 
@@ -224,35 +346,83 @@ class ChecklistSyncWriter:
         raw_eval: dict[str, Any],
         existing_fingerprints: set[tuple[str, str | None, str, str]],
     ) -> int:
-        status = self._normalize_evaluation_status(raw_eval.get("status"))
-        source_type = str(raw_eval.get("sourceType") or raw_eval.get("source_type") or "agent-validation")
-        source_id_raw = raw_eval.get("id") or raw_eval.get("sourceId") or raw_eval.get("source_id")
-        source_id = str(source_id_raw) if source_id_raw else None
-        evidence_value = raw_eval.get("evidence")
-
-        fingerprint = (
-            source_type,
-            source_id,
-            status.value,
-            self._hash_evidence(evidence_value),
-        )
+        values = self._evaluation_values(item.id, project_id, raw_eval)
+        fingerprint = self._evaluation_fingerprint(values)
         if fingerprint in existing_fingerprints:
             return 0
 
-        evaluation = ChecklistItemEvaluation(
-            item_id=item.id,
-            project_id=project_id,
-            status=status,
-            comment=raw_eval.get("comment"),
-            evidence=evidence_value,
-            evaluator=str(raw_eval.get("evaluator", "agent")),
-            source_type=source_type,
-            source_id=source_id,
-        )
-        session.add(evaluation)
+        evaluated_at = datetime.now(timezone.utc)
+        session.add(ChecklistItemEvaluation(**values, created_at=evaluated_at))
+        item.latest_status = values["status"]
+        item.latest_evaluated_at = evaluated_at
         existing_fingerprints.add(fingerprint)
         return 1
 
+    def _evaluation_values(
+        self,
+        item_id: UUID,
+        project_id: str,
+        raw_eval: dict[str, Any],
+    ) -> dict[str, Any]:
+        source_id_raw = raw_eval.get("id") or raw_eval.get("sourceId") or raw_eval.get("source_id")
+        return {
+            "item_id": item_id,
+            "project_id": project_id,
+            "status": self._normalize_evaluation_status(raw_eval.get("status")),
+            "comment": raw_eval.get("comment"),
+            "evidence": raw_eval.get("evidence"),
+            "evaluator": str(raw_eval.get("evaluator", "agent")),
+            "source_type": str(
+                raw_eval.get("sourceType") or raw_eval.get("source_type") or "agent-validation"
+            ),
+            "source_id": str(source_id_raw) if source_id_raw else None,
+        }
+
+    def _evaluation_fingerprint(
+        self,
+        values: dict[str, Any],
+    ) -> tuple[str, str | None, str, str]:
+        return (
+            values["source_type"],
+            values["source_id"],
+            values["status"].value,
+            self._hash_evidence(values["evidence"]),
+        )
+
+    def _item_values(
+        self,
+        *,
+        checklist: Checklist,
+        item_id: UUID,
+        template_item_id: str,
+        template: ChecklistTemplate,
+        item_payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        metadata = self.resolver.metadata_for_item(template, template_item_id)
+        title = str(
+            metadata.get("title")
+            or item_payload.get("topic")
+            or item_payload.get("title")
+            or template_item_id
+        )
+        return {
+            "id": item_id,
+            "checklist_id": checklist.id,
+            "template_item_id": template_item_id,
+            "title": title,
+            "description": str(metadata.get("description") or ""),
+            "pillar": str(metadata.get("pillar") or item_payload.get("pillar") or "General"),
+            "severity": self._normalize_severity(
+                metadata.get("severity") or metadata.get("priority") or item_payload.get("severity")
+            ),
+            "guidance": metadata.get("guidance"),
+            "item_metadata": metadata if metadata else None,
+        }
+
+    @staticmethod
+    def _item_slug(item_payload: dict[str, Any]) -> str:
+        return str(item_payload.get("id") or item_payload.get("slug") or "").strip()
+
     async def _existing_eval_fingerprints(
         self,
         session: AsyncSession,
@@ -263,20 +433,41 @@ class ChecklistSyncWriter:
                 select(ChecklistItemEvaluation).where(ChecklistItemEvaluation.item_id == item_id)
             )
         ).scalars().all()
+        return {self._stored_evaluation_fingerprint(entry) for entry in existing}
 
-        fingerprints: set[tuple[str, str | None, str, str]] = set()
-        for entry in existing:
-            raw_status = entry.status.value if isinstance(entry.status, EvaluationStatus) else str(entry.status)
-            fingerprints.add(
-                (
-                    str(entry.source_type or "agent-validation"),
-                    str(entry.source_id) if entry.source_id is not None else None,
-                    raw_status,
-                    self._hash_evidence(entry.evidence),
+    async def _existing_checklist_eval_fingerprints(
+        self,
+        session: AsyncSession,
+        checklist_id: UUID,
+    ) -> dict[UUID, set[tuple[str, str | None, str, str]]]:
+        rows = (
+            await session.execute(
+                select(
+                    ChecklistItemEvaluation.item_id,
+                    ChecklistItemEvaluation.source_type,
+                    ChecklistItemEvaluation.source_id,
+                    ChecklistItemEvaluation.status,
+                    ChecklistItemEvaluation.evidence,
                 )
+                .join(ChecklistItem, ChecklistItem.id == ChecklistItemEvaluation.item_id)
+                .where(ChecklistItem.checklist_id == checklist_id)
             )
+        ).all()
+
+        fingerprints: dict[UUID, set[tuple[str, str | None, str, str]]] = {}
+        for row in rows:
+            fingerprints.setdefault(row.item_id, set()).add(self._stored_evaluation_fingerprint(row))
         return fingerprints
 
+    def _stored_evaluation_fingerprint(self, entry: Any) -> tuple[str, str | None, str, str]:
+        raw_status = entry.status.value if isinstance(entry.status, EvaluationStatus) else str(entry.status)
+        return (
+            str(entry.source_type or "agent-validation"),
+            str(entry.source_id) if entry.source_id is not None else None,
+            raw_status,
+            self._hash_evidence(entry.evidence),
+        )
+
     @staticmethod
     def _normalize_evaluation_status(raw_status: Any) -> EvaluationStatus:
         value = str(raw_status or EvaluationStatus.OPEN.value).strip().lower().replace("-", "_")
@@ -305,3 +496,4 @@ class ChecklistSyncWriter:
         else:
             payload = str(evidence)
         return hashlib.sha1(payload.encode("utf-8")).hexdigest()  # noqa: S324
+
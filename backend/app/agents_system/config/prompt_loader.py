@@ -12,7 +12,7 @@ from typing import Any
 
 import yaml  # type: ignore[import-untyped]
 
-from app.agents_system.memory.token_counter import TokenCounter
+from app.shared.ai.token_counter import TokenCounter
 
 logger = logging.getLogger(__name__)
 
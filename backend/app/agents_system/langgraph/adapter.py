@@ -13,9 +13,11 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.shared.db.round_trips import RoundTripCounter, count_round_trips
+
 from ..runner import get_agent_runner
 from ..services.response_sanitizer import sanitize_agent_output
-from .graph_factory import build_project_chat_graph
+from .graph_factory import build_project_chat_config, get_project_chat_graph
 from .nodes.agent_native import run_stage_aware_agent
 from .state import GraphState
 
@@ -28,13 +30,6 @@ def _sse_event(event: str, payload: dict[str, Any]) -> str:
     return f"event: {event}\ndata: {data}\n\n"
 
 
-def _build_thread_config(thread_id: str | None) -> dict[str, Any] | None:
-    """Build LangGraph config with thread_id for checkpointer."""
-    if thread_id:
-        return {"configurable": {"thread_id": thread_id}}
-    return None
-
-
 def _resolve_thread_id(thread_id: str | None) -> str:
     """Return the provided thread ID or mint one for checkpointer-backed runs."""
     if thread_id:
@@ -42,6 +37,15 @@ def _resolve_thread_id(thread_id: str | None) -> str:
     return str(uuid.uuid4())
 
 
+def _log_round_trips(project_id: str, counter: RoundTripCounter) -> None:
+    logger.info(
+        "Project chat turn for %s: %d DB statements, %d full project state reads",
+        project_id,
+        counter.statements,
+        counter.events["project_state_reads"],
+    )
+
+
 def _build_reasoning_step(step: object) -> dict[str, str] | None:
     """Normalize an intermediate agent step for SSE consumers."""
     if not isinstance(step, tuple) or len(step) != _INTERMEDIATE_STEP_PARTS:
@@ -115,11 +119,7 @@ async def execute_project_chat(
     """
     effective_thread_id = _resolve_thread_id(thread_id)
     try:
-        response_message_id = str(uuid.uuid4())
-        graph = build_project_chat_graph(
-            db,
-            response_message_id,
-        )
+        graph = get_project_chat_graph()
         initial_state: GraphState = {
             "project_id": project_id,
             "user_message": user_message,
@@ -127,8 +127,14 @@ async def execute_project_chat(
             "success": False,
             "retry_count": 0,
         }
-        config = _build_thread_config(effective_thread_id)
-        result = await graph.ainvoke(initial_state, config=config)
+        config = build_project_chat_config(
+            db=db,
+            thread_id=effective_thread_id,
+            response_message_id=str(uuid.uuid4()),
+        )
+        with count_round_trips() as round_trips:
+            result = await graph.ainvoke(initial_state, config=config)
+        _log_round_trips(project_id, round_trips)
         output = str(result.get("final_answer", ""))
         if not output:
             output = sanitize_agent_output(str(result.get("agent_output", "")))
@@ -142,6 +148,7 @@ async def execute_project_chat(
             "intermediate_steps": result.get("intermediate_steps", []),
             "error": result.get("error"),
             "thread_id": effective_thread_id,
+            "db_round_trips": round_trips.as_dict(),
         }
     except Exception as e:
         logger.error("LangGraph project chat execution failed: %s", e, exc_info=True)
@@ -171,11 +178,7 @@ async def execute_project_chat_stream(
 
     async def _run() -> None:
         try:
-            response_message_id = str(uuid.uuid4())
-            graph = build_project_chat_graph(
-                db,
-                response_message_id,
-            )
+            graph = get_project_chat_graph()
             initial_state: GraphState = {
                 "project_id": project_id,
                 "user_message": user_message,
@@ -183,13 +186,15 @@ async def execute_project_chat_stream(
                 "success": False,
                 "retry_count": 0,
             }
-            config: dict[str, Any] = {
-                "configurable": {
-                    "thread_id": effective_thread_id,
-                    "event_callback": _emit,
-                }
-            }
-            result_state = await graph.ainvoke(initial_state, config=config)
+            config = build_project_chat_config(
+                db=db,
+                thread_id=effective_thread_id,
+                response_message_id=str(uuid.uuid4()),
+                event_callback=_emit,
+            )
+            with count_round_trips() as round_trips:
+                result_state = await graph.ainvoke(initial_state, config=config)
+            _log_round_trips(project_id, round_trips)
             final_answer = str(result_state.get("final_answer", ""))
             success = bool(result_state.get("success", False))
             updated_state = result_state.get("updated_project_state")
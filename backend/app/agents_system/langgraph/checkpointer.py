@@ -0,0 +1,402 @@
+"""SQLite-backed LangGraph checkpointer for thread-scoped memory.
+
+Checkpoints live in a small SQLite file next to the projects database. Each
+thread keeps only its newest ``max_checkpoints`` checkpoints, checkpoints older
+than ``ttl_seconds`` are swept periodically, and turn snapshot channels that
+``load_state`` re-reads on every turn are not persisted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+
+from app.shared.config.app_settings import get_app_settings
+from app.shared.db.projects_database import DB_PATH
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINTS_DB_PATH = DB_PATH.parent / "thread_checkpoints.db"
+
+# Re-read from the database by load_state at the start of every turn.
+_TURN_SNAPSHOT_CHANNELS = frozenset({"current_project_state", "mindmap", "mindmap_coverage"})
+_METADATA_TYPES = (str, int, float, bool, type(None), dict, list)
+_COMPRESS_MIN_BYTES = 1024
+_COMPRESSED_SUFFIX = "+zlib"
+_SWEEP_INTERVAL_SECONDS = 300
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE INDEX IF NOT EXISTS ix_checkpoints_created_at ON checkpoints (created_at);
+CREATE TABLE IF NOT EXISTS checkpoint_writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB NOT NULL,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+# Newest (or requested) checkpoint plus its pending writes in one indexed read.
+_SELECT_TUPLE = """
+SELECT c.checkpoint_id, c.parent_checkpoint_id, c.type, c.checkpoint,
+       c.metadata_type, c.metadata, w.task_id, w.channel, w.type, w.value
+FROM (
+    SELECT * FROM checkpoints
+    WHERE thread_id = ? AND checkpoint_ns = ? {checkpoint_filter}
+    ORDER BY checkpoint_id DESC
+    LIMIT 1
+) AS c
+LEFT JOIN checkpoint_writes AS w
+    ON w.thread_id = c.thread_id
+    AND w.checkpoint_ns = c.checkpoint_ns
+    AND w.checkpoint_id = c.checkpoint_id
+ORDER BY w.task_id, w.idx
+"""
+
+# Each filter is skipped when its parameter is NULL.
+_SELECT_LIST = """
+SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type,
+       checkpoint, metadata_type, metadata
+FROM checkpoints
+WHERE (:thread_id IS NULL OR thread_id = :thread_id)
+    AND (:checkpoint_ns IS NULL OR checkpoint_ns = :checkpoint_ns)
+    AND (:before_id IS NULL OR checkpoint_id < :before_id)
+ORDER BY checkpoint_id DESC
+"""
+
+_PRUNE_CHECKPOINTS = (
+    "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?"
+)
+_PRUNE_WRITES = (
+    "DELETE FROM checkpoint_writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?"
+)
+
+
+class SqliteThreadCheckpointer(BaseCheckpointSaver):
+    """Async LangGraph checkpoint saver with per-thread retention and TTL eviction."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_checkpoints: int = 20,
+        ttl_seconds: float = 7 * 24 * 3600,
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.max_checkpoints = max_checkpoints
+        self.ttl_seconds = ttl_seconds
+        self._conn: aiosqlite.Connection | None = None
+        self._lock = asyncio.Lock()
+        self._last_sweep = 0.0
+
+    async def _connection(self) -> aiosqlite.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = await aiosqlite.connect(self.path)
+            await conn.execute("PRAGMA journal_mode=WAL")
+            await conn.executescript(_SCHEMA)
+            await conn.commit()
+            self._conn = conn
+        return self._conn
+
+    async def aclose(self) -> None:
+        async with self._lock:
+            if self._conn is not None:
+                await self._conn.close()
+                self._conn = None
+
+    def _dumps(self, value: Any) -> tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(value)
+        if len(data) >= _COMPRESS_MIN_BYTES:
+            return f"{type_}{_COMPRESSED_SUFFIX}", zlib.compress(data)
+        return type_, data
+
+    def _loads(self, type_: str, data: bytes) -> Any:
+        if type_.endswith(_COMPRESSED_SUFFIX):
+            type_ = type_[: -len(_COMPRESSED_SUFFIX)]
+            data = zlib.decompress(data)
+        return self.serde.loads_typed((type_, data))
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = str(configurable.get("checkpoint_ns", ""))
+        checkpoint_id = get_checkpoint_id(config)
+        params: list[Any] = [thread_id, checkpoint_ns]
+        checkpoint_filter = ""
+        if checkpoint_id:
+            checkpoint_filter = "AND checkpoint_id = ?"
+            params.append(checkpoint_id)
+
+        async with self._lock:
+            conn = await self._connection()
+            async with conn.execute(
+                _SELECT_TUPLE.format(checkpoint_filter=checkpoint_filter), params
+            ) as cursor:
+                rows = await cursor.fetchall()
+        if not rows:
+            return None
+
+        first = rows[0]
+        pending_writes = [
+            (task_id, channel, self._loads(value_type, value))
+            for *_, task_id, channel, value_type, value in rows
+            if task_id is not None
+        ]
+        return self._tuple(thread_id, checkpoint_ns, first[:6], pending_writes)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        params: dict[str, Any] = {"thread_id": None, "checkpoint_ns": None, "before_id": None}
+        if config is not None:
+            params["thread_id"] = str(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                params["checkpoint_ns"] = str(checkpoint_ns)
+        if before is not None:
+            params["before_id"] = get_checkpoint_id(before) or None
+
+        async with self._lock:
+            conn = await self._connection()
+            async with conn.execute(_SELECT_LIST, params) as cursor:
+                rows = await cursor.fetchall()
+
+        yielded = 0
+        for thread_id, checkpoint_ns, *row in rows:
+            checkpoint_tuple = self._tuple(thread_id, checkpoint_ns, row, [])
+            if filter and any(checkpoint_tuple.metadata.get(k) != v for k, v in filter.items()):
+                continue
+            yield checkpoint_tuple
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = str(configurable.get("checkpoint_ns", ""))
+        compact = {
+            **checkpoint,
+            "channel_values": {
+                key: value
+                for key, value in checkpoint["channel_values"].items()
+                if key not in _TURN_SNAPSHOT_CHANNELS
+            },
+        }
+        # Request-scoped configurable values (db session, callbacks) must not be stored.
+        safe_metadata = {
+            key: value for key, value in metadata.items() if isinstance(value, _METADATA_TYPES)
+        }
+        checkpoint_type, checkpoint_data = self._dumps(compact)
+        metadata_type, metadata_data = self._dumps(safe_metadata)
+
+        async with self._lock:
+            conn = await self._connection()
+            await conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, "
+                "parent_checkpoint_id, type, checkpoint, metadata_type, metadata, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    configurable.get("checkpoint_id"),
+                    checkpoint_type,
+                    checkpoint_data,
+                    metadata_type,
+                    metadata_data,
+                    time.time(),
+                ),
+            )
+            await self._prune_thread(conn, thread_id, checkpoint_ns)
+            await self._sweep_expired(conn)
+            await conn.commit()
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = str(configurable.get("checkpoint_ns", ""))
+        checkpoint_id = str(configurable["checkpoint_id"])
+        rows = []
+        for index, (channel, value) in enumerate(writes):
+            value_type, value_data = self._dumps(value)
+            rows.append(
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    task_id,
+                    WRITES_IDX_MAP.get(channel, index),
+                    channel,
+                    value_type,
+                    value_data,
+                    task_path,
+                )
+            )
+        # Special channels (errors, interrupts) overwrite; regular writes are idempotent.
+        verb = "INSERT OR REPLACE" if all(w[0] in WRITES_IDX_MAP for w in writes) else "INSERT OR IGNORE"
+
+        async with self._lock:
+            conn = await self._connection()
+            await conn.executemany(
+                f"{verb} INTO checkpoint_writes (thread_id, checkpoint_ns, checkpoint_id, "
+                "task_id, idx, channel, type, value, task_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            await conn.commit()
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        async with self._lock:
+            conn = await self._connection()
+            await conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+            await conn.execute("DELETE FROM checkpoint_writes WHERE thread_id = ?", (thread_id,))
+            await conn.commit()
+
+    async def _prune_thread(
+        self,
+        conn: aiosqlite.Connection,
+        thread_id: str,
+        checkpoint_ns: str,
+    ) -> None:
+        """Keep only the newest ``max_checkpoints`` checkpoints of one thread."""
+        async with conn.execute(
+            "SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+            "ORDER BY checkpoint_id DESC LIMIT 1 OFFSET ?",
+            (thread_id, checkpoint_ns, self.max_checkpoints - 1),
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return
+        params = (thread_id, checkpoint_ns, row[0])
+        await conn.execute(_PRUNE_CHECKPOINTS, params)
+        await conn.execute(_PRUNE_WRITES, params)
+
+    async def _sweep_expired(self, conn: aiosqlite.Connection) -> None:
+        """Drop checkpoints past their TTL, at most once per sweep interval."""
+        now = time.time()
+        if now - self._last_sweep < _SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_sweep = now
+        cursor = await conn.execute(
+            "DELETE FROM checkpoints WHERE created_at < ?", (now - self.ttl_seconds,)
+        )
+        if cursor.rowcount:
+            await conn.execute(
+                "DELETE FROM checkpoint_writes WHERE NOT EXISTS ("
+                "SELECT 1 FROM checkpoints AS c WHERE c.thread_id = checkpoint_writes.thread_id "
+                "AND c.checkpoint_ns = checkpoint_writes.checkpoint_ns "
+                "AND c.checkpoint_id = checkpoint_writes.checkpoint_id)"
+            )
+            logger.info("Evicted %d expired thread checkpoints", cursor.rowcount)
+        await cursor.close()
+
+    def _tuple(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        row: Sequence[Any],
+        pending_writes: list[tuple[str, str, Any]],
+    ) -> CheckpointTuple:
+        checkpoint_id, parent_checkpoint_id, type_, data, metadata_type, metadata = row
+        parent_config: RunnableConfig | None = None
+        if parent_checkpoint_id:
+            parent_config = {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": parent_checkpoint_id,
+                }
+            }
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self._loads(type_, data),
+            metadata=self._loads(metadata_type, metadata),
+            parent_config=parent_config,
+            pending_writes=pending_writes,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_thread_checkpointer() -> SqliteThreadCheckpointer:
+    """Return the process-wide thread checkpointer configured from settings."""
+    settings = get_app_settings()
+    return SqliteThreadCheckpointer(
+        CHECKPOINTS_DB_PATH,
+        max_checkpoints=settings.aaa_thread_memory_max_checkpoints,
+        ttl_seconds=settings.aaa_thread_memory_ttl_hours * 3600,
+    )
+
+
+async def close_thread_checkpointer() -> None:
+    """Close the shared checkpointer connection, if one was opened."""
+    if get_thread_checkpointer.cache_info().currsize:
+        await get_thread_checkpointer().aclose()
+        get_thread_checkpointer.cache_clear()
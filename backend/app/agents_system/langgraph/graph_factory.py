@@ -1,15 +1,16 @@
 """Graph factory for the single-path LangGraph project chat runtime."""
 
 import logging
-from typing import Literal
+from typing import Any, Literal
 
 from langchain_core.runnables import RunnableConfig
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
+from langgraph.graph.state import CompiledStateGraph
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.config.app_settings import get_app_settings
 
+from .checkpointer import get_thread_checkpointer
 from .nodes.agent import run_agent_node
 from .nodes.architecture_planner import architecture_planner_node
 from .nodes.clarify import execute_clarification_planner_node
@@ -40,98 +41,125 @@ from .state import GraphState
 logger = logging.getLogger(__name__)
 
 
-def build_project_chat_graph(
+# Compiled graphs keyed by the settings that shape them; nodes are stateless.
+_compiled_graphs: dict[bool, CompiledStateGraph] = {}
+
+
+def build_project_chat_config(
+    *,
     db: AsyncSession,
+    thread_id: str,
     response_message_id: str = "",
-) -> StateGraph:
-    """Build the project chat graph."""
+    **extra: Any,
+) -> RunnableConfig:
+    """Build the per-request config consumed by the shared project chat graph."""
+    return {
+        "configurable": {
+            "thread_id": thread_id,
+            "db": db,
+            "response_message_id": response_message_id,
+            **extra,
+        }
+    }
+
+
+def get_project_chat_graph() -> CompiledStateGraph:
+    """Return the shared compiled project chat graph for the current settings."""
+    thread_memory_enabled = bool(get_app_settings().aaa_thread_memory_enabled)
+    graph = _compiled_graphs.get(thread_memory_enabled)
+    if graph is None:
+        graph = build_project_chat_graph()
+        _compiled_graphs[thread_memory_enabled] = graph
+    return graph
+
+
+def build_project_chat_graph() -> CompiledStateGraph:
+    """Build and compile the project chat graph.
+
+    Request-scoped dependencies (``db``, ``response_message_id``) are read from
+    ``config["configurable"]`` at run time, so the compiled graph can be shared.
+    """
     workflow = StateGraph(GraphState)
 
     # Core nodes (all phases)
-    workflow.add_node("load_state", _wrap_load_state(db))
-    workflow.add_node("build_summary", _wrap_build_summary(db))
+    workflow.add_node("load_state", _load_state)
+    workflow.add_node("build_summary", _build_summary)
     workflow.add_node("classify_stage", classify_next_stage)
-    workflow.add_node("clarify_stage_worker", _wrap_clarify(db))
+    workflow.add_node("clarify_stage_worker", _clarify)
     workflow.add_node("export_stage_worker", execute_export_stage_worker_node)
-    workflow.add_node("extract_requirements", _wrap_extract_requirements(db))
+    workflow.add_node("extract_requirements", _extract_requirements)
     workflow.add_node("iac_stage_worker", execute_iac_stage_worker_node)
     workflow.add_node("build_research", build_research_plan_node)
     workflow.add_node("research_worker", execute_research_worker_node)
     workflow.add_node("build_mindmap_guidance", _pass_through_mindmap_guidance)
-    workflow.add_node("manage_adr_stage_worker", _wrap_manage_adr(db))
+    workflow.add_node("manage_adr_stage_worker", _manage_adr)
     workflow.add_node("validate_stage_worker", execute_validate_stage_worker_node)
     workflow.add_node("prepare_architecture_handoff", prepare_architecture_planner_handoff)
     workflow.add_node("architecture_planner", architecture_planner_node)
     workflow.add_node("cost_stage_worker", execute_cost_stage_worker_node)
-    workflow.add_node("run_agent", _wrap_run_agent(db))
-    workflow.add_node("persist_messages", _wrap_persist_messages(db))
-    workflow.add_node("postprocess", _wrap_postprocess(response_message_id))
-    workflow.add_node("apply_updates", _wrap_apply_updates(db))
+    workflow.add_node("run_agent", _run_agent)
+    workflow.add_node("persist_messages", _persist_messages)
+    workflow.add_node("postprocess", _postprocess)
+    workflow.add_node("apply_updates", _apply_updates)
     workflow.add_node("retry_prompt", build_retry_prompt)
     workflow.add_node("propose_next_step", propose_next_step)
 
     # Build workflow
     _build_workflow_edges(workflow)
 
-    # Add checkpointer for thread-scoped memory when enabled
+    # Add persistent checkpointer for thread-scoped memory when enabled
     settings = get_app_settings()
-    checkpointer = MemorySaver() if settings.aaa_thread_memory_enabled else None
+    checkpointer = get_thread_checkpointer() if settings.aaa_thread_memory_enabled else None
 
     return workflow.compile(checkpointer=checkpointer)
 
 
-def _wrap_load_state(db: AsyncSession):
-    async def load_state(state: GraphState) -> dict:
-        return await load_project_state_node(state, db)
-    return load_state
+def _configurable(config: RunnableConfig | None) -> dict[str, Any]:
+    return (config or {}).get("configurable") or {}
+
+
+def _config_db(config: RunnableConfig | None) -> AsyncSession:
+    db = _configurable(config).get("db")
+    if db is None:
+        raise RuntimeError("Project chat graph requires a database session in config['configurable']['db']")
+    return db
+
+
+async def _load_state(state: GraphState, config: RunnableConfig) -> dict:
+    return await load_project_state_node(state, _config_db(config))
 
 
-def _wrap_build_summary(db: AsyncSession):
-    async def build_summary(state: GraphState) -> dict:
-        return await build_context_summary_node(state, db)
-    return build_summary
+async def _build_summary(state: GraphState, config: RunnableConfig) -> dict:
+    return await build_context_summary_node(state, _config_db(config))
 
 
-def _wrap_postprocess(response_message_id: str):
-    async def postprocess(state: GraphState) -> dict:
-        return await postprocess_node(state, response_message_id)
-    return postprocess
+async def _postprocess(state: GraphState, config: RunnableConfig) -> dict:
+    response_message_id = str(_configurable(config).get("response_message_id") or "")
+    return await postprocess_node(state, response_message_id)
 
 
-def _wrap_extract_requirements(db: AsyncSession):
-    async def extract_requirements(state: GraphState, config: RunnableConfig) -> dict:
-        return await execute_extract_requirements_node(state, db, config=config)
-    return extract_requirements
+async def _extract_requirements(state: GraphState, config: RunnableConfig) -> dict:
+    return await execute_extract_requirements_node(state, _config_db(config), config=config)
 
 
-def _wrap_clarify(db: AsyncSession):
-    async def clarify(state: GraphState, config: RunnableConfig) -> dict:
-        return await execute_clarification_planner_node(state, db, config=config)
-    return clarify
+async def _clarify(state: GraphState, config: RunnableConfig) -> dict:
+    return await execute_clarification_planner_node(state, _config_db(config), config=config)
 
 
-def _wrap_persist_messages(db: AsyncSession):
-    async def persist_messages(state: GraphState) -> dict:
-        return await persist_messages_node(state, db)
-    return persist_messages
+async def _persist_messages(state: GraphState, config: RunnableConfig) -> dict:
+    return await persist_messages_node(state, _config_db(config))
 
 
-def _wrap_manage_adr(db: AsyncSession):
-    async def manage_adr(state: GraphState) -> dict:
-        return await execute_manage_adr_stage_worker_node(state, db)
-    return manage_adr
+async def _manage_adr(state: GraphState, config: RunnableConfig) -> dict:
+    return await execute_manage_adr_stage_worker_node(state, _config_db(config))
 
 
-def _wrap_apply_updates(db: AsyncSession):
-    async def apply_updates(state: GraphState) -> dict:
-        return await apply_state_updates_node(state, db)
-    return apply_updates
+async def _apply_updates(state: GraphState, config: RunnableConfig) -> dict:
+    return await apply_state_updates_node(state, _config_db(config))
 
 
-def _wrap_run_agent(db: AsyncSession):
-    async def run_agent(state: GraphState, config: RunnableConfig) -> dict:
-        return await run_agent_node(state, config=config)
-    return run_agent
+async def _run_agent(state: GraphState, config: RunnableConfig) -> dict:
+    return await run_agent_node(state, config=config)
 
 
 def _pass_through_mindmap_guidance(state: GraphState) -> dict:
@@ -128,7 +128,11 @@ async def build_context_summary_node(
                 "context_budget_meta": pack.budget_meta,
             }
 
-        context_summary = await get_project_context_summary(project_id, db)
+        context_summary = await get_project_context_summary(
+            project_id,
+            db,
+            project_state=state.get("current_project_state") or None,
+        )
 
         logger.info(f"Built context summary for {project_id} ({len(context_summary)} chars)")
         return {
@@ -12,13 +12,17 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents_system.memory.telemetry import emit_trace_event
-from app.agents_system.memory.token_counter import TokenCounter
 from app.features.checklists.infrastructure.service import get_checklist_service
+from app.shared.ai.token_counter import TokenCounter
 from app.shared.config.app_settings import get_app_settings
 
 from ....models.project import ConversationMessage
 from ...services.iteration_logging import derive_uncovered_topic_questions
-from ...services.project_context import read_project_state, update_project_state
+from ...services.project_context import (
+    read_project_state,
+    refresh_snapshot_after_update,
+    update_project_state,
+)
 from ...services.response_sanitizer import sanitize_agent_output
 from ..state import GraphState
 
@@ -129,7 +133,10 @@ async def apply_state_updates_node(
         )
 
         waf_update = combined_updates.pop("wafChecklist", None)
+        snapshot = state.get("current_project_state")
+        snapshot_stale = not snapshot
         if isinstance(waf_update, dict):
+            snapshot_stale = True
             try:
                 settings = get_app_settings()
                 service = await get_checklist_service(db=db, settings=settings)
@@ -140,11 +147,16 @@ async def apply_state_updates_node(
             except Exception as e:  # noqa: BLE001
                 logger.error(f"Failed to sync project {project_id} WAF updates: {e}")
 
+        written_state = None
         if combined_updates:
-            await update_project_state(project_id, combined_updates, db)
-
-        refreshed_state = await read_project_state(project_id, db)
-        updated_state = refreshed_state if isinstance(refreshed_state, dict) else {}
+            written_state = await update_project_state(project_id, combined_updates, db)
+
+        # Reuse the turn snapshot unless the checklist changed under it
+        if written_state is not None and not snapshot_stale:
+            updated_state = refresh_snapshot_after_update(snapshot, written_state)
+        else:
+            refreshed_state = await read_project_state(project_id, db)
+            updated_state = refreshed_state if isinstance(refreshed_state, dict) else {}
 
         # Build final answer with additional guidance
         final_answer = sanitize_agent_output(str(agent_output))
@@ -28,6 +28,8 @@ class GraphState(TypedDict, total=False):
     # Context loading
     context_summary: str | None
     context_pack: dict[str, Any] | None  # Stage-specific context pack (Phase 3)
+    # Turn snapshot: read once by load_state and reused by later nodes until
+    # a write in this turn invalidates it
     current_project_state: dict[str, Any]
     mindmap: dict[str, Any] | None
     mindmap_coverage: dict[str, Any] | None
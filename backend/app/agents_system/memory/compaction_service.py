@@ -12,8 +12,7 @@ from typing import Any
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from app.agents_system.config.prompt_loader import PromptLoader
-
-from .token_counter import TokenCounter
+from app.shared.ai.token_counter import TokenCounter
 
 logger = logging.getLogger(__name__)
 
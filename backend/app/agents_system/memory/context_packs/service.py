@@ -9,7 +9,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
-from app.agents_system.memory.token_counter import TokenCounter
+from app.shared.ai.token_counter import TokenCounter
 
 from .schema import ContextPack, ContextSection
 from .stage_packers import (
@@ -4,7 +4,7 @@ Provides read/write access to ProjectState from database.
 """
 
 import logging
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from datetime import datetime, timezone
 from typing import Any
 
@@ -18,6 +18,7 @@ from app.features.projects.infrastructure.project_state_decomposition import (
 )
 from app.features.projects.infrastructure.project_state_store import ProjectStateStore
 from app.models.checklist import Checklist, ChecklistItem
+from app.shared.db.round_trips import record_round_trip_event
 
 from ...models import Project, ProjectDocument, ProjectState
 from .aaa_state_models import AAAProjectState, apply_us6_enrichment, ensure_aaa_defaults
@@ -60,12 +61,16 @@ def _document_to_reference_payload(document: ProjectDocument) -> dict[str, Any]:
 
 def _compute_project_document_stats(documents: Sequence[ProjectDocument]) -> dict[str, Any]:
     parsed_documents = 0
+    pending_documents = 0
     failures: list[dict[str, Any]] = []
     for document in documents:
         parse_status = _normalize_parse_status(document)
         if parse_status == "parsed":
             parsed_documents += 1
             continue
+        if parse_status == "pending":
+            pending_documents += 1
+            continue
         failures.append(
             {
                 "documentId": document.id,
@@ -76,7 +81,8 @@ def _compute_project_document_stats(documents: Sequence[ProjectDocument]) -> dic
     return {
         "attemptedDocuments": len(documents),
         "parsedDocuments": parsed_documents,
-        "failedDocuments": max(len(documents) - parsed_documents, 0),
+        "pendingDocuments": pending_documents,
+        "failedDocuments": max(len(documents) - parsed_documents - pending_documents, 0),
         "failures": failures,
     }
 
@@ -131,17 +137,26 @@ async def _get_waf_checklist_state(
     return {"items": items}
 
 
-async def read_project_state(project_id: str, db: AsyncSession) -> dict[str, Any] | None:
+async def read_project_state(
+    project_id: str,
+    db: AsyncSession,
+    *,
+    include_logs: bool | Collection[str] = True,
+    include_waf_checklist: bool = True,
+) -> dict[str, Any] | None:
     """
     Read ProjectState from database.
 
     Args:
         project_id: Project ID
         db: Database session
+        include_logs: Append-only log families to load (all by default)
+        include_waf_checklist: Whether to load the WAF checklist items
 
     Returns:
         ProjectState dictionary or None if not found
     """
+    record_round_trip_event("project_state_reads")
     state_result = await db.execute(
         select(ProjectState).where(ProjectState.project_id == project_id)
     )
@@ -156,10 +171,12 @@ async def read_project_state(project_id: str, db: AsyncSession) -> dict[str, Any
         project_id=project_id,
         state=blob_state or {},
         db=db,
+        include_logs=include_logs,
     )
-    waf_checklist = await _get_waf_checklist_state(project_id, db)
-    if waf_checklist is not None:
-        raw_state["wafChecklist"] = waf_checklist
+    if include_waf_checklist:
+        waf_checklist = await _get_waf_checklist_state(project_id, db)
+        if waf_checklist is not None:
+            raw_state["wafChecklist"] = waf_checklist
     raw_state = ensure_aaa_defaults(raw_state)
     try:
         state_data = AAAProjectState.model_validate(raw_state).model_dump(
@@ -199,6 +216,39 @@ async def read_project_state(project_id: str, db: AsyncSession) -> dict[str, Any
     return state_data
 
 
+def refresh_snapshot_after_update(
+    snapshot: dict[str, Any],
+    updated_state: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Rebuild the ``read_project_state`` view after ``update_project_state``.
+
+    The write returns the persisted state; the read-side fields it does not
+    touch (WAF checklist and uploaded-document references/stats) are carried
+    over from the turn snapshot instead of being re-queried. Callers must fall
+    back to ``read_project_state`` when the checklist was written this turn.
+    """
+    refreshed = dict(updated_state)
+    refreshed.pop("conflicts", None)
+    if "wafChecklist" in snapshot:
+        refreshed["wafChecklist"] = snapshot["wafChecklist"]
+
+    uploaded_reference_documents = [
+        item
+        for item in snapshot.get("referenceDocuments") or []
+        if isinstance(item, dict) and item.get("category") == "uploaded"
+    ]
+    if uploaded_reference_documents:
+        refreshed["referenceDocuments"] = _merge_uploaded_reference_documents(
+            refreshed.get("referenceDocuments"),
+            uploaded_reference_documents,
+        )
+    for key in ("projectDocumentStats", "ingestionStats"):
+        if key in snapshot:
+            refreshed[key] = snapshot[key]
+    return refreshed
+
+
 async def update_project_state(
     project_id: str, updates: dict[str, Any], db: AsyncSession, merge: bool = True
 ) -> dict[str, Any]:
@@ -239,6 +289,7 @@ async def update_project_state(
                 project_id=project_id,
                 state=blob_state,
                 db=db,
+                include_logs=True,
             )
         )
         current_state.pop("wafChecklist", None)
@@ -284,7 +335,11 @@ async def update_project_state(
     return response_state
 
 
-async def get_project_context_summary(project_id: str, db: AsyncSession) -> str:
+async def get_project_context_summary(
+    project_id: str,
+    db: AsyncSession,
+    project_state: dict[str, Any] | None = None,
+) -> str:
     """
     Get formatted summary of project context for agent prompts.
 
@@ -294,6 +349,7 @@ async def get_project_context_summary(project_id: str, db: AsyncSession) -> str:
     Args:
         project_id: Project ID
         db: Database session
+        project_state: Already-loaded state for this turn; read from the DB when omitted
 
     Returns:
         Formatted string with project context
@@ -305,7 +361,7 @@ async def get_project_context_summary(project_id: str, db: AsyncSession) -> str:
         return f"Project {project_id} not found"
 
     # Get state
-    state = await read_project_state(project_id, db)
+    state = project_state or await read_project_state(project_id, db)
     if not state:
         return f"PROJECT: {project.name}\nNo architecture state available yet."
 
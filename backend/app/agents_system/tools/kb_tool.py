@@ -2,7 +2,6 @@
 KB tools wrapping existing RAG services for use by the ReAct agent.
 """
 
-import asyncio
 import contextlib
 import json
 from pathlib import Path
@@ -34,31 +33,36 @@ class KBSearchTool(BaseTool):
         self._agent = RAGAgent()
 
     def _run(self, payload: str | dict | Any) -> str:
-        # Normalize payload to (query, profile, kb_ids, top_k)
-        if isinstance(payload, str):
-            query = payload
-            profile = "chat"
-            kb_ids = None
-            top_k = 5
-        elif isinstance(payload, dict):
-            query = payload.get("query")
-            profile = payload.get("profile", "chat")
-            kb_ids = payload.get("kb_ids")
-            top_k = payload.get("top_k") or payload.get("topK") or 5
-        else:
-            # object-like
-            query = getattr(payload, "query", str(payload))
-            profile = getattr(payload, "profile", "chat")
-            kb_ids = getattr(payload, "kb_ids", None)
-            top_k = getattr(payload, "top_k", getattr(payload, "topK", 5))
-
+        query, profile, kb_ids, top_k = _normalize_payload(payload)
         result = self._agent.execute(query, profile=profile, kb_ids=kb_ids, top_k=top_k)
         payload_out = build_cited_reply(result)
         return payload_out["assistantMessage"]
 
     async def _arun(self, payload: str | dict | Any) -> str:
-        # Wrap the sync call to keep tool signature consistent
-        return await asyncio.to_thread(self._run, payload)
+        query, profile, kb_ids, top_k = _normalize_payload(payload)
+        result = await self._agent.aexecute(query, profile=profile, kb_ids=kb_ids, top_k=top_k)
+        payload_out = build_cited_reply(result)
+        return payload_out["assistantMessage"]
+
+
+def _normalize_payload(payload: str | dict | Any) -> tuple[Any, str, list[str] | None, int]:
+    """Normalize a tool payload to (query, profile, kb_ids, top_k)."""
+    if isinstance(payload, str):
+        return payload, "chat", None, 5
+    if isinstance(payload, dict):
+        return (
+            payload.get("query"),
+            payload.get("profile", "chat"),
+            payload.get("kb_ids"),
+            payload.get("top_k") or payload.get("topK") or 5,
+        )
+    # object-like
+    return (
+        getattr(payload, "query", str(payload)),
+        getattr(payload, "profile", "chat"),
+        getattr(payload, "kb_ids", None),
+        getattr(payload, "top_k", getattr(payload, "topK", 5)),
+    )
 
 
 def _discover_specific_kb_tools() -> list[BaseTool]:
@@ -81,18 +85,19 @@ def _discover_specific_kb_tools() -> list[BaseTool]:
                         description: str = f"Search KB: {kname} (id={kid})"
 
                         def _run(self, payload: Any) -> str:
-                            tool = KBSearchTool()
+                            return KBSearchTool()._run(self._scoped(payload))
+
+                        async def _arun(self, payload: Any) -> str:
+                            return await KBSearchTool()._arun(self._scoped(payload))
+
+                        def _scoped(self, payload: Any) -> dict:
                             if isinstance(payload, str):
-                                payload_obj = {"query": payload, "kb_ids": [kid]}
-                            elif isinstance(payload, dict):
+                                return {"query": payload, "kb_ids": [kid]}
+                            if isinstance(payload, dict):
                                 payload_obj = dict(payload)
                                 payload_obj.setdefault("kb_ids", [kid])
-                            else:
-                                payload_obj = {"query": str(payload), "kb_ids": [kid]}
-                            return tool._run(payload_obj)
-
-                        async def _arun(self, payload: Any) -> str:
-                            return await asyncio.to_thread(self._run, payload)
+                                return payload_obj
+                            return {"query": str(payload), "kb_ids": [kid]}
                     return PerKBTool()
 
                 specific_tools.append(_build_kb_tool(str(kb_id), str(kb_name)))
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,6 +13,7 @@ from app.features.agent.application.agent_api_service import (
     AgentApiService,
     get_agent_api_service,
 )
+from app.shared.config.app_settings import get_app_settings
 from app.shared.db.projects_database import get_db
 
 from .models import (
@@ -109,12 +110,19 @@ async def stream_project_chat_with_context(
 @router.get("/projects/{project_id}/history")
 async def get_conversation_history(
     project_id: str,
+    limit: int | None = Query(default=None, ge=1, le=500),
+    thread_id: str | None = None,
     db: AsyncSession = Depends(get_db),
     service: AgentApiService = Depends(get_agent_api_service),
 ) -> dict[str, Any]:
-    """Get conversation history for a project in chronological order."""
+    """Get the latest conversation history page for a project in chronological order."""
     try:
-        return await service.get_project_history(project_id, db)
+        return await service.get_project_history(
+            project_id,
+            db,
+            limit=limit or get_app_settings().messages_pagination_limit,
+            thread_id=thread_id,
+        )
     except HTTPException:
         raise
     except Exception as exc:
@@ -8,7 +8,7 @@ from __future__ import annotations
 from collections.abc import AsyncIterator
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents_system.langgraph.adapter import (
@@ -65,16 +65,28 @@ class AgentApiService:
             yield chunk
 
     async def get_project_history(
-        self, project_id: str, db: AsyncSession
+        self,
+        project_id: str,
+        db: AsyncSession,
+        *,
+        limit: int = 50,
+        thread_id: str | None = None,
     ) -> dict[str, Any]:
-        """Load conversation history for a project."""
+        """Load the newest page of conversation history in chronological order."""
+        filters = [ConversationMessage.project_id == project_id]
+        if thread_id is not None:
+            filters.append(ConversationMessage.thread_id == thread_id)
         result = await db.execute(
             select(ConversationMessage)
-            .where(ConversationMessage.project_id == project_id)
-            .order_by(ConversationMessage.timestamp)
+            .where(*filters)
+            .order_by(ConversationMessage.timestamp.desc(), ConversationMessage.id.desc())
+            .limit(limit)
         )
-        messages = result.scalars().all()
-        return {"messages": [msg.to_dict() for msg in messages], "total": len(messages)}
+        messages = list(reversed(result.scalars().all()))
+        total = await db.scalar(
+            select(func.count()).select_from(ConversationMessage).where(*filters)
+        )
+        return {"messages": [msg.to_dict() for msg in messages], "total": int(total or 0)}
 
     async def health(self) -> dict[str, Any]:
         """Return agent runtime health."""
@@ -113,10 +113,12 @@ class ChecklistReadAssembler:
         typed = [evaluation for evaluation in evaluations if isinstance(evaluation, ChecklistItemEvaluation)]
         if not typed:
             return None
+        # Newest created_at wins; ties go to the higher id, as in reconcile_latest_status.
         typed.sort(
-            key=lambda evaluation: evaluation.created_at
-            if isinstance(evaluation.created_at, datetime)
-            else datetime.min,
+            key=lambda evaluation: (
+                evaluation.created_at if isinstance(evaluation.created_at, datetime) else datetime.min,
+                str(evaluation.id or ""),
+            ),
             reverse=True,
         )
         return typed[0]
@@ -10,10 +10,15 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.features.diagrams.infrastructure.models import Base
 from app.shared.config.app_settings import get_app_settings
+from app.shared.db.sqlite_profile import (
+    RoutingSession,
+    SQLiteProfile,
+    install_sqlite_pragmas,
+)
 
 
 class DiagramDatabase:
@@ -21,6 +26,7 @@ class DiagramDatabase:
 
     def __init__(self) -> None:
         self._engine: AsyncEngine | None = None
+        self._read_engine: AsyncEngine | None = None
         self._session_factory: async_sessionmaker[AsyncSession] | None = None
 
     async def initialize(self) -> None:
@@ -40,19 +46,37 @@ class DiagramDatabase:
 
         dsn = f"sqlite+aiosqlite:///{db_file.as_posix()}"
 
-        # Create async engine
+        profile = SQLiteProfile.from_settings()
+
+        # One pooled writer connection serialises writes, plus a query_only reader pool
         self._engine = create_async_engine(
             dsn,
             echo=False,
-            poolclass=NullPool,  # SQLite doesn't benefit from connection pooling
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=1,
+            max_overflow=0,
             connect_args={"check_same_thread": False},
         )
+        install_sqlite_pragmas(self._engine.sync_engine, profile)
+
+        if profile.reader_pool_size > 0:
+            self._read_engine = create_async_engine(
+                dsn,
+                echo=False,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=profile.reader_pool_size,
+                max_overflow=profile.reader_pool_size,
+                connect_args={"check_same_thread": False},
+            )
+            install_sqlite_pragmas(self._read_engine.sync_engine, profile, read_only=True)
 
         # Create session factory
         self._session_factory = async_sessionmaker(
-            self._engine,
             class_=AsyncSession,
+            sync_session_class=RoutingSession,
             expire_on_commit=False,
+            writer_bind=self._engine.sync_engine,
+            reader_bind=self._read_engine.sync_engine if self._read_engine else None,
         )
 
         # Create all tables
@@ -77,6 +101,9 @@ class DiagramDatabase:
 
     async def close(self) -> None:
         """Close diagram database connections."""
+        if self._read_engine is not None:
+            await self._read_engine.dispose()
+            self._read_engine = None
         if self._engine is not None:
             await self._engine.dispose()
             self._engine = None
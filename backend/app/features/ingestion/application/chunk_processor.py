@@ -4,9 +4,9 @@ import asyncio
 import logging
 from typing import Any
 
-from app.features.ingestion.application.policies import RetryPolicy
+from app.features.ingestion.application.policies import EmbeddingBatchPolicy, RetryPolicy
 from app.features.ingestion.application.tasks import ProcessingTask
-from app.features.ingestion.domain.embedding import Embedder
+from app.features.ingestion.domain.embedding import Embedder, EmbeddingResult
 from app.features.ingestion.domain.indexing import Indexer
 
 logger = logging.getLogger(__name__)
@@ -56,3 +56,116 @@ class ChunkProcessor:
                     )
                     return {'success': False, 'skipped': False, 'error': str(exc)}
 
+    async def process_chunks(
+        self, kb_id: str, chunks: list[Any], batch_policy: EmbeddingBatchPolicy
+    ) -> list[dict[str, Any]]:
+        """Embed and index a window of chunks through micro-batched provider calls.
+
+        Returns one result dict per input chunk, in input order, with the same
+        shape as ``process_chunk``.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(chunks)
+        pending: list[tuple[int, Any]] = []
+        seen_hashes: set[str] = set()
+
+        exists_flags = await asyncio.to_thread(self._exists_many, kb_id, chunks)
+        for position, (chunk, exists) in enumerate(zip(chunks, exists_flags, strict=True)):
+            if exists or chunk.content_hash in seen_hashes:
+                results[position] = {'success': True, 'skipped': True}
+                continue
+            seen_hashes.add(chunk.content_hash)
+            pending.append((position, chunk))
+
+        semaphore = asyncio.Semaphore(batch_policy.max_in_flight)
+
+        async def _run(micro_batch: list[tuple[int, Any]]) -> list[tuple[int, EmbeddingResult | Exception]]:
+            async with semaphore:
+                return await self._embed_with_split(micro_batch)
+
+        micro_batches = [
+            pending[start : start + batch_policy.micro_batch_size]
+            for start in range(0, len(pending), batch_policy.micro_batch_size)
+        ]
+        embedded = await asyncio.gather(*(_run(micro_batch) for micro_batch in micro_batches))
+
+        outcomes = sorted((item for batch in embedded for item in batch), key=lambda item: item[0])
+        index_errors = await asyncio.to_thread(self._index_many, kb_id, outcomes)
+        for position, outcome in outcomes:
+            error = index_errors.get(position) or (outcome if isinstance(outcome, Exception) else None)
+            if error is None:
+                results[position] = {'success': True, 'skipped': False}
+            else:
+                results[position] = {'success': False, 'skipped': False, 'error': str(error)}
+
+        return [result or {'success': False, 'skipped': False, 'error': 'not processed'} for result in results]
+
+    def _exists_many(self, kb_id: str, chunks: list[Any]) -> list[bool]:
+        return [self._indexer.exists(kb_id, chunk.content_hash) for chunk in chunks]
+
+    def _index_many(
+        self, kb_id: str, outcomes: list[tuple[int, EmbeddingResult | Exception]]
+    ) -> dict[int, Exception]:
+        errors: dict[int, Exception] = {}
+        for position, outcome in outcomes:
+            if isinstance(outcome, Exception):
+                continue
+            try:
+                self._indexer.index(kb_id, outcome)
+            except Exception as exc:
+                logger.error(
+                    'Indexing failed for embedded chunk',
+                    extra={'content_hash': outcome.content_hash[:8], 'error_type': type(exc).__name__},
+                    exc_info=True,
+                )
+                errors[position] = exc
+        return errors
+
+    async def _embed_with_split(
+        self, micro_batch: list[tuple[int, Any]]
+    ) -> list[tuple[int, EmbeddingResult | Exception]]:
+        """Embed a micro-batch, splitting it in halves when the request keeps failing.
+
+        A single chunk that still fails falls back to the per-chunk retry policy.
+        """
+        if len(micro_batch) == 1:
+            return [await self._embed_single_with_retry(*micro_batch[0])]
+
+        try:
+            embeddings = await self._embedder.embed_batch([chunk for _, chunk in micro_batch])
+            return [(position, embedding) for (position, _), embedding in zip(micro_batch, embeddings, strict=True)]
+        except (RuntimeError, ValueError, OSError) as exc:
+            # Embedders wrap provider failures in RuntimeError; ValueError covers
+            # empty chunks and a short response, OSError transport failures.
+            middle = len(micro_batch) // 2
+            logger.warning(
+                'Embedding micro-batch failed; splitting',
+                extra={'batch_size': len(micro_batch), 'error_type': type(exc).__name__},
+            )
+            left, right = await asyncio.gather(
+                self._embed_with_split(micro_batch[:middle]),
+                self._embed_with_split(micro_batch[middle:]),
+            )
+            return left + right
+
+    async def _embed_single_with_retry(
+        self, position: int, chunk: Any
+    ) -> tuple[int, EmbeddingResult | Exception]:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return position, await self._embedder.embed(chunk)
+            except Exception as exc:
+                if self._retry_policy.should_retry(attempt, exc):
+                    await asyncio.sleep(self._retry_policy.get_backoff_delay(attempt))
+                    continue
+                logger.error(
+                    'Chunk failed after retries',
+                    extra={
+                        'content_hash': getattr(chunk, 'content_hash', '')[:8],
+                        'attempts': attempt,
+                        'error_type': type(exc).__name__,
+                    },
+                    exc_info=True,
+                )
+                return position, exc
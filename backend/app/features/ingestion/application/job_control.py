@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+from dataclasses import dataclass, field
+
+
+@dataclass
+class JobControl:
+    """In-memory status of a running job; ``changed`` fires on every transition."""
+
+    job_id: str
+    status: str = 'running'
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    async def wait_for_change(self, timeout: float) -> None:
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.changed.wait(), timeout=timeout)
+        self.changed.clear()
+
+
+class JobControlPlane:
+    """Holds the authoritative status of running ingestion jobs in memory.
+
+    Status transitions (pause, cancel, terminal states) are pushed here so the
+    job gate never has to poll the database between chunks.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._jobs: dict[str, JobControl] = {}
+
+    def register_job(self, job_id: str, status: str = 'running') -> JobControl:
+        """Register a running job and return its control handle."""
+        control = JobControl(job_id=job_id, status=status)
+        with self._lock:
+            self._jobs[job_id] = control
+        return control
+
+    def get(self, job_id: str) -> JobControl | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def set_status(self, job_id: str, status: str) -> None:
+        """Record a status transition and wake anything waiting on the job."""
+        control = self.get(job_id)
+        if control is None:
+            return
+        control.status = status
+        control.changed.set()
+
+    def unregister_job(self, job_id: str) -> None:
+        """Remove a job from tracking after it stops running."""
+        with self._lock:
+            self._jobs.pop(job_id, None)
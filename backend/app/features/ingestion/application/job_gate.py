@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 
+from app.features.ingestion.application.job_control import JobControlPlane
 from app.features.ingestion.application.job_lifecycle import JobLifecycleManager
 from app.features.ingestion.domain.indexing import Indexer
 from app.features.ingestion.infrastructure.job_repository import JobRepository
@@ -12,19 +13,35 @@ logger = logging.getLogger(__name__)
 
 
 class JobGate:
-    def __init__(self, repo: JobRepository, lifecycle: JobLifecycleManager) -> None:
+    """Decides between chunks whether a job may continue.
+
+    Jobs registered in the control plane are checked against their in-memory
+    status; anything else falls back to polling the job repository.
+    """
+
+    def __init__(
+        self,
+        repo: JobRepository,
+        lifecycle: JobLifecycleManager,
+        control_plane: JobControlPlane | None = None,
+    ) -> None:
         self._repo = repo
         self._lifecycle = lifecycle
+        self._control_plane = control_plane
 
     async def check(self, job_id: str, kb_id: str, indexer: Indexer) -> bool:
+        control = self._control_plane.get(job_id) if self._control_plane is not None else None
         while True:
-            status = self._repo.get_job_status(job_id)
+            status = control.status if control is not None else self._repo.get_job_status(job_id)
 
             if status == 'running':
                 return True
             if status == 'paused':
                 logger.info('Job paused, waiting', extra={'job_id': job_id})
-                await asyncio.sleep(get_app_settings().job_gate_poll_interval)
+                if control is not None:
+                    await control.wait_for_change(get_app_settings().job_gate_poll_interval)
+                else:
+                    await asyncio.sleep(get_app_settings().job_gate_poll_interval)
             elif status == 'canceled':
                 logger.info('Job canceled, running cleanup', extra={'job_id': job_id})
                 await self._cleanup(job_id, kb_id, indexer)
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+from app.features.ingestion.application.job_control import JobControlPlane
+from app.features.ingestion.application.progress_writer import ProgressWriter
 from app.features.ingestion.domain.indexing import Indexer
 from app.features.ingestion.infrastructure.job_repository import JobRepository
 
@@ -19,15 +21,29 @@ class BatchProgress:
 
 
 class JobLifecycleManager:
-    """Centralizes ingestion job state transitions and checkpoint persistence."""
+    """Centralizes ingestion job state transitions and checkpoint persistence.
+
+    With a ``progress_writer``, per-chunk progress is buffered and flushed in the
+    background while batch boundaries, pauses and terminal states are written
+    synchronously. With a ``control_plane``, every status change is also pushed
+    to the in-memory status that the job gate reads.
+    """
 
     ACTIVE_BATCH_ID = 'active_batch_id'
     ACTIVE_BATCH_DOCS = 'active_batch_docs'
     ACTIVE_BATCH_CHUNKS = 'active_batch_chunks'
     RESUME_CHUNK_INDEX = 'resume_chunk_index'
 
-    def __init__(self, repo: JobRepository) -> None:
+    def __init__(
+        self,
+        repo: JobRepository,
+        *,
+        progress_writer: ProgressWriter | None = None,
+        control_plane: JobControlPlane | None = None,
+    ) -> None:
         self._repo = repo
+        self._progress_writer = progress_writer
+        self._control_plane = control_plane
 
     def is_resuming_batch(self, checkpoint: dict[str, Any], batch_id: int) -> bool:
         active_batch_id = checkpoint.get(self.ACTIVE_BATCH_ID, -1)
@@ -39,10 +55,21 @@ class JobLifecycleManager:
         chunk_index = checkpoint.get(self.RESUME_CHUNK_INDEX, -1)
         return int(chunk_index if chunk_index is not None else -1)
 
+    def _push_status(self, job_id: str, status: str) -> None:
+        if self._control_plane is not None:
+            self._control_plane.set_status(job_id, status)
+
+    def _flush_progress(self) -> None:
+        if self._progress_writer is not None:
+            self._progress_writer.flush()
+
     def mark_running(self, job_id: str) -> None:
         self._repo.set_job_status(job_id, status='running')
+        self._push_status(job_id, 'running')
 
     def mark_failed(self, job_id: str, error_message: str) -> None:
+        self._flush_progress()
+        self._push_status(job_id, 'failed')
         self._repo.set_job_status(
             job_id,
             status='failed',
@@ -51,6 +78,8 @@ class JobLifecycleManager:
         )
 
     def mark_completed(self, job_id: str) -> None:
+        self._flush_progress()
+        self._push_status(job_id, 'completed')
         self._repo.set_job_status(
             job_id,
             status='completed',
@@ -59,6 +88,7 @@ class JobLifecycleManager:
         )
 
     def request_cancel(self, job_id: str) -> None:
+        self._push_status(job_id, 'canceled')
         self._repo.set_job_status(job_id, status='canceled')
 
     def persist_progress(
@@ -68,7 +98,16 @@ class JobLifecycleManager:
         counters: dict[str, Any] | None,
         *,
         heartbeat: bool = False,
+        buffered: bool = False,
     ) -> None:
+        """Persist progress; ``buffered`` writes may lag by one flush interval."""
+        if self._progress_writer is not None:
+            # Every write goes through the writer so a buffered chunk update can never land
+            # after (and overwrite) a newer synchronous one.
+            self._progress_writer.submit_job_progress(job_id, checkpoint, counters, heartbeat=heartbeat)
+            if not buffered:
+                self._progress_writer.flush()
+            return
         if checkpoint is not None or counters is not None:
             self._repo.update_job(job_id, checkpoint=checkpoint, counters=counters)
         if heartbeat:
@@ -81,6 +120,7 @@ class JobLifecycleManager:
         counters: dict[str, Any] | None = None,
     ) -> None:
         self.persist_progress(job_id, checkpoint, counters)
+        self._push_status(job_id, 'paused')
         self._repo.set_job_status(job_id, status='paused')
 
     def mark_batch_started(
@@ -108,7 +148,7 @@ class JobLifecycleManager:
     ) -> None:
         checkpoint[self.ACTIVE_BATCH_ID] = batch_id
         checkpoint[self.RESUME_CHUNK_INDEX] = chunk_index
-        self.persist_progress(job_id, checkpoint, counters)
+        self.persist_progress(job_id, checkpoint, counters, buffered=True)
 
     def mark_batch_completed(
         self,
@@ -134,6 +174,8 @@ class JobLifecycleManager:
         *,
         reason: str = 'Canceled by user',
     ) -> None:
+        if self._progress_writer is not None:
+            self._progress_writer.discard(job_id)
         indexer.delete_by_job(job_id, kb_id)
         logger.info('Deleted indexed data for canceled job', extra={'job_id': job_id})
         self._repo.set_job_status(
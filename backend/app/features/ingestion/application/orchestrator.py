@@ -6,8 +6,10 @@ See docs/SYSTEM_ARCHITECTURE.md for a pipeline overview.
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from typing import Any
 
+from app.features.ingestion.application.job_control import JobControlPlane
 from app.features.ingestion.application.job_gate import JobGate
 from app.features.ingestion.application.job_lifecycle import JobLifecycleManager
 from app.features.ingestion.application.pipeline_components import create_pipeline_components
@@ -16,6 +18,10 @@ from app.features.ingestion.application.pipeline_coordinator import (
     PipelineRunRequest,
 )
 from app.features.ingestion.application.policies import RetryPolicy, WorkflowDefinition
+from app.features.ingestion.application.progress_writer import (
+    BufferedPhaseRepository,
+    ProgressWriter,
+)
 from app.features.ingestion.application.shutdown_manager import ShutdownManager
 from app.features.ingestion.domain.errors import PhaseNotFoundError, PhaseRepositoryError
 from app.features.ingestion.infrastructure.job_repository import (
@@ -38,6 +44,16 @@ except Exception:  # noqa: BLE001
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class OrchestratorServices:
+    """Process-wide collaborators shared by every orchestrator run."""
+
+    shutdown_manager: ShutdownManager | None = None
+    lifecycle_manager: JobLifecycleManager | None = None
+    control_plane: JobControlPlane | None = None
+    progress_writer: ProgressWriter | None = None
+
+
 class IngestionOrchestrator:
     """
     Sequential orchestrator for ingestion pipeline.
@@ -49,8 +65,7 @@ class IngestionOrchestrator:
         repo: JobRepository | None = None,
         workflow: WorkflowDefinition | None = None,
         retry_policy: RetryPolicy | None = None,
-        shutdown_manager: ShutdownManager | None = None,
-        lifecycle_manager: JobLifecycleManager | None = None,
+        services: OrchestratorServices | None = None,
     ) -> None:
         """
         Initialize orchestrator.
@@ -59,13 +74,19 @@ class IngestionOrchestrator:
             repo: Repository for job persistence
             workflow: Workflow definition (defaults to standard)
             retry_policy: Retry policy (defaults to 3 attempts)
+            services: Shutdown manager, lifecycle manager, in-memory control
+                plane and buffered progress writer shared across runs
         """
+        services = services or OrchestratorServices()
         self.repo = repo or create_job_repository()
         self.phase_repo = create_phase_repository()
+        if services.progress_writer is not None:
+            self.phase_repo = BufferedPhaseRepository(self.phase_repo, services.progress_writer)
         self.workflow = workflow or WorkflowDefinition()
         self.retry_policy = retry_policy or RetryPolicy()
-        self.shutdown_manager = shutdown_manager
-        self.lifecycle = lifecycle_manager or JobLifecycleManager(self.repo)
+        self.shutdown_manager = services.shutdown_manager
+        self.control_plane = services.control_plane
+        self.lifecycle = services.lifecycle_manager or JobLifecycleManager(self.repo)
         self._shutdown_event = asyncio.Event()
         logger.info('IngestionOrchestrator initialized')
 
@@ -150,6 +171,8 @@ class IngestionOrchestrator:
 
         if self.shutdown_manager is not None:
             self._shutdown_event = self.shutdown_manager.register_job(job_id)
+        if self.control_plane is not None:
+            self.control_plane.register_job(job_id)
         try:
             # 1. Load job state
             checkpoint, counters = self._prepare_job_state(job_id)
@@ -163,7 +186,7 @@ class IngestionOrchestrator:
 
             # 3. Process pipeline
             try:
-                job_gate = JobGate(self.repo, self.lifecycle)
+                job_gate = JobGate(self.repo, self.lifecycle, self.control_plane)
                 coordinator = PipelineCoordinator(
                     phase_repo=self.phase_repo,
                     job_gate=job_gate,
@@ -188,6 +211,8 @@ class IngestionOrchestrator:
         finally:
             if self.shutdown_manager is not None:
                 self.shutdown_manager.unregister_job(job_id)
+            if self.control_plane is not None:
+                self.control_plane.unregister_job(job_id)
 
     def _prepare_job_state(self, job_id: str) -> tuple[dict[str, Any], dict[str, int]]:
         """Load and initialize job state."""
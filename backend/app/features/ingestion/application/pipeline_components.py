@@ -4,11 +4,14 @@ from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 
+from app.features.ingestion.application.policies import EmbeddingBatchPolicy
 from app.features.ingestion.domain.chunking.adapter import create_chunker_from_config
 from app.features.ingestion.domain.embedding import Embedder
 from app.features.ingestion.domain.indexing import Indexer
 from app.features.ingestion.domain.loading import fetch_batches
+from app.features.ingestion.domain.sources.crawl_manifest import CrawlManifest
 from app.shared.ai.config import AIConfig
+from app.shared.config.app_settings import get_kb_defaults
 
 
 @dataclass
@@ -17,12 +20,21 @@ class PipelineComponents:
     chunker: Any
     embedder: Embedder
     indexer: Indexer
+    embedding_batch_policy: EmbeddingBatchPolicy
+    manifest: CrawlManifest | None = None
 
 
 def create_pipeline_components(
     kb_id: str, kb_config: dict[str, Any], checkpoint: dict[str, Any]
 ) -> PipelineComponents:
-    loader = fetch_batches(kb_config, checkpoint)
+    indexer = Indexer(
+        kb_id=kb_id,
+        vector_store=kb_config.get('vector_store', get_kb_defaults().vector_store),
+    )
+    manifest = None
+    if _is_incremental(kb_config):
+        manifest = CrawlManifest.load(indexer.crawl_manifest_file)
+    loader = fetch_batches(kb_config, checkpoint, manifest=manifest)
     chunker = create_chunker_from_config(kb_config)
     embedder = Embedder(
         model_name=kb_config.get(
@@ -30,7 +42,23 @@ def create_pipeline_components(
             AIConfig.default().active_embedding_model,
         )
     )
-    indexer = Indexer(kb_id=kb_id)
-    return PipelineComponents(loader=loader, chunker=chunker, embedder=embedder, indexer=indexer)
+    return PipelineComponents(
+        loader=loader,
+        chunker=chunker,
+        embedder=embedder,
+        indexer=indexer,
+        embedding_batch_policy=EmbeddingBatchPolicy.from_kb_config(kb_config),
+        manifest=manifest,
+    )
+
+
+def _is_incremental(kb_config: dict[str, Any]) -> bool:
+    """Crawled website KBs re-ingest incrementally unless ``source_config.incremental`` is false."""
+    source_config = kb_config.get('source_config') or {}
+    return (
+        kb_config.get('source_type') == 'website'
+        and 'start_url' in source_config
+        and source_config.get('incremental', True)
+    )
 
 
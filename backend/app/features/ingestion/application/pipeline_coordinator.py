@@ -19,7 +19,9 @@ from app.features.ingestion.application.stages.embedding_stage import (
 from app.features.ingestion.application.stages.loading_stage import LoadingStage
 from app.features.ingestion.domain.errors import PhaseNotFoundError, PhaseRepositoryError
 from app.features.ingestion.domain.indexing import Indexer
+from app.features.ingestion.domain.sources.crawl_manifest import CrawlManifest
 from app.features.ingestion.infrastructure.phase_repository import PhaseRepository
+from app.features.knowledge.infrastructure import clear_index_cache
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +87,7 @@ class PipelineCoordinator:
                 indexer=request.components.indexer,
                 gate_check=self._job_gate.check,
                 is_shutdown_requested=self._is_shutdown_requested,
+                batch_policy=request.components.embedding_batch_policy,
             ),
         )
 
@@ -131,6 +134,10 @@ class PipelineCoordinator:
             if not pipeline_context.should_continue():
                 return
 
+            if request.components.manifest is not None:
+                await self._commit_crawled_pages(
+                    pipeline_context, request.components.manifest, request.components.indexer
+                )
             await asyncio.to_thread(request.components.indexer.persist)
 
             self._lifecycle.mark_batch_completed(
@@ -147,15 +154,49 @@ class PipelineCoordinator:
             phases_started,
             request.counters,
             request.components.indexer,
+            request.components.manifest,
         )
 
+    async def _commit_crawled_pages(
+        self, context: PipelineContext, manifest: CrawlManifest, indexer: Indexer
+    ) -> None:
+        """Commit re-crawled pages of the batch and delete chunks their new text no longer produces.
+
+        Runs after the batch is embedded. A page with a failed chunk keeps its previous
+        manifest entry and chunks, so the next run fetches it again.
+        """
+        hashes_by_url: dict[str, list[str]] = {}
+        for chunk in context.require_chunks():
+            url = chunk.metadata.get('crawl_url')
+            if url:
+                hashes_by_url.setdefault(url, []).append(chunk.content_hash)
+        failed_urls = {chunk.metadata.get('crawl_url') for chunk in context.failed_chunks()}
+
+        stale: set[str] = set()
+        for doc in context.require_batch():
+            url = doc.metadata.get('crawl_url')
+            if not url:
+                continue
+            if url in failed_urls:
+                manifest.discard_page(url)
+                logger.warning('Keeping previous crawl of page with failed chunks', extra={'job_id': context.job_id, 'url': url})
+            else:
+                stale |= manifest.assign_chunks(url, hashes_by_url.get(url, []))
+        if stale:
+            await asyncio.to_thread(indexer.delete_chunks, context.kb_id, stale)
+
     async def _mark_job_complete(
         self,
         job_id: str,
         phases_started: dict[str, bool],
         counters: dict[str, int],
         indexer: Indexer | None = None,
+        manifest: CrawlManifest | None = None,
     ) -> None:
+        unchanged_pages = 0
+        if manifest is not None:
+            unchanged_pages = await self._release_stale_manifest_chunks(job_id, manifest, indexer)
+
         if indexer:
             try:
                 await asyncio.to_thread(indexer.persist)
@@ -166,7 +207,7 @@ class PipelineCoordinator:
         chunks_seen = int(counters.get('chunks_seen', 0) or 0)
         chunks_processed = int(counters.get('chunks_processed', 0) or 0)
 
-        if docs_seen == 0 and chunks_seen == 0 and chunks_processed == 0:
+        if docs_seen == 0 and chunks_seen == 0 and chunks_processed == 0 and unchanged_pages == 0:
             message = 'No documents were loaded from the configured source.'
             try:
                 self._phase_repo.fail_phase(job_id, 'loading', error_message=message)
@@ -176,6 +217,30 @@ class PipelineCoordinator:
             self._lifecycle.mark_failed(job_id, message)
             return
 
+        self._complete_started_phases(job_id, phases_started)
+
+        if manifest is not None:
+            # Saved only after the index is persisted so a failed run is re-crawled in full
+            await asyncio.to_thread(manifest.save)
+        self._lifecycle.mark_completed(job_id)
+        if indexer:
+            # Drop the stale in-memory index and any query results computed from it.
+            clear_index_cache(kb_id=indexer.kb_id, storage_dir=indexer.storage_dir)
+
+    async def _release_stale_manifest_chunks(
+        self, job_id: str, manifest: CrawlManifest, indexer: Indexer | None
+    ) -> int:
+        """Delete chunks of pages gone since the last crawl; returns the unchanged page count."""
+        removed = manifest.take_stale_hashes()
+        if indexer and removed:
+            await asyncio.to_thread(indexer.delete_chunks, indexer.kb_id, removed)
+        logger.info(
+            'Incremental crawl summary',
+            extra={'job_id': job_id, 'unchanged_pages': manifest.unchanged_count, 'removed_chunks': len(removed)},
+        )
+        return manifest.unchanged_count
+
+    def _complete_started_phases(self, job_id: str, phases_started: dict[str, bool]) -> None:
         for phase_name in ('loading', 'chunking', 'embedding', 'indexing'):
             should_complete = phase_name == 'loading' or bool(phases_started.get(phase_name))
             if should_complete:
@@ -184,5 +249,3 @@ class PipelineCoordinator:
                 except (PhaseNotFoundError, PhaseRepositoryError):
                     logger.warning('Failed to complete phase (non-critical)', extra={'job_id': job_id, 'phase_name': phase_name})
 
-        self._lifecycle.mark_completed(job_id)
-
@@ -28,6 +28,7 @@ class PipelineContext:
         self.results['batch_id'] = batch_id
         self.results['resume_active_batch'] = resume_active_batch
         self.results['resume_chunk_index'] = resume_chunk_index
+        self.results['failed_chunks'] = []
 
     def require_batch(self) -> list[Any]:
         batch = self.results.get('batch')
@@ -44,6 +45,12 @@ class PipelineContext:
             raise TypeError('PipelineContext requires a list of chunks in results["chunks"]')
         return chunks
 
+    def record_failed_chunk(self, chunk: Any) -> None:
+        self.results.setdefault('failed_chunks', []).append(chunk)
+
+    def failed_chunks(self) -> list[Any]:
+        return list(self.results.get('failed_chunks', []))
+
     def get_batch_id(self) -> int:
         batch_id = self.results.get('batch_id', 0)
         return int(batch_id if batch_id is not None else 0)
@@ -2,8 +2,11 @@
 Policy utilities for the ingestion orchestrator.
 """
 
+from dataclasses import dataclass
 from enum import Enum
-from typing import ClassVar
+from typing import Any, ClassVar
+
+from app.shared.config.app_settings import get_kb_defaults
 
 
 class StepName(str, Enum):
@@ -51,3 +54,30 @@ class RetryPolicy:
     def get_backoff_delay(self, attempt: int) -> float:
         delay = float(2**attempt) * self.backoff_multiplier
         return min(delay, 60.0)
+
+
+@dataclass(frozen=True)
+class EmbeddingBatchPolicy:
+    """Micro-batching parameters for the embedding stage.
+
+    A ``micro_batch_size`` of 1 keeps the legacy one-request-per-chunk path.
+    """
+
+    micro_batch_size: int = 1
+    max_in_flight: int = 1
+
+    @property
+    def enabled(self) -> bool:
+        return self.micro_batch_size > 1
+
+    @property
+    def window_size(self) -> int:
+        """Number of chunks handled between two gate checks / checkpoints."""
+        return self.micro_batch_size * self.max_in_flight
+
+    @classmethod
+    def from_kb_config(cls, kb_config: dict[str, Any]) -> 'EmbeddingBatchPolicy':
+        kb_defaults = get_kb_defaults()
+        micro_batch_size = int(kb_config.get('embedding_batch_size', kb_defaults.embedding_batch_size))
+        max_in_flight = int(kb_config.get('embedding_concurrency', kb_defaults.embedding_concurrency))
+        return cls(micro_batch_size=max(1, micro_batch_size), max_in_flight=max(1, max_in_flight))
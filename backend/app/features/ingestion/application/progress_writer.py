@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from app.features.ingestion.application.phase_tracking import update_progress_noncritical
+from app.features.ingestion.infrastructure.job_repository import JobRepository
+from app.features.ingestion.infrastructure.phase_repository import PhaseRepository
+from app.shared.config.app_settings import get_app_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingJobProgress:
+    checkpoint: dict[str, Any] | None = None
+    counters: dict[str, Any] | None = None
+    heartbeat: bool = False
+
+
+class ProgressWriter:
+    """Coalesces ingestion progress writes and flushes them from a background thread.
+
+    Only the latest checkpoint/counters per job and the latest progress per phase
+    are kept, so a flush costs one row update per job and phase regardless of how
+    many chunks were recorded since the previous one. Writes happen every
+    ``flush_interval`` seconds, after ``flush_every`` buffered updates, or
+    synchronously via ``flush()``.
+    """
+
+    def __init__(
+        self,
+        repo: JobRepository,
+        phase_repo: PhaseRepository,
+        *,
+        flush_interval: float | None = None,
+        flush_every: int | None = None,
+    ) -> None:
+        if flush_interval is None:
+            flush_interval = get_app_settings().ingestion_progress_flush_interval
+        if flush_every is None:
+            flush_every = get_app_settings().ingestion_progress_flush_every
+        self._repo = repo
+        self._phase_repo = phase_repo
+        self._flush_interval = flush_interval
+        self._flush_every = max(1, flush_every)
+        self._cond = threading.Condition()
+        self._jobs: dict[str, _PendingJobProgress] = {}
+        self._phases: dict[tuple[str, str], dict[str, Any]] = {}
+        self._submitted = 0
+        self._written = 0
+        self._flush_requested = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def submit_job_progress(
+        self,
+        job_id: str,
+        checkpoint: dict[str, Any] | None,
+        counters: dict[str, Any] | None,
+        *,
+        heartbeat: bool = False,
+    ) -> None:
+        with self._cond:
+            pending = self._jobs.setdefault(job_id, _PendingJobProgress())
+            if checkpoint is not None:
+                pending.checkpoint = copy.deepcopy(checkpoint)
+            if counters is not None:
+                pending.counters = dict(counters)
+            pending.heartbeat = pending.heartbeat or heartbeat
+            self._enqueued()
+
+    def submit_phase_progress(self, job_id: str, phase_name: str, **kwargs: Any) -> None:
+        with self._cond:
+            self._phases.setdefault((job_id, phase_name), {}).update(kwargs)
+            self._enqueued()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Write everything submitted so far; returns False if ``timeout`` expired."""
+        with self._cond:
+            target = self._submitted
+            if self._written >= target:
+                return True
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._written >= target, timeout)
+
+    def discard(self, job_id: str) -> None:
+        """Drop buffered progress for ``job_id`` and wait for any in-flight write."""
+        with self._cond:
+            self._jobs.pop(job_id, None)
+            for key in [key for key in self._phases if key[0] == job_id]:
+                del self._phases[key]
+        self.flush()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _enqueued(self) -> None:
+        self._submitted += 1
+        if self._thread is None or not self._thread.is_alive():
+            self._closed = False
+            self._thread = threading.Thread(
+                target=self._run, name='ingestion-progress-writer', daemon=True
+            )
+            self._thread.start()
+        pending = self._submitted - self._written
+        # Wake the writer when it goes from idle to pending (starts the interval) or hits the count
+        if pending == 1 or pending >= self._flush_every:
+            self._cond.notify_all()
+
+    def _should_flush(self) -> bool:
+        return (
+            self._closed
+            or self._flush_requested
+            or self._submitted - self._written >= self._flush_every
+        )
+
+    def _wait_for_flush(self) -> None:
+        deadline: float | None = None
+        while not self._should_flush():
+            if self._submitted == self._written:
+                deadline = None
+                self._cond.wait()
+                continue
+            if deadline is None:
+                deadline = time.monotonic() + self._flush_interval
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._cond.wait(remaining)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._wait_for_flush()
+                jobs, self._jobs = self._jobs, {}
+                phases, self._phases = self._phases, {}
+                target = self._submitted
+                self._flush_requested = False
+                closing = self._closed
+
+            self._write(jobs, phases)
+
+            with self._cond:
+                self._written = max(self._written, target)
+                self._cond.notify_all()
+            if closing:
+                return
+
+    def _write(
+        self,
+        jobs: dict[str, _PendingJobProgress],
+        phases: dict[tuple[str, str], dict[str, Any]],
+    ) -> None:
+        for job_id, pending in jobs.items():
+            try:
+                if pending.checkpoint is not None or pending.counters is not None:
+                    self._repo.update_job(
+                        job_id, checkpoint=pending.checkpoint, counters=pending.counters
+                    )
+                if pending.heartbeat:
+                    self._repo.update_heartbeat(job_id)
+            except Exception:
+                logger.error('Failed to flush job progress', extra={'job_id': job_id}, exc_info=True)
+        for (job_id, phase_name), kwargs in phases.items():
+            update_progress_noncritical(self._phase_repo, job_id, phase_name, **kwargs)
+
+
+class BufferedPhaseRepository:
+    """Phase repository view whose progress updates go through a ``ProgressWriter``.
+
+    Phase transitions flush buffered progress first so a late progress write can
+    never overwrite a completed or failed phase.
+    """
+
+    def __init__(self, phase_repo: PhaseRepository, writer: ProgressWriter) -> None:
+        self._phase_repo = phase_repo
+        self._writer = writer
+
+    def update_progress(self, job_id: str, phase_name: str, **kwargs: Any) -> None:
+        self._writer.submit_phase_progress(job_id, phase_name, **kwargs)
+
+    def start_phase(self, job_id: str, phase_name: str) -> None:
+        self._writer.flush()
+        self._phase_repo.start_phase(job_id, phase_name)
+
+    def complete_phase(self, job_id: str, phase_name: str) -> None:
+        self._writer.flush()
+        self._phase_repo.complete_phase(job_id, phase_name)
+
+    def fail_phase(self, job_id: str, phase_name: str, error_message: str) -> None:
+        self._writer.flush()
+        self._phase_repo.fail_phase(job_id, phase_name, error_message=error_message)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._phase_repo, name)
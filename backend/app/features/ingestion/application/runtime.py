@@ -10,15 +10,19 @@ from typing import Any
 
 from fastapi import HTTPException
 
+from app.features.ingestion.application.job_control import JobControlPlane
 from app.features.ingestion.application.job_lifecycle import JobLifecycleManager
 from app.features.ingestion.application.orchestrator import (
     IngestionOrchestrator,
+    OrchestratorServices,
     RetryPolicy,
     WorkflowDefinition,
 )
+from app.features.ingestion.application.progress_writer import ProgressWriter
 from app.features.ingestion.application.shutdown_manager import ShutdownManager
 from app.features.ingestion.domain.indexing.indexer import Indexer
 from app.features.ingestion.infrastructure import create_job_repository
+from app.features.ingestion.infrastructure.phase_repository import create_phase_repository
 from app.features.knowledge.infrastructure import KBManager
 from app.shared.config.app_settings import get_app_settings
 
@@ -30,7 +34,13 @@ class IngestionRuntimeService:
 
     def __init__(self, *, repo: Any | None = None) -> None:
         self.repo = repo if repo is not None else create_job_repository()
-        self._lifecycle = JobLifecycleManager(self.repo)
+        self.control_plane = JobControlPlane()
+        self.progress_writer = ProgressWriter(self.repo, create_phase_repository())
+        self._lifecycle = JobLifecycleManager(
+            self.repo,
+            progress_writer=self.progress_writer,
+            control_plane=self.control_plane,
+        )
         self.shutdown_manager = ShutdownManager()
         self._running_tasks: dict[str, asyncio.Task[Any]] = {}
 
@@ -41,8 +51,12 @@ class IngestionRuntimeService:
             repo=self.repo,
             workflow=WorkflowDefinition(),
             retry_policy=RetryPolicy(max_attempts=3),
-            shutdown_manager=self.shutdown_manager,
-            lifecycle_manager=self._lifecycle,
+            services=OrchestratorServices(
+                shutdown_manager=self.shutdown_manager,
+                lifecycle_manager=self._lifecycle,
+                control_plane=self.control_plane,
+                progress_writer=self.progress_writer,
+            ),
         )
         try:
             await orchestrator.run(job_id, kb_id, kb_config)
@@ -160,14 +174,21 @@ class IngestionRuntimeService:
         if not job_id:
             raise HTTPException(status_code=404, detail=f"No job found for KB '{kb_id}'")
 
+        # Pushes the cancel into the running job's in-memory status; its next gate
+        # check stops the pipeline without waiting for a database poll.
         self._lifecycle.request_cancel(job_id)
 
         try:
             task = self._running_tasks.get(job_id)
             if task and not task.done():
-                task.cancel()
                 with suppress(asyncio.CancelledError, asyncio.TimeoutError):
-                    await asyncio.wait_for(task, timeout=get_app_settings().ingestion_cancel_timeout)
+                    await asyncio.wait_for(
+                        asyncio.shield(task), timeout=get_app_settings().ingestion_cancel_timeout
+                    )
+                if not task.done():
+                    task.cancel()
+                    with suppress(asyncio.CancelledError, asyncio.TimeoutError):
+                        await asyncio.wait_for(task, timeout=get_app_settings().ingestion_stop_timeout)
 
             indexer = Indexer(kb_id=kb_id)
             self._lifecycle.cleanup_canceled_job(job_id, kb_id, indexer)
@@ -214,5 +235,6 @@ class IngestionRuntimeService:
                 if task in done:
                     self._running_tasks.pop(job_id, None)
 
+        await asyncio.to_thread(self.progress_writer.flush)
         logger.warning("cleanup_running_tasks COMPLETE")
 
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 from app.features.ingestion.application.chunk_processor import ChunkProcessor
 from app.features.ingestion.application.job_lifecycle import JobLifecycleManager
@@ -11,7 +12,11 @@ from app.features.ingestion.application.phase_tracking import (
     update_progress_noncritical,
 )
 from app.features.ingestion.application.pipeline_stage import PipelineContext, PipelineStage
-from app.features.ingestion.application.policies import RetryPolicy, StepName
+from app.features.ingestion.application.policies import (
+    EmbeddingBatchPolicy,
+    RetryPolicy,
+    StepName,
+)
 from app.features.ingestion.application.tasks import ProcessingTask
 from app.features.ingestion.domain.embedding import Embedder
 from app.features.ingestion.domain.indexing import Indexer
@@ -27,6 +32,7 @@ class EmbeddingProcessingDeps:
     indexer: Indexer
     gate_check: Callable[[str, str, Indexer], Awaitable[bool]]
     is_shutdown_requested: Callable[[], bool]
+    batch_policy: EmbeddingBatchPolicy = field(default_factory=EmbeddingBatchPolicy)
 
 
 class EmbeddingIndexingStage(PipelineStage):
@@ -46,6 +52,7 @@ class EmbeddingIndexingStage(PipelineStage):
         self._indexer = processing_deps.indexer
         self._gate_check = processing_deps.gate_check
         self._is_shutdown_requested = processing_deps.is_shutdown_requested
+        self._batch_policy = processing_deps.batch_policy
 
     def get_stage_name(self) -> str:
         return 'embedding_indexing'
@@ -61,6 +68,10 @@ class EmbeddingIndexingStage(PipelineStage):
             start_phase_noncritical(self._phase_repo, context.job_id, 'indexing')
             phases_started['indexing'] = True
 
+        if self._batch_policy.enabled:
+            await self._execute_batched(context, chunks)
+            return
+
         batch_id = context.get_batch_id()
         resume_chunk_index = context.get_resume_chunk_index()
 
@@ -89,33 +100,68 @@ class EmbeddingIndexingStage(PipelineStage):
 
             result = await self._chunk_processor.process_chunk(task, chunk)
 
-            if result['skipped']:
-                context.counters['chunks_skipped'] = int(context.counters.get('chunks_skipped', 0)) + 1
-            elif result['success']:
-                context.counters['chunks_processed'] = int(context.counters.get('chunks_processed', 0)) + 1
-            else:
-                context.counters['chunks_error'] = int(context.counters.get('chunks_error', 0)) + 1
-                logger.error('Chunk processing failed', extra={'error': result.get('error')})
-
-            update_progress_noncritical(
-                self._phase_repo,
-                context.job_id,
-                'embedding',
-                items_processed=context.counters['chunks_processed'],
-            )
-            update_progress_noncritical(
-                self._phase_repo,
-                context.job_id,
-                'indexing',
-                items_processed=context.counters['chunks_processed'],
-            )
-            self._lifecycle.record_chunk_progress(
-                context.job_id,
-                context.checkpoint,
-                context.counters,
-                batch_id=batch_id,
-                chunk_index=chunk_idx,
-            )
+            self._count_result(context, chunk, result)
+            self._record_progress(context, batch_id=batch_id, chunk_index=chunk_idx)
+
+        context.mark_should_continue(True)
+
+    async def _execute_batched(self, context: PipelineContext, chunks: list[Any]) -> None:
+        """Process chunks in windows of concurrent embedding micro-batches.
+
+        Gate checks and checkpoints happen once per window; chunks already
+        indexed before a crash inside a window are skipped by the indexer on resume.
+        """
+        batch_id = context.get_batch_id()
+        window_size = self._batch_policy.window_size
+
+        for window_start in range(context.get_resume_chunk_index() + 1, len(chunks), window_size):
+            if self._is_shutdown_requested():
+                self._lifecycle.pause(context.job_id, context.checkpoint, context.counters)
+                context.mark_should_continue(False)
+                return
+
+            if not await self._gate_check(context.job_id, context.kb_id, self._indexer):
+                self._lifecycle.persist_progress(context.job_id, context.checkpoint, context.counters)
+                context.mark_should_continue(False)
+                return
+
+            window = chunks[window_start : window_start + window_size]
+            results = await self._chunk_processor.process_chunks(context.kb_id, window, self._batch_policy)
+            for chunk, result in zip(window, results, strict=True):
+                self._count_result(context, chunk, result)
+
+            self._record_progress(context, batch_id=batch_id, chunk_index=window_start + len(window) - 1)
 
         context.mark_should_continue(True)
 
+    def _count_result(self, context: PipelineContext, chunk: Any, result: dict[str, Any]) -> None:
+        if result['skipped']:
+            context.counters['chunks_skipped'] = int(context.counters.get('chunks_skipped', 0)) + 1
+        elif result['success']:
+            context.counters['chunks_processed'] = int(context.counters.get('chunks_processed', 0)) + 1
+        else:
+            context.counters['chunks_error'] = int(context.counters.get('chunks_error', 0)) + 1
+            context.record_failed_chunk(chunk)
+            logger.error('Chunk processing failed', extra={'error': result.get('error')})
+
+    def _record_progress(self, context: PipelineContext, *, batch_id: int, chunk_index: int) -> None:
+        update_progress_noncritical(
+            self._phase_repo,
+            context.job_id,
+            'embedding',
+            items_processed=context.counters['chunks_processed'],
+        )
+        update_progress_noncritical(
+            self._phase_repo,
+            context.job_id,
+            'indexing',
+            items_processed=context.counters['chunks_processed'],
+        )
+        self._lifecycle.record_chunk_progress(
+            context.job_id,
+            context.checkpoint,
+            context.counters,
+            batch_id=batch_id,
+            chunk_index=chunk_index,
+        )
+
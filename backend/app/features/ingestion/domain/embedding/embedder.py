@@ -91,4 +91,51 @@ class Embedder:
             logger.error(f'✗ Embedding provider error for chunk {chunk.content_hash[:8]}: {e}')
             raise RuntimeError(f'Embedding generation failed: {e}') from e
 
+    async def embed_batch(self, chunks: list[Chunk]) -> list[EmbeddingResult]:
+        """
+        Generate embeddings for several chunks in a single provider request.
+
+        Args:
+            chunks: Chunks to embed (sent as one request, in order)
+
+        Returns:
+            EmbeddingResults aligned with the input chunks
+
+        Raises:
+            ValueError: If any chunk text is empty
+            RuntimeError: If embedding generation fails or returns a short response
+        """
+        if not chunks:
+            return []
+        if any(not chunk.text or not chunk.text.strip() for chunk in chunks):
+            raise ValueError('Cannot embed empty chunk text')
+
+        try:
+            logger.info(
+                f'→ Calling embedding provider: model={self.model_name}, batch={len(chunks)} chunks'
+            )
+
+            vectors = await self.ai_service.embed_batch(
+                [chunk.text for chunk in chunks], batch_size=len(chunks)
+            )
 
+            if len(vectors) != len(chunks) or any(not vector for vector in vectors):
+                raise RuntimeError(
+                    f'Embedding batch returned {len(vectors)} vectors for {len(chunks)} chunks'
+                )
+
+            logger.info(f'✓ Embedding batch response: {len(vectors)} vectors')
+
+            return [
+                EmbeddingResult(
+                    vector=vector,
+                    content_hash=chunk.content_hash,
+                    text=chunk.text,
+                    metadata=chunk.metadata,
+                )
+                for chunk, vector in zip(chunks, vectors, strict=True)
+            ]
+
+        except Exception as e:
+            logger.error(f'✗ Embedding provider error for batch of {len(chunks)} chunks: {e}')
+            raise RuntimeError(f'Embedding generation failed: {e}') from e
@@ -3,6 +3,7 @@ Indexing Domain
 Vector store indexing with idempotency and cleanup.
 """
 
+from .checkpoint_store import HashCheckpointStore
 from .indexer import Indexer
 
-__all__ = ['Indexer']
+__all__ = ['HashCheckpointStore', 'Indexer']
@@ -0,0 +1,146 @@
+"""
+Checkpoint Store
+Append-only log of indexed content hashes used for crash recovery.
+"""
+
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Compact once the log holds this many redundant lines beyond the live hash count.
+COMPACTION_SLACK_LINES = 10_000
+
+
+class HashCheckpointStore:
+    """
+    Append-only content-hash checkpoint.
+
+    Hashes are staged in memory by ``stage`` and written to the log (and fsynced)
+    by ``commit``, which the indexer calls right after the vector store has been
+    persisted. The log therefore never references a chunk that is missing from
+    the on-disk docstore, and each commit writes only the new hashes.
+    """
+
+    def __init__(self, log_path: str, legacy_json_path: str | None = None):
+        """
+        Initialize checkpoint store.
+
+        Args:
+            log_path: Path of the newline-delimited hash log
+            legacy_json_path: Previous ``checkpoint.json`` snapshot, migrated on load
+        """
+        self.log_path = log_path
+        self.legacy_json_path = legacy_json_path
+        self._pending: list[str] = []
+        self._line_count = 0
+        self._live_count = 0
+
+    def load(self) -> set[str]:
+        """Read committed hashes, migrating a legacy JSON snapshot if present."""
+        hashes: set[str] = set()
+        self._line_count = 0
+
+        if os.path.exists(self.log_path):
+            try:
+                complete_bytes = 0
+                torn_tail = False
+                with open(self.log_path, 'rb') as f:
+                    for line in f:
+                        # A line without newline is a torn write from a crash mid-append.
+                        if not line.endswith(b'\n'):
+                            torn_tail = True
+                            break
+                        complete_bytes += len(line)
+                        content_hash = line.decode('utf-8').strip()
+                        if content_hash:
+                            hashes.add(content_hash)
+                            self._line_count += 1
+                if torn_tail:
+                    # Drop the fragment so the next append starts on a fresh line.
+                    os.truncate(self.log_path, complete_bytes)
+                    logger.warning('Truncated torn tail of checkpoint log')
+            except (OSError, UnicodeDecodeError) as exc:
+                logger.warning(f'Failed to load checkpoint log: {exc}')
+                hashes = set()
+                self._line_count = 0
+
+        legacy_hashes = self._load_legacy_json()
+        self._live_count = len(hashes | legacy_hashes)
+        if legacy_hashes or self._needs_compaction():
+            hashes |= legacy_hashes
+            self.compact(hashes)
+
+        return hashes
+
+    def _load_legacy_json(self) -> set[str]:
+        if not self.legacy_json_path or not os.path.exists(self.legacy_json_path):
+            return set()
+        try:
+            with open(self.legacy_json_path, encoding='utf-8') as f:
+                data = json.load(f)
+            legacy_hashes = set(data.get('indexed_hashes', []))
+            logger.info(f'Migrating legacy checkpoint with {len(legacy_hashes)} hashes')
+            return legacy_hashes
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning(f'Failed to load legacy checkpoint file: {exc}')
+            return set()
+
+    def _needs_compaction(self) -> bool:
+        return self._line_count - self._live_count > COMPACTION_SLACK_LINES
+
+    def stage(self, content_hash: str) -> None:
+        """Queue a hash for the next commit."""
+        self._pending.append(content_hash)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def commit(self) -> None:
+        """Append staged hashes to the log and fsync them."""
+        if not self._pending:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(f'{content_hash}\n' for content_hash in self._pending))
+                f.flush()
+                os.fsync(f.fileno())
+            self._line_count += len(self._pending)
+            self._live_count += len(set(self._pending))
+            self._pending.clear()
+        except OSError as exc:
+            logger.error(f'Failed to append checkpoint log: {exc}')
+
+    def compact(self, hashes: set[str]) -> None:
+        """Atomically rewrite the log with exactly ``hashes`` and drop the legacy snapshot."""
+        tmp_path = f'{self.log_path}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(''.join(f'{content_hash}\n' for content_hash in sorted(hashes)))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.log_path)
+            self._line_count = len(hashes)
+            self._live_count = len(hashes)
+            if self.legacy_json_path and os.path.exists(self.legacy_json_path):
+                os.remove(self.legacy_json_path)
+            logger.info(f'Compacted checkpoint log to {len(hashes)} hashes')
+        except OSError as exc:
+            logger.error(f'Failed to compact checkpoint log: {exc}')
+
+    def clear(self) -> None:
+        """Delete the log, the legacy snapshot and any staged hashes."""
+        self._pending.clear()
+        self._line_count = 0
+        self._live_count = 0
+        for path in (self.log_path, self.legacy_json_path):
+            if path and os.path.exists(path):
+                try:
+                    os.remove(path)
+                    logger.info(f'Deleted checkpoint file: {path}')
+                except OSError as exc:
+                    logger.warning(f'Failed to delete checkpoint file: {exc}')
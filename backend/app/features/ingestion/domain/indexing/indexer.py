@@ -3,7 +3,6 @@ Indexer
 Vector store indexing with idempotency checks and cleanup support.
 """
 
-import json
 import logging
 import os
 import shutil
@@ -15,9 +14,12 @@ from llama_index.core import (
     VectorStoreIndex,
     load_index_from_storage,
 )
+from llama_index.core.schema import TextNode
 
 from app.features.ingestion.domain.embedding.embedder import EmbeddingResult
+from app.features.ingestion.domain.indexing.checkpoint_store import HashCheckpointStore
 from app.shared.config.app_settings import get_kb_storage_root
+from app.shared.vector_store import VECTOR_STORE_MMAP, VECTOR_STORE_SIMPLE, MmapVectorStore
 
 logger = logging.getLogger(__name__)
 
@@ -25,28 +27,43 @@ logger = logging.getLogger(__name__)
 class Indexer:
     """
     Indexes embeddings to vector store with idempotency and cleanup.
-    Uses LlamaIndex VectorStoreIndex with disk persistence.
+    Uses LlamaIndex VectorStoreIndex with disk persistence, or an MmapVectorStore
+    when the KB is configured with ``vector_store='mmap'``.
     """
 
-    def __init__(self, kb_id: str, storage_base_dir: str | None = None):
+    def __init__(
+        self,
+        kb_id: str,
+        storage_base_dir: str | None = None,
+        vector_store: str = VECTOR_STORE_SIMPLE,
+    ):
         """
         Initialize indexer.
 
         Args:
             kb_id: Knowledge base identifier
             storage_base_dir: Base directory for knowledge bases storage (default: backend/data/knowledge_bases)
+            vector_store: Vector store backend ('simple' or 'mmap')
         """
         self.kb_id = kb_id
+        self.vector_store = vector_store
 
         # Single source of truth: respect KNOWLEDGE_BASES_ROOT (resolved relative to backend root).
         if storage_base_dir is None:
             storage_base_dir = str(get_kb_storage_root())
 
         self.storage_dir = os.path.join(storage_base_dir, kb_id, 'index')
-        self.checkpoint_file = os.path.join(storage_base_dir, kb_id, 'checkpoint.json')
+        self.checkpoint_file = os.path.join(storage_base_dir, kb_id, 'checkpoint.log')
+        self.crawl_manifest_file = os.path.join(storage_base_dir, kb_id, 'crawl_manifest.json')
+        self._checkpoint = HashCheckpointStore(
+            self.checkpoint_file,
+            legacy_json_path=os.path.join(storage_base_dir, kb_id, 'checkpoint.json'),
+        )
         self._index: VectorStoreIndex | None = None
+        self._mmap_store: MmapVectorStore | None = None
         self._indexed_hashes: set[str] = set()  # In-memory cache of indexed content_hashes
         self._pending_persist = False  # Track if index has unpersisted changes
+        self._hashes_removed = False  # Checkpoint log must be compacted on next persist
 
         # Load checkpoint for crash recovery
         self._load_checkpoint()
@@ -54,25 +71,15 @@ class Indexer:
         logger.info(f'Indexer initialized: kb_id={kb_id}, storage={self.storage_dir}, checkpoint_hashes={len(self._indexed_hashes)}')
 
     def _load_checkpoint(self) -> None:
-        """Load checkpoint file to recover processed content hashes after crash."""
-        if os.path.exists(self.checkpoint_file):
-            try:
-                with open(self.checkpoint_file, encoding='utf-8') as f:
-                    data = json.load(f)
-                    self._indexed_hashes = set(data.get('indexed_hashes', []))
-                    logger.info(f'Loaded checkpoint with {len(self._indexed_hashes)} processed hashes')
-            except (OSError, json.JSONDecodeError) as exc:
-                logger.warning(f'Failed to load checkpoint file: {exc}')
-                self._indexed_hashes = set()
-
-    def _save_checkpoint(self) -> None:
-        """Save checkpoint file immediately after indexing (lightweight operation)."""
-        try:
-            os.makedirs(os.path.dirname(self.checkpoint_file), exist_ok=True)
-            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump({'indexed_hashes': list(self._indexed_hashes)}, f)
-        except (OSError, TypeError) as exc:
-            logger.error(f'Failed to save checkpoint: {exc}')
+        """Load checkpoint log to recover processed content hashes after crash."""
+        self._indexed_hashes = self._checkpoint.load()
+        if self._indexed_hashes:
+            logger.info(f'Loaded checkpoint with {len(self._indexed_hashes)} processed hashes')
+
+    def _get_mmap_store(self) -> MmapVectorStore:
+        if self._mmap_store is None:
+            self._mmap_store = MmapVectorStore(persist_dir=self.storage_dir)
+        return self._mmap_store
 
     def _load_index(self) -> VectorStoreIndex | None:
         """Load existing index from storage if available."""
@@ -120,6 +127,9 @@ class Indexer:
         if content_hash in self._indexed_hashes:
             return True
 
+        if self.vector_store == VECTOR_STORE_MMAP:
+            return self._get_mmap_store().contains(content_hash)
+
         # Load index to populate cache if not loaded
         index = self._load_index()
         if index:
@@ -145,6 +155,22 @@ class Indexer:
         if not embedding_result.vector:
             raise ValueError('Embedding result has no vector')
 
+        if self.vector_store == VECTOR_STORE_MMAP:
+            self._get_mmap_store().add(
+                [
+                    TextNode(
+                        id_=embedding_result.content_hash,
+                        text=embedding_result.text,
+                        metadata=embedding_result.metadata,
+                        embedding=embedding_result.vector,
+                    )
+                ]
+            )
+            self._indexed_hashes.add(embedding_result.content_hash)
+            self._checkpoint.stage(embedding_result.content_hash)
+            self._pending_persist = True
+            return
+
         # Create LlamaIndex Document with embedding
         doc = Document(
             text=embedding_result.text,  # Store original chunk text
@@ -164,24 +190,70 @@ class Indexer:
             # Persist immediately on first chunk to create valid index files
             # This prevents repeated index recreation on subsequent chunks
             index.storage_context.persist(persist_dir=self.storage_dir)
+            self._indexed_hashes.add(embedding_result.content_hash)
+            self._checkpoint.stage(embedding_result.content_hash)
+            self._checkpoint.commit()
             logger.info(f'Created new index for KB {kb_id} and persisted initial state')
-        else:
-            # Insert into existing index
-            index.insert(doc)
+            return
 
-        # Update cache and checkpoint (lightweight write for crash recovery)
+        # Insert into existing index
+        index.insert(doc)
+
+        # Stage the hash; it is written to the checkpoint log once persist() succeeds
         self._indexed_hashes.add(embedding_result.content_hash)
+        self._checkpoint.stage(embedding_result.content_hash)
         self._pending_persist = True
-        self._save_checkpoint()
 
         logger.debug(f'Indexed chunk {embedding_result.content_hash[:8]}')
 
+    def delete_chunks(self, kb_id: str, content_hashes: set[str]) -> int:
+        """
+        Remove chunks by content hash (pages that changed or disappeared).
+
+        Deletions become durable on the next ``persist``. Returns how many of the
+        hashes were known to this index.
+        """
+        if kb_id != self.kb_id:
+            raise ValueError(f'KB ID mismatch: expected {self.kb_id}, got {kb_id}')
+        if not content_hashes:
+            return 0
+
+        if self.vector_store == VECTOR_STORE_MMAP:
+            self._get_mmap_store().delete_nodes(node_ids=sorted(content_hashes))
+        else:
+            index = self._load_index()
+            if index is not None:
+                for content_hash in content_hashes:
+                    if content_hash in self._indexed_hashes:
+                        index.delete_ref_doc(content_hash, delete_from_docstore=True)
+
+        removed = len(content_hashes & self._indexed_hashes)
+        self._indexed_hashes -= content_hashes
+        self._hashes_removed = True
+        self._pending_persist = True
+        logger.info(f'Deleted {removed} stale chunks from KB {kb_id}')
+        return removed
+
+    def _commit_checkpoint(self) -> None:
+        self._checkpoint.commit()
+        if self._hashes_removed:
+            self._checkpoint.compact(self._indexed_hashes)
+            self._hashes_removed = False
+
     def persist(self) -> None:
         """Persist index to disk (call after batch processing to avoid per-chunk overhead)."""
+        if self._mmap_store is not None and self._pending_persist:
+            self._mmap_store.persist()
+            self._pending_persist = False
+            self._commit_checkpoint()
+            logger.info(f'Persisted vector store with {self._mmap_store.node_count} total chunks')
+            return
+
         if self._index and self._pending_persist:
             try:
                 self._index.storage_context.persist(persist_dir=self.storage_dir)
                 self._pending_persist = False
+                self._commit_checkpoint()
                 logger.info(f'Persisted index with {len(self._indexed_hashes)} total chunks')
             except Exception as e:
                 logger.error(f'Failed to persist index: {e}')
@@ -206,6 +278,10 @@ class Indexer:
         logger.info(f'  storage_dir: {self.storage_dir}')
         logger.info(f'  checkpoint_file: {self.checkpoint_file}')
 
+        if self._mmap_store is not None:
+            self._mmap_store.close()
+            self._mmap_store = None
+
         # Delete index directory
         if os.path.exists(self.storage_dir):
             try:
@@ -230,17 +306,18 @@ class Indexer:
         else:
             logger.warning(f'Documents directory does not exist, nothing to delete: {documents_dir}')
 
-        # Delete checkpoint file
-        if os.path.exists(self.checkpoint_file):
-            try:
-                os.remove(self.checkpoint_file)
-                logger.info(f'Deleted checkpoint file: {self.checkpoint_file}')
-            except OSError as exc:
-                logger.warning(f'Failed to delete checkpoint file: {exc}')
+        # Delete checkpoint log (and any legacy JSON snapshot)
+        self._checkpoint.clear()
+
+        # Without an index, the crawl manifest would make the next run skip every page
+        if os.path.exists(self.crawl_manifest_file):
+            os.remove(self.crawl_manifest_file)
+            logger.info(f'Deleted crawl manifest: {self.crawl_manifest_file}')
 
         # Clear in-memory state
         self._index = None
         self._indexed_hashes.clear()
         self._pending_persist = False
+        self._hashes_removed = False
         logger.info(f'Cleared in-memory state for KB {kb_id}')
 
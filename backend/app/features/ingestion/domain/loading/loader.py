@@ -10,6 +10,7 @@ from typing import Any
 
 from llama_index.core import Document
 
+from app.features.ingestion.domain.sources.crawl_manifest import CrawlManifest
 from app.features.ingestion.domain.sources.factory import SourceHandlerFactory
 
 logger = logging.getLogger(__name__)
@@ -40,6 +41,7 @@ def fetch_batches(
     kb_config: dict[str, Any],
     checkpoint: dict[str, Any] | None = None,
     batch_size: int = 10,
+    manifest: CrawlManifest | None = None,
 ) -> Generator[list[Document], None, None]:
     """
     Fetch document batches from configured source with checkpoint support.
@@ -48,6 +50,7 @@ def fetch_batches(
         kb_config: Knowledge base configuration with 'source_type' and 'source_config'
         checkpoint: Optional checkpoint dict with 'last_batch_id' and 'cursor'
         batch_size: Number of documents per batch
+        manifest: Crawl manifest enabling incremental re-ingestion for sources that support it
 
     Yields:
         Lists of LlamaIndex Documents
@@ -70,6 +73,7 @@ def fetch_batches(
         job=None,
         state=None,
     )
+    handler.manifest = manifest
 
     try:
         result = handler.ingest(source_config)
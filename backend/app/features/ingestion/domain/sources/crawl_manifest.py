@@ -0,0 +1,217 @@
+"""
+Crawl Manifest
+Per-URL record of the last successful crawl of a KB, used for incremental re-ingestion.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestEntry:
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+    chunk_hashes: list[str] = field(default_factory=list)
+    links: list[str] = field(default_factory=list)
+    lastmod: str | None = None
+
+
+def _parse_lastmod(value: str | None) -> datetime | None:
+    """Parse a sitemap W3C datetime (``2024-05-01`` or ``2024-05-01T10:00:00Z``)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class CrawlManifest:
+    """
+    HTTP validators, page hash, outgoing links and chunk hashes per crawled URL.
+
+    The crawler uses it to send conditional requests and to drop pages whose
+    extracted text did not change; the pipeline uses it to find chunks of pages
+    that changed or disappeared. A changed page is only staged by ``record_page``
+    and replaces the stored entry once its chunks are indexed (``assign_chunks``);
+    ``discard_page`` drops the staged entry of a page whose chunks failed. The
+    manifest is saved only when a job completes, so a crashed or canceled run
+    never marks pages as ingested.
+    """
+
+    def __init__(self, path: str, entries: dict[str, ManifestEntry] | None = None) -> None:
+        self.path = path
+        self._entries = entries or {}
+        self._seen: set[str] = set()
+        self._pending: dict[str, ManifestEntry] = {}
+        self._unchanged: set[str] = set()
+        self._stale_hashes: set[str] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> 'CrawlManifest':
+        """Load the manifest at ``path``; a missing or unreadable file starts empty."""
+        if not os.path.exists(path):
+            return cls(path)
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            entries = {url: ManifestEntry(**entry) for url, entry in data.get('pages', {}).items()}
+            logger.info(f'Loaded crawl manifest with {len(entries)} pages')
+            return cls(path, entries)
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning(f'Ignoring unreadable crawl manifest {path}: {exc}')
+            return cls(path)
+
+    @staticmethod
+    def page_hash(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    @property
+    def unchanged_count(self) -> int:
+        return len(self._unchanged)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """``If-None-Match``/``If-Modified-Since`` headers for the stored validators."""
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None or not entry.content_hash:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def is_unchanged(self, url: str, content_hash: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(url)
+            return entry is not None and entry.content_hash == content_hash
+
+    def is_fresh(self, url: str, lastmod: str | None) -> bool:
+        """True when the sitemap ``lastmod`` is not newer than the one stored for ``url``."""
+        current = _parse_lastmod(lastmod)
+        if current is None:
+            return False
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None or not entry.content_hash:
+                return False
+            stored = _parse_lastmod(entry.lastmod)
+        return stored is not None and current <= stored
+
+    def set_lastmod(self, url: str, lastmod: str | None) -> None:
+        """Remember the sitemap ``lastmod`` of a page crawled in this run."""
+        if not lastmod:
+            return
+        with self._lock:
+            entry = self._pending.get(url) or self._entries.get(url)
+            if entry is not None:
+                entry.lastmod = lastmod
+
+    def mark_unchanged(
+        self,
+        url: str,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        links: list[str] | None = None,
+    ) -> list[str]:
+        """Keep ``url`` as-is (refreshing validators) and return its outgoing links."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return []
+            self._seen.add(url)
+            self._unchanged.add(url)
+            entry.etag = etag or entry.etag
+            entry.last_modified = last_modified or entry.last_modified
+            if links is not None:
+                entry.links = list(links)
+            return list(entry.links)
+
+    def record_page(
+        self,
+        url: str,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+        content_hash: str,
+        links: list[str],
+    ) -> None:
+        """Stage a new or changed page until ``assign_chunks`` commits it."""
+        with self._lock:
+            self._pending[url] = ManifestEntry(
+                etag=etag,
+                last_modified=last_modified,
+                content_hash=content_hash,
+                links=list(links),
+            )
+            self._seen.add(url)
+            self._unchanged.discard(url)
+
+    def assign_chunks(self, url: str, chunk_hashes: list[str]) -> set[str]:
+        """Commit a page staged in this run with its indexed chunks; returns hashes it no longer has."""
+        with self._lock:
+            entry = self._pending.pop(url, None)
+            if entry is None:
+                return set()
+            previous = self._entries.get(url)
+            stale = set(previous.chunk_hashes) - set(chunk_hashes) if previous else set()
+            entry.chunk_hashes = list(chunk_hashes)
+            self._entries[url] = entry
+            return stale
+
+    def discard_page(self, url: str) -> None:
+        """Drop the staged entry of a page whose chunks were not all indexed.
+
+        The stored entry (and its chunks) stays, so the page is fetched again next run.
+        """
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def complete_crawl(self) -> None:
+        """Forget pages not reached by a finished crawl and queue their chunks for deletion."""
+        with self._lock:
+            removed = [url for url in self._entries if url not in self._seen]
+            for url in removed:
+                self._stale_hashes.update(self._entries.pop(url).chunk_hashes)
+        if removed:
+            logger.info(f'Crawl manifest: {len(removed)} pages disappeared since the last crawl')
+
+    def take_stale_hashes(self) -> set[str]:
+        with self._lock:
+            stale, self._stale_hashes = self._stale_hashes, set()
+            return stale
+
+    def save(self) -> None:
+        """Atomically write the manifest next to the KB index."""
+        with self._lock:
+            data = {
+                'version': MANIFEST_VERSION,
+                'pages': {url: asdict(entry) for url, entry in self._entries.items()},
+            }
+        tmp_path = f'{self.path}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            logger.info(f'Saved crawl manifest with {len(data["pages"])} pages')
+        except OSError as exc:
+            logger.error(f'Failed to save crawl manifest: {exc}')
@@ -9,6 +9,8 @@ from typing import Any
 
 from llama_index.core import Document
 
+from .crawl_manifest import CrawlManifest
+
 
 class BaseSourceHandler(ABC):
     """Abstract base class for source handlers"""
@@ -17,6 +19,7 @@ class BaseSourceHandler(ABC):
         self.kb_id = kb_id
         self.job = job  # Optional job reference for cancellation checks
         self.state = state  # Optional IngestionState for cooperative pause/cancel
+        self.manifest: CrawlManifest | None = None  # Set by the loader for incremental re-ingestion
 
     @abstractmethod
     def ingest(self, config: dict[str, Any]) -> list[Document] | Generator[list[Document], None, None]:
@@ -0,0 +1,468 @@
+"""
+Async Website Crawler
+Concurrent crawl mode: pooled HTTP/2 fetches, per-host token buckets that honour
+robots.txt crawl-delay, and HTML parsing in a process pool. Still exposed as a
+synchronous generator of Document batches so the loader pipeline is unchanged.
+"""
+
+import asyncio
+import importlib.util
+import itertools
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import httpx
+import trafilatura
+from bs4 import BeautifulSoup, FeatureNotFound  # type: ignore[import-untyped]
+from llama_index.core import Document
+
+from app.shared.config.app_settings import get_app_settings
+
+from .crawler import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_PAGES,
+    HTTP_BAD_REQUEST,
+    HTTP_INTERNAL_ERROR,
+    HTTP_NOT_MODIFIED,
+    RETRY_DELAY,
+    ExtractedPage,
+    FetchedPage,
+    WebsiteCrawler,
+)
+from .sitemap import SitemapEntry, SitemapReader
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional 'h2' package; without it httpx falls back to HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+BATCH_QUEUE_SIZE = 2
+QUEUE_POLL_INTERVAL = 0.5
+HTTP_OK = 200
+
+_DONE = object()
+
+
+def parse_page(html: str, extract_links: bool = True) -> tuple[str | None, list[str]]:
+    """Extract page text and raw hrefs; module-level so it can run in a worker process."""
+    text = trafilatura.extract(html, include_comments=False, include_tables=True)
+    if not extract_links:
+        return text, []
+    try:
+        soup = BeautifulSoup(html, 'lxml')
+    except FeatureNotFound:
+        soup = BeautifulSoup(html, 'html.parser')
+    return text, [anchor['href'] for anchor in soup.find_all('a', href=True)]
+
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` acquisitions per second."""
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class HostPoliteness:
+    """Per-host robots.txt rules and rate limits, loaded lazily on first contact."""
+
+    def __init__(self, client: httpx.AsyncClient, user_agent: str, default_rate: float) -> None:
+        self._client = client
+        self._user_agent = user_agent
+        self._default_rate = default_rate
+        self._robots: dict[str, RobotFileParser] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def allowed(self, url: str) -> bool:
+        robots = await self._robots_for(url)
+        return robots.can_fetch(self._user_agent, url)
+
+    async def acquire(self, url: str) -> None:
+        await self._robots_for(url)
+        await self._buckets[self._host(url)].acquire()
+
+    @staticmethod
+    def _host(url: str) -> str:
+        parsed = urlparse(url)
+        return f'{parsed.scheme}://{parsed.netloc.lower()}'
+
+    async def _robots_for(self, url: str) -> RobotFileParser:
+        host = self._host(url)
+        if host in self._robots:
+            return self._robots[host]
+
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            if host not in self._robots:
+                robots = await self._fetch_robots(host)
+                crawl_delay = robots.crawl_delay(self._user_agent)
+                rate = 1 / float(crawl_delay) if crawl_delay else self._default_rate
+                self._buckets[host] = TokenBucket(rate)
+                self._robots[host] = robots
+                logger.info(f'Crawl rate for {host}: {rate:.2f} req/s (crawl-delay={crawl_delay})')
+        return self._robots[host]
+
+    async def _fetch_robots(self, host: str) -> RobotFileParser:
+        robots = RobotFileParser(f'{host}/robots.txt')
+        try:
+            response = await self._client.get(f'{host}/robots.txt')
+            lines = response.text.splitlines() if response.status_code == HTTP_OK else []
+        except httpx.HTTPError as e:
+            logger.warning(f'  Could not fetch robots.txt for {host}: {e}')
+            lines = []
+        robots.parse(lines)
+        return robots
+
+
+PageResult = tuple[str, Document | None, str | None, list[str]]
+
+
+@dataclass(frozen=True)
+class AsyncCrawlOptions:
+    """Concurrency knobs for the async crawler; unset fields fall back to app settings."""
+
+    concurrency: int | None = None
+    host_rate: float | None = None
+    parse_workers: int | None = None
+    transport: httpx.AsyncBaseTransport | None = None
+
+
+@dataclass(frozen=True)
+class _PageFetcher:
+    """HTTP client, politeness rules and parse executor shared by one crawl's fetches."""
+
+    client: httpx.AsyncClient
+    politeness: HostPoliteness
+    executor: Executor | None
+
+
+@dataclass
+class _CrawlRun:
+    """Frontier, in-flight fetches and counters of one crawl."""
+
+    max_pages: int
+    batch_size: int
+    batches: queue.Queue[Any]
+    stop: threading.Event
+    sitemap: Iterator[SitemapEntry] | None = None
+    follow_links: bool = field(init=False)
+    frontier: deque[str] = field(default_factory=deque)
+    seen: set[str] = field(default_factory=set)
+    lastmods: dict[str, str | None] = field(default_factory=dict)
+    in_flight: set[asyncio.Task[PageResult]] = field(default_factory=set)
+    current_batch: list[Document] = field(default_factory=list)
+    scheduled: int = 0
+    failed_count: int = 0
+    fresh_count: int = 0
+
+    def __post_init__(self) -> None:
+        # With a sitemap the frontier is filled lazily from it and links are not followed
+        self.follow_links = self.sitemap is None
+
+    @property
+    def at_limit(self) -> bool:
+        return self.scheduled >= self.max_pages
+
+
+class AsyncWebsiteCrawler(WebsiteCrawler):
+    """
+    Website crawler running concurrent fetches on a private event loop thread.
+    """
+
+    def __init__(
+        self,
+        kb_id: str,
+        job: Any | None = None,
+        state: Any | None = None,
+        *,
+        options: AsyncCrawlOptions | None = None,
+    ) -> None:
+        super().__init__(kb_id, job=job, state=state)
+        options = options or AsyncCrawlOptions()
+        settings = get_app_settings()
+        self.concurrency = max(
+            1, options.concurrency if options.concurrency is not None else settings.web_crawl_concurrency
+        )
+        self.host_rate = options.host_rate if options.host_rate is not None else settings.web_crawl_host_rate
+        self.parse_workers = (
+            options.parse_workers if options.parse_workers is not None else settings.web_crawl_parse_workers
+        )
+        self._transport = options.transport
+
+    def crawl(
+        self,
+        start_url: str,
+        url_prefix: str | None = None,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Generator[list[Document], None, None]:
+        """Crawl a website yields batches of documents."""
+        self._configure_scope(start_url, url_prefix)
+
+        sitemap_client = self._sitemap_client() if self.use_sitemaps else None
+        entries = self._sitemap_frontier(SitemapReader(sitemap_client), start_url) if sitemap_client else None
+
+        batches: queue.Queue[Any] = queue.Queue(maxsize=BATCH_QUEUE_SIZE)
+        stop = threading.Event()
+        crawl_run = _CrawlRun(
+            max_pages=max_pages, batch_size=batch_size, batches=batches, stop=stop, sitemap=entries
+        )
+
+        def run() -> None:
+            try:
+                asyncio.run(self._crawl(start_url, crawl_run))
+            except BaseException as e:  # noqa: BLE001 - re-raised in the consumer
+                self._put(batches, e, stop)
+            self._put(batches, _DONE, stop)
+
+        worker = threading.Thread(target=run, name=f'crawler-{self.kb_id}', daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            worker.join(timeout=self.timeout)
+            if sitemap_client is not None:
+                sitemap_client.close()
+
+    def _sitemap_client(self) -> httpx.Client:
+        # Reuse an injected transport when it can also serve synchronous requests
+        transport = self._transport if isinstance(self._transport, httpx.BaseTransport) else None
+        return httpx.Client(
+            headers=self.headers, timeout=self.timeout, follow_redirects=True, transport=transport
+        )
+
+    @staticmethod
+    def _put(batches: queue.Queue[Any], item: Any, stop: threading.Event) -> None:
+        """Block until the consumer takes ``item`` or the crawl is abandoned."""
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=QUEUE_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def _create_executor(self) -> Executor | None:
+        if self.parse_workers <= 0:
+            return None
+        # spawn: forking a process that runs an event loop thread is unsafe
+        return ProcessPoolExecutor(
+            max_workers=self.parse_workers, mp_context=multiprocessing.get_context('spawn')
+        )
+
+    async def _crawl(self, start_url: str, run: _CrawlRun) -> None:
+        if run.follow_links:
+            start = self._normalize_url(start_url)
+            run.frontier.append(start)
+            run.seen.add(start)
+
+        logger.info(
+            f'Async crawler start: {start_url} (limit={run.max_pages}, concurrency={self.concurrency}, '
+            f'http2={HTTP2_AVAILABLE}, path_filter={self.semantic_path})'
+        )
+
+        executor = self._create_executor()
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.concurrency),
+            transport=self._transport,
+        )
+        try:
+            fetcher = _PageFetcher(
+                client, HostPoliteness(client, self.headers['User-Agent'], self.host_rate), executor
+            )
+            while (run.frontier or run.in_flight or run.sitemap is not None) and not run.stop.is_set():
+                await self._refill_frontier(run)
+                await self._schedule_fetches(run, fetcher)
+                if not run.in_flight:
+                    if run.sitemap is None or run.at_limit:
+                        break
+                    continue
+
+                done, run.in_flight = await asyncio.wait(run.in_flight, return_when=asyncio.FIRST_COMPLETED)
+                await self._handle_results(run, done)
+                self._log_progress(run.scheduled - len(run.in_flight), len(run.frontier))
+
+            if run.current_batch and not run.stop.is_set():
+                await self._flush_batch(run)
+            crawl_finished = not run.frontier and not run.in_flight and run.sitemap is None
+            if self.manifest is not None and crawl_finished and not run.stop.is_set():
+                self.manifest.complete_crawl()
+        finally:
+            for task in run.in_flight:
+                task.cancel()
+            await client.aclose()
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(
+            f'Async crawler stopped: {run.scheduled} scheduled, {run.fresh_count} fresh by lastmod, '
+            f'{run.failed_count} failed, queue empty: {not run.frontier}, hit limit: {run.at_limit}'
+        )
+
+    async def _refill_frontier(self, run: _CrawlRun) -> None:
+        """Top the frontier up from the sitemap while it is shorter than the fetch window."""
+        if run.sitemap is not None and len(run.frontier) < self.concurrency and not run.at_limit:
+            run.sitemap = await asyncio.to_thread(
+                self._refill_from_sitemap, run.sitemap, run.frontier, run.seen, run.lastmods
+            )
+
+    async def _schedule_fetches(self, run: _CrawlRun, fetcher: _PageFetcher) -> None:
+        """Start page fetches until the concurrency window or the page limit is reached."""
+        while run.frontier and len(run.in_flight) < self.concurrency and not run.at_limit:
+            url = run.frontier.popleft()
+            if not self._is_valid_url(url):
+                self._log_skipped_url(url, False)
+                continue
+            if not await fetcher.politeness.allowed(url):
+                logger.info(f'Skipping URL disallowed by robots.txt: {url}')
+                continue
+            run.scheduled += 1
+            lastmod = run.lastmods.pop(url, None)
+            if self._skip_if_fresh(url, lastmod):
+                run.fresh_count += 1
+                continue
+            run.in_flight.add(
+                asyncio.create_task(
+                    self._crawl_page(fetcher, url, run.scheduled, run.follow_links, lastmod)
+                )
+            )
+
+    async def _handle_results(self, run: _CrawlRun, done: set[asyncio.Task[PageResult]]) -> None:
+        """Batch finished documents and push newly discovered links onto the frontier."""
+        for task in done:
+            url, doc, final_url, links = task.result()
+            if not doc and not links:
+                if run.follow_links:
+                    run.failed_count += 1
+                continue
+            self._handle_redirect(url, final_url, run.seen)
+            if doc:
+                run.current_batch.append(doc)
+            for link in links:
+                if link not in run.seen:
+                    run.seen.add(link)
+                    run.frontier.append(link)
+
+            if len(run.current_batch) >= run.batch_size:
+                await self._flush_batch(run)
+
+    async def _flush_batch(self, run: _CrawlRun) -> None:
+        await asyncio.to_thread(self._put, run.batches, run.current_batch, run.stop)
+        run.current_batch = []
+
+    def _refill_from_sitemap(
+        self,
+        sitemap: Iterator[SitemapEntry],
+        frontier: deque[str],
+        seen: set[str],
+        lastmods: dict[str, str | None],
+    ) -> Iterator[SitemapEntry] | None:
+        """Move the next sitemap entries into the frontier; returns None once the sitemap is exhausted."""
+        wanted = self.concurrency * 2
+        taken = list(itertools.islice(sitemap, wanted))
+        for entry in taken:
+            if entry.url not in seen:
+                seen.add(entry.url)
+                frontier.append(entry.url)
+                lastmods[entry.url] = entry.lastmod
+        return sitemap if len(taken) == wanted else None
+
+    async def _crawl_page(
+        self,
+        fetcher: _PageFetcher,
+        url: str,
+        doc_id: int,
+        follow_links: bool = True,
+        lastmod: str | None = None,
+    ) -> PageResult:
+        """Fetch and parse one page; returns (url, document, final_url, links)."""
+        page = await self._fetch_html_async(fetcher.client, fetcher.politeness, url)
+        if page is None:
+            return url, None, None, self._links_for_failed_fetch(url)
+        if page.not_modified:
+            links = self._links_for_unchanged(url, page)
+            self._record_lastmod(url, lastmod)
+            return url, None, None, links
+
+        actual_url = page.final_url or url
+        if page.final_url:
+            self._maybe_update_domains_from_redirect(url, page.final_url, doc_id)
+
+        try:
+            text, hrefs = await asyncio.get_running_loop().run_in_executor(
+                fetcher.executor, parse_page, page.html, follow_links
+            )
+        except (ValueError, RuntimeError) as e:
+            logger.error(f'  Error parsing {actual_url}: {e}')
+            return url, None, None, []
+        links = self._accept_links(hrefs, actual_url)
+        doc = self._document_if_changed(ExtractedPage(url, page, text, actual_url, links), doc_id)
+        self._record_lastmod(url, lastmod)
+        return url, doc, page.final_url, links
+
+    async def _fetch_html_async(
+        self, client: httpx.AsyncClient, politeness: HostPoliteness, url: str
+    ) -> FetchedPage | None:
+        """Fetch HTML with retries, per-host rate limiting and conditional headers."""
+        headers = self.manifest.conditional_headers(url) if self.manifest is not None else {}
+        for attempt in range(self.max_retries):
+            await politeness.acquire(url)
+            try:
+                response = await client.get(url, headers=headers)
+                etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+                if response.status_code == HTTP_NOT_MODIFIED:
+                    return FetchedPage(None, None, etag, last_modified)
+                response.raise_for_status()
+                final_url = str(response.url) if response.history else url
+                return FetchedPage(response.text, final_url, etag, last_modified)
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if HTTP_BAD_REQUEST <= status < HTTP_INTERNAL_ERROR:
+                    logger.warning(f'  ✗ Client error {status}: {url}')
+                    self._gone_urls.add(url)
+                    return None
+                error = str(e)
+            except httpx.HTTPError as e:
+                error = str(e)
+
+            if attempt < self.max_retries - 1:
+                logger.warning(f'  Retry delayed ({attempt + 1}/{self.max_retries}): {error}')
+                await asyncio.sleep(RETRY_DELAY)
+            else:
+                logger.error(f'  Failed after {self.max_retries} attempts')
+
+        return None
@@ -1,16 +1,22 @@
+import itertools
 import logging
 import re
 import time
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
+import httpx
 import requests
 import trafilatura
 from bs4 import BeautifulSoup, FeatureNotFound  # type: ignore[import-untyped]
 from llama_index.core import Document
 
+from ..crawl_manifest import CrawlManifest
+from .sitemap import SitemapEntry, SitemapReader
+
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -25,6 +31,7 @@ MAX_REJECTED_COUNT = 10
 LOG_INTERVAL = 20
 HTTP_BAD_REQUEST = 400
 HTTP_INTERNAL_ERROR = 500
+HTTP_NOT_MODIFIED = 304
 
 EXCLUDED_EXTENSIONS = (
     '.pdf',
@@ -38,6 +45,31 @@ EXCLUDED_EXTENSIONS = (
 )
 
 
+@dataclass(frozen=True)
+class FetchedPage:
+    """Result of a page fetch; ``html`` is None when the server answered 304."""
+
+    html: str | None
+    final_url: str | None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.html is None
+
+
+@dataclass(frozen=True)
+class ExtractedPage:
+    """Text and outgoing links extracted from a fetched page."""
+
+    url: str
+    page: FetchedPage
+    content: str | None
+    actual_url: str
+    links: list[str]
+
+
 class WebsiteCrawler:
     """
     Orchestrates website crawling with link discovery and support for batching.
@@ -57,6 +89,11 @@ class WebsiteCrawler:
         self.semantic_path = ''
         self._invalid_url_count = 0
         self._rejected_count = 0
+        # Set for incremental re-ingestion: enables conditional requests and unchanged-page skipping
+        self.manifest: CrawlManifest | None = None
+        self._gone_urls: set[str] = set()
+        # Use sitemap.xml as the frontier when the site has one covering the crawl scope
+        self.use_sitemaps = True
 
     @staticmethod
     def _canonical_netloc(netloc: str) -> str:
@@ -117,14 +154,8 @@ class WebsiteCrawler:
         if links:
             logger.info(f"Links found: {len(links)}, added: {added}, skipped (visited: {skipped_visited}, queued: {skipped_queued})")
 
-    def crawl(
-        self,
-        start_url: str,
-        url_prefix: str | None = None,
-        max_pages: int = DEFAULT_MAX_PAGES,
-        batch_size: int = DEFAULT_BATCH_SIZE,
-    ) -> Generator[list[Document], None, None]:
-        """Crawl a website yields batches of documents."""
+    def _configure_scope(self, start_url: str, url_prefix: str | None) -> None:
+        """Restrict the crawl to the start domain and semantic path."""
         parsed_start = urlparse(start_url)
         self.base_domain = parsed_start.netloc.lower()
         self.allowed_domains = {self.base_domain} if self.base_domain else set()
@@ -143,6 +174,23 @@ class WebsiteCrawler:
                 "This prevents unrestricted domain-wide crawling."
             )
 
+    def crawl(
+        self,
+        start_url: str,
+        url_prefix: str | None = None,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Generator[list[Document], None, None]:
+        """Crawl a website yields batches of documents."""
+        self._configure_scope(start_url, url_prefix)
+
+        if self.use_sitemaps:
+            with self._sitemap_client() as client:
+                entries = self._sitemap_frontier(SitemapReader(client), start_url)
+                if entries is not None:
+                    yield from self._crawl_sitemap(entries, max_pages, batch_size)
+                    return
+
         visited: set[str] = set()
         to_visit: list[str] = [self._normalize_url(start_url)]
         current_batch: list[Document] = []
@@ -180,22 +228,157 @@ class WebsiteCrawler:
         if current_batch:
             yield current_batch
 
+        if self.manifest is not None and not to_visit:
+            self.manifest.complete_crawl()
+
         self._log_summary(visited, to_visit, max_pages, failed_count)
 
+    def _sitemap_client(self) -> httpx.Client:
+        return httpx.Client(headers=self.headers, timeout=self.timeout, follow_redirects=True)
+
+    def _sitemap_frontier(self, reader: SitemapReader, start_url: str) -> Iterator[SitemapEntry] | None:
+        """Lazily stream in-scope sitemap entries; None when no sitemap covers the crawl scope."""
+        entries = (
+            SitemapEntry(url, entry.lastmod)
+            for entry in reader.iter_entries(reader.discover(start_url))
+            if (url := self._normalize_url(entry.url)) and self._is_valid_url(url)
+        )
+        first = next(entries, None)
+        if first is None:
+            logger.info('No sitemap entries in crawl scope, falling back to link crawling')
+            return None
+        logger.info('Using sitemap as crawl frontier (links are not followed)')
+        return itertools.chain([first], entries)
+
+    def _skip_if_fresh(self, url: str, lastmod: str | None) -> bool:
+        """Keep a page without fetching it when its sitemap lastmod is not newer than the last crawl."""
+        if self.manifest is None or not self.manifest.is_fresh(url, lastmod):
+            return False
+        self.manifest.mark_unchanged(url)
+        return True
+
+    def _crawl_sitemap(
+        self, entries: Iterator[SitemapEntry], max_pages: int, batch_size: int
+    ) -> Generator[list[Document], None, None]:
+        """Fetch the pages listed in the sitemap, skipping those fresh by lastmod."""
+        visited: set[str] = set()
+        current_batch: list[Document] = []
+        last_id = 0
+        fresh_count = 0
+        exhausted = True
+
+        for entry in entries:
+            if entry.url in visited:
+                continue
+            if len(visited) >= max_pages:
+                exhausted = False
+                break
+            visited.add(entry.url)
+            if self._skip_if_fresh(entry.url, entry.lastmod):
+                fresh_count += 1
+                continue
+
+            last_id += 1
+            doc = self._fetch_sitemap_page(entry, last_id)
+            if doc:
+                current_batch.append(doc)
+                if len(current_batch) >= batch_size:
+                    yield current_batch
+                    current_batch = []
+            self._log_progress(len(visited), 0)
+            time.sleep(RATE_LIMIT_DELAY)
+
+        if current_batch:
+            yield current_batch
+
+        if self.manifest is not None and exhausted:
+            self.manifest.complete_crawl()
+
+        logger.info(
+            f'Sitemap crawl stopped: {len(visited)} pages, {last_id} fetched, '
+            f'{fresh_count} fresh by lastmod, hit limit: {not exhausted}'
+        )
+
+    def _fetch_sitemap_page(self, entry: SitemapEntry, last_id: int) -> Document | None:
+        page = self._fetch_html_with_redirect(entry.url)
+        if page is None:
+            self._links_for_failed_fetch(entry.url)
+            return None
+        if page.not_modified:
+            self._links_for_unchanged(entry.url, page)
+            doc = None
+        else:
+            doc, _ = self._process_page(entry.url, page, last_id, follow_links=False)
+        self._record_lastmod(entry.url, entry.lastmod)
+        return doc
+
+    def _record_lastmod(self, url: str, lastmod: str | None) -> None:
+        """Store the sitemap lastmod once the page was actually fetched this run."""
+        if self.manifest is not None:
+            self.manifest.set_lastmod(url, lastmod)
+
     def _fetch_and_process_url(self, url: str, last_id: int) -> tuple[Document | None, str | None, list[str]]:
         """Fetch HTML, extract document and links in one step."""
-        content, final_url = self._fetch_html_with_redirect(url)
-        if not content:
-            return None, None, []
-
-        actual_url = final_url or url
+        page = self._fetch_html_with_redirect(url)
+        if page is None:
+            return None, None, self._links_for_failed_fetch(url)
+        if page.not_modified:
+            return None, None, self._links_for_unchanged(url, page)
+
+        doc, links = self._process_page(url, page, last_id)
+        return doc, page.final_url, links
+
+    def _process_page(
+        self, url: str, page: FetchedPage, last_id: int, follow_links: bool = True
+    ) -> tuple[Document | None, list[str]]:
+        """Extract the document (and outgoing links) from a fetched page."""
+        actual_url = page.final_url or url
+
+        if page.final_url:
+            self._maybe_update_domains_from_redirect(url, page.final_url, last_id)
+
+        content = trafilatura.extract(page.html, include_comments=False, include_tables=True)
+        links = self._extract_links(page.html, actual_url) if follow_links else []
+        doc = self._document_if_changed(ExtractedPage(url, page, content, actual_url, links), last_id)
+        return doc, links
+
+    def _document_if_changed(self, extracted: ExtractedPage, doc_id: int) -> Document | None:
+        """Build the page Document, or None when the manifest shows the text is unchanged."""
+        if self.manifest is None or not extracted.content:
+            return self._make_document(extracted.content, extracted.actual_url, doc_id)
+
+        url, page = extracted.url, extracted.page
+        content_hash = CrawlManifest.page_hash(extracted.content)
+        if self.manifest.is_unchanged(url, content_hash):
+            self.manifest.mark_unchanged(
+                url, etag=page.etag, last_modified=page.last_modified, links=extracted.links
+            )
+            return None
 
-        if final_url:
-            self._maybe_update_domains_from_redirect(url, final_url, last_id)
+        self.manifest.record_page(
+            url,
+            etag=page.etag,
+            last_modified=page.last_modified,
+            content_hash=content_hash,
+            links=extracted.links,
+        )
+        doc = self._make_document(extracted.content, extracted.actual_url, doc_id)
+        if doc is not None:
+            doc.metadata['crawl_url'] = url
+        return doc
+
+    def _links_for_unchanged(self, url: str, page: FetchedPage) -> list[str]:
+        """Outgoing links of a 304 page, taken from the manifest."""
+        if self.manifest is None:
+            return []
+        links = self.manifest.mark_unchanged(url, etag=page.etag, last_modified=page.last_modified)
+        return [link for link in links if self._is_valid_url(link)]
 
-        doc = self._extract_document(content, actual_url, last_id)
-        links = self._extract_links(content, actual_url)
-        return doc, final_url, links
+    def _links_for_failed_fetch(self, url: str) -> list[str]:
+        """Keep a known page (and keep crawling its links) when it could not be fetched this time."""
+        if self.manifest is None or url in self._gone_urls:
+            return []
+        return [link for link in self.manifest.mark_unchanged(url) if self._is_valid_url(link)]
 
     def _handle_redirect(self, url: str, final_url: str | None, visited: set[str]) -> None:
         """Add normalized final URL to visited if it differs from the original."""
@@ -237,9 +420,8 @@ class WebsiteCrawler:
         logger.info(f'  Failed: {failed} pages')
         logger.info('=' * 70)
 
-    def _extract_document(self, html: str, url: str, doc_id: int) -> Document | None:
-        """Extract clean text content and wrap in Document."""
-        content = trafilatura.extract(html, include_comments=False, include_tables=True)
+    def _make_document(self, content: str | None, url: str, doc_id: int) -> Document | None:
+        """Wrap extracted page text in a Document."""
         if not content:
             logger.warning(f'  ✗ Failed to extract content from {url}')
             return None
@@ -289,31 +471,43 @@ class WebsiteCrawler:
 
         return True
 
-    def _fetch_html_with_redirect(self, url: str) -> tuple[str | None, str | None]:
-        """Fetch HTML content with retries and redirect following."""
+    def _fetch_html_with_redirect(self, url: str) -> FetchedPage | None:
+        """Fetch HTML content with retries, redirect following and conditional headers."""
+        headers = dict(self.headers)
+        if self.manifest is not None:
+            headers.update(self.manifest.conditional_headers(url))
+
         for attempt in range(self.max_retries):
             try:
                 response = requests.get(
                     url,
                     timeout=self.timeout,
-                    headers=self.headers,
+                    headers=headers,
                     allow_redirects=True,
                 )
+                if response.status_code == HTTP_NOT_MODIFIED:
+                    return FetchedPage(None, None, response.headers.get('ETag'), response.headers.get('Last-Modified'))
                 response.raise_for_status()
                 final_url = response.url if response.history else url
-                return response.text, final_url
+                return FetchedPage(
+                    response.text,
+                    final_url,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                )
 
             except requests.exceptions.HTTPError as e:
                 # Don't retry on 4xx errors
                 status = e.response.status_code
                 if HTTP_BAD_REQUEST <= status < HTTP_INTERNAL_ERROR:
                     logger.warning(f'  ✗ Client error {status}: {url}')
-                    return None, None
+                    self._gone_urls.add(url)
+                    return None
                 self._handle_retry(attempt, str(e))
             except requests.exceptions.RequestException as e:
                 self._handle_retry(attempt, str(e))
 
-        return None, None
+        return None
 
     def _handle_retry(self, attempt: int, error: str) -> None:
         """Log retry attempt if possible."""
@@ -330,20 +524,24 @@ class WebsiteCrawler:
                 soup = BeautifulSoup(html, 'lxml')
             except FeatureNotFound:
                 soup = BeautifulSoup(html, 'html.parser')
-            links = []
-            for anchor in soup.find_all('a', href=True):
-                href = anchor['href']
-                if href.startswith(('#', 'javascript:', 'mailto:')):
-                    continue
-                absolute_url = urljoin(current_url, href)
-                normalized_url = self._normalize_url(absolute_url)
-                if normalized_url and self._is_valid_url(normalized_url):
-                    links.append(normalized_url)
-            return list(set(links))
+            hrefs = [anchor['href'] for anchor in soup.find_all('a', href=True)]
+            return self._accept_links(hrefs, current_url)
         except (ValueError, RuntimeError) as e:
             logger.error(f'  Error extracting links: {e}')
             return []
 
+    def _accept_links(self, hrefs: list[str], current_url: str) -> list[str]:
+        """Resolve, normalize and scope-filter raw hrefs into unique crawlable URLs."""
+        links = []
+        for href in hrefs:
+            if href.startswith(('#', 'javascript:', 'mailto:')):
+                continue
+            absolute_url = urljoin(current_url, href)
+            normalized_url = self._normalize_url(absolute_url)
+            if normalized_url and self._is_valid_url(normalized_url):
+                links.append(normalized_url)
+        return list(set(links))
+
     def _normalize_url(self, url: str) -> str:
         """Normalize URL by removing fragments and trailing slashes."""
         try:
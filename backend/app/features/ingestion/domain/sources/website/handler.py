@@ -6,7 +6,10 @@ from urllib.parse import urlparse
 
 from llama_index.core import Document
 
+from app.shared.config.app_settings import get_app_settings
+
 from ..handler_base import BaseSourceHandler
+from .async_crawler import AsyncWebsiteCrawler
 from .content_fetcher import ContentFetcher
 from .crawler import WebsiteCrawler
 
@@ -43,7 +46,13 @@ class WebsiteSourceHandler(BaseSourceHandler):
         if 'start_url' in config:
             start_url = config['start_url']
             _ = urlparse(start_url).netloc.lower()
-            return self.crawler.crawl(start_url, url_prefix, max_pages, batch_size=10)
+            settings = get_app_settings()
+            crawler = self.crawler
+            if config.get('crawl_mode', settings.web_crawl_mode) == 'async':
+                crawler = AsyncWebsiteCrawler(self.kb_id, job=self.job, state=self.state)
+            crawler.manifest = self.manifest
+            crawler.use_sitemaps = config.get('use_sitemap', settings.web_crawl_use_sitemap)
+            return crawler.crawl(start_url, url_prefix, max_pages, batch_size=10)
 
         # Mode 2: Direct URLs
         if 'urls' in config:
@@ -10,11 +10,12 @@ from pathlib import Path
 
 from pydantic import ValidationError
 from pydantic_settings import SettingsError
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.features.ingestion.infrastructure import ingestion_schema
 from app.shared.config.app_settings import get_app_settings
+from app.shared.db.sqlite_profile import RoutingSession, SQLiteProfile, install_sqlite_pragmas
 
 # Point to consolidated data directory at backend/data
 BACKEND_ROOT = Path(__file__).parent.parent.parent.parent.parent
@@ -47,14 +48,40 @@ if not Path(INGESTION_DB_PATH).is_absolute():
 
 SQLALCHEMY_DATABASE_URL = f'sqlite:///{INGESTION_DB_PATH}'
 
+SQLITE_PROFILE = SQLiteProfile.from_settings()
+
+# A single pooled writer connection serialises writes from pipeline threads;
+# status and progress reads go to the query_only reader pool.
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={'check_same_thread': False},
+    pool_size=1,
+    max_overflow=0,
     pool_pre_ping=True,
     future=True,
 )
+install_sqlite_pragmas(engine, SQLITE_PROFILE)
+
+read_engine: Engine | None = None
+if SQLITE_PROFILE.reader_pool_size > 0:
+    read_engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={'check_same_thread': False},
+        pool_size=SQLITE_PROFILE.reader_pool_size,
+        max_overflow=SQLITE_PROFILE.reader_pool_size,
+        pool_pre_ping=True,
+        future=True,
+    )
+    install_sqlite_pragmas(read_engine, SQLITE_PROFILE, read_only=True)
 
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autoflush=False,
+    autocommit=False,
+    future=True,
+    writer_bind=engine,
+    reader_bind=read_engine,
+)
 
 
 def init_ingestion_database() -> None:
@@ -4,7 +4,7 @@ Request and response models for KB endpoints.
 """
 
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -43,6 +43,20 @@ class CreateKBRequest(BaseModel):
         default_factory=lambda: get_kb_defaults().chunk_overlap,
         description="Chunk overlap for indexing",
     )
+    embedding_batch_size: int = Field(
+        default_factory=lambda: get_kb_defaults().embedding_batch_size,
+        ge=1,
+        description="Chunks per embedding request during ingestion (1 disables batching)",
+    )
+    embedding_concurrency: int = Field(
+        default_factory=lambda: get_kb_defaults().embedding_concurrency,
+        ge=1,
+        description="Embedding requests in flight during ingestion",
+    )
+    vector_store: Literal["simple", "mmap"] = Field(
+        default_factory=lambda: get_kb_defaults().vector_store,
+        description="Vector store backend ('mmap' = memory-mapped vectors + SQLite metadata)",
+    )
     profiles: list[str] | None = Field(
         default=["chat", "kb-query"], description="Query profiles"
     )
@@ -97,3 +111,40 @@ class KBStatusResponse(BaseModel):
     status: str
     metrics: dict[str, int] | None = None
 
+
+
+class QueryCacheStatsResponse(BaseModel):
+    """Hit/miss counters for the KB query result cache."""
+
+    enabled: bool
+    exact_hits: int
+    semantic_hits: int
+    misses: int
+    invalidations: int
+    hit_rate: float
+    exact_entries: int
+    semantic_entries: int
+    max_entries: int
+    similarity_threshold: float
+
+
+class IndexCacheEntry(BaseModel):
+    """A loaded KB index held in the index cache."""
+
+    kb_id: str
+    storage_dir: str
+    size_bytes: int
+    load_seconds: float
+    hits: int
+    loaded_at: float
+    last_used_at: float
+
+
+class IndexCacheStatsResponse(BaseModel):
+    """Occupancy and per-KB load stats for the KB index cache."""
+
+    max_bytes: int
+    max_entries: int
+    total_bytes: int
+    evictions: int
+    indexes: list[IndexCacheEntry]
@@ -16,11 +16,13 @@ from app.shared.http.error_utils import map_value_error
 from .management_models import (
     CreateKBRequest,
     CreateKBResponse,
+    IndexCacheStatsResponse,
     KBHealthInfo,
     KBHealthResponse,
     KBInfo,
     KBListResponse,
     KBStatusResponse,
+    QueryCacheStatsResponse,
 )
 
 router = APIRouter(prefix="/api/kb", tags=["knowledge-bases"])
@@ -49,6 +51,9 @@ async def create_kb(
                 embedding_model=request.embedding_model,
                 chunk_size=request.chunk_size,
                 chunk_overlap=request.chunk_overlap,
+                embedding_batch_size=request.embedding_batch_size,
+                embedding_concurrency=request.embedding_concurrency,
+                vector_store=request.vector_store,
                 profiles=request.profiles,
                 priority=request.priority,
             ),
@@ -123,6 +128,22 @@ async def check_kb_health(
     )
 
 
+@router.get("/query-cache/stats", response_model=QueryCacheStatsResponse)
+async def get_query_cache_stats(
+    operations: KBManagementService = Depends(get_management_service_dep),
+) -> QueryCacheStatsResponse:
+    """Hit/miss counters and occupancy of the KB query result cache."""
+    return QueryCacheStatsResponse.model_validate(operations.get_query_cache_stats())
+
+
+@router.get("/index-cache/stats", response_model=IndexCacheStatsResponse)
+async def get_index_cache_stats(
+    operations: KBManagementService = Depends(get_management_service_dep),
+) -> IndexCacheStatsResponse:
+    """Loaded KB indexes with estimated memory, load time and hit counts."""
+    return IndexCacheStatsResponse.model_validate(operations.get_index_cache_stats())
+
+
 @router.get("/{kb_id}/status", response_model=KBStatusResponse)
 async def get_kb_status(
     kb_id: str,
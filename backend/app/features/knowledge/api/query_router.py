@@ -72,7 +72,7 @@ async def query_legacy(
     Legacy query endpoint - queries all active KBs using CHAT profile.
     Maintained for backward compatibility.
     """
-    result = operations.query_with_profile(
+    result = await operations.query_with_profile(
         multi_query_service, request.question, QueryProfile.CHAT, request.top_k
     )
     return _to_query_response(result)
@@ -98,7 +98,7 @@ async def query_chat(
             suggested_follow_ups=None,
         )
 
-    result = operations.query_with_profile(
+    result = await operations.query_with_profile(
         multi_query_service,
         request.question,
         QueryProfile.CHAT,
@@ -127,7 +127,7 @@ async def query_proposal(
             suggested_follow_ups=None,
         )
 
-    result = operations.query_with_profile(
+    result = await operations.query_with_profile(
         multi_query_service,
         request.question,
         QueryProfile.PROPOSAL,
@@ -156,7 +156,7 @@ async def query_kb_manual(
             suggested_follow_ups=None,
         )
 
-    result = operations.query_specific_kbs(
+    result = await operations.query_specific_kbs(
         multi_query_service, request.question, ready_kb_ids, request.top_k_per_kb
     )
     return _to_query_response(result)
@@ -0,0 +1,79 @@
+"""Retrieval-first answer synthesis across multiple knowledge bases."""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Literal
+
+from llama_index.core.schema import NodeWithScore
+
+SynthesisMode = Literal["per_kb", "single"]
+
+SYNTHESIS_PER_KB: SynthesisMode = "per_kb"
+SYNTHESIS_SINGLE: SynthesisMode = "single"
+
+
+@dataclass(frozen=True)
+class RankedNode:
+    """A retrieved node tagged with the KB it came from."""
+
+    kb_id: str
+    kb_name: str
+    node: NodeWithScore
+
+    @property
+    def score(self) -> float:
+        return float(self.node.score or 0.0)
+
+
+def content_hash(text: str) -> str:
+    """Hash chunk text with whitespace and case normalised, so near-identical chunks collide."""
+    normalized = " ".join(text.split()).lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def merge_ranked_nodes(
+    per_kb_nodes: list[list[RankedNode]],
+    per_kb_quota: int,
+    max_nodes: int,
+) -> list[RankedNode]:
+    """Merge per-KB results by score, keeping at most ``per_kb_quota`` per KB and dropping duplicates."""
+    candidates = [node for nodes in per_kb_nodes for node in nodes[:per_kb_quota]]
+    candidates.sort(key=lambda ranked: ranked.score, reverse=True)
+
+    merged: list[RankedNode] = []
+    seen: set[str] = set()
+    for ranked in candidates:
+        key = content_hash(ranked.node.node.get_content())
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(ranked)
+        if len(merged) >= max_nodes:
+            break
+    return merged
+
+
+def build_synthesis_prompt(question: str, nodes: list[RankedNode]) -> str:
+    kb_names = sorted({ranked.kb_name for ranked in nodes})
+    context = "\n".join(
+        f"[Source {i} - {ranked.kb_name}]\n{ranked.node.node.get_content()}\n"
+        for i, ranked in enumerate(nodes, 1)
+    )
+    return (
+        f"You are an expert assistant for {', '.join(kb_names)}.\n\n"
+        "Use the following context, gathered from several knowledge bases, to answer the question. "
+        "Be specific and cite sources using [Source N].\n\n"
+        f"Context:\n{context}\n\nQuestion: {question}\n\nAnswer:"
+    )
+
+
+def to_source(ranked: RankedNode) -> dict:
+    metadata = ranked.node.node.metadata
+    return {
+        "url": metadata.get("url", ""),
+        "title": metadata.get("title", ""),
+        "section": metadata.get("section", ""),
+        "score": ranked.score,
+        "kb_id": ranked.kb_id,
+        "kb_name": ranked.kb_name,
+    }
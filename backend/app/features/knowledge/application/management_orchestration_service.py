@@ -18,6 +18,8 @@ from app.features.knowledge.infrastructure import (
     KBManager,
     KnowledgeBaseService,
     clear_index_cache,
+    get_index_cache,
+    get_query_cache,
 )
 from app.service_registry import ServiceRegistry
 from app.shared.config.app_settings import get_app_settings
@@ -35,6 +37,9 @@ class CreateKnowledgeBaseInput:
     embedding_model: str
     chunk_size: int
     chunk_overlap: int
+    embedding_batch_size: int
+    embedding_concurrency: int
+    vector_store: str
     profiles: list[str] | None
     priority: int
 
@@ -64,6 +69,9 @@ class KBManagementService:
             "embedding_model": request.embedding_model,
             "chunk_size": request.chunk_size,
             "chunk_overlap": request.chunk_overlap,
+            "embedding_batch_size": request.embedding_batch_size,
+            "embedding_concurrency": request.embedding_concurrency,
+            "vector_store": request.vector_store,
             "profiles": request.profiles or ["chat", "kb-query"],
             "priority": request.priority,
             "indexed": False,
@@ -79,6 +87,12 @@ class KBManagementService:
             "kb_name": request.name,
         }
 
+    def get_index_cache_stats(self) -> dict[str, Any]:
+        return get_index_cache().stats()
+
+    def get_query_cache_stats(self) -> dict[str, Any]:
+        return get_query_cache().stats()
+
     def list_knowledge_bases(self, manager: KBManager) -> list[dict[str, Any]]:
         return cast(list[dict[str, Any]], manager.list_kbs())
 
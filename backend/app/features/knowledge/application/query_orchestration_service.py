@@ -28,7 +28,7 @@ class KBQueryService:
             and KnowledgeBaseService(kb_config).is_index_ready()
         ]
 
-    def query_with_profile(
+    async def query_with_profile(
         self,
         service: MultiKBQueryService,
         question: str,
@@ -37,14 +37,14 @@ class KBQueryService:
     ) -> dict[str, Any]:
         logger.info("%s query: %s", profile.value, question[:100])
         effective_top_k = top_k_per_kb if top_k_per_kb is not None else 3
-        result = service.query_profile(
+        result = await service.aquery_profile(
             question=question,
             profile=profile,
             top_k_per_kb=effective_top_k,
         )
         return cast(dict[str, Any], result)
 
-    def query_specific_kbs(
+    async def query_specific_kbs(
         self,
         service: MultiKBQueryService,
         question: str,
@@ -52,7 +52,7 @@ class KBQueryService:
         top_k_per_kb: int = 5,
     ) -> dict[str, Any]:
         logger.info("KB Query for KBs: %s, question: %s", kb_ids, question[:100])
-        result = service.query_kbs(
+        result = await service.aquery_kbs(
             question=question,
             kb_ids=kb_ids,
             top_k_per_kb=top_k_per_kb,
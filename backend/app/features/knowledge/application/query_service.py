@@ -1,15 +1,40 @@
 """KB query services for single- and multi-KB execution."""
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from enum import Enum
-
-from llama_index.core import Settings
-
-from app.features.knowledge.infrastructure import KBConfig, KBManager, KnowledgeBaseService
+from typing import TypeVar
+
+from llama_index.core import QueryBundle, Settings, VectorStoreIndex
+from llama_index.core.base.base_retriever import BaseRetriever
+from llama_index.core.schema import NodeWithScore
+
+from app.features.knowledge.infrastructure import (
+    KBConfig,
+    KBManager,
+    KnowledgeBaseService,
+    QueryCacheKey,
+    QueryResultCache,
+    get_query_cache,
+)
+from app.shared.ai import get_ai_service
+from app.shared.ai.adapters import AIServiceEmbedding
 from app.shared.config.app_settings import get_app_settings
 
+from .answer_synthesis import (
+    SYNTHESIS_SINGLE,
+    RankedNode,
+    build_synthesis_prompt,
+    merge_ranked_nodes,
+    to_source,
+)
+
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class QueryProfile(str, Enum):
     CHAT = "chat"
@@ -36,34 +61,118 @@ class KBQueryService:
         self.min_initial_retrieve = _s.search_min_initial_retrieve
 
     def query(
-        self, question: str, top_k: int = 5, metadata_filters: dict | None = None
+        self,
+        question: str,
+        top_k: int = 5,
+        metadata_filters: dict | None = None,
+        query_embedding: list[float] | None = None,
     ) -> dict:
         logger.info("[%s] Processing query: %s...", self.kb_id, question[:100])
 
+        filtered = self.retrieve(question, top_k, metadata_filters, query_embedding)
+        if not filtered:
+            return self._empty_result()
+
+        prompt, sources, scores = self._build_context(question, filtered)
+        try:
+            llm = Settings.llm
+            response = llm.complete(prompt)
+            answer = response.text.strip()
+            logger.info("[%s] Answer generated: %d chars", self.kb_id, len(answer))
+        except Exception as exc:
+            logger.error("[%s] Generation failed: %s", self.kb_id, exc)
+            raise
+
+        return self._result(answer, sources, scores)
+
+    async def aquery(
+        self,
+        question: str,
+        top_k: int = 5,
+        metadata_filters: dict | None = None,
+        query_embedding: list[float] | None = None,
+    ) -> dict:
+        """Async variant of ``query`` that can reuse a precomputed question embedding."""
+        logger.info("[%s] Processing async query: %s...", self.kb_id, question[:100])
+
+        filtered = await self.aretrieve(question, top_k, metadata_filters, query_embedding)
+        if not filtered:
+            return self._empty_result()
+
+        prompt, sources, scores = self._build_context(question, filtered)
+        try:
+            response = await Settings.llm.acomplete(prompt)
+            answer = response.text.strip()
+            logger.info("[%s] Answer generated: %d chars", self.kb_id, len(answer))
+        except Exception as exc:
+            logger.error("[%s] Generation failed: %s", self.kb_id, exc)
+            raise
+
+        return self._result(answer, sources, scores)
+
+    def retrieve(
+        self,
+        question: str,
+        top_k: int = 5,
+        metadata_filters: dict | None = None,
+        query_embedding: list[float] | None = None,
+    ) -> list[NodeWithScore]:
+        """Retrieve and threshold-filter nodes without generating an answer."""
         index = KnowledgeBaseService(self.kb_config).get_index()
+        retriever = self._build_retriever(index, top_k, metadata_filters)
+        query_bundle = QueryBundle(query_str=question, embedding=query_embedding)
+        return self._filter_nodes(retriever.retrieve(query_bundle), top_k)
+
+    async def aretrieve(
+        self,
+        question: str,
+        top_k: int = 5,
+        metadata_filters: dict | None = None,
+        query_embedding: list[float] | None = None,
+    ) -> list[NodeWithScore]:
+        """
+        Async ``retrieve``. A missing question embedding is computed natively on
+        the caller's loop; index loading and vector search run in a worker thread.
+        """
+        if query_embedding is None:
+            embed_model = AIServiceEmbedding(
+                get_ai_service(), model_name=self.kb_config.embedding_model
+            )
+            query_embedding = await embed_model.aget_query_embedding(question)
+        index = await asyncio.to_thread(KnowledgeBaseService(self.kb_config).get_index)
+        retriever = self._build_retriever(index, top_k, metadata_filters)
+        query_bundle = QueryBundle(query_str=question, embedding=query_embedding)
+        retrieved_nodes = await asyncio.to_thread(retriever.retrieve, query_bundle)
+        return self._filter_nodes(retrieved_nodes, top_k)
+
+    def _build_retriever(
+        self, index: VectorStoreIndex, top_k: int, metadata_filters: dict | None
+    ) -> BaseRetriever:
         initial_retrieve_count = max(
             top_k * self.initial_retrieve_multiplier,
             self.min_initial_retrieve,
         )
-        retriever = index.as_retriever(similarity_top_k=initial_retrieve_count)
+        if not metadata_filters:
+            return index.as_retriever(similarity_top_k=initial_retrieve_count)
 
-        if metadata_filters:
-            from llama_index.core.vector_stores import (  # noqa: PLC0415
-                MetadataFilter,
-                MetadataFilters,
-            )
+        from llama_index.core.vector_stores import (  # noqa: PLC0415
+            MetadataFilter,
+            MetadataFilters,
+        )
 
-            filters = MetadataFilters(
-                filters=[
-                    MetadataFilter(key=k, value=v) for k, v in metadata_filters.items()
-                ]
-            )
-            retriever = index.as_retriever(
-                similarity_top_k=initial_retrieve_count,
-                filters=filters,
-            )
+        filters = MetadataFilters(
+            filters=[
+                MetadataFilter(key=k, value=v) for k, v in metadata_filters.items()
+            ]
+        )
+        return index.as_retriever(
+            similarity_top_k=initial_retrieve_count,
+            filters=filters,
+        )
 
-        retrieved_nodes = retriever.retrieve(question)
+    def _filter_nodes(
+        self, retrieved_nodes: list[NodeWithScore], top_k: int
+    ) -> list[NodeWithScore]:
         logger.info("[%s] Retrieved %d nodes", self.kb_id, len(retrieved_nodes))
 
         if retrieved_nodes:
@@ -89,21 +198,15 @@ class KBQueryService:
 
         filtered = filtered[:top_k]
         logger.info("[%s] After filtering: %d nodes (returned)", self.kb_id, len(filtered))
+        return filtered
 
-        if not filtered:
-            return {
-                "answer": f"No relevant information found in {self.kb_name}.",
-                "sources": [],
-                "scores": [],
-                "has_results": False,
-                "kb_id": self.kb_id,
-                "kb_name": self.kb_name,
-            }
-
+    def _build_context(
+        self, question: str, nodes: list[NodeWithScore]
+    ) -> tuple[str, list[dict], list[float]]:
         context_parts: list[str] = []
         sources: list[dict] = []
         scores: list[float] = []
-        for i, node in enumerate(filtered, 1):
+        for i, node in enumerate(nodes, 1):
             context_parts.append(f"[Source {i} - {self.kb_name}]\n{node.text}\n")
             sources.append(
                 {
@@ -117,16 +220,19 @@ class KBQueryService:
             )
             scores.append(float(node.score))
 
-        prompt = self._build_prompt(question, "\n".join(context_parts))
-        try:
-            llm = Settings.llm
-            response = llm.complete(prompt)
-            answer = response.text.strip()
-            logger.info("[%s] Answer generated: %d chars", self.kb_id, len(answer))
-        except Exception as exc:
-            logger.error("[%s] Generation failed: %s", self.kb_id, exc)
-            raise
+        return self._build_prompt(question, "\n".join(context_parts)), sources, scores
 
+    def _empty_result(self) -> dict:
+        return {
+            "answer": f"No relevant information found in {self.kb_name}.",
+            "sources": [],
+            "scores": [],
+            "has_results": False,
+            "kb_id": self.kb_id,
+            "kb_name": self.kb_name,
+        }
+
+    def _result(self, answer: str, sources: list[dict], scores: list[float]) -> dict:
         return {
             "answer": answer,
             "sources": sources,
@@ -144,12 +250,33 @@ class KBQueryService:
         )
 
 
+@dataclass(frozen=True)
+class _QueryPlan:
+    kb_configs: list[KBConfig]
+    question: str
+    profile: QueryProfile
+    top_k: int
+    metadata_filters: dict | None
+    scope: str
+    no_results: dict
+
+    def cache_key(self) -> QueryCacheKey:
+        return QueryCacheKey.build(
+            [kb.id for kb in self.kb_configs],
+            self.question,
+            self.top_k,
+            self.metadata_filters,
+            self.scope,
+        )
+
+
 class MultiKBQueryService:
     """Aggregate queries across multiple knowledge bases."""
 
-    def __init__(self, kb_manager: KBManager):
+    def __init__(self, kb_manager: KBManager, query_cache: QueryResultCache | None = None):
         self.kb_manager = kb_manager
         self._kb_services: dict[str, KBQueryService] = {}
+        self._query_cache = query_cache if query_cache is not None else get_query_cache()
         logger.info("MultiKBQueryService initialized")
 
     def _get_kb_service(self, kb_config: KBConfig) -> KBQueryService:
@@ -176,29 +303,263 @@ class MultiKBQueryService:
                 "kbs_queried": [],
             }
 
+        return self._run_cached(
+            _QueryPlan(
+                kb_configs=kb_configs,
+                question=question,
+                profile=profile,
+                top_k=top_k_per_kb,
+                metadata_filters=metadata_filters,
+                scope=f"profile:{profile.value}",
+                no_results={
+                    "answer": "No relevant information found across knowledge bases.",
+                    "sources": [],
+                    "has_results": False,
+                    "kbs_queried": [kb.id for kb in kb_configs],
+                },
+            )
+        )
+
+    def query_specific_kbs(
+        self,
+        question: str,
+        kb_ids: list[str],
+        top_k: int = 5,
+        metadata_filters: dict | None = None,
+    ) -> dict:
+        logger.info("Query specific KBs: %s", kb_ids)
+        return self._run_cached(self._specific_kbs_plan(question, kb_ids, top_k, metadata_filters))
+
+    def query_kbs(
+        self,
+        question: str,
+        kb_ids: list[str],
+        top_k_per_kb: int = 5,
+        metadata_filters: dict | None = None,
+    ) -> dict:
+        return self.query_specific_kbs(
+            question=question,
+            kb_ids=kb_ids,
+            top_k=top_k_per_kb,
+            metadata_filters=metadata_filters,
+        )
+
+    async def aquery_profile(
+        self,
+        question: str,
+        profile: QueryProfile,
+        top_k_per_kb: int = 3,
+        metadata_filters: dict | None = None,
+        deadline_seconds: float | None = None,
+    ) -> dict:
+        """Concurrent variant of ``query_profile`` bounded by a per-request deadline."""
+        logger.info("Async query with profile: %s", profile.value)
+
+        kb_configs = self.kb_manager.get_kbs_for_profile(profile.value)
+        if not kb_configs:
+            logger.warning("No KBs found for profile: %s", profile.value)
+            return {
+                "answer": f"No knowledge bases available for {profile.value} profile.",
+                "sources": [],
+                "has_results": False,
+                "kbs_queried": [],
+            }
+
+        return await self._arun_cached(
+            _QueryPlan(
+                kb_configs=kb_configs,
+                question=question,
+                profile=profile,
+                top_k=top_k_per_kb,
+                metadata_filters=metadata_filters,
+                scope=f"profile:{profile.value}",
+                no_results={
+                    "answer": "No relevant information found across knowledge bases.",
+                    "sources": [],
+                    "has_results": False,
+                    "kbs_queried": [kb.id for kb in kb_configs],
+                },
+            ),
+            deadline_seconds,
+        )
+
+    async def aquery_specific_kbs(
+        self,
+        question: str,
+        kb_ids: list[str],
+        top_k: int = 5,
+        metadata_filters: dict | None = None,
+        deadline_seconds: float | None = None,
+    ) -> dict:
+        """Concurrent variant of ``query_specific_kbs`` bounded by a per-request deadline."""
+        logger.info("Async query specific KBs: %s", kb_ids)
+        return await self._arun_cached(
+            self._specific_kbs_plan(question, kb_ids, top_k, metadata_filters),
+            deadline_seconds,
+        )
+
+    async def aquery_kbs(
+        self,
+        question: str,
+        kb_ids: list[str],
+        top_k_per_kb: int = 5,
+        metadata_filters: dict | None = None,
+        deadline_seconds: float | None = None,
+    ) -> dict:
+        return await self.aquery_specific_kbs(
+            question=question,
+            kb_ids=kb_ids,
+            top_k=top_k_per_kb,
+            metadata_filters=metadata_filters,
+            deadline_seconds=deadline_seconds,
+        )
+
+    def _specific_kbs_plan(
+        self, question: str, kb_ids: list[str], top_k: int, metadata_filters: dict | None
+    ) -> _QueryPlan:
+        kb_configs: list[KBConfig] = []
+        for kb_id in kb_ids:
+            kb_config = self.kb_manager.get_kb(kb_id)
+            if not kb_config or not kb_config.is_active:
+                logger.warning("KB not found or inactive: %s", kb_id)
+                continue
+            kb_configs.append(kb_config)
+
+        return _QueryPlan(
+            kb_configs=kb_configs,
+            question=question,
+            profile=QueryProfile.CHAT,
+            top_k=top_k,
+            metadata_filters=metadata_filters,
+            scope="kbs",
+            no_results={
+                "answer": "No relevant information found.",
+                "sources": [],
+                "has_results": False,
+                "kbs_queried": kb_ids,
+            },
+        )
+
+    # ── Cached execution ─────────────────────────────────────────────────────
+
+    def _run_cached(self, plan: _QueryPlan) -> dict:
+        if not plan.kb_configs:
+            return plan.no_results
+
+        key = plan.cache_key()
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            embeddings = self._embed_question(plan.question, plan.kb_configs)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Shared question embedding failed, KBs will embed individually: %s", exc)
+            embeddings = {}
+        primary_model, primary_embedding = _primary_embedding(embeddings)
+        cached = self._query_cache.get_similar(key, primary_model, primary_embedding)
+        if cached is not None:
+            return cached
+
+        if self._synthesis_mode(plan.profile) == SYNTHESIS_SINGLE:
+            result, complete = self._synthesize(plan, embeddings)
+        else:
+            result, complete = self._answer_per_kb(plan, embeddings)
+
+        if result is None:
+            return plan.no_results
+        if complete:
+            self._query_cache.put(key, result, primary_model, primary_embedding)
+        return result
+
+    async def _arun_cached(self, plan: _QueryPlan, deadline_seconds: float | None) -> dict:
+        if not plan.kb_configs:
+            return plan.no_results
+
+        key = plan.cache_key()
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        deadline = (
+            deadline_seconds
+            if deadline_seconds is not None
+            else get_app_settings().kb_query_deadline_seconds
+        )
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        try:
+            embeddings = await asyncio.wait_for(
+                self._aembed_question(plan.question, plan.kb_configs), timeout=deadline
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Question embedding missed the %.1fs query deadline", deadline)
+            return plan.no_results
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Shared question embedding failed, KBs will embed individually: %s", exc)
+            embeddings = {}
+        primary_model, primary_embedding = _primary_embedding(embeddings)
+        cached = self._query_cache.get_similar(key, primary_model, primary_embedding)
+        if cached is not None:
+            return cached
+
+        remaining = max(deadline - (loop.time() - started), 0.0)
+        if self._synthesis_mode(plan.profile) == SYNTHESIS_SINGLE:
+            result, complete = await self._asynthesize(plan, embeddings, remaining)
+        else:
+            result, complete = await self._aanswer_per_kb(plan, embeddings, remaining)
+
+        if result is None:
+            return plan.no_results
+        if complete:
+            self._query_cache.put(key, result, primary_model, primary_embedding)
+        return result
+
+    # ── Per-KB answers ───────────────────────────────────────────────────────
+
+    def _answer_per_kb(
+        self, plan: _QueryPlan, embeddings: dict[str, list[float]]
+    ) -> tuple[dict | None, bool]:
         results: list[dict] = []
-        for kb_config in kb_configs:
+        complete = True
+        for kb_config in plan.kb_configs:
             try:
                 service = self._get_kb_service(kb_config)
                 outcome = service.query(
-                    question=question,
-                    top_k=top_k_per_kb,
-                    metadata_filters=metadata_filters,
+                    question=plan.question,
+                    top_k=plan.top_k,
+                    metadata_filters=plan.metadata_filters,
+                    query_embedding=embeddings.get(kb_config.embedding_model),
                 )
                 if outcome["has_results"]:
                     results.append(outcome)
             except Exception as exc:  # noqa: BLE001
                 logger.error("Failed to query KB %s: %s", kb_config.id, exc)
+                complete = False
 
         if not results:
-            return {
-                "answer": "No relevant information found across knowledge bases.",
-                "sources": [],
-                "has_results": False,
-                "kbs_queried": [kb.id for kb in kb_configs],
-            }
-
-        return self._merge_results(results, question, profile)
+            return None, complete
+        return self._merge_results(results, plan.question, plan.profile), complete
+
+    async def _aanswer_per_kb(
+        self, plan: _QueryPlan, embeddings: dict[str, list[float]], timeout: float
+    ) -> tuple[dict | None, bool]:
+        outcomes, complete = await self._afan_out(
+            plan.kb_configs,
+            embeddings,
+            timeout,
+            lambda service, embedding: service.aquery(
+                question=plan.question,
+                top_k=plan.top_k,
+                metadata_filters=plan.metadata_filters,
+                query_embedding=embedding,
+            ),
+        )
+        results = [outcome for outcome in outcomes if outcome["has_results"]]
+        if not results:
+            return None, complete
+        return self._merge_results(results, plan.question, plan.profile), complete
 
     def _merge_results(
         self, all_results: list[dict], question: str, profile: QueryProfile
@@ -235,54 +596,167 @@ class MultiKBQueryService:
             "kb_count": len(all_results),
         }
 
-    def query_specific_kbs(
-        self,
-        question: str,
-        kb_ids: list[str],
-        top_k: int = 5,
-        metadata_filters: dict | None = None,
-    ) -> dict:
-        logger.info("Query specific KBs: %s", kb_ids)
+    # ── Single synthesis ─────────────────────────────────────────────────────
 
-        results: list[dict] = []
-        for kb_id in kb_ids:
-            kb_config = self.kb_manager.get_kb(kb_id)
-            if not kb_config or not kb_config.is_active:
-                logger.warning("KB not found or inactive: %s", kb_id)
-                continue
+    def _synthesis_mode(self, profile: QueryProfile) -> str:
+        settings = get_app_settings()
+        if profile == QueryProfile.CHAT:
+            return settings.kb_synthesis_mode_chat
+        return settings.kb_synthesis_mode_proposal
 
+    def _max_sources(self, profile: QueryProfile) -> int:
+        settings = get_app_settings()
+        if profile == QueryProfile.CHAT:
+            return settings.kb_max_sources_chat
+        return settings.kb_max_sources_proposal
+
+    def _synthesize(
+        self, plan: _QueryPlan, embeddings: dict[str, list[float]]
+    ) -> tuple[dict | None, bool]:
+        """Retrieve from every KB, then answer once over the merged context."""
+        per_kb_nodes: list[list[RankedNode]] = []
+        complete = True
+        for kb_config in plan.kb_configs:
             try:
                 service = self._get_kb_service(kb_config)
-                outcome = service.query(
-                    question=question,
-                    top_k=top_k,
-                    metadata_filters=metadata_filters,
+                nodes = service.retrieve(
+                    plan.question,
+                    plan.top_k,
+                    plan.metadata_filters,
+                    embeddings.get(kb_config.embedding_model),
                 )
-                if outcome["has_results"]:
-                    results.append(outcome)
+                per_kb_nodes.append(self._rank(service, nodes))
             except Exception as exc:  # noqa: BLE001
-                logger.error("Failed to query KB %s: %s", kb_id, exc)
+                logger.error("Failed to retrieve from KB %s: %s", kb_config.id, exc)
+                complete = False
 
-        if not results:
-            return {
-                "answer": "No relevant information found.",
-                "sources": [],
-                "has_results": False,
-                "kbs_queried": kb_ids,
-            }
+        merged = merge_ranked_nodes(per_kb_nodes, plan.top_k, self._max_sources(plan.profile))
+        if not merged:
+            return None, complete
 
-        return self._merge_results(results, question, QueryProfile.CHAT)
+        response = Settings.llm.complete(build_synthesis_prompt(plan.question, merged))
+        return self._synthesis_result(response.text.strip(), merged), complete
 
-    def query_kbs(
+    async def _asynthesize(
+        self, plan: _QueryPlan, embeddings: dict[str, list[float]], timeout: float
+    ) -> tuple[dict | None, bool]:
+        """Async ``_synthesize``: concurrent retrieval under the deadline, then one LLM call."""
+
+        async def retrieve(service: KBQueryService, embedding: list[float] | None) -> list[RankedNode]:
+            nodes = await service.aretrieve(
+                plan.question, plan.top_k, plan.metadata_filters, embedding
+            )
+            return self._rank(service, nodes)
+
+        per_kb_nodes, complete = await self._afan_out(
+            plan.kb_configs, embeddings, timeout, retrieve
+        )
+        merged = merge_ranked_nodes(per_kb_nodes, plan.top_k, self._max_sources(plan.profile))
+        if not merged:
+            return None, complete
+
+        response = await Settings.llm.acomplete(build_synthesis_prompt(plan.question, merged))
+        return self._synthesis_result(response.text.strip(), merged), complete
+
+    @staticmethod
+    def _rank(service: KBQueryService, nodes: list[NodeWithScore]) -> list[RankedNode]:
+        return [RankedNode(kb_id=service.kb_id, kb_name=service.kb_name, node=node) for node in nodes]
+
+    def _synthesis_result(self, answer: str, merged: list[RankedNode]) -> dict:
+        kb_ids = list(dict.fromkeys(ranked.kb_id for ranked in merged))
+        logger.info(
+            "Synthesized one answer from %d nodes across %d KBs", len(merged), len(kb_ids)
+        )
+        return {
+            "answer": answer,
+            "sources": [to_source(ranked) for ranked in merged],
+            "has_results": True,
+            "kbs_queried": kb_ids,
+            "kb_count": len(kb_ids),
+        }
+
+    # ── Fan-out and embedding ────────────────────────────────────────────────
+
+    async def _afan_out(
         self,
-        question: str,
-        kb_ids: list[str],
-        top_k_per_kb: int = 5,
-        metadata_filters: dict | None = None,
-    ) -> dict:
-        return self.query_specific_kbs(
-            question=question,
-            kb_ids=kb_ids,
-            top_k=top_k_per_kb,
-            metadata_filters=metadata_filters,
+        kb_configs: list[KBConfig],
+        embeddings: dict[str, list[float]],
+        timeout: float,
+        call: Callable[[KBQueryService, list[float] | None], Awaitable[_T]],
+    ) -> tuple[list[_T], bool]:
+        """Run ``call`` for every KB concurrently and return the outcomes in KB order.
+
+        KBs still running after ``timeout`` seconds are cancelled and dropped; the
+        flag is False when any KB was dropped or failed. Retrieval already handed
+        to a worker thread finishes in the background.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        tasks = {
+            asyncio.create_task(
+                call(
+                    self._get_kb_service(kb_config),
+                    embeddings.get(kb_config.embedding_model),
+                ),
+                name=f"kb-query-{kb_config.id}",
+            ): kb_config
+            for kb_config in kb_configs
+        }
+        _done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+        outcomes: list[_T] = []
+        complete = not pending
+        for task, kb_config in tasks.items():
+            if task in pending:
+                logger.warning("KB %s missed the query deadline - dropped", kb_config.id)
+                continue
+            exc = task.exception()
+            if exc is not None:
+                logger.error("Failed to query KB %s: %s", kb_config.id, exc)
+                complete = False
+                continue
+            outcomes.append(task.result())
+
+        logger.info(
+            "Multi-KB fan-out: %d/%d KBs answered in %.2fs",
+            len(outcomes),
+            len(kb_configs),
+            loop.time() - started,
+        )
+        return outcomes, complete
+
+    def _embed_question(
+        self, question: str, kb_configs: list[KBConfig]
+    ) -> dict[str, list[float]]:
+        """Embed the question once per distinct embedding model used by ``kb_configs``."""
+        ai_service = get_ai_service()
+        return {
+            model: AIServiceEmbedding(ai_service, model_name=model).get_query_embedding(question)
+            for model in sorted({kb_config.embedding_model for kb_config in kb_configs})
+        }
+
+    async def _aembed_question(
+        self, question: str, kb_configs: list[KBConfig]
+    ) -> dict[str, list[float]]:
+        """Async ``_embed_question``; models are embedded concurrently."""
+        ai_service = get_ai_service()
+        models = sorted({kb_config.embedding_model for kb_config in kb_configs})
+        vectors = await asyncio.gather(
+            *(
+                AIServiceEmbedding(ai_service, model_name=model).aget_query_embedding(question)
+                for model in models
+            )
         )
+        return dict(zip(models, vectors, strict=True))
+
+
+def _primary_embedding(
+    embeddings: dict[str, list[float]],
+) -> tuple[str | None, list[float] | None]:
+    """Pick a deterministic embedding for the semantic cache level."""
+    if not embeddings:
+        return None, None
+    model = min(embeddings)
+    return model, embeddings[model]
@@ -1,16 +1,29 @@
 """Knowledge infrastructure package."""
 
+from .index_cache import IndexCache
 from .knowledge_base_manager import KBManager
 from .models import KBConfig
 from .multi_query import MultiSourceQueryService, QueryProfile
-from .service import KnowledgeBaseService, clear_index_cache, get_cached_index_count
+from .query_cache import QueryCacheKey, QueryResultCache, get_query_cache, invalidate_query_cache
+from .service import (
+    KnowledgeBaseService,
+    clear_index_cache,
+    get_cached_index_count,
+    get_index_cache,
+)
 
 __all__ = [
+    "IndexCache",
     "KBConfig",
     "KBManager",
     "KnowledgeBaseService",
     "MultiSourceQueryService",
+    "QueryCacheKey",
     "QueryProfile",
+    "QueryResultCache",
     "clear_index_cache",
     "get_cached_index_count",
+    "get_index_cache",
+    "get_query_cache",
+    "invalidate_query_cache",
 ]
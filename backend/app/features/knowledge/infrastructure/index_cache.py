@@ -0,0 +1,180 @@
+"""Memory-budgeted LRU cache of loaded knowledge-base indexes."""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from llama_index.core import VectorStoreIndex
+
+from app.shared.vector_store import VECTOR_FILE
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_index_bytes(storage_dir: str) -> int:
+    """
+    Estimate the resident size of an index from its files on disk.
+
+    JSON stores are parsed fully into memory, so their file size is a lower
+    bound on what they cost. The mmap vector file is skipped: its pages belong
+    to the OS page cache, not the process heap.
+    """
+    total = 0
+    try:
+        with os.scandir(storage_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name != VECTOR_FILE:
+                    total += entry.stat().st_size
+    except OSError:
+        return 0
+    return total
+
+
+@dataclass
+class _CachedIndex:
+    kb_id: str
+    index: VectorStoreIndex
+    size_bytes: int
+    load_seconds: float
+    loaded_at: float = field(default_factory=time.time)
+    last_used_at: float = field(default_factory=time.time)
+    hits: int = 0
+
+
+class IndexCache:
+    """
+    LRU of ``VectorStoreIndex`` objects keyed by storage directory.
+
+    Loads are lazy and serialised per key, so concurrent first queries for the
+    same KB trigger a single load. When the estimated total size exceeds
+    ``max_bytes`` the least recently used indexes are evicted; the index just
+    loaded is always kept, even if it alone is over budget.
+    """
+
+    def __init__(self, max_bytes: int = 0, max_entries: int = 0) -> None:
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _CachedIndex] = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._evictions = 0
+
+    def __contains__(self, storage_dir: object) -> bool:
+        with self._lock:
+            return storage_dir in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, storage_dir: str) -> VectorStoreIndex | None:
+        with self._lock:
+            entry = self._entries.get(storage_dir)
+            if entry is None:
+                return None
+            self._entries.move_to_end(storage_dir)
+            entry.hits += 1
+            entry.last_used_at = time.time()
+            return entry.index
+
+    def get_or_load(
+        self,
+        storage_dir: str,
+        kb_id: str,
+        loader: Callable[[], VectorStoreIndex],
+    ) -> VectorStoreIndex:
+        index = self.get(storage_dir)
+        if index is not None:
+            logger.info(f"[{kb_id}] Using cached index")
+            return index
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(storage_dir, threading.Lock())
+
+        with load_lock:
+            index = self.get(storage_dir)
+            if index is not None:
+                return index
+
+            start = time.perf_counter()
+            index = loader()
+            load_seconds = time.perf_counter() - start
+            self.put(storage_dir, kb_id, index, load_seconds)
+            return index
+
+    def put(
+        self,
+        storage_dir: str,
+        kb_id: str,
+        index: VectorStoreIndex,
+        load_seconds: float = 0.0,
+    ) -> None:
+        size_bytes = estimate_index_bytes(storage_dir)
+        with self._lock:
+            self._entries[storage_dir] = _CachedIndex(
+                kb_id=kb_id,
+                index=index,
+                size_bytes=size_bytes,
+                load_seconds=load_seconds,
+            )
+            self._entries.move_to_end(storage_dir)
+            evicted = self._evict_locked()
+
+        logger.info(
+            f"[{kb_id}] Index cached (~{size_bytes / 1_048_576:.1f} MiB, loaded in {load_seconds:.2f}s)"
+        )
+        for evicted_kb_id, evicted_bytes in evicted:
+            logger.info(
+                f"[{evicted_kb_id}] Evicted index from cache (~{evicted_bytes / 1_048_576:.1f} MiB)"
+            )
+
+    def _evict_locked(self) -> list[tuple[str, int]]:
+        evicted: list[tuple[str, int]] = []
+        while len(self._entries) > 1 and self._over_budget_locked():
+            _storage_dir, entry = self._entries.popitem(last=False)
+            evicted.append((entry.kb_id, entry.size_bytes))
+            self._evictions += 1
+        return evicted
+
+    def _over_budget_locked(self) -> bool:
+        if self.max_entries and len(self._entries) > self.max_entries:
+            return True
+        if self.max_bytes:
+            return sum(entry.size_bytes for entry in self._entries.values()) > self.max_bytes
+        return False
+
+    def invalidate(self, storage_dir: str) -> bool:
+        with self._lock:
+            return self._entries.pop(storage_dir, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            total_bytes = sum(entry.size_bytes for entry in self._entries.values())
+            return {
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "total_bytes": total_bytes,
+                "evictions": self._evictions,
+                "indexes": [
+                    {
+                        "kb_id": entry.kb_id,
+                        "storage_dir": storage_dir,
+                        "size_bytes": entry.size_bytes,
+                        "load_seconds": round(entry.load_seconds, 3),
+                        "hits": entry.hits,
+                        "loaded_at": entry.loaded_at,
+                        "last_used_at": entry.last_used_at,
+                    }
+                    # Most recently used first
+                    for storage_dir, entry in reversed(self._entries.items())
+                ],
+            }
@@ -6,6 +6,7 @@ import os
 import shutil
 import stat
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, cast
 
@@ -192,33 +193,46 @@ class KBManager:
         self._load_config()
         logger.info(f"Deleted KB: {kb_id}")
 
-    def preload_all_indices(self) -> dict[str, float]:
-        """Preload indices for all active knowledge bases at startup."""
+    def warm_up_indices(
+        self, max_kbs: int | None = None, max_workers: int | None = None
+    ) -> dict[str, float]:
+        """
+        Load the indexes of the highest-priority active KBs in parallel.
+
+        Remaining KBs are loaded lazily on their first query. Returns load time
+        per KB in seconds (-1.0 on failure).
+        """
+        settings = get_app_settings()
+        limit = settings.kb_index_warmup_count if max_kbs is None else max_kbs
+        workers = max_workers or settings.kb_index_warmup_workers
         timing: dict[str, float] = {}
-        active_kbs = self.get_active_kbs()
 
-        if not active_kbs:
-            logger.info("No active KBs to preload")
+        candidates = sorted(self.get_active_kbs(), key=lambda kb: kb.priority)[:limit]
+        if not candidates:
+            logger.info("No KB indices to warm up (lazy loading on first query)")
             return timing
 
-        logger.info(f"Preloading {len(active_kbs)} active KB indices...")
-
-        for kb_config in active_kbs:
-            try:
-                start = time.perf_counter()
-                service = KnowledgeBaseService(kb_config)
-                service.get_index()
-                elapsed = time.perf_counter() - start
-                timing[kb_config.id] = elapsed
-                logger.info(f"  [ok] [{kb_config.id}] Loaded in {elapsed:.2f}s")
-            except Exception as e:  # noqa: BLE001
-                logger.error(f"  [fail] [{kb_config.id}] Failed to load: {e}")
-                timing[kb_config.id] = -1.0
-
-        total_time = sum(t for t in timing.values() if t > 0)
-        success_count = sum(1 for t in timing.values() if t > 0)
         logger.info(
-            f"Preloaded {success_count}/{len(active_kbs)} indices in {total_time:.2f}s total"
+            f"Warming up {len(candidates)} KB indices with {workers} workers: "
+            f"{', '.join(kb.id for kb in candidates)}"
         )
 
+        def load(kb_config: KBConfig) -> float:
+            start = time.perf_counter()
+            KnowledgeBaseService(kb_config).get_index()
+            return time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kb-warmup") as pool:
+            futures = {pool.submit(load, kb_config): kb_config for kb_config in candidates}
+            for future in as_completed(futures):
+                kb_config = futures[future]
+                try:
+                    timing[kb_config.id] = future.result()
+                    logger.info(f"  [ok] [{kb_config.id}] Loaded in {timing[kb_config.id]:.2f}s")
+                except Exception as e:  # noqa: BLE001
+                    logger.error(f"  [fail] [{kb_config.id}] Failed to load: {e}")
+                    timing[kb_config.id] = -1.0
+
+        success_count = sum(1 for t in timing.values() if t > 0)
+        logger.info(f"Warmed up {success_count}/{len(candidates)} indices")
         return timing
@@ -28,6 +28,13 @@ class KBConfig:
         self.chunk_overlap: int = config_dict.get(
             "chunk_overlap", kb_defaults.chunk_overlap
         )
+        self.embedding_batch_size: int = config_dict.get(
+            "embedding_batch_size", kb_defaults.embedding_batch_size
+        )
+        self.embedding_concurrency: int = config_dict.get(
+            "embedding_concurrency", kb_defaults.embedding_concurrency
+        )
+        self.vector_store: str = config_dict.get("vector_store", kb_defaults.vector_store)
         self.source_url: str = config_dict.get("source_url", "")
         self.paths: dict[str, Any] = config_dict.get("paths", {})
         self.indexed: bool = bool(config_dict.get("indexed", False))
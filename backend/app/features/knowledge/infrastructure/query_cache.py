@@ -0,0 +1,217 @@
+"""Two-level result cache for knowledge-base queries."""
+
+import copy
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from app.shared.config.app_settings import get_app_settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_question(question: str) -> str:
+    return " ".join(question.split()).lower()
+
+
+@dataclass(frozen=True)
+class QueryCacheKey:
+    """Exact-match key: KB set, normalised question, top_k, filters and query scope."""
+
+    kb_ids: tuple[str, ...]
+    question: str
+    top_k: int
+    filters: str
+    scope: str
+
+    @classmethod
+    def build(
+        cls,
+        kb_ids: list[str],
+        question: str,
+        top_k: int,
+        metadata_filters: dict | None,
+        scope: str,
+    ) -> "QueryCacheKey":
+        return cls(
+            kb_ids=tuple(sorted(set(kb_ids))),
+            question=normalize_question(question),
+            top_k=top_k,
+            filters=json.dumps(metadata_filters or {}, sort_keys=True, default=str),
+            scope=scope,
+        )
+
+    @property
+    def partition(self) -> tuple[tuple[str, ...], int, str, str]:
+        """Everything but the question; semantic hits must match it exactly."""
+        return (self.kb_ids, self.top_k, self.filters, self.scope)
+
+
+@dataclass
+class _SemanticEntry:
+    partition: tuple[tuple[str, ...], int, str, str]
+    embedding_model: str
+    vector: np.ndarray
+    result: dict[str, Any]
+
+
+class QueryResultCache:
+    """
+    Exact LRU plus embedding-similarity cache for query results.
+
+    Level one matches ``QueryCacheKey`` exactly. Level two compares the question
+    embedding against cached questions with the same partition and embedding
+    model and returns the best match at or above ``similarity_threshold``.
+    Both levels are bounded LRUs and are dropped per KB by ``invalidate``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        similarity_threshold: float = 0.97,
+        enabled: bool = True,
+    ) -> None:
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.enabled = enabled and max_entries > 0
+        self._exact: OrderedDict[QueryCacheKey, dict[str, Any]] = OrderedDict()
+        self._semantic: OrderedDict[QueryCacheKey, _SemanticEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+        }
+
+    def get(self, key: QueryCacheKey) -> dict[str, Any] | None:
+        """Exact lookup. Does not count a miss; callers fall through to ``get_similar``."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            result = self._exact.get(key)
+            if result is None:
+                return None
+            self._exact.move_to_end(key)
+            self._counters["exact_hits"] += 1
+            return copy.deepcopy(result)
+
+    def get_similar(
+        self,
+        key: QueryCacheKey,
+        embedding_model: str | None,
+        embedding: list[float] | None,
+    ) -> dict[str, Any] | None:
+        """Semantic lookup; counts a miss when nothing is close enough."""
+        if not self.enabled:
+            return None
+        vector = _unit(embedding)
+        with self._lock:
+            best_key: QueryCacheKey | None = None
+            best_score = self.similarity_threshold
+            if vector is not None and embedding_model:
+                for cached_key, entry in self._semantic.items():
+                    if entry.partition != key.partition or entry.embedding_model != embedding_model:
+                        continue
+                    if entry.vector.shape != vector.shape:
+                        continue
+                    score = float(np.dot(entry.vector, vector))
+                    if score >= best_score:
+                        best_key, best_score = cached_key, score
+
+            if best_key is None:
+                self._counters["misses"] += 1
+                return None
+
+            self._semantic.move_to_end(best_key)
+            self._counters["semantic_hits"] += 1
+            logger.debug("Semantic query cache hit (cosine=%.4f): %s", best_score, best_key.question)
+            return copy.deepcopy(self._semantic[best_key].result)
+
+    def put(
+        self,
+        key: QueryCacheKey,
+        result: dict[str, Any],
+        embedding_model: str | None = None,
+        embedding: list[float] | None = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        stored = copy.deepcopy(result)
+        vector = _unit(embedding)
+        with self._lock:
+            self._exact[key] = stored
+            self._exact.move_to_end(key)
+            while len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
+
+            if vector is not None and embedding_model:
+                self._semantic[key] = _SemanticEntry(key.partition, embedding_model, vector, stored)
+                self._semantic.move_to_end(key)
+                while len(self._semantic) > self.max_entries:
+                    self._semantic.popitem(last=False)
+
+    def invalidate(self, kb_id: str | None = None) -> int:
+        """Drop entries touching ``kb_id`` (all entries when None); returns how many were removed."""
+        with self._lock:
+            if kb_id is None:
+                removed = len(self._exact) + len(self._semantic)
+                self._exact.clear()
+                self._semantic.clear()
+            else:
+                exact_keys = [key for key in self._exact if kb_id in key.kb_ids]
+                semantic_keys = [key for key in self._semantic if kb_id in key.kb_ids]
+                for key in exact_keys:
+                    del self._exact[key]
+                for key in semantic_keys:
+                    del self._semantic[key]
+                removed = len(exact_keys) + len(semantic_keys)
+            self._counters["invalidations"] += 1
+
+        if removed:
+            logger.info("Invalidated %d query cache entries for KB %s", removed, kb_id or "*")
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            hits = self._counters["exact_hits"] + self._counters["semantic_hits"]
+            lookups = hits + self._counters["misses"]
+            return {
+                "enabled": self.enabled,
+                **self._counters,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "exact_entries": len(self._exact),
+                "semantic_entries": len(self._semantic),
+                "max_entries": self.max_entries,
+                "similarity_threshold": self.similarity_threshold,
+            }
+
+
+def _unit(embedding: list[float] | None) -> np.ndarray | None:
+    if not embedding:
+        return None
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return None
+    return vector / norm
+
+
+@lru_cache(maxsize=1)
+def get_query_cache() -> QueryResultCache:
+    settings = get_app_settings()
+    return QueryResultCache(
+        max_entries=settings.kb_query_cache_max_entries,
+        similarity_threshold=settings.kb_query_cache_similarity_threshold,
+        enabled=settings.kb_query_cache_enabled,
+    )
+
+
+def invalidate_query_cache(kb_id: str | None = None) -> int:
+    return get_query_cache().invalidate(kb_id)
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from functools import lru_cache
 from typing import cast
 
 from llama_index.core import Settings, StorageContext, VectorStoreIndex, load_index_from_storage
@@ -9,12 +10,22 @@ from llama_index.core import Settings, StorageContext, VectorStoreIndex, load_in
 from app.shared.ai import get_ai_service
 from app.shared.ai.adapters import AIServiceEmbedding, AIServiceLLM
 from app.shared.config.app_settings import get_app_settings
+from app.shared.vector_store import VECTOR_STORE_MMAP, MmapVectorStore, is_mmap_store_dir
 
+from .index_cache import IndexCache
 from .models import KBConfig
+from .query_cache import invalidate_query_cache
 
 logger = logging.getLogger(__name__)
 
-_INDEX_CACHE: dict[str, VectorStoreIndex] = {}
+
+@lru_cache(maxsize=1)
+def get_index_cache() -> IndexCache:
+    settings = get_app_settings()
+    return IndexCache(
+        max_bytes=settings.kb_index_cache_max_mb * 1_048_576,
+        max_entries=settings.kb_index_cache_max_entries,
+    )
 
 
 class KnowledgeBaseService:
@@ -47,28 +58,34 @@ class KnowledgeBaseService:
 
     def _load_index(self) -> VectorStoreIndex:
         self._ensure_settings()
+        return get_index_cache().get_or_load(self.storage_dir, self.kb_id, self._read_index)
 
-        cache_key = self.storage_dir
-        if cache_key in _INDEX_CACHE:
-            logger.info(f"[{self.kb_id}] Using cached index")
-            return _INDEX_CACHE[cache_key]
-
+    def _read_index(self) -> VectorStoreIndex:
         logger.info(f"[{self.kb_id}] Loading index from {self.storage_dir}")
         if not os.path.exists(self.storage_dir):
             raise FileNotFoundError(f"Index not found: {self.storage_dir}")
 
-        storage_context = StorageContext.from_defaults(persist_dir=self.storage_dir)
-        index = cast(VectorStoreIndex, load_index_from_storage(storage_context))
-        _INDEX_CACHE[cache_key] = index
-        logger.info(f"[{self.kb_id}] Index loaded and cached")
+        if self._uses_mmap_store():
+            index = VectorStoreIndex.from_vector_store(
+                MmapVectorStore(persist_dir=self.storage_dir)
+            )
+        else:
+            storage_context = StorageContext.from_defaults(persist_dir=self.storage_dir)
+            index = cast(VectorStoreIndex, load_index_from_storage(storage_context))
+        logger.info(f"[{self.kb_id}] Index loaded")
         return index
 
+    def _uses_mmap_store(self) -> bool:
+        return self.kb_config.vector_store == VECTOR_STORE_MMAP
+
     def get_index(self) -> VectorStoreIndex:
         return self._load_index()
 
     def is_index_ready(self) -> bool:
         if not os.path.exists(self.storage_dir):
             return False
+        if self._uses_mmap_store():
+            return is_mmap_store_dir(self.storage_dir)
         docstore_path = os.path.join(self.storage_dir, "docstore.json")
         return os.path.exists(docstore_path)
 
@@ -76,16 +93,16 @@ class KnowledgeBaseService:
 def clear_index_cache(
     kb_id: str | None = None, storage_dir: str | None = None
 ) -> None:
+    invalidate_query_cache(kb_id if storage_dir else None)
     if storage_dir:
-        if storage_dir in _INDEX_CACHE:
-            del _INDEX_CACHE[storage_dir]
+        if get_index_cache().invalidate(storage_dir):
             logger.info(f"[{kb_id or 'Unknown'}] Cleared index cache for: {storage_dir}")
         else:
             logger.debug(f"[{kb_id or 'Unknown'}] Index not in cache: {storage_dir}")
     else:
-        _INDEX_CACHE.clear()
+        get_index_cache().clear()
         logger.info("Cleared all index caches")
 
 
 def get_cached_index_count() -> int:
-    return len(_INDEX_CACHE)
+    return len(get_index_cache())
@@ -45,6 +45,7 @@ from app.features.projects.application.pending_changes_service import (
 from app.features.projects.application.project_analysis_service import ProjectAnalysisService
 from app.features.projects.application.project_service import ProjectService
 from app.features.projects.application.state_edit_service import ProjectStateEditService
+from app.features.projects.application.state_log_service import ProjectStateLogService
 from app.features.projects.infrastructure import (
     ProjectArchitectureInputsRepository,
     ProjectWorkspaceRepository,
@@ -80,8 +81,10 @@ class _KnowledgeChatQueryAdapter:
     def __init__(self, query_service: Any) -> None:
         self._query_service = query_service
 
-    def query_chat_sources(self, message: str, *, top_k_per_kb: int = 3) -> list[dict[str, Any]]:
-        kb_res = self._query_service.query_profile(
+    async def query_chat_sources(
+        self, message: str, *, top_k_per_kb: int = 3
+    ) -> list[dict[str, Any]]:
+        kb_res = await self._query_service.aquery_profile(
             question=message,
             profile=QueryProfile.CHAT,
             top_k_per_kb=top_k_per_kb,
@@ -172,6 +175,7 @@ _requirements_extraction_entry_service = ProjectRequirementsExtractionEntryServi
     )
 )
 _project_state_edit_service = ProjectStateEditService()
+_project_state_log_service = ProjectStateLogService()
 _checklists_api_service = ChecklistsApiService()
 _settings_models_service = SettingsModelsService()
 _architecture_inputs_repository = ProjectArchitectureInputsRepository()
@@ -202,6 +206,10 @@ def get_state_edit_service_dep() -> ProjectStateEditService:
     return _project_state_edit_service
 
 
+def get_state_log_service_dep() -> ProjectStateLogService:
+    return _project_state_log_service
+
+
 def get_pending_changes_service_dep() -> ProjectPendingChangesService:
     return _pending_changes_service
 
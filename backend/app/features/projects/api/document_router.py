@@ -1,14 +1,16 @@
 """Project document endpoints owned by the projects feature."""
 
-from typing import Any
+from dataclasses import dataclass
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.projects.application.document_content_service import DocumentContentService
 from app.features.projects.application.document_service import DocumentService
 from app.features.projects.application.project_analysis_service import ProjectAnalysisService
+from app.features.projects.application.proposal_stream_service import stream_document_analysis
 from app.features.projects.application.requirements_extraction_entry_service import (
     ProjectRequirementsExtractionEntryService,
 )
@@ -27,20 +29,34 @@ from .project_models import DocumentsResponse, StateResponse
 router = APIRouter(prefix="/api", tags=["projects"])
 
 
+@dataclass(frozen=True)
+class DocumentUploadParams:
+    documents: Annotated[list[UploadFile] | None, File()] = None
+    files: Annotated[list[UploadFile] | None, File()] = None
+    background: bool = Query(
+        default=False,
+        description="Return immediately with parseStatus 'pending' and parse in the background",
+    )
+
+    def selected_files(self) -> list[UploadFile]:
+        return self.documents or self.files or []
+
+
 @router.post("/projects/{project_id}/documents", response_model=DocumentsResponse)
 async def upload_documents(
     project_id: str,
-    documents: list[UploadFile] | None = File(default=None),
-    files: list[UploadFile] | None = File(default=None),
+    upload: Annotated[DocumentUploadParams, Depends()],
     db: AsyncSession = Depends(get_db),
     document_service: DocumentService = Depends(get_document_service_dep),
 ) -> dict[str, Any]:
     """Upload documents for a project."""
-    selected_files = documents or files
+    selected_files = upload.selected_files()
     if not selected_files:
         raise HTTPException(status_code=400, detail="No files uploaded")
     try:
-        upload_result = await document_service.upload_documents(project_id, selected_files, db)
+        upload_result = await document_service.upload_documents(
+            project_id, selected_files, db, wait_for_parsing=not upload.background
+        )
     except ValueError as exc:
         raise map_value_error(exc, default_status=400) from exc
     return {
@@ -49,6 +65,19 @@ async def upload_documents(
     }
 
 
+@router.get("/projects/{project_id}/documents/status", response_model=DocumentsResponse)
+async def get_documents_parse_status(
+    project_id: str,
+    db: AsyncSession = Depends(get_db),
+    document_service: DocumentService = Depends(get_document_service_dep),
+) -> dict[str, Any]:
+    """Poll parse status of a project's documents (e.g. after a background upload)."""
+    try:
+        return await document_service.get_parse_status(project_id, db)
+    except ValueError as exc:
+        raise map_value_error(exc, default_status=400) from exc
+
+
 @router.get(
     "/projects/{project_id}/documents/{document_id}/content",
     response_class=FileResponse,
@@ -99,6 +128,24 @@ async def analyze_documents(
     return {"projectState": state}
 
 
+@router.post("/projects/{project_id}/analyze-docs/stream")
+async def analyze_documents_stream(
+    project_id: str,
+    db: AsyncSession = Depends(get_db),
+    project_analysis_service: ProjectAnalysisService = Depends(get_project_analysis_service_dep),
+) -> StreamingResponse:
+    """Analyze documents, streaming chunk progress as server-sent events."""
+    return StreamingResponse(
+        stream_document_analysis(
+            project_analysis_service=project_analysis_service,
+            project_id=project_id,
+            db=db,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
+    )
+
+
 @router.post(
     "/projects/{project_id}/extract-requirements",
     response_model=PendingChangeSetContract,
@@ -0,0 +1,17 @@
+"""Application-level exception handlers owned by the projects feature."""
+
+from __future__ import annotations
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.features.projects.infrastructure.project_state_store import ProjectStateConflictError
+
+
+async def project_state_conflict_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Answer concurrent ProjectState writes with 409 so clients can reload and retry."""
+    return JSONResponse(status_code=409, content={"detail": str(exc)})
+
+
+def register_project_error_handlers(app: FastAPI) -> None:
+    app.add_exception_handler(ProjectStateConflictError, project_state_conflict_handler)
@@ -48,6 +48,13 @@ class MessagesResponse(BaseModel):
     messages: list[dict[str, Any]]
 
 
+class StateLogPageResponse(BaseModel):
+    """One page of an append-only state log family."""
+
+    items: list[Any]
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
+
+
 class BulkDeleteProjectsRequest(BaseModel):
     """Request to bulk delete multiple projects."""
 
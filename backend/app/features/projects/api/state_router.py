@@ -15,6 +15,7 @@ from app.features.projects.application.proposal_stream_service import (
     stream_architecture_proposal,
 )
 from app.features.projects.application.state_edit_service import ProjectStateEditService
+from app.features.projects.application.state_log_service import ProjectStateLogService
 from app.features.projects.contracts.workspace import workspace_view_to_project_state
 from app.shared.config.app_settings import get_app_settings
 from app.shared.db.projects_database import get_db
@@ -24,9 +25,15 @@ from ._deps import (
     get_chat_service_dep,
     get_document_service_dep,
     get_state_edit_service_dep,
+    get_state_log_service_dep,
     get_workspace_composer_dep,
 )
-from .project_models import AdrAppendRequest, MessagesResponse, StateResponse
+from .project_models import (
+    AdrAppendRequest,
+    MessagesResponse,
+    StateLogPageResponse,
+    StateResponse,
+)
 
 router = APIRouter(prefix="/api", tags=["projects"])
 _STATE_DEPRECATION_SUNSET = "2026-06-01"
@@ -36,7 +43,8 @@ _STATE_DEPRECATION_SUNSET = "2026-06-01"
 class MessageQueryParams:
     before_id: str | None = None
     since_id: str | None = None
-    limit: int | None = Query(default=None)
+    thread_id: str | None = None
+    limit: int | None = Query(default=None, ge=1, le=500)
 
     def resolve_limit(self) -> int:
         if self.limit is not None:
@@ -44,6 +52,17 @@ class MessageQueryParams:
         return get_app_settings().messages_pagination_limit
 
 
+@dataclass(frozen=True)
+class StateLogQueryParams:
+    cursor: str | None = Query(default=None, pattern=r"^\d+$")
+    limit: int | None = Query(default=None, ge=1, le=500)
+
+    def resolve_limit(self) -> int:
+        if self.limit is not None:
+            return self.limit
+        return get_app_settings().state_log_pagination_limit
+
+
 @router.get("/projects/{project_id}/state", response_model=StateResponse)
 async def get_project_state(
     project_id: str,
@@ -80,12 +99,63 @@ async def get_messages(
             before_id=params.before_id,
             since_id=params.since_id,
             limit=params.resolve_limit(),
+            thread_id=params.thread_id,
+        )
+    except ValueError as exc:
+        raise map_value_error(exc, default_status=404) from exc
+    return {"messages": messages}
+
+
+@router.get(
+    "/projects/{project_id}/threads/{thread_id}/messages",
+    response_model=MessagesResponse,
+)
+async def get_thread_messages(
+    project_id: str,
+    thread_id: str,
+    params: Annotated[MessageQueryParams, Depends()],
+    db: AsyncSession = Depends(get_db),
+    chat_service: ChatService = Depends(get_chat_service_dep),
+) -> dict[str, Any]:
+    """Get one thread's conversation history with pagination support."""
+    try:
+        messages = await chat_service.get_conversation_messages(
+            project_id,
+            db,
+            before_id=params.before_id,
+            since_id=params.since_id,
+            limit=params.resolve_limit(),
+            thread_id=thread_id,
         )
     except ValueError as exc:
         raise map_value_error(exc, default_status=404) from exc
     return {"messages": messages}
 
 
+@router.get(
+    "/projects/{project_id}/state/logs/{family}",
+    response_model=StateLogPageResponse,
+)
+async def get_state_log_page(
+    project_id: str,
+    family: str,
+    params: Annotated[StateLogQueryParams, Depends()],
+    db: AsyncSession = Depends(get_db),
+    state_log_service: ProjectStateLogService = Depends(get_state_log_service_dep),
+) -> dict[str, Any]:
+    """Page through mcpQueries, iterationEvents, traceabilityLinks or traceabilityIssues."""
+    try:
+        return await state_log_service.list_entries(
+            project_id=project_id,
+            family=family,
+            db=db,
+            cursor=params.cursor,
+            limit=params.resolve_limit(),
+        )
+    except ValueError as exc:
+        raise map_value_error(exc, default_status=404) from exc
+
+
 @router.patch("/projects/{project_id}/adrs/{adr_id}/append", response_model=StateResponse)
 async def append_to_adr(
     project_id: str,
@@ -1,9 +1,13 @@
 """Workspace endpoints owned by the projects feature."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from dataclasses import dataclass
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.features.projects.application import ProjectWorkspaceComposer
+from app.features.projects.application import ProjectWorkspaceComposer, WorkspaceProjection
 from app.features.projects.contracts import ProjectWorkspaceView
 from app.shared.db.projects_database import get_db
 
@@ -12,14 +16,65 @@ from ._deps import get_workspace_composer_dep
 router = APIRouter(prefix="/api", tags=["projects"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+@dataclass(frozen=True)
+class WorkspaceQueryParams:
+    sections: str | None = Query(
+        default=None,
+        description="Comma-separated top-level sections to return (e.g. project,artifacts)",
+    )
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated artifact families to return (e.g. requirements,adrs)",
+    )
+
+    def projection(self) -> WorkspaceProjection:
+        try:
+            return WorkspaceProjection.parse(sections=self.sections, fields=self.fields)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 @router.get("/projects/{project_id}/workspace", response_model=ProjectWorkspaceView)
 async def get_project_workspace(
     project_id: str,
+    request: Request,
+    params: Annotated[WorkspaceQueryParams, Depends()],
     db: AsyncSession = Depends(get_db),
     workspace_composer: ProjectWorkspaceComposer = Depends(get_workspace_composer_dep),
-) -> ProjectWorkspaceView:
-    """Return a composed workspace view for a project."""
+) -> Response:
+    """Return a composed workspace view for a project, optionally projected.
+
+    Responses carry a strong ETag; a matching ``If-None-Match`` returns 304
+    without composing the workspace.
+    """
+    projection = params.projection()
+    etag = await workspace_composer.compute_etag(
+        project_id=project_id,
+        db=db,
+        projection=projection,
+    )
+    if etag is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
     try:
-        return await workspace_composer.compose(project_id=project_id, db=db)
+        workspace = await workspace_composer.compose(
+            project_id=project_id,
+            db=db,
+            projection=projection,
+        )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return JSONResponse(
+        content=workspace.model_dump(mode="json", by_alias=True, include=projection.include()),
+        headers=headers,
+    )
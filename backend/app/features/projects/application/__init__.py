@@ -4,10 +4,11 @@ from .requirements_extraction_entry_service import (
     ProjectRequirementsExtractionEntryService,
     create_requirements_extraction_entry_service,
 )
-from .workspace_composer import ProjectWorkspaceComposer
+from .workspace_composer import ProjectWorkspaceComposer, WorkspaceProjection
 
 __all__ = [
     "ProjectRequirementsExtractionEntryService",
     "ProjectWorkspaceComposer",
+    "WorkspaceProjection",
     "create_requirements_extraction_entry_service",
 ]
@@ -1,10 +1,11 @@
 import json
 import logging
 import uuid
+from collections.abc import Collection
 from datetime import datetime, timezone
 from typing import Any, Protocol, cast
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents_system.services.project_context import read_project_state
@@ -18,12 +19,28 @@ logger = logging.getLogger(__name__)
 _project_state_store = ProjectStateStore()
 
 
+def _message_key_before(key: tuple[str, str]) -> ColumnElement[bool]:
+    timestamp, message_id = key
+    return or_(
+        ConversationMessage.timestamp < timestamp,
+        and_(ConversationMessage.timestamp == timestamp, ConversationMessage.id < message_id),
+    )
+
+
+def _message_key_after(key: tuple[str, str]) -> ColumnElement[bool]:
+    timestamp, message_id = key
+    return or_(
+        ConversationMessage.timestamp > timestamp,
+        and_(ConversationMessage.timestamp == timestamp, ConversationMessage.id > message_id),
+    )
+
+
 class KnowledgeQueryGateway(Protocol):
-    def query_chat_sources(self, message: str, *, top_k_per_kb: int = 3) -> list[dict[str, Any]]: ...
+    async def query_chat_sources(self, message: str, *, top_k_per_kb: int = 3) -> list[dict[str, Any]]: ...
 
 
 class _NoopKnowledgeQueryGateway:
-    def query_chat_sources(self, message: str, *, top_k_per_kb: int = 3) -> list[dict[str, Any]]:
+    async def query_chat_sources(self, message: str, *, top_k_per_kb: int = 3) -> list[dict[str, Any]]:
         return []
 
 
@@ -101,7 +118,7 @@ class ChatService:
 
         logger.info("Architecture question detected, querying KB")
         try:
-            kb_res = self._knowledge_query_gateway.query_chat_sources(
+            kb_res = await self._knowledge_query_gateway.query_chat_sources(
                 message,
                 top_k_per_kb=3,
             )
@@ -173,68 +190,91 @@ class ChatService:
         }
 
     async def get_project_state(
-        self, project_id: str, db: AsyncSession
+        self,
+        project_id: str,
+        db: AsyncSession,
+        *,
+        include_logs: bool | Collection[str] = True,
+        include_waf_checklist: bool = True,
     ) -> dict[str, Any]:
         # Delegate to the AAA-aware state reader to ensure stable defaults and
         # casing (camelCase aliases) across the app.
-        state = await read_project_state(project_id, db)
+        state = await read_project_state(
+            project_id,
+            db,
+            include_logs=include_logs,
+            include_waf_checklist=include_waf_checklist,
+        )
         if not state:
             raise ValueError("Project state not found. Please analyze documents first.")
-        waf_checklist = await self._project_service.get_waf_checklist_state(project_id, db)
-        if waf_checklist is not None:
-            state["wafChecklist"] = waf_checklist
+        if include_waf_checklist:
+            waf_checklist = await self._project_service.get_waf_checklist_state(project_id, db)
+            if waf_checklist is not None:
+                state["wafChecklist"] = waf_checklist
         return cast(dict[str, Any], state)
 
-    async def get_conversation_messages(
+    async def get_conversation_messages(  # noqa: PLR0913 - cursor filters are keyword-only
         self,
         project_id: str,
         db: AsyncSession,
+        *,
         before_id: str | None = None,
         since_id: str | None = None,
         limit: int = 50,
+        thread_id: str | None = None,
     ) -> list[dict[str, Any]]:
-        result = await db.execute(select(Project).where(Project.id == project_id))
-        project = result.scalar_one_or_none()
-        if not project:
+        """Return one page of messages in chronological order.
+
+        Pages are keyset-ordered on ``(timestamp, id)``. Without ``since_id``
+        the page holds the ``limit`` newest messages older than ``before_id``
+        (or the newest overall); with ``since_id`` it holds the ``limit``
+        oldest messages newer than it. ``thread_id`` scopes the page to a thread.
+        """
+        result = await db.execute(select(Project.id).where(Project.id == project_id))
+        if result.scalar_one_or_none() is None:
             raise ValueError("Project not found")
 
         query = select(ConversationMessage).where(
             ConversationMessage.project_id == project_id
         )
+        if thread_id is not None:
+            query = query.where(ConversationMessage.thread_id == thread_id)
 
-        if before_id:
-            # Find the timestamp of the message before which we want older messages
-            ref_msg = await db.execute(
-                select(ConversationMessage).where(ConversationMessage.id == before_id)
-            )
-            ref_msg_obj = ref_msg.scalar_one_or_none()
-            if ref_msg_obj:
-                query = query.where(ConversationMessage.timestamp < ref_msg_obj.timestamp)
+        keys = await self._resolve_message_keys(
+            project_id, [ref for ref in (before_id, since_id) if ref], db
+        )
+        if before_id and before_id in keys:
+            query = query.where(_message_key_before(keys[before_id]))
+        if since_id and since_id in keys:
+            query = query.where(_message_key_after(keys[since_id]))
 
         if since_id:
-            # Find the timestamp of the message since which we want newer messages
-            ref_msg = await db.execute(
-                select(ConversationMessage).where(ConversationMessage.id == since_id)
-            )
-            ref_msg_obj = ref_msg.scalar_one_or_none()
-            if ref_msg_obj:
-                query = query.where(ConversationMessage.timestamp > ref_msg_obj.timestamp)
-
-        if before_id:
-            # Older messages: newest first (for limit/offset), then reverse for client
-            query = query.order_by(ConversationMessage.timestamp.desc()).limit(limit)
+            query = query.order_by(
+                ConversationMessage.timestamp.asc(), ConversationMessage.id.asc()
+            ).limit(limit)
+            result = await db.execute(query)
+            messages = list(result.scalars().all())
         else:
-            # Newer messages or full history: oldest first
-            query = query.order_by(ConversationMessage.timestamp.asc())
-            if since_id:
-                query = query.limit(limit)
-
-        result = await db.execute(query)
-        messages = result.scalars().all()
-
-        if before_id:
-            # Reverse back to chronologic order for the client if we fetched oldest-first via desc limit
-            messages = list(reversed(messages))
+            # Newest page first via desc + limit, then back to chronological order.
+            query = query.order_by(
+                ConversationMessage.timestamp.desc(), ConversationMessage.id.desc()
+            ).limit(limit)
+            result = await db.execute(query)
+            messages = list(reversed(result.scalars().all()))
 
         return [msg.to_dict() for msg in messages]
 
+    async def _resolve_message_keys(
+        self, project_id: str, message_ids: list[str], db: AsyncSession
+    ) -> dict[str, tuple[str, str]]:
+        """Map cursor message ids to their ``(timestamp, id)`` keyset position."""
+        if not message_ids:
+            return {}
+        result = await db.execute(
+            select(ConversationMessage.id, ConversationMessage.timestamp).where(
+                ConversationMessage.project_id == project_id,
+                ConversationMessage.id.in_(message_ids),
+            )
+        )
+        return {str(msg_id): (str(timestamp), str(msg_id)) for msg_id, timestamp in result.all()}
+
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import logging
 from io import BytesIO
+from pathlib import Path
 
 import openpyxl
 import xlrd
@@ -48,6 +49,23 @@ def extract_text_from_upload(
         return content.decode("utf-8", errors="replace"), None
 
 
+def is_binary_document(file_name: str, mime_type: str | None) -> bool:
+    """True for uploads parsed with pypdf/openpyxl/xlrd rather than decoded as text."""
+    lower_name = (file_name or "").strip().lower()
+    return lower_name.endswith((".pdf", ".xlsx", ".xls")) or (mime_type or "") == "application/pdf"
+
+
+def parse_stored_upload(
+    path: str, file_name: str, mime_type: str | None
+) -> tuple[str | None, str | None]:
+    """Read a stored upload from disk and extract its text (parse-worker entry point)."""
+    try:
+        content = Path(path).read_bytes()
+    except OSError as exc:
+        return None, f"Stored upload could not be read: {exc}"
+    return extract_text_from_upload(file_name=file_name, mime_type=mime_type, content=content)
+
+
 def _extract_pdf_text(content: bytes) -> tuple[str | None, str | None]:
     try:
         reader = PdfReader(BytesIO(content))
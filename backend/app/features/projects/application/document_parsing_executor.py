@@ -0,0 +1,141 @@
+"""Out-of-process parsing for PDF and Excel uploads.
+
+pypdf/openpyxl/xlrd are CPU-bound and can take seconds on large files, so they
+run in a small process pool instead of on the API event loop. Each parse is
+bounded by a timeout (the pool is recycled to kill a stuck worker) and workers
+run under a heap limit where the platform supports it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, TypeVar
+
+from app.shared.config.app_settings import get_app_settings
+
+from .document_parsing import parse_stored_upload
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class DocumentParseTimeoutError(TimeoutError):
+    """Raised when a parse worker exceeds the configured timeout."""
+
+
+def _limit_worker_memory(limit_bytes: int) -> None:
+    """Pool initializer: cap the worker heap so a hostile file cannot exhaust host memory."""
+    if resource is None or limit_bytes <= 0:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_DATA)
+    if hard != resource.RLIM_INFINITY:
+        limit_bytes = min(limit_bytes, hard)
+    resource.setrlimit(resource.RLIMIT_DATA, (limit_bytes, hard))
+
+
+class DocumentParsingExecutor:
+    """Runs upload parsing in worker processes with per-file timeouts."""
+
+    def __init__(self, *, max_workers: int, timeout: float, memory_limit_mb: int) -> None:
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.memory_limit_bytes = max(memory_limit_mb, 0) * 1024 * 1024
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    async def parse(
+        self, path: Path, *, file_name: str, mime_type: str | None
+    ) -> tuple[str | None, str | None]:
+        """Extract text from a stored upload; failures are returned as (None, reason)."""
+        try:
+            return await self.submit(parse_stored_upload, str(path), file_name, mime_type)
+        except DocumentParseTimeoutError:
+            logger.warning("Parsing %s timed out after %.0fs", file_name, self.timeout)
+            return None, f"Parsing timed out after {self.timeout:g}s"
+        except MemoryError:
+            return None, "Document exceeds the parser memory limit"
+        except BrokenProcessPool:
+            logger.exception("Parse worker crashed on %s", file_name)
+            return None, "Parser worker crashed"
+
+    async def submit(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` in a worker process, retrying once if another file broke the pool."""
+        if self.max_workers <= 0:
+            return await asyncio.to_thread(fn, *args)
+
+        try:
+            return await self._run(fn, args)
+        except BrokenProcessPool:
+            # Recycling the pool after a timeout kills every worker, including ones
+            # parsing other files; those get a single retry on the fresh pool.
+            return await self._run(fn, args)
+
+    async def _run(self, fn: Callable[..., T], args: tuple[Any, ...]) -> T:
+        pool = self._get_pool()
+        try:
+            future = pool.submit(fn, *args)
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except asyncio.TimeoutError as exc:
+            self._recycle_pool(pool)
+            raise DocumentParseTimeoutError(f"Parse exceeded {self.timeout:g}s") from exc
+        except BrokenProcessPool:
+            self._recycle_pool(pool)
+            raise
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn: the API process runs event loop and DB threads that must not be forked
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_limit_worker_memory,
+                    initargs=(self.memory_limit_bytes,),
+                )
+            return self._pool
+
+    def _recycle_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Drop ``pool`` and kill its workers; the next submit starts a fresh pool."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        # ProcessPoolExecutor cannot cancel a running task, so terminate its workers directly
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=1)
+def get_document_parsing_executor() -> DocumentParsingExecutor:
+    settings = get_app_settings()
+    return DocumentParsingExecutor(
+        max_workers=settings.project_document_parse_workers,
+        timeout=settings.project_document_parse_timeout,
+        memory_limit_mb=settings.project_document_parse_memory_mb,
+    )
+
+
+def shutdown_document_parsing_executor() -> None:
+    if get_document_parsing_executor.cache_info().currsize:
+        get_document_parsing_executor().shutdown()
+        get_document_parsing_executor.cache_clear()
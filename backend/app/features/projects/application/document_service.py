@@ -1,6 +1,11 @@
+import asyncio
+import copy
 import logging
 import mimetypes
 import uuid
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, cast
@@ -10,25 +15,36 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents_system.services.aaa_state_models import ensure_aaa_defaults
 from app.agents_system.services.project_context import read_project_state
+from app.features.projects.infrastructure.document_analysis_cache_repository import (
+    AnalysisCacheKey,
+    CachedAnalysis,
+    DocumentAnalysisCacheRepository,
+    content_hash,
+)
 from app.features.projects.infrastructure.project_state_decomposition import (
     compose_project_state,
 )
 from app.features.projects.infrastructure.project_state_store import ProjectStateStore
 from app.models import Project, ProjectDocument
 from app.shared.ai import llm_service
+from app.shared.ai.document_analysis import merge_partial_states
 from app.shared.config.app_settings import get_app_settings
+from app.shared.db.session_helpers import get_project_session
 
 from .document_normalization import (
     normalize_aaa_requirements_and_questions,
 )
-from .document_parsing import extract_text_from_upload
+from .document_parsing import extract_text_from_upload, is_binary_document
+from .document_parsing_executor import DocumentParsingExecutor, get_document_parsing_executor
 
 logger = logging.getLogger(__name__)
 _project_state_store = ProjectStateStore()
+_analysis_cache = DocumentAnalysisCacheRepository()
 
 
 PARSE_STATUS_PARSED = "parsed"
 PARSE_STATUS_FAILED = "parse_failed"
+PARSE_STATUS_PENDING = "pending"
 ANALYSIS_STATUS_NOT_STARTED = "not_started"
 ANALYSIS_STATUS_ANALYZING = "analyzing"
 ANALYSIS_STATUS_ANALYZED = "analyzed"
@@ -36,98 +52,267 @@ ANALYSIS_STATUS_FAILED = "analysis_failed"
 ANALYSIS_STATUS_SKIPPED = "skipped"
 
 
+@dataclass(frozen=True)
+class _AnalysisBlock:
+    document: ProjectDocument | None
+    text: str
+    content_hash: str
+
+
+def _rebind_sources(
+    result: dict[str, Any],
+    cached_document_id: str | None,
+    document: ProjectDocument | None,
+) -> dict[str, Any]:
+    """Point sources of a cached result at ``document`` when the same content was
+    first analyzed under a different document id (e.g. a re-upload)."""
+    rebound = copy.deepcopy(result)
+    if document is None or cached_document_id in (None, document.id):
+        return rebound
+    for requirement in rebound.get("requirements") or []:
+        if not isinstance(requirement, dict):
+            continue
+        for source in requirement.get("sources") or []:
+            if isinstance(source, dict) and source.get("documentId") == cached_document_id:
+                source["documentId"] = document.id
+                source["fileName"] = document.file_name
+    return rebound
+
+
+@dataclass(frozen=True)
+class _StoredUpload:
+    document_id: str
+    file_name: str
+    original_name: str | None
+    mime_type: str
+    path: Path
+
+
 class DocumentService:
     """Handles document upload and analysis for projects."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        parsing_executor: DocumentParsingExecutor | None = None,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]] | None = None,
+    ) -> None:
         document_store_dir = get_app_settings().project_documents_root
         if document_store_dir is None:
             raise ValueError("PROJECT_DOCUMENTS_ROOT must be configured")
         self.document_store_dir = document_store_dir
+        self.parsing_executor = parsing_executor or get_document_parsing_executor()
+        self._session_factory = session_factory or get_project_session
+        self._background_tasks: set[asyncio.Task[None]] = set()
 
-    async def upload_documents(  # noqa: PLR0915
+    async def upload_documents(
         self,
         project_id: str,
         files: list[Any],
         db: AsyncSession,
+        *,
+        wait_for_parsing: bool = True,
     ) -> dict[str, Any]:
+        """Store uploads and parse them; with ``wait_for_parsing=False`` parsing runs
+        in the background and documents are returned with ``parse_status="pending"``."""
         result = await db.execute(select(Project).where(Project.id == project_id))
         project = result.scalar_one_or_none()
         if not project:
             raise ValueError("Project not found")
 
-        saved_docs: list[ProjectDocument] = []
-        attempted_documents = 0
-        parsed_documents = 0
+        uploads = [await self._store_upload(project_id, file) for file in files]
+        saved_docs = [self._new_document(project_id, upload) for upload in uploads]
         failures: list[dict[str, Any]] = []
 
-        for file in files:
-            attempted_documents += 1
-            content = await file.read()
-            document_id = str(uuid.uuid4())
-            safe_file_name = Path(file.filename or "document").name
-            uploaded_mime_type = (getattr(file, "content_type", None) or "").strip()
-            if uploaded_mime_type in {"", "application/octet-stream"}:
-                guessed_mime_type, _ = mimetypes.guess_type(safe_file_name)
-                if guessed_mime_type:
-                    uploaded_mime_type = guessed_mime_type
-            if uploaded_mime_type == "":
-                uploaded_mime_type = "application/octet-stream"
-            storage_dir = self.document_store_dir / project_id
-            storage_dir.mkdir(parents=True, exist_ok=True)
-            stored_path = storage_dir / f"{document_id}_{safe_file_name}"
-            stored_path.write_bytes(content)
-
-            extracted_text, failure_reason = extract_text_from_upload(
-                file_name=safe_file_name,
-                mime_type=uploaded_mime_type,
-                content=content,
+        if wait_for_parsing:
+            parse_results = await asyncio.gather(
+                *(self._parse_upload(upload) for upload in uploads)
             )
-
-            if extracted_text is None:
-                parse_status = PARSE_STATUS_FAILED
-                parse_error = failure_reason or "unknown parse failure"
-                analysis_status = ANALYSIS_STATUS_SKIPPED
-                failures.append(
-                    {
-                        "documentId": document_id,
-                        "fileName": file.filename,
-                        "reason": parse_error,
-                    }
-                )
-                extracted_text = ""  # Persist empty text but keep the document record
-            else:
-                parse_status = PARSE_STATUS_PARSED
-                parse_error = None
-                analysis_status = ANALYSIS_STATUS_NOT_STARTED
-                parsed_documents += 1
-
-            doc = ProjectDocument(
-                id=document_id,
-                project_id=project_id,
-                file_name=safe_file_name,
-                mime_type=uploaded_mime_type,
-                raw_text=extracted_text,
-                stored_path=str(stored_path),
-                parse_status=parse_status,
-                analysis_status=analysis_status,
-                parse_error=parse_error,
-                uploaded_at=datetime.now(timezone.utc).isoformat(),
-            )
-
-            db.add(doc)
-            saved_docs.append(doc)
-
+            for upload, doc, (extracted_text, failure_reason) in zip(
+                uploads, saved_docs, parse_results, strict=True
+            ):
+                failure = self._apply_parse_result(doc, extracted_text, failure_reason)
+                if failure is not None:
+                    failures.append({**failure, "fileName": upload.original_name})
+
+        db.add_all(saved_docs)
         await db.commit()
 
+        parsed_documents = sum(doc.parse_status == PARSE_STATUS_PARSED for doc in saved_docs)
+        pending_documents = sum(doc.parse_status == PARSE_STATUS_PENDING for doc in saved_docs)
         upload_summary = {
-            "attemptedDocuments": attempted_documents,
+            "attemptedDocuments": len(saved_docs),
             "parsedDocuments": parsed_documents,
-            "failedDocuments": max(attempted_documents - parsed_documents, 0),
+            "pendingDocuments": pending_documents,
+            "failedDocuments": max(len(saved_docs) - parsed_documents - pending_documents, 0),
             "failures": failures,
         }
 
         # Persist document stats + reference docs into ProjectState without blocking upload.
+        await self._refresh_document_state(project_id, db)
+
+        if not wait_for_parsing:
+            self._schedule_background_parse(project_id, uploads)
+
+        logger.info(f"Uploaded {len(saved_docs)} documents for project: {project_id}")
+        return {
+            "documents": [doc.to_dict() for doc in saved_docs],
+            "uploadSummary": upload_summary,
+        }
+
+    async def get_parse_status(self, project_id: str, db: AsyncSession) -> dict[str, Any]:
+        """Per-document parse/analysis status, for polling after a background upload."""
+        result = await db.execute(select(Project.id).where(Project.id == project_id))
+        if result.scalar_one_or_none() is None:
+            raise ValueError("Project not found")
+
+        documents = await self._fetch_project_documents(project_id, db)
+        return {
+            "documents": [
+                {
+                    "id": doc.id,
+                    "fileName": doc.file_name,
+                    "parseStatus": doc.parse_status,
+                    "parseError": doc.parse_error,
+                    "analysisStatus": doc.analysis_status,
+                    "uploadedAt": doc.uploaded_at,
+                }
+                for doc in documents
+            ],
+            "uploadSummary": self._compute_ingestion_stats(documents),
+        }
+
+    async def _store_upload(self, project_id: str, file: Any) -> _StoredUpload:
+        """Stream an upload to the project document store in fixed-size chunks."""
+        document_id = str(uuid.uuid4())
+        safe_file_name = Path(file.filename or "document").name
+        uploaded_mime_type = (getattr(file, "content_type", None) or "").strip()
+        if uploaded_mime_type in {"", "application/octet-stream"}:
+            guessed_mime_type, _ = mimetypes.guess_type(safe_file_name)
+            if guessed_mime_type:
+                uploaded_mime_type = guessed_mime_type
+        if uploaded_mime_type == "":
+            uploaded_mime_type = "application/octet-stream"
+        storage_dir = self.document_store_dir / project_id
+        storage_dir.mkdir(parents=True, exist_ok=True)
+        stored_path = storage_dir / f"{document_id}_{safe_file_name}"
+
+        chunk_size = get_app_settings().project_document_upload_chunk_size
+        with stored_path.open("wb") as stored_file:
+            while chunk := await file.read(chunk_size):
+                await asyncio.to_thread(stored_file.write, chunk)
+
+        return _StoredUpload(
+            document_id=document_id,
+            file_name=safe_file_name,
+            original_name=file.filename,
+            mime_type=uploaded_mime_type,
+            path=stored_path,
+        )
+
+    def _new_document(self, project_id: str, upload: _StoredUpload) -> ProjectDocument:
+        return ProjectDocument(
+            id=upload.document_id,
+            project_id=project_id,
+            file_name=upload.file_name,
+            mime_type=upload.mime_type,
+            raw_text="",
+            stored_path=str(upload.path),
+            parse_status=PARSE_STATUS_PENDING,
+            analysis_status=ANALYSIS_STATUS_NOT_STARTED,
+            parse_error=None,
+            uploaded_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+    async def _parse_upload(self, upload: _StoredUpload) -> tuple[str | None, str | None]:
+        """PDF/Excel go to the parse worker pool; text uploads are decoded in-process."""
+        if is_binary_document(upload.file_name, upload.mime_type):
+            return await self.parsing_executor.parse(
+                upload.path, file_name=upload.file_name, mime_type=upload.mime_type
+            )
+        content = await asyncio.to_thread(upload.path.read_bytes)
+        return extract_text_from_upload(
+            file_name=upload.file_name,
+            mime_type=upload.mime_type,
+            content=content,
+        )
+
+    def _apply_parse_result(
+        self,
+        doc: ProjectDocument,
+        extracted_text: str | None,
+        failure_reason: str | None,
+    ) -> dict[str, Any] | None:
+        """Record a parse outcome on ``doc``; returns the failure entry when parsing failed."""
+        if extracted_text is None:
+            doc.parse_status = PARSE_STATUS_FAILED
+            doc.parse_error = failure_reason or "unknown parse failure"
+            doc.analysis_status = ANALYSIS_STATUS_SKIPPED
+            doc.raw_text = ""  # Persist empty text but keep the document record
+            return {"documentId": doc.id, "fileName": doc.file_name, "reason": doc.parse_error}
+
+        doc.parse_status = PARSE_STATUS_PARSED
+        doc.parse_error = None
+        doc.analysis_status = ANALYSIS_STATUS_NOT_STARTED
+        doc.raw_text = extracted_text
+        return None
+
+    async def resume_pending_parses(self) -> int:
+        """Re-queue background parses interrupted by a restart; returns how many were queued.
+
+        Documents whose stored upload is gone are marked failed instead of staying pending.
+        """
+        uploads_by_project: dict[str, list[_StoredUpload]] = {}
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(ProjectDocument).where(ProjectDocument.parse_status == PARSE_STATUS_PENDING)
+            )
+            for doc in result.scalars().all():
+                stored_path = Path(doc.stored_path) if doc.stored_path else None
+                if stored_path is None or not stored_path.is_file():
+                    self._apply_parse_result(doc, None, "stored upload missing when resuming parse")
+                    continue
+                uploads_by_project.setdefault(doc.project_id, []).append(
+                    _StoredUpload(
+                        document_id=doc.id,
+                        file_name=doc.file_name,
+                        original_name=doc.file_name,
+                        mime_type=doc.mime_type,
+                        path=stored_path,
+                    )
+                )
+            await db.commit()
+
+        for project_id, uploads in uploads_by_project.items():
+            self._schedule_background_parse(project_id, uploads)
+        return sum(len(uploads) for uploads in uploads_by_project.values())
+
+    def _schedule_background_parse(self, project_id: str, uploads: list[_StoredUpload]) -> None:
+        task = asyncio.create_task(self._parse_in_background(project_id, uploads))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _parse_in_background(self, project_id: str, uploads: list[_StoredUpload]) -> None:
+        try:
+            parse_results = await asyncio.gather(*(self._parse_upload(upload) for upload in uploads))
+            async with self._session_factory() as db:
+                result = await db.execute(
+                    select(ProjectDocument).where(
+                        ProjectDocument.id.in_([upload.document_id for upload in uploads])
+                    )
+                )
+                docs_by_id = {doc.id: doc for doc in result.scalars().all()}
+                for upload, (extracted_text, failure_reason) in zip(uploads, parse_results, strict=True):
+                    doc = docs_by_id.get(upload.document_id)
+                    if doc is not None:  # Deleted while parsing
+                        self._apply_parse_result(doc, extracted_text, failure_reason)
+                await db.commit()
+                await self._refresh_document_state(project_id, db)
+            logger.info(f"Background parsing finished for {len(uploads)} documents: {project_id}")
+        except Exception:
+            logger.exception("Background document parsing failed for project %s", project_id)
+
+    async def _refresh_document_state(self, project_id: str, db: AsyncSession) -> None:
+        """Write projectDocumentStats/referenceDocuments into ProjectState; failures are logged."""
         try:
             all_documents = await self._fetch_project_documents(project_id, db)
             computed_stats = self._compute_ingestion_stats(all_documents)
@@ -179,30 +364,118 @@ class DocumentService:
                 project_id,
             )
 
-        logger.info(f"Uploaded {len(saved_docs)} documents for project: {project_id}")
-        return {
-            "documents": [doc.to_dict() for doc in saved_docs],
-            "uploadSummary": upload_summary,
-        }
-
-    def _prepare_document_texts(
+    def _prepare_analysis_blocks(
         self, project: Project, documents: list[ProjectDocument]
-    ) -> list[str]:
+    ) -> list[_AnalysisBlock]:
         """Combine project text requirements and uploaded document contents for LLM."""
-        texts = [
-            f"DocumentId: {doc.id}\nFileName: {doc.file_name}\n---\n{doc.raw_text}"
+        blocks = [
+            _AnalysisBlock(
+                document=doc,
+                text=f"DocumentId: {doc.id}\nFileName: {doc.file_name}\n---\n{doc.raw_text}",
+                content_hash=content_hash(doc.raw_text),
+            )
             for doc in documents
             if (doc.raw_text or "").strip()
         ]
         if project.text_requirements:
-            texts.append(project.text_requirements)
-        return texts
+            blocks.append(
+                _AnalysisBlock(
+                    document=None,
+                    text=project.text_requirements,
+                    content_hash=content_hash(project.text_requirements),
+                )
+            )
+        return blocks
+
+    async def _analyze_blocks(
+        self,
+        service: Any,
+        blocks: list[_AnalysisBlock],
+        run_id: str,
+        db: AsyncSession,
+        on_progress: Callable[[str, str | None], None] | None,
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Analyze blocks, reusing cached per-document results for unchanged content.
+
+        Returns the merged state and, for documents served from the cache, the id
+        of the analysis run that produced their cached result.
+        """
+        settings = get_app_settings()
+        progress_kwargs = {"on_progress": on_progress} if on_progress is not None else {}
+        if not settings.llm_analyze_cache_enabled:
+            state = await service.analyze_documents([block.text for block in blocks], **progress_kwargs)
+            return state, {}
+
+        model = str(service.model)
+        prompt_version = llm_service.ANALYSIS_PROMPT_VERSION
+        cached = await _analysis_cache.get_many(
+            content_hashes=[block.content_hash for block in blocks],
+            prompt_version=prompt_version,
+            model=model,
+            db=db,
+        )
+        # End the read transaction so no connection is held across the LLM calls.
+        await db.commit()
+
+        partials: list[dict[str, Any]] = [{} for _ in blocks]
+        reused_runs: dict[str, str] = {}
+        pending: list[int] = []
+        for index, block in enumerate(blocks):
+            hit = cached.get(block.content_hash)
+            if hit is None:
+                pending.append(index)
+                continue
+            partials[index] = _rebind_sources(hit.result, hit.document_id, block.document)
+            if block.document is not None:
+                reused_runs[block.document.id] = hit.analysis_run_id
+
+        logger.info(
+            f"Analysis cache: {len(blocks) - len(pending)} reused, {len(pending)} to analyze"
+        )
+        if on_progress is not None and len(pending) < len(blocks):
+            on_progress(
+                "analysis_cached",
+                f"Reused cached analysis for {len(blocks) - len(pending)} of {len(blocks)} documents",
+            )
+
+        # One limiter bounds the LLM calls of all documents, including their chunks.
+        limiter = asyncio.Semaphore(max(1, settings.llm_analyze_concurrency))
+        results = await asyncio.gather(
+            *(
+                service.analyze_documents([blocks[index].text], limiter=limiter, **progress_kwargs)
+                for index in pending
+            ),
+            return_exceptions=True,
+        )
+        failure: BaseException | None = None
+        for index, partial in zip(pending, results, strict=True):
+            if isinstance(partial, BaseException):
+                failure = failure or partial
+                continue
+            partials[index] = partial
+            block = blocks[index]
+            # Successful documents are cached even if another one failed, so a retry
+            # only repeats the failed calls.
+            await _analysis_cache.put(
+                key=AnalysisCacheKey(block.content_hash, prompt_version, model),
+                entry=CachedAnalysis(
+                    result=partial,
+                    document_id=block.document.id if block.document is not None else None,
+                    analysis_run_id=run_id,
+                ),
+                db=db,
+            )
+        if failure is not None:
+            raise failure
+
+        return merge_partial_states(partials), reused_runs
 
     def _compute_ingestion_stats(
         self, documents: list[ProjectDocument]
     ) -> dict[str, Any]:
         """Calculate document processing success and failure metrics."""
         parsed = 0
+        pending = 0
         failures = []
         for doc in documents:
             parse_status = (
@@ -212,6 +485,8 @@ class DocumentService:
             )
             if parse_status == PARSE_STATUS_PARSED:
                 parsed += 1
+            elif parse_status == PARSE_STATUS_PENDING:
+                pending += 1
             else:
                 failures.append(
                     {
@@ -224,7 +499,8 @@ class DocumentService:
         return {
             "attemptedDocuments": len(documents),
             "parsedDocuments": parsed,
-            "failedDocuments": max(len(documents) - parsed, 0),
+            "pendingDocuments": pending,
+            "failedDocuments": max(len(documents) - parsed - pending, 0),
             "failures": failures,
         }
 
@@ -336,7 +612,10 @@ class DocumentService:
                 doc.analysis_status = ANALYSIS_STATUS_FAILED
 
     async def analyze_documents(
-        self, project_id: str, db: AsyncSession
+        self,
+        project_id: str,
+        db: AsyncSession,
+        on_progress: Callable[[str, str | None], None] | None = None,
     ) -> dict[str, Any]:
         """Run AI analysis on documents and persist project state."""
         result = await db.execute(select(Project).where(Project.id == project_id))
@@ -345,20 +624,24 @@ class DocumentService:
             raise ValueError("Project not found")
 
         documents = await self._fetch_project_documents(project_id, db)
+        blocks = self._prepare_analysis_blocks(project, documents)
+        if not blocks:
+            raise ValueError("No content to analyze (missing text and documents)")
+
         analysis_run_id = str(uuid.uuid4())
         started_at = datetime.now(timezone.utc).isoformat()
         self._apply_analysis_status_start(documents, analysis_run_id)
-        await db.flush()
-
-        texts = self._prepare_document_texts(project, documents)
-        if not texts:
-            raise ValueError("No content to analyze (missing text and documents)")
+        # Commit before the LLM calls so this session does not hold the single
+        # projects-database writer connection for the whole analysis.
+        await db.commit()
 
-        logger.info(f"Analyzing {len(texts)} content blocks for project: {project_id}")
+        logger.info(f"Analyzing {len(blocks)} content blocks for project: {project_id}")
 
         service = llm_service.get_llm_service()
         try:
-            state_data = await service.analyze_documents(texts)
+            state_data, reused_runs = await self._analyze_blocks(
+                service, blocks, analysis_run_id, db, on_progress
+            )
         except Exception:
             self._apply_analysis_status_failed(documents, analysis_run_id)
             await db.commit()
@@ -371,6 +654,9 @@ class DocumentService:
             analysis_run_id,
             completed_at,
         )
+        for doc in documents:
+            if doc.id in reused_runs:
+                doc.last_analysis_run_id = reused_runs[doc.id]
 
         # Append telemetry/stats and setup summary.
         stats = self._compute_ingestion_stats(documents)
@@ -384,6 +670,7 @@ class DocumentService:
             "status": "success",
             "analyzedDocuments": analyzed_documents,
             "skippedDocuments": skipped_documents,
+            "cachedDocuments": len(reused_runs),
         }
         state_data["referenceDocuments"] = self._merge_reference_documents(
             state_data.get("referenceDocuments"),
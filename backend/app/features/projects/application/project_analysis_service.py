@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import Any, Protocol
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -64,8 +65,9 @@ class ProjectAnalysisService:
         *,
         project_id: str,
         db: AsyncSession,
+        on_progress: Callable[[str, str | None], None] | None = None,
     ) -> dict[str, Any]:
-        state = await self.document_service.analyze_documents(project_id, db)
+        state = await self.document_service.analyze_documents(project_id, db, on_progress)
 
         try:
             diagram_ref = await self._diagram_bootstrapper.ensure_initial_context_diagram(
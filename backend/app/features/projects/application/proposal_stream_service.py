@@ -1,14 +1,18 @@
-"""Streaming helpers for architecture proposal SSE endpoints."""
+"""Streaming helpers for architecture proposal and document analysis SSE endpoints."""
 
 from __future__ import annotations
 
 import asyncio
 import json
+from collections.abc import Awaitable, Callable
 from contextlib import suppress
 from datetime import datetime, timezone
 from typing import Any
 
 from .document_service import DocumentService
+from .project_analysis_service import ProjectAnalysisService
+
+ProgressCallback = Callable[[str, str | None], None]
 
 
 def _format_sse(payload: dict[str, Any]) -> str:
@@ -30,20 +34,64 @@ async def stream_architecture_proposal(
     db: Any,
 ) -> Any:
     """Yield SSE payloads as proposal generation progresses."""
+
+    async def _generate(on_progress: ProgressCallback) -> dict[str, Any]:
+        proposal = await document_service.generate_proposal(project_id, db, on_progress)
+        return {"proposal": proposal}
+
+    async for event in _stream_with_progress(
+        _generate,
+        started_detail="Initializing proposal generation",
+        completed_detail="Proposal generated successfully",
+    ):
+        yield event
+
+
+async def stream_document_analysis(
+    *,
+    project_analysis_service: ProjectAnalysisService,
+    project_id: str,
+    db: Any,
+) -> Any:
+    """Yield SSE payloads (per-chunk progress included) as document analysis runs."""
+
+    async def _analyze(on_progress: ProgressCallback) -> dict[str, Any]:
+        state = await project_analysis_service.analyze_documents_with_bootstrap(
+            project_id=project_id,
+            db=db,
+            on_progress=on_progress,
+        )
+        return {"projectState": state}
+
+    async for event in _stream_with_progress(
+        _analyze,
+        started_detail="Initializing document analysis",
+        completed_detail="Documents analyzed successfully",
+    ):
+        yield event
+
+
+async def _stream_with_progress(
+    run: Callable[[ProgressCallback], Awaitable[dict[str, Any]]],
+    *,
+    started_detail: str,
+    completed_detail: str,
+) -> Any:
+    """Run ``run`` in a task and yield its progress events, then a ``done`` payload."""
     queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
     done_token = {"stage": "__done__"}
 
     def on_progress(stage: str, detail: str | None = None) -> None:
         queue.put_nowait(_progress_payload(stage, detail))
 
-    async def _run_generation() -> None:
+    async def _run() -> None:
         try:
-            proposal = await document_service.generate_proposal(project_id, db, on_progress)
-            await queue.put(_progress_payload("completed", "Proposal generated successfully"))
+            result = await run(on_progress)
+            await queue.put(_progress_payload("completed", completed_detail))
             await queue.put(
                 {
                     "stage": "done",
-                    "proposal": proposal,
+                    **result,
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
             )
@@ -66,9 +114,9 @@ async def stream_architecture_proposal(
         finally:
             await queue.put(done_token)
 
-    task = asyncio.create_task(_run_generation())
+    task = asyncio.create_task(_run())
     try:
-        yield _format_sse(_progress_payload("started", "Initializing proposal generation"))
+        yield _format_sse(_progress_payload("started", started_detail))
         while True:
             event = await queue.get()
             if event is done_token:
@@ -79,4 +127,3 @@ async def stream_architecture_proposal(
             task.cancel()
             with suppress(asyncio.CancelledError):
                 await task
-
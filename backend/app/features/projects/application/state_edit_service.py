@@ -40,6 +40,7 @@ class ProjectStateEditService:
             project_id=project_id,
             state=blob_state,
             db=db,
+            include_logs=True,
         )
         adrs = state.get("adrs")
         if not isinstance(adrs, list):
@@ -0,0 +1,42 @@
+"""Cursor-paginated reads of append-only ProjectState log families."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.projects.infrastructure.project_state_log_repository import (
+    ProjectStateLogRepository,
+)
+from app.models import Project
+
+
+class ProjectStateLogService:
+    """Serves mcpQueries/iterationEvents/traceability entries page by page."""
+
+    def __init__(self, repository: ProjectStateLogRepository | None = None) -> None:
+        self._repository = repository or ProjectStateLogRepository()
+
+    async def list_entries(
+        self,
+        *,
+        project_id: str,
+        family: str,
+        db: AsyncSession,
+        cursor: str | None,
+        limit: int,
+    ) -> dict[str, Any]:
+        result = await db.execute(select(Project.id).where(Project.id == project_id))
+        if result.scalar_one_or_none() is None:
+            raise ValueError("Project not found")
+
+        page = await self._repository.get_page(
+            project_id=project_id,
+            family=family,
+            db=db,
+            cursor=cursor,
+            limit=limit,
+        )
+        return {"items": page.items, "nextCursor": page.next_cursor}
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+from collections.abc import Collection
 from dataclasses import dataclass
 from typing import Any, Protocol, cast
 
@@ -21,6 +24,9 @@ from app.features.projects.contracts import (
 from app.features.projects.infrastructure.architecture_inputs_repository import (
     merge_architecture_inputs,
 )
+from app.features.projects.infrastructure.project_state_log_repository import (
+    PROJECT_STATE_LOG_FAMILIES,
+)
 
 
 class WorkspaceRepository(Protocol):
@@ -31,9 +37,23 @@ class WorkspaceRepository(Protocol):
         db: object,
     ) -> dict[str, Any] | None: ...
 
+    async def get_workspace_fingerprint(
+        self,
+        *,
+        project_id: str,
+        db: object,
+    ) -> tuple[str, ...] | None: ...
+
 
 class StateProvider(Protocol):
-    async def get_project_state(self, project_id: str, db: object) -> dict[str, Any]: ...
+    async def get_project_state(
+        self,
+        project_id: str,
+        db: object,
+        *,
+        include_logs: bool | Collection[str] = True,
+        include_waf_checklist: bool = True,
+    ) -> dict[str, Any]: ...
 
 
 class ChecklistProvider(Protocol):
@@ -77,6 +97,93 @@ _REQUIRED_PROVIDER_KEYS = frozenset(
 )
 _EXCLUDED_ARTIFACT_KEYS = frozenset({"projectId", "lastUpdated", "diagrams", "wafChecklist"})
 
+# Public section name -> ProjectWorkspaceView field name.
+WORKSPACE_SECTIONS: dict[str, str] = {
+    (field.alias or name): name for name, field in ProjectWorkspaceView.model_fields.items()
+}
+# Public artifact family name (the ProjectState key) -> ProjectWorkspaceArtifacts field name.
+WORKSPACE_ARTIFACT_FIELDS: dict[str, str] = {
+    (field.alias or name): name for name, field in ProjectWorkspaceArtifacts.model_fields.items()
+}
+_STATE_BACKED_SECTIONS = frozenset({"state", "inputs", "documents", "artifacts", "diagrams"})
+
+
+@dataclass(frozen=True)
+class WorkspaceProjection:
+    """Subset of workspace sections and artifact families to compose.
+
+    ``None`` means "everything". Requesting artifact fields implies the
+    ``artifacts`` section. ``state.artifactKeys`` only lists the families that
+    were loaded for the projection.
+    """
+
+    sections: frozenset[str] | None = None
+    artifact_fields: frozenset[str] | None = None
+
+    @classmethod
+    def parse(cls, *, sections: str | None, fields: str | None) -> WorkspaceProjection:
+        """Build a projection from comma-separated ``sections=``/``fields=`` values."""
+        requested_sections = _split_names(sections, WORKSPACE_SECTIONS, kind="section")
+        requested_fields = _split_names(fields, WORKSPACE_ARTIFACT_FIELDS, kind="field")
+        if requested_fields is not None:
+            requested_sections = (requested_sections or frozenset()) | {"artifacts"}
+        return cls(sections=requested_sections, artifact_fields=requested_fields)
+
+    @property
+    def is_full(self) -> bool:
+        return self.sections is None and self.artifact_fields is None
+
+    def wants(self, section: str) -> bool:
+        return self.sections is None or section in self.sections
+
+    def wants_artifact(self, family: str) -> bool:
+        return self.wants("artifacts") and (
+            self.artifact_fields is None or family in self.artifact_fields
+        )
+
+    @property
+    def needs_project_state(self) -> bool:
+        return any(self.wants(section) for section in _STATE_BACKED_SECTIONS)
+
+    @property
+    def log_families(self) -> tuple[str, ...]:
+        return tuple(family for family in PROJECT_STATE_LOG_FAMILIES if self.wants_artifact(family))
+
+    def cache_key(self) -> str:
+        sections = ",".join(sorted(self.sections)) if self.sections is not None else "*"
+        fields = ",".join(sorted(self.artifact_fields)) if self.artifact_fields is not None else "*"
+        return f"{sections};{fields}"
+
+    def include(self) -> dict[str, Any] | None:
+        """``model_dump(include=...)`` spec selecting the projected view fields."""
+        if self.is_full:
+            return None
+        include: dict[str, Any] = {
+            WORKSPACE_SECTIONS[section]: True
+            for section in WORKSPACE_SECTIONS
+            if self.wants(section)
+        }
+        if "artifacts" in include and self.artifact_fields is not None:
+            include["artifacts"] = {
+                WORKSPACE_ARTIFACT_FIELDS[family]: True for family in self.artifact_fields
+            }
+        return include
+
+
+def _split_names(
+    raw: str | None,
+    allowed: Collection[str],
+    *,
+    kind: str,
+) -> frozenset[str] | None:
+    if raw is None:
+        return None
+    names = frozenset(name.strip() for name in raw.split(",") if name.strip())
+    unknown = sorted(names - set(allowed))
+    if unknown:
+        raise ValueError(f"Unknown workspace {kind}(s): {', '.join(unknown)}")
+    return names
+
 
 class ProjectWorkspaceComposer:
     """Compose a project workspace view from project and cross-feature sources."""
@@ -96,20 +203,73 @@ class ProjectWorkspaceComposer:
         self._knowledge_provider = resolved_providers.knowledge_provider
         self._settings_provider = settings_provider
 
-    async def compose(self, *, project_id: str, db: object) -> ProjectWorkspaceView:
+    async def compute_etag(
+        self,
+        *,
+        project_id: str,
+        db: object,
+        projection: WorkspaceProjection | None = None,
+    ) -> str | None:
+        """Strong ETag for the projected workspace, computed without composing it.
+
+        Returns ``None`` when the project does not exist.
+        """
+        projection = projection or WorkspaceProjection()
+        fingerprint = await self._repository.get_workspace_fingerprint(
+            project_id=project_id,
+            db=db,
+        )
+        if fingerprint is None:
+            return None
+
+        parts: list[Any] = [project_id, projection.cache_key(), list(fingerprint)]
+        if projection.wants("knowledgeBases"):
+            parts.append(self._knowledge_provider.list_knowledge_bases())
+        if projection.wants("settings"):
+            parts.append(
+                [
+                    self._settings_provider.get_current_provider(),
+                    self._settings_provider.get_current_model(),
+                ]
+            )
+        serialized = json.dumps(parts, sort_keys=True, default=str)
+        return f'"{hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:32]}"'
+
+    async def compose(
+        self,
+        *,
+        project_id: str,
+        db: object,
+        projection: WorkspaceProjection | None = None,
+    ) -> ProjectWorkspaceView:
+        """Compose the workspace view; unprojected sections keep their empty defaults."""
+        projection = projection or WorkspaceProjection()
         workspace_seed = await self._repository.get_workspace_seed(project_id=project_id, db=db)
         if workspace_seed is None:
             raise ValueError("Project not found")
 
-        project_state = await self._safe_get_project_state(project_id=project_id, db=db)
-        architecture_inputs = await self._safe_get_architecture_inputs(project_id=project_id, db=db)
-        project_state = merge_architecture_inputs(project_state, architecture_inputs)
+        project_state: dict[str, Any] = {}
+        if projection.needs_project_state:
+            project_state = await self._safe_get_project_state(
+                project_id=project_id,
+                db=db,
+                projection=projection,
+            )
+            architecture_inputs = await self._safe_get_architecture_inputs(
+                project_id=project_id,
+                db=db,
+            )
+            project_state = merge_architecture_inputs(project_state, architecture_inputs)
         project_state.setdefault("projectId", project_id)
-        checklist_payloads = await self._checklist_provider.list_checklists(
-            project_id=project_id,
-            db=db,
-        )
-        knowledge_base_payloads = self._knowledge_provider.list_knowledge_bases()
+        checklist_payloads: list[dict[str, Any]] = []
+        if projection.wants("checklists"):
+            checklist_payloads = await self._checklist_provider.list_checklists(
+                project_id=project_id,
+                db=db,
+            )
+        knowledge_base_payloads: list[dict[str, Any]] = []
+        if projection.wants("knowledgeBases"):
+            knowledge_base_payloads = self._knowledge_provider.list_knowledge_bases()
 
         project_payload = workspace_seed["project"]
         state_last_updated = self._stringify(project_state.get("lastUpdated"))
@@ -195,9 +355,22 @@ class ProjectWorkspaceComposer:
             ),
         )
 
-    async def _safe_get_project_state(self, *, project_id: str, db: object) -> dict[str, Any]:
+    async def _safe_get_project_state(
+        self,
+        *,
+        project_id: str,
+        db: object,
+        projection: WorkspaceProjection,
+    ) -> dict[str, Any]:
         try:
-            return await self._state_provider.get_project_state(project_id, db)
+            if projection.is_full:
+                return await self._state_provider.get_project_state(project_id, db)
+            return await self._state_provider.get_project_state(
+                project_id,
+                db,
+                include_logs=projection.log_families,
+                include_waf_checklist=projection.wants_artifact("wafChecklist"),
+            )
         except ValueError:
             return {}
 
@@ -2,12 +2,13 @@
 
 from .architecture_inputs_repository import ProjectArchitectureInputsRepository
 from .project_state_components_repository import ProjectStateComponentsRepository
-from .project_state_store import ProjectStateStore
+from .project_state_store import ProjectStateConflictError, ProjectStateStore
 from .workspace_repository import ProjectWorkspaceRepository
 
 __all__ = [
     "ProjectArchitectureInputsRepository",
     "ProjectStateComponentsRepository",
+    "ProjectStateConflictError",
     "ProjectStateStore",
     "ProjectWorkspaceRepository",
 ]
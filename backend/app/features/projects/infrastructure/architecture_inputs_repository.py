@@ -83,25 +83,6 @@ class ProjectArchitectureInputsRepository:
 
         return payload or None
 
-    async def sync_from_state(
-        self,
-        *,
-        project_id: str,
-        state: Mapping[str, Any],
-        db: AsyncSession,
-        replace_missing: bool,
-        updated_at: str | None = None,
-    ) -> dict[str, Any]:
-        architecture_inputs = extract_architecture_inputs(state)
-        await self.upsert_architecture_inputs(
-            project_id=project_id,
-            architecture_inputs=architecture_inputs,
-            db=db,
-            replace_missing=replace_missing,
-            updated_at=updated_at,
-        )
-        return strip_architecture_inputs(state)
-
     async def upsert_architecture_inputs(
         self,
         *,
@@ -110,14 +91,15 @@ class ProjectArchitectureInputsRepository:
         db: AsyncSession,
         replace_missing: bool,
         updated_at: str | None = None,
-    ) -> None:
+    ) -> list[str]:
+        """Write only the families whose serialized payload changed; return their keys."""
         result = await db.execute(
             select(ProjectArchitectureInputs).where(ProjectArchitectureInputs.project_id == project_id)
         )
         row = result.scalar_one_or_none()
 
         if row is None and not architecture_inputs:
-            return
+            return []
 
         if row is None:
             row = ProjectArchitectureInputs(
@@ -126,19 +108,27 @@ class ProjectArchitectureInputsRepository:
             )
             db.add(row)
 
+        changed: list[str] = []
         for state_key, column_name in ARCHITECTURE_INPUT_FIELD_MAP.items():
             if state_key in architecture_inputs:
-                setattr(row, column_name, json.dumps(architecture_inputs[state_key]))
+                value = json.dumps(architecture_inputs[state_key])
             elif replace_missing:
-                setattr(row, column_name, None)
+                value = None
+            else:
+                continue
+            if getattr(row, column_name) != value:
+                setattr(row, column_name, value)
+                changed.append(state_key)
 
         if self._row_is_empty(row):
             await db.delete(row)
             await db.flush()
-            return
+            return changed
 
-        row.updated_at = updated_at or self._now_iso()
-        await db.flush()
+        if changed:
+            row.updated_at = updated_at or self._now_iso()
+            await db.flush()
+        return changed
 
     def _deserialize(
         self,
@@ -0,0 +1,102 @@
+"""Persistence helpers for the per-document analysis result cache."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import DocumentAnalysisCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str) -> str:
+    """sha256 of the raw document text, the content part of the cache key."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class AnalysisCacheKey:
+    content_hash: str
+    prompt_version: str
+    model: str
+
+
+@dataclass(frozen=True)
+class CachedAnalysis:
+    result: dict[str, Any]
+    document_id: str | None
+    analysis_run_id: str
+
+
+class DocumentAnalysisCacheRepository:
+    """Load and store per-document analysis results."""
+
+    async def get_many(
+        self,
+        *,
+        content_hashes: Iterable[str],
+        prompt_version: str,
+        model: str,
+        db: AsyncSession,
+    ) -> dict[str, CachedAnalysis]:
+        hashes = sorted(set(content_hashes))
+        if not hashes:
+            return {}
+        result = await db.execute(
+            select(DocumentAnalysisCacheEntry).where(
+                DocumentAnalysisCacheEntry.content_hash.in_(hashes),
+                DocumentAnalysisCacheEntry.prompt_version == prompt_version,
+                DocumentAnalysisCacheEntry.model == model,
+            )
+        )
+        cached: dict[str, CachedAnalysis] = {}
+        for row in result.scalars().all():
+            try:
+                payload = json.loads(row.result_json)
+            except json.JSONDecodeError:
+                logger.warning("Ignoring corrupt analysis cache entry %s", row.content_hash)
+                continue
+            if isinstance(payload, dict):
+                cached[row.content_hash] = CachedAnalysis(
+                    result=payload,
+                    document_id=row.document_id,
+                    analysis_run_id=row.analysis_run_id,
+                )
+        return cached
+
+    async def put(
+        self,
+        *,
+        key: AnalysisCacheKey,
+        entry: CachedAnalysis,
+        db: AsyncSession,
+    ) -> None:
+        values = {
+            "content_hash": key.content_hash,
+            "prompt_version": key.prompt_version,
+            "model": key.model,
+            "result_json": json.dumps(entry.result, ensure_ascii=False),
+            "document_id": entry.document_id,
+            "analysis_run_id": entry.analysis_run_id,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        statement = insert(DocumentAnalysisCacheEntry).values(**values)
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["content_hash", "prompt_version", "model"],
+                set_={
+                    column: statement.excluded[column]
+                    for column in ("result_json", "document_id", "analysis_run_id", "created_at")
+                },
+            )
+        )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from collections.abc import Mapping
@@ -10,6 +11,7 @@ from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.models.project import ProjectStateComponent
 
@@ -25,13 +27,9 @@ PROJECT_STATE_COMPONENT_SOURCES: dict[str, tuple[str, ...]] = {
     "diagrams": ("diagrams",),
     "iacArtifacts": ("iacArtifacts",),
     "costEstimates": ("costEstimates",),
-    "traceabilityLinks": ("traceabilityLinks",),
-    "traceabilityIssues": ("traceabilityIssues",),
     "mindMapCoverage": ("mindMapCoverage",),
     "mindMap": ("mindMap",),
     "referenceDocuments": ("referenceDocuments",),
-    "mcpQueries": ("mcpQueries",),
-    "iterationEvents": ("iterationEvents",),
     "analysisSummary": ("analysisSummary",),
     "projectDocumentStats": ("projectDocumentStats", "ingestionStats"),
 }
@@ -44,6 +42,11 @@ PROJECT_STATE_COMPONENT_ALIAS_KEYS: frozenset[str] = frozenset(
 )
 
 
+def payload_hash(payload_json: str) -> str:
+    """Content hash stored next to a serialized component payload."""
+    return hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
+
+
 def extract_project_state_components(state: Mapping[str, Any]) -> dict[str, Any]:
     """Return the decomposed ProjectState component subset for persistence."""
     components: dict[str, Any] = {}
@@ -133,36 +136,19 @@ class ProjectStateComponentsRepository:
         for component_key, payload in components.items():
             if component_key in existing_rows:
                 continue
+            payload_json = json.dumps(payload)
             db.add(
                 ProjectStateComponent(
                     project_id=project_id,
                     component_key=component_key,
-                    payload_json=json.dumps(payload),
+                    payload_json=payload_json,
+                    content_hash=payload_hash(payload_json),
                     updated_at=updated_at or self._now_iso(),
                 )
             )
 
         await db.flush()
 
-    async def sync_from_state(
-        self,
-        *,
-        project_id: str,
-        state: Mapping[str, Any],
-        db: AsyncSession,
-        replace_missing: bool,
-        updated_at: str | None = None,
-    ) -> dict[str, Any]:
-        components = extract_project_state_components(state)
-        await self.upsert_project_state_components(
-            project_id=project_id,
-            components=components,
-            db=db,
-            replace_missing=replace_missing,
-            updated_at=updated_at,
-        )
-        return strip_project_state_components(state)
-
     async def upsert_project_state_components(
         self,
         *,
@@ -171,30 +157,50 @@ class ProjectStateComponentsRepository:
         db: AsyncSession,
         replace_missing: bool,
         updated_at: str | None = None,
-    ) -> None:
+    ) -> list[str]:
+        """Write only the families whose payload changed; return their keys.
+
+        Existing rows are compared by ``content_hash`` with ``payload_json``
+        deferred, so unchanged multi-MB families are neither loaded nor rewritten.
+        Rows already loaded by a read in this session are reused as-is.
+        """
         result = await db.execute(
-            select(ProjectStateComponent).where(ProjectStateComponent.project_id == project_id)
+            select(ProjectStateComponent)
+            .where(ProjectStateComponent.project_id == project_id)
+            .options(defer(ProjectStateComponent.payload_json))
         )
         existing_rows = {row.component_key: row for row in result.scalars().all()}
 
+        changed: list[str] = []
         for component_key in PROJECT_STATE_COMPONENT_KEYS:
             row = existing_rows.get(component_key)
             if component_key in components:
+                payload_json = json.dumps(components[component_key])
+                content_hash = payload_hash(payload_json)
                 if row is None:
-                    row = ProjectStateComponent(
-                        project_id=project_id,
-                        component_key=component_key,
-                        payload_json=json.dumps(components[component_key]),
-                        updated_at=updated_at or self._now_iso(),
+                    db.add(
+                        ProjectStateComponent(
+                            project_id=project_id,
+                            component_key=component_key,
+                            payload_json=payload_json,
+                            content_hash=content_hash,
+                            updated_at=updated_at or self._now_iso(),
+                        )
                     )
-                    db.add(row)
-                else:
-                    row.payload_json = json.dumps(components[component_key])
+                elif row.content_hash != content_hash:
+                    row.payload_json = payload_json
+                    row.content_hash = content_hash
                     row.updated_at = updated_at or self._now_iso()
+                else:
+                    continue
+                changed.append(component_key)
             elif replace_missing and row is not None:
                 await db.delete(row)
+                changed.append(component_key)
 
-        await db.flush()
+        if changed:
+            await db.flush()
+        return changed
 
     def _deserialize(
         self,
@@ -227,5 +233,6 @@ __all__ = [
     "ProjectStateComponentsRepository",
     "extract_project_state_components",
     "merge_project_state_components",
+    "payload_hash",
     "strip_project_state_components",
 ]
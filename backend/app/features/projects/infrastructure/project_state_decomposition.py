@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.projects.infrastructure.architecture_inputs_repository import (
     ProjectArchitectureInputsRepository,
+    extract_architecture_inputs,
     merge_architecture_inputs,
+    strip_architecture_inputs,
 )
 from app.features.projects.infrastructure.project_state_components_repository import (
     ProjectStateComponentsRepository,
+    extract_project_state_components,
     merge_project_state_components,
+    strip_project_state_components,
+)
+from app.features.projects.infrastructure.project_state_log_repository import (
+    ProjectStateLogRepository,
+    resolve_log_families,
+    strip_project_state_logs,
 )
 
 _architecture_inputs_repository = ProjectArchitectureInputsRepository()
 _project_state_components_repository = ProjectStateComponentsRepository()
+_project_state_log_repository = ProjectStateLogRepository()
 
 
 async def compose_project_state(
@@ -26,14 +37,24 @@ async def compose_project_state(
     state: Mapping[str, Any],
     db: AsyncSession,
     backfill_missing_components: bool = True,
+    include_logs: bool | Collection[str] = False,
 ) -> dict[str, Any]:
-    """Overlay decomposed stores on top of the compatibility blob payload."""
+    """Overlay decomposed stores on top of the compatibility blob payload.
+
+    Append-only log families (see ``PROJECT_STATE_LOG_FAMILIES``) are only
+    loaded when requested through *include_logs* (``True`` or a subset of keys).
+    """
     if backfill_missing_components:
         await _project_state_components_repository.backfill_missing_from_state(
             project_id=project_id,
             state=state,
             db=db,
         )
+        await _project_state_log_repository.append_from_state(
+            project_id=project_id,
+            state=state,
+            db=db,
+        )
 
     architecture_inputs = await _architecture_inputs_repository.get_architecture_inputs(
         project_id=project_id,
@@ -45,7 +66,23 @@ async def compose_project_state(
         project_id=project_id,
         db=db,
     )
-    return merge_project_state_components(merged_state, components)
+    composed = strip_project_state_logs(merge_project_state_components(merged_state, components))
+    composed.update(
+        await _project_state_log_repository.get_logs(
+            project_id=project_id,
+            families=resolve_log_families(include_logs),
+            db=db,
+        )
+    )
+    return composed
+
+
+@dataclass(frozen=True)
+class ProjectStateSync:
+    """Stripped compatibility blob plus the decomposed families that were rewritten."""
+
+    state: dict[str, Any]
+    changed_keys: tuple[str, ...]
 
 
 async def sync_project_state(
@@ -55,22 +92,36 @@ async def sync_project_state(
     db: AsyncSession,
     replace_missing: bool,
     updated_at: str | None = None,
-) -> dict[str, Any]:
-    """Persist decomposed families and return the stripped compatibility blob."""
-    stripped_state = await _architecture_inputs_repository.sync_from_state(
+) -> ProjectStateSync:
+    """Persist changed decomposed families and return the stripped compatibility blob.
+
+    Log families are append-only: new entries are stored, absent ones are kept.
+    """
+    changed_inputs = await _architecture_inputs_repository.upsert_architecture_inputs(
         project_id=project_id,
-        state=state,
+        architecture_inputs=extract_architecture_inputs(state),
         db=db,
         replace_missing=replace_missing,
         updated_at=updated_at,
     )
-    return await _project_state_components_repository.sync_from_state(
+    stripped_state = strip_architecture_inputs(state)
+    changed_components = await _project_state_components_repository.upsert_project_state_components(
         project_id=project_id,
-        state=stripped_state,
+        components=extract_project_state_components(stripped_state),
         db=db,
         replace_missing=replace_missing,
         updated_at=updated_at,
     )
+    changed_logs = await _project_state_log_repository.append_from_state(
+        project_id=project_id,
+        state=stripped_state,
+        db=db,
+        created_at=updated_at,
+    )
+    return ProjectStateSync(
+        state=strip_project_state_logs(strip_project_state_components(stripped_state)),
+        changed_keys=(*changed_inputs, *changed_components, *changed_logs),
+    )
 
 
-__all__ = ["compose_project_state", "sync_project_state"]
+__all__ = ["ProjectStateSync", "compose_project_state", "sync_project_state"]
@@ -0,0 +1,271 @@
+"""Persistence helpers for append-only ProjectState log families.
+
+``mcpQueries``, ``iterationEvents``, ``traceabilityLinks`` and
+``traceabilityIssues`` grow with every turn, so they are stored one row per
+entry instead of as JSON arrays in ``project_state_components``. State writes
+only append entries whose id is not stored yet; entries are never rewritten or
+deleted by a write, so a state composed without these families is safe to persist.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import ProjectStateComponent, ProjectStateLogEntry
+
+logger = logging.getLogger(__name__)
+
+PROJECT_STATE_LOG_FAMILIES: tuple[str, ...] = (
+    "mcpQueries",
+    "iterationEvents",
+    "traceabilityLinks",
+    "traceabilityIssues",
+)
+
+
+def resolve_log_families(include_logs: bool | Collection[str]) -> tuple[str, ...]:
+    """Normalize an ``include_logs`` argument (all, none, or a subset) to family keys."""
+    if include_logs is True:
+        return PROJECT_STATE_LOG_FAMILIES
+    if not include_logs:
+        return ()
+    return tuple(family for family in PROJECT_STATE_LOG_FAMILIES if family in include_logs)
+
+
+def strip_project_state_logs(state: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a copy of *state* without log families."""
+    return {key: value for key, value in state.items() if key not in PROJECT_STATE_LOG_FAMILIES}
+
+
+def log_entry_id(entry: Any) -> str:
+    """Stable identity of a log entry: its ``id``, else a hash of its content."""
+    if isinstance(entry, Mapping):
+        entry_id = str(entry.get("id") or "").strip()
+        if entry_id:
+            return entry_id
+    serialized = json.dumps(entry, sort_keys=True, default=str)
+    return "sha256:" + hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class LogPage:
+    items: list[Any]
+    next_cursor: str | None
+
+
+@dataclass(frozen=True)
+class _LogTarget:
+    """Where new entries of one family go, and the entry ids already stored there."""
+
+    project_id: str
+    family: str
+    seen: set[str]
+    created_at: str
+
+
+class ProjectStateLogRepository:
+    """Append and read per-entry ProjectState log families."""
+
+    async def append_from_state(
+        self,
+        *,
+        project_id: str,
+        state: Mapping[str, Any],
+        db: AsyncSession,
+        created_at: str | None = None,
+    ) -> list[str]:
+        """Append entries of *state*'s log families that are not stored yet.
+
+        Returns the families that received new entries.
+        """
+        families = [
+            family
+            for family in PROJECT_STATE_LOG_FAMILIES
+            if isinstance(state.get(family), list) and state[family]
+        ]
+        if not families:
+            return []
+
+        await self._absorb_legacy_components(project_id=project_id, db=db)
+        existing = await self._existing_entry_ids(project_id=project_id, families=families, db=db)
+        timestamp = created_at or self._now_iso()
+
+        changed: list[str] = []
+        for family in families:
+            target = _LogTarget(
+                project_id=project_id,
+                family=family,
+                seen=existing.setdefault(family, set()),
+                created_at=timestamp,
+            )
+            if self._add_entries(target=target, entries=state[family], db=db):
+                changed.append(family)
+
+        if changed:
+            await db.flush()
+        return changed
+
+    async def get_logs(
+        self,
+        *,
+        project_id: str,
+        families: Collection[str],
+        db: AsyncSession,
+    ) -> dict[str, list[Any]]:
+        """Load the requested families in append order (every family gets a list)."""
+        if not families:
+            return {}
+
+        await self._absorb_legacy_components(project_id=project_id, db=db)
+        result = await db.execute(
+            select(ProjectStateLogEntry.family, ProjectStateLogEntry.payload_json)
+            .where(
+                ProjectStateLogEntry.project_id == project_id,
+                ProjectStateLogEntry.family.in_(list(families)),
+            )
+            .order_by(ProjectStateLogEntry.seq)
+        )
+        logs: dict[str, list[Any]] = {family: [] for family in families}
+        for family, payload_json in result.all():
+            logs[family].append(json.loads(payload_json))
+        return logs
+
+    async def get_page(
+        self,
+        *,
+        project_id: str,
+        family: str,
+        db: AsyncSession,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> LogPage:
+        """Return up to *limit* entries appended after *cursor*, oldest first."""
+        if family not in PROJECT_STATE_LOG_FAMILIES:
+            raise ValueError(f"Unknown state log family: {family}")
+        after_seq = 0
+        if cursor:
+            try:
+                after_seq = int(cursor)
+            except ValueError as exc:
+                raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+        await self._absorb_legacy_components(project_id=project_id, db=db)
+        result = await db.execute(
+            select(ProjectStateLogEntry.seq, ProjectStateLogEntry.payload_json)
+            .where(
+                ProjectStateLogEntry.project_id == project_id,
+                ProjectStateLogEntry.family == family,
+                ProjectStateLogEntry.seq > after_seq,
+            )
+            .order_by(ProjectStateLogEntry.seq)
+            .limit(limit + 1)
+        )
+        rows = result.all()
+        page = rows[:limit]
+        return LogPage(
+            items=[json.loads(payload_json) for _, payload_json in page],
+            next_cursor=str(page[-1][0]) if len(rows) > limit else None,
+        )
+
+    async def _absorb_legacy_components(self, *, project_id: str, db: AsyncSession) -> None:
+        """Move log families still stored as component rows into the entry table."""
+        result = await db.execute(
+            select(ProjectStateComponent).where(
+                ProjectStateComponent.project_id == project_id,
+                ProjectStateComponent.component_key.in_(PROJECT_STATE_LOG_FAMILIES),
+            )
+        )
+        rows = result.scalars().all()
+        if not rows:
+            return
+
+        existing = await self._existing_entry_ids(
+            project_id=project_id,
+            families=[row.component_key for row in rows],
+            db=db,
+        )
+        for row in rows:
+            try:
+                entries = json.loads(row.payload_json)
+            except json.JSONDecodeError:
+                logger.warning(
+                    "Dropping undecodable %s component payload for project %s",
+                    row.component_key,
+                    project_id,
+                )
+                entries = []
+            if isinstance(entries, list):
+                target = _LogTarget(
+                    project_id=project_id,
+                    family=row.component_key,
+                    seen=existing.setdefault(row.component_key, set()),
+                    created_at=row.updated_at,
+                )
+                self._add_entries(target=target, entries=entries, db=db)
+            await db.delete(row)
+        await db.flush()
+
+    async def _existing_entry_ids(
+        self,
+        *,
+        project_id: str,
+        families: Collection[str],
+        db: AsyncSession,
+    ) -> dict[str, set[str]]:
+        result = await db.execute(
+            select(ProjectStateLogEntry.family, ProjectStateLogEntry.entry_id).where(
+                ProjectStateLogEntry.project_id == project_id,
+                ProjectStateLogEntry.family.in_(list(families)),
+            )
+        )
+        existing: dict[str, set[str]] = {}
+        for family, entry_id in result.all():
+            existing.setdefault(family, set()).add(entry_id)
+        return existing
+
+    def _add_entries(
+        self,
+        *,
+        target: _LogTarget,
+        entries: list[Any],
+        db: AsyncSession,
+    ) -> bool:
+        added = False
+        for entry in entries:
+            entry_id = log_entry_id(entry)
+            if entry_id in target.seen:
+                continue
+            target.seen.add(entry_id)
+            db.add(
+                ProjectStateLogEntry(
+                    project_id=target.project_id,
+                    family=target.family,
+                    entry_id=entry_id,
+                    payload_json=json.dumps(entry),
+                    created_at=target.created_at,
+                )
+            )
+            added = True
+        return added
+
+    def _now_iso(self) -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+
+__all__ = [
+    "PROJECT_STATE_LOG_FAMILIES",
+    "LogPage",
+    "ProjectStateLogRepository",
+    "log_entry_id",
+    "resolve_log_families",
+    "strip_project_state_logs",
+]
@@ -9,11 +9,27 @@ from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.features.projects.infrastructure.project_state_decomposition import sync_project_state
 from app.models.project import ProjectState
 
 
+class ProjectStateConflictError(RuntimeError):
+    """Raised when another writer updated the project state since it was loaded.
+
+    Deliberately not a ``ValueError`` so routers' validation mapping does not
+    turn it into a 400/404; the app-level handler answers 409 instead.
+    """
+
+    def __init__(self, project_id: str) -> None:
+        super().__init__(f"ProjectState for project {project_id} was modified concurrently")
+        self.project_id = project_id
+
+
+_LOADED_VERSIONS_KEY = "project_state_versions"
+
+
 class ProjectStateStore:
     """Owns reads and writes of the legacy ProjectState compatibility blob."""
 
@@ -21,7 +37,12 @@ class ProjectStateStore:
         result = await db.execute(
             select(ProjectState).where(ProjectState.project_id == project_id)
         )
-        return result.scalar_one_or_none()
+        record = result.scalar_one_or_none()
+        if record is not None:
+            # The identity map holds records weakly, so remember the version this
+            # session last read for the conflict check on write.
+            db.info.setdefault(_LOADED_VERSIONS_KEY, {})[project_id] = record.version
+        return record
 
     async def get_blob_state(self, *, project_id: str, db: AsyncSession) -> dict[str, Any] | None:
         record = await self.get_record(project_id=project_id, db=db)
@@ -55,18 +76,37 @@ class ProjectStateStore:
         replace_missing: bool,
         updated_at: str | None = None,
     ) -> dict[str, Any]:
+        """Persist *state*, writing only the families and blob that changed.
+
+        The ``ProjectState`` row is bumped whenever anything changed; its
+        ``version`` column makes the update fail with
+        ``ProjectStateConflictError`` if another writer got there first.
+        """
         timestamp = updated_at or datetime.now(timezone.utc).isoformat()
-        stripped_state = await sync_project_state(
-            project_id=project_id,
-            state=state,
-            db=db,
-            replace_missing=replace_missing,
-            updated_at=timestamp,
-        )
+        loaded_versions = db.info.setdefault(_LOADED_VERSIONS_KEY, {})
+        expected_version = loaded_versions.get(project_id)
         record = await self.ensure_record(project_id=project_id, db=db, updated_at=timestamp)
-        record.state = json.dumps(stripped_state)
-        record.updated_at = timestamp
-        return stripped_state
+        if expected_version is not None and expected_version != record.version:
+            raise ProjectStateConflictError(project_id)
+        try:
+            synced = await sync_project_state(
+                project_id=project_id,
+                state=state,
+                db=db,
+                replace_missing=replace_missing,
+                updated_at=timestamp,
+            )
+            blob_json = json.dumps(synced.state)
+            if record.state != blob_json:
+                record.state = blob_json
+            elif not synced.changed_keys:
+                return synced.state
+            record.updated_at = timestamp
+            await db.flush()
+        except StaleDataError as exc:
+            raise ProjectStateConflictError(project_id) from exc
+        loaded_versions[project_id] = record.version
+        return synced.state
 
 
-__all__ = ["ProjectStateStore"]
+__all__ = ["ProjectStateConflictError", "ProjectStateStore"]
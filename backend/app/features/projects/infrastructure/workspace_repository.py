@@ -4,11 +4,20 @@ from __future__ import annotations
 
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.models.project import Project
+from app.models.checklist import Checklist, ChecklistItem, ChecklistItemEvaluation
+from app.models.project import (
+    ConversationMessage,
+    Project,
+    ProjectArchitectureInputs,
+    ProjectDocument,
+    ProjectState,
+    ProjectStateComponent,
+    ProjectStateLogEntry,
+    ProjectThread,
+)
 
 
 class ProjectWorkspaceRepository:
@@ -21,26 +30,129 @@ class ProjectWorkspaceRepository:
         db: AsyncSession,
     ) -> dict[str, Any] | None:
         result = await db.execute(
-            select(Project)
-            .where(Project.id == project_id, Project.deleted_at.is_(None))
-            .options(
-                selectinload(Project.documents),
-                selectinload(Project.messages),
-                selectinload(Project.threads),
-            )
+            select(
+                Project,
+                select(func.count())
+                .select_from(ProjectDocument)
+                .where(ProjectDocument.project_id == project_id)
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(ConversationMessage)
+                .where(ConversationMessage.project_id == project_id)
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(ProjectThread)
+                .where(ProjectThread.project_id == project_id)
+                .scalar_subquery(),
+                select(func.max(ConversationMessage.timestamp))
+                .where(ConversationMessage.project_id == project_id)
+                .scalar_subquery(),
+            ).where(Project.id == project_id, Project.deleted_at.is_(None))
         )
-        project = result.scalar_one_or_none()
-        if project is None:
+        row = result.one_or_none()
+        if row is None:
             return None
 
-        last_message_at = None
-        if project.messages:
-            last_message_at = max(message.timestamp for message in project.messages)
-
+        project, document_count, message_count, thread_count, last_message_at = row
         return {
             "project": project.to_dict(),
-            "documentCount": len(project.documents),
-            "messageCount": len(project.messages),
-            "threadCount": len(project.threads),
+            "documentCount": int(document_count or 0),
+            "messageCount": int(message_count or 0),
+            "threadCount": int(thread_count or 0),
             "lastMessageAt": last_message_at,
         }
+
+    async def get_workspace_fingerprint(
+        self,
+        *,
+        project_id: str,
+        db: AsyncSession,
+    ) -> tuple[str, ...] | None:
+        """Return change markers for every store the workspace is composed from.
+
+        Each marker is a version, count or latest ``updated_at`` so the tuple
+        changes whenever a composed section could change. Returns ``None`` for
+        unknown or deleted projects.
+        """
+        checklist_ids = select(Checklist.id).where(Checklist.project_id == project_id)
+        result = await db.execute(
+            select(
+                Project.name,
+                Project.text_requirements,
+                Project.created_at,
+                select(ProjectState.version)
+                .where(ProjectState.project_id == project_id)
+                .scalar_subquery(),
+                select(ProjectState.updated_at)
+                .where(ProjectState.project_id == project_id)
+                .scalar_subquery(),
+                select(ProjectArchitectureInputs.updated_at)
+                .where(ProjectArchitectureInputs.project_id == project_id)
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(ProjectStateComponent)
+                .where(ProjectStateComponent.project_id == project_id)
+                .scalar_subquery(),
+                select(func.max(ProjectStateComponent.updated_at))
+                .where(ProjectStateComponent.project_id == project_id)
+                .scalar_subquery(),
+                select(func.max(ProjectStateLogEntry.seq))
+                .where(ProjectStateLogEntry.project_id == project_id)
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(ConversationMessage)
+                .where(ConversationMessage.project_id == project_id)
+                .scalar_subquery(),
+                select(func.max(ConversationMessage.timestamp))
+                .where(ConversationMessage.project_id == project_id)
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(ProjectThread)
+                .where(ProjectThread.project_id == project_id)
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(Checklist)
+                .where(Checklist.project_id == project_id)
+                .scalar_subquery(),
+                select(func.max(Checklist.updated_at))
+                .where(Checklist.project_id == project_id)
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(ChecklistItem)
+                .where(ChecklistItem.checklist_id.in_(checklist_ids))
+                .scalar_subquery(),
+                select(func.max(ChecklistItem.updated_at))
+                .where(ChecklistItem.checklist_id.in_(checklist_ids))
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(ChecklistItemEvaluation)
+                .where(ChecklistItemEvaluation.project_id == project_id)
+                .scalar_subquery(),
+                select(func.max(ChecklistItemEvaluation.updated_at))
+                .where(ChecklistItemEvaluation.project_id == project_id)
+                .scalar_subquery(),
+            ).where(Project.id == project_id, Project.deleted_at.is_(None))
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        # Uploaded documents surface as reference documents with their parse and
+        # analysis status, which change without any timestamp of their own.
+        documents = await db.execute(
+            select(
+                ProjectDocument.id,
+                ProjectDocument.file_name,
+                ProjectDocument.mime_type,
+                ProjectDocument.stored_path.is_(None),
+                ProjectDocument.parse_status,
+                ProjectDocument.analysis_status,
+                ProjectDocument.parse_error,
+                ProjectDocument.uploaded_at,
+                ProjectDocument.analyzed_at,
+            )
+            .where(ProjectDocument.project_id == project_id)
+            .order_by(ProjectDocument.id)
+        )
+        markers = [*row, *(value for document in documents.all() for value in document)]
+        return tuple("" if value is None else str(value) for value in markers)
@@ -7,6 +7,8 @@ import asyncio
 import logging
 from pathlib import Path
 
+from app.agents_system.langgraph.checkpointer import close_thread_checkpointer
+from app.agents_system.langgraph.graph_factory import get_project_chat_graph
 from app.agents_system.runner import initialize_agent_runner, shutdown_agent_runner
 from app.agents_system.services.mindmap_loader import initialize_mindmap
 from app.features.diagrams.application.database import (
@@ -14,6 +16,10 @@ from app.features.diagrams.application.database import (
     init_diagram_database,
 )
 from app.features.ingestion.infrastructure.ingestion_database import init_ingestion_database
+from app.features.projects.api import get_document_service_dep
+from app.features.projects.application.document_parsing_executor import (
+    shutdown_document_parsing_executor,
+)
 from app.service_registry import ServiceRegistry, get_kb_manager
 from app.shared.config.app_settings import get_app_settings
 from app.shared.db.projects_database import close_database, init_database
@@ -47,6 +53,7 @@ async def startup():
         logger.info("Initializing database...")
         await init_database()
         logger.info("Database initialized")
+        await _resume_pending_document_parses()
 
         # Initialize ingestion database (producer/consumer pipeline)
         logger.info("Initializing ingestion persistence...")
@@ -58,19 +65,17 @@ async def startup():
         await init_diagram_database()
         logger.info("Diagram database ready")
 
-        # Load KB manager and preload all indices for performance
+        # Load KB manager
         logger.info("Loading KB Manager...")
         kb_mgr = get_kb_manager()
         logger.info(f"KB Manager ready ({len(kb_mgr.list_kbs())} knowledge bases)")
 
-        # Preload all active KB indices at startup
-        logger.info("Preloading KB indices...")
-        timing = kb_mgr.preload_all_indices()
+        # Warm up the top-priority KB indices; the rest load on first query
+        logger.info("Warming up KB indices...")
+        timing = await asyncio.to_thread(kb_mgr.warm_up_indices)
         if timing:
-            total_time = sum(t for t in timing.values() if t > 0)
-            logger.info(f"  All indices preloaded in {total_time:.2f}s")
-        else:
-            logger.info("  No active KBs to preload")
+            slowest = max(timing.values())
+            logger.info(f"  KB index warm-up finished (slowest load {slowest:.2f}s)")
 
         # Initialize agent system with MCP client
         try:
@@ -86,6 +91,7 @@ async def startup():
 
             logger.info("Initializing agent system...")
             await initialize_agent_runner(mcp_client)
+            get_project_chat_graph()
             logger.info("✓ Agent system ready")
         except (MCPError, RuntimeError, ValueError) as e:
             logger.warning(f"Failed to initialize agent system: {e}")
@@ -100,6 +106,13 @@ async def startup():
         raise
 
 
+async def _resume_pending_document_parses() -> None:
+    """Re-queue uploads whose background parse was cut short by the previous shutdown."""
+    resumed = await get_document_service_dep().resume_pending_parses()
+    if resumed:
+        logger.info(f"Re-queued {resumed} pending document parses")
+
+
 async def shutdown():
     """
     Cleanup on shutdown - stop running ingestion jobs gracefully.
@@ -132,6 +145,12 @@ async def shutdown():
             logger.warning(f"Error closing MCP client: {e}")
             ServiceRegistry.set_mcp_client(None)  # type: ignore
 
+    # Close thread memory checkpoints
+    await close_thread_checkpointer()
+
+    # Stop document parse workers
+    shutdown_document_parsing_executor()
+
     # Close database connections
     await close_database()
 
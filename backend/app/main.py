@@ -26,6 +26,7 @@ from app.features.knowledge.api import (
     kb_query_router,
 )
 from app.features.projects.api import project_management_router as project_router
+from app.features.projects.api.error_handlers import register_project_error_handlers
 from app.features.settings.api import router as settings_router
 from app.shared.config.app_settings import get_app_settings
 from app.shared.http.router_guardrails import enforce_router_guardrails
@@ -98,6 +99,7 @@ app.include_router(checklist_router)  # New normalized checklists
 app.include_router(diagram_generation_router, prefix=API_BASE_PREFIX)  # Diagram generation
 app.include_router(settings_router, prefix=f"{API_BASE_PREFIX}/settings", tags=["settings"])  # Settings endpoints
 enforce_router_guardrails(app)
+register_project_error_handlers(app)
 
 # Health check
 class HealthResponse(BaseModel):
@@ -5,11 +5,13 @@ Database models for the application.
 from .checklist import Checklist, ChecklistItem, ChecklistItemEvaluation, ChecklistTemplate
 from .project import (
     ConversationMessage,
+    DocumentAnalysisCacheEntry,
     Project,
     ProjectArchitectureInputs,
     ProjectDocument,
     ProjectState,
     ProjectStateComponent,
+    ProjectStateLogEntry,
 )
 
 __all__ = [
@@ -18,10 +20,12 @@ __all__ = [
     "ChecklistItemEvaluation",
     "ChecklistTemplate",
     "ConversationMessage",
+    "DocumentAnalysisCacheEntry",
     "Project",
     "ProjectArchitectureInputs",
     "ProjectDocument",
     "ProjectState",
     "ProjectStateComponent",
+    "ProjectStateLogEntry",
 ]
 
@@ -135,6 +135,11 @@ class ChecklistItem(Base):
     severity: Mapped[SeverityLevel] = mapped_column(Enum(SeverityLevel, name='severity_level'), nullable=False)
     guidance: Mapped[dict[str, object] | None] = mapped_column(JSON, nullable=True)
     item_metadata: Mapped[dict[str, object] | None] = mapped_column(JSON, nullable=True)
+    # Denormalized from the newest evaluation; maintained by evaluation writers.
+    latest_status: Mapped[EvaluationStatus] = mapped_column(
+        Enum(EvaluationStatus, name='evaluation_status'), default=EvaluationStatus.OPEN, nullable=False
+    )
+    latest_evaluated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
@@ -151,6 +156,7 @@ class ChecklistItem(Base):
     __table_args__ = (
         Index('ix_item_checklist_id', 'checklist_id'),
         Index('ix_item_severity', 'severity'),
+        Index('ix_item_checklist_latest_status', 'checklist_id', 'latest_status', 'severity'),
         UniqueConstraint('checklist_id', 'template_item_id', name='uq_checklist_item_template'),
     )
 
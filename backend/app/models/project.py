@@ -5,9 +5,9 @@ from __future__ import annotations
 import json
 import uuid
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, ClassVar
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -131,6 +131,25 @@ class ProjectDocument(Base):
         }
 
 
+class DocumentAnalysisCacheEntry(Base):
+    """Cached per-document analysis output keyed by content hash, prompt version and model."""
+
+    __tablename__ = "document_analysis_cache"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    prompt_version: Mapped[str] = mapped_column(String(32), primary_key=True)
+    model: Mapped[str] = mapped_column(String(128), primary_key=True)
+    result_json: Mapped[str] = mapped_column(Text, nullable=False)
+    # Document the result was produced for; its id appears in requirement sources.
+    document_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    analysis_run_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    created_at: Mapped[str] = mapped_column(
+        String(30),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).isoformat(),
+    )
+
+
 class ProjectState(Base):
     """Project state - Architecture Sheet."""
 
@@ -145,10 +164,14 @@ class ProjectState(Base):
         nullable=False,
         default=lambda: datetime.now(timezone.utc).isoformat(),
     )
+    # Optimistic-concurrency counter: every UPDATE checks and bumps it.
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
 
     # Relationships
     project: Mapped[Project] = relationship("Project", back_populates="states")
 
+    __mapper_args__: ClassVar[dict[str, Any]] = {"version_id_col": version}
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for API responses."""
         state_data: dict[str, Any] = json.loads(str(self.state))
@@ -190,6 +213,8 @@ class ProjectStateComponent(Base):
     )
     component_key: Mapped[str] = mapped_column(String(128), primary_key=True)
     payload_json: Mapped[str] = mapped_column(Text, nullable=False)
+    # sha256 of payload_json, compared on write so unchanged families are skipped.
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     updated_at: Mapped[str] = mapped_column(
         String(30),
         nullable=False,
@@ -199,10 +224,37 @@ class ProjectStateComponent(Base):
     project: Mapped[Project] = relationship("Project", back_populates="state_components")
 
 
+class ProjectStateLogEntry(Base):
+    """Append-only entry of a log-like ProjectState family (mcpQueries, iterationEvents, ...)."""
+
+    __tablename__ = "project_state_log_entries"
+    __table_args__ = (
+        UniqueConstraint("project_id", "family", "entry_id", name="uq_project_state_log_entry"),
+        Index("ix_project_state_log_entries_project_created", "project_id", "family", "created_at"),
+    )
+
+    # Autoincrement sequence: preserves append order and serves as the page cursor.
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    project_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    family: Mapped[str] = mapped_column(String(64), nullable=False)
+    entry_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    payload_json: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[str] = mapped_column(
+        String(30),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).isoformat(),
+    )
+
+
 class ConversationMessage(Base):
     """Chat message in project conversation."""
 
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_project_thread_timestamp", "project_id", "thread_id", "timestamp"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     project_id: Mapped[str] = mapped_column(
@@ -48,10 +48,9 @@ class ServiceRegistry:
     - See tests/conftest.py for mock fixtures
 
     Caching Strategy:
-    - KBs preloaded eagerly at application startup via lifecycle.py
-    - All active KB indices loaded into memory during startup
+    - Top-priority KB indexes warmed up at startup via lifecycle.py; others load lazily
     - Configuration changes trigger invalidation via invalidate_kb_manager()
-    - Indices kept in memory until process restart or invalidation
+    - Loaded indices live in a memory-budgeted LRU and are evicted when over budget
     """
 
     _kb_manager: KBManager | None = None
@@ -7,21 +7,22 @@ AI service configuration and monitoring.
 
 Note on event-loop bridging
 ---------------------------
-LlamaIndex's synchronous ``_get_*_embedding`` and ``complete``/``chat`` methods
-must call async AIService methods from a (potentially) already-running event loop.
-``nest_asyncio.apply()`` is called **once at module load time** to allow
-``loop.run_until_complete()`` to be called from within a running loop.
-
-This is a process-wide side effect.  Callers that require strict asyncio
-isolation should use the async ``_aget_*`` methods directly instead of
-relying on these sync shims.
+The async LlamaIndex entry points (``acomplete``, ``achat``, ``_aget_*``) await
+AIService directly on the caller's event loop; async callers should use them.
+
+The synchronous ``complete``/``chat`` and ``_get_*_embedding`` shims submit the
+coroutine to a dedicated event loop running on a daemon worker thread and block
+on the result.  The caller's loop is never re-entered, so no process-wide
+``nest_asyncio`` patch is needed, but a sync call made from inside a running
+loop still blocks that loop until it returns.
 """
 
 import asyncio
 import logging
-from typing import Any, ClassVar, cast
+import threading
+from collections.abc import Coroutine
+from typing import Any, ClassVar, TypeVar
 
-import nest_asyncio
 from llama_index.core.base.llms.types import (
     ChatMessage as LlamaIndexChatMessage,
 )
@@ -35,34 +36,59 @@ from llama_index.core.base.llms.types import (
 )
 from llama_index.core.embeddings import BaseEmbedding
 from llama_index.core.llms import CustomLLM
+from llama_index.core.llms.callbacks import llm_completion_callback
 
 from ..ai_service import AIService
 from ..interfaces import ChatMessage, LLMResponse
 
 logger = logging.getLogger(__name__)
 
-# Apply nest_asyncio once at module load time so sync adapter methods can safely
-# call run_until_complete even when an event loop is already running.
-nest_asyncio.apply()
+_T = TypeVar("_T")
 
 
-def _run_async(coro: Any) -> Any:
-    """Execute a coroutine synchronously.
+class _SyncBridgeLoop:
+    """Event loop on a daemon thread that runs coroutines for the sync adapter shims."""
 
-    Prefers the already-running event loop (nest_asyncio makes run_until_complete
-    safe in that case).  Falls back to a fresh event loop when no loop is
-    running, closing it afterwards to avoid resource leaks.
-    """
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        # No running loop - spin up a temporary one.
-        loop = asyncio.new_event_loop()
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            return loop
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="llamaindex-sync-bridge",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        loop = self._ensure_loop()
         try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
-    return loop.run_until_complete(coro)
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError(
+                "Sync LlamaIndex adapter called from its own bridge loop; use the async API"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+_SYNC_BRIDGE = _SyncBridgeLoop()
+
+
+def _run_async(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Execute a coroutine synchronously on the shared bridge loop."""
+    return _SYNC_BRIDGE.run(coro)
 
 
 class AIServiceLLM(CustomLLM):
@@ -139,6 +165,18 @@ class AIServiceLLM(CustomLLM):
         )
         return CompletionResponse(text=response)
 
+    @llm_completion_callback()
+    async def acomplete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponse:
+        """Native async completion, awaited on the caller's event loop."""
+        response = await self.ai_service.complete(
+            prompt,
+            temperature=kwargs.get("temperature", self.temperature),
+            max_tokens=kwargs.get("max_tokens", self.max_tokens),
+        )
+        return CompletionResponse(text=response)
+
     def stream_complete(self, prompt: str, **kwargs: Any) -> CompletionResponseGen:
         """Streaming not implemented for adapter."""
         raise NotImplementedError("Streaming not supported in adapter")
@@ -156,21 +194,22 @@ class AIServiceLLM(CustomLLM):
         Returns:
             ChatResponse with assistant message
         """
+        return _run_async(self.achat(messages, **kwargs))
+
+    async def achat(
+        self, messages: list[LlamaIndexChatMessage], **kwargs: Any
+    ) -> ChatResponse:
+        """Native async chat, awaited on the caller's event loop."""
         # Convert LlamaIndex messages to AIService format
         ai_messages = [
             ChatMessage(role=msg.role.value, content=msg.content or "")
             for msg in messages
         ]
 
-        response = cast(
-            LLMResponse,
-            _run_async(
-                self.ai_service.chat(
-                    ai_messages,
-                    temperature=kwargs.get("temperature", self.temperature),
-                    max_tokens=kwargs.get("max_tokens", self.max_tokens),
-                )
-            ),
+        response: LLMResponse = await self.ai_service.chat(
+            ai_messages,
+            temperature=kwargs.get("temperature", self.temperature),
+            max_tokens=kwargs.get("max_tokens", self.max_tokens),
         )
 
         return ChatResponse(
@@ -252,3 +291,7 @@ class AIServiceEmbedding(BaseEmbedding):
         """
         return _run_async(self.ai_service.embed_batch(texts))
 
+    async def _aget_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Async batch embedding in a single AIService call."""
+        return await self.ai_service.embed_batch(texts)
+
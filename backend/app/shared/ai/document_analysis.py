@@ -0,0 +1,241 @@
+"""Map-reduce helpers for document analysis.
+
+Splits project documents into token-budgeted chunks for per-chunk extraction and
+merges the partial ProjectState results back together deterministically.
+Kept separate from llm_service.py so chunking and merging are testable without an LLM.
+"""
+
+import copy
+import json
+import re
+from collections.abc import Callable
+from typing import Any
+
+DOCUMENT_SEPARATOR = "\n\n---\n\n"
+_PARAGRAPH_SEPARATOR = "\n\n"
+_DOCUMENT_HEADER = re.compile(r"\ADocumentId: [^\n]*\nFileName: [^\n]*\n---\n")
+_PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+_IDENTITY_KEYS = ("text", "question", "name", "id")
+
+TokenCount = Callable[[str], int]
+
+
+def normalize_text(value: Any) -> str:
+    """Case- and punctuation-insensitive key used for deduplication."""
+    if not isinstance(value, str):
+        return ""
+    return re.sub(r"[\W_]+", " ", value.casefold()).strip()
+
+
+def split_documents_by_budget(
+    document_texts: list[str],
+    *,
+    budget: int,
+    count_tokens: TokenCount,
+) -> list[str]:
+    """Pack documents into chunks of at most ``budget`` tokens.
+
+    Documents stay whole when they fit; larger ones are split on paragraph
+    boundaries and every piece repeats the ``DocumentId``/``FileName`` header so
+    the model can still attribute sources.
+    """
+    separator_tokens = count_tokens(DOCUMENT_SEPARATOR)
+    chunks: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+    for text in document_texts:
+        for piece in _split_document(text, budget, count_tokens):
+            piece_tokens = count_tokens(piece)
+            if current and current_tokens + separator_tokens + piece_tokens > budget:
+                chunks.append(DOCUMENT_SEPARATOR.join(current))
+                current, current_tokens = [], 0
+            current_tokens += piece_tokens + (separator_tokens if current else 0)
+            current.append(piece)
+    if current:
+        chunks.append(DOCUMENT_SEPARATOR.join(current))
+    return chunks
+
+
+def _split_document(text: str, budget: int, count_tokens: TokenCount) -> list[str]:
+    if count_tokens(text) <= budget:
+        return [text]
+
+    match = _DOCUMENT_HEADER.match(text)
+    header = match.group(0) if match else ""
+    body_budget = max(budget - count_tokens(header), 1)
+    separator_tokens = count_tokens(_PARAGRAPH_SEPARATOR)
+
+    pieces: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+    for block in _blocks(text[len(header):], body_budget, count_tokens):
+        block_tokens = count_tokens(block)
+        if current and current_tokens + separator_tokens + block_tokens > body_budget:
+            pieces.append(header + _PARAGRAPH_SEPARATOR.join(current))
+            current, current_tokens = [], 0
+        current_tokens += block_tokens + (separator_tokens if current else 0)
+        current.append(block)
+    if current:
+        pieces.append(header + _PARAGRAPH_SEPARATOR.join(current))
+    return pieces
+
+
+def _blocks(body: str, budget: int, count_tokens: TokenCount) -> list[str]:
+    """Paragraphs of ``body``; a paragraph larger than ``budget`` is split on words."""
+    blocks: list[str] = []
+    for paragraph in body.split(_PARAGRAPH_SEPARATOR):
+        if not paragraph.strip():
+            continue
+        if count_tokens(paragraph) <= budget:
+            blocks.append(paragraph)
+            continue
+        window: list[str] = []
+        window_tokens = 0
+        for word in paragraph.split():
+            word_tokens = count_tokens(f" {word}")
+            if window and window_tokens + word_tokens > budget:
+                blocks.append(" ".join(window))
+                window, window_tokens = [], 0
+            window.append(word)
+            window_tokens += word_tokens
+        if window:
+            blocks.append(" ".join(window))
+    return blocks
+
+
+def merge_partial_states(partials: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge per-chunk extraction results in chunk order.
+
+    Requirements and clarification questions are deduplicated by normalized text;
+    duplicates pool their ``sources`` and question ``relatedRequirementIndexes``
+    are remapped to the merged requirement list. Other sections are merged
+    field by field: lists are unioned, differing strings are concatenated.
+    """
+    merged: dict[str, Any] = {}
+    requirements: list[dict[str, Any]] = []
+    requirement_positions: dict[str, int] = {}
+    questions: list[dict[str, Any]] = []
+    question_positions: dict[str, int] = {}
+
+    for partial in partials:
+        local_to_merged = _merge_requirements(partial, requirements, requirement_positions)
+        _merge_questions(partial, questions, question_positions, local_to_merged)
+
+        for section, value in partial.items():
+            if section in ("requirements", "clarificationQuestions"):
+                continue
+            merged[section] = (
+                _merge_values(merged[section], value) if section in merged else copy.deepcopy(value)
+            )
+
+    merged["requirements"] = requirements
+    merged["clarificationQuestions"] = questions
+    return merged
+
+
+def _merge_requirements(
+    partial: dict[str, Any],
+    requirements: list[dict[str, Any]],
+    positions: dict[str, int],
+) -> dict[int, int]:
+    """Fold one chunk's requirements into ``requirements``; returns local -> merged indexes."""
+    local_to_merged: dict[int, int] = {}
+    for local_index, requirement in enumerate(partial.get("requirements") or []):
+        if not isinstance(requirement, dict):
+            continue
+        key = normalize_text(requirement.get("text"))
+        if not key:
+            continue
+        if key in positions:
+            _merge_requirement(requirements[positions[key]], requirement)
+        else:
+            positions[key] = len(requirements)
+            requirements.append(copy.deepcopy(requirement))
+        local_to_merged[local_index] = positions[key]
+    return local_to_merged
+
+
+def _merge_questions(
+    partial: dict[str, Any],
+    questions: list[dict[str, Any]],
+    positions: dict[str, int],
+    local_to_merged: dict[int, int],
+) -> None:
+    """Fold one chunk's clarification questions into ``questions``, remapping requirement indexes."""
+    for question in partial.get("clarificationQuestions") or []:
+        if not isinstance(question, dict):
+            continue
+        key = normalize_text(question.get("question"))
+        if not key:
+            continue
+        related = {
+            local_to_merged[index]
+            for index in question.get("relatedRequirementIndexes") or []
+            if isinstance(index, int) and index in local_to_merged
+        }
+        if key in positions:
+            existing = questions[positions[key]]
+            related |= set(existing.get("relatedRequirementIndexes") or [])
+            priorities = [
+                p for p in (existing.get("priority"), question.get("priority")) if isinstance(p, int)
+            ]
+            if priorities:
+                existing["priority"] = min(priorities)
+        else:
+            positions[key] = len(questions)
+            existing = copy.deepcopy(question)
+            questions.append(existing)
+        existing["relatedRequirementIndexes"] = sorted(related)
+
+
+def _merge_requirement(existing: dict[str, Any], duplicate: dict[str, Any]) -> None:
+    existing["sources"] = _merge_values(existing.get("sources") or [], duplicate.get("sources") or [])
+
+    existing_rank = _PRIORITY_RANK.get(str(existing.get("priority")).lower())
+    duplicate_rank = _PRIORITY_RANK.get(str(duplicate.get("priority")).lower())
+    if duplicate_rank is not None and (existing_rank is None or duplicate_rank < existing_rank):
+        existing["priority"] = duplicate["priority"]
+
+    ambiguity = duplicate.get("ambiguity")
+    if isinstance(ambiguity, dict):
+        current = existing.get("ambiguity") if isinstance(existing.get("ambiguity"), dict) else {}
+        existing["ambiguity"] = {
+            **current,
+            "isAmbiguous": bool(current.get("isAmbiguous")) or bool(ambiguity.get("isAmbiguous")),
+            "notes": _merge_values(current.get("notes") or "", ambiguity.get("notes") or ""),
+        }
+
+
+def _merge_values(current: Any, incoming: Any) -> Any:
+    if isinstance(current, dict) and isinstance(incoming, dict):
+        result = dict(current)
+        for key, value in incoming.items():
+            result[key] = _merge_values(result[key], value) if key in result else copy.deepcopy(value)
+        return result
+    if isinstance(current, list) and isinstance(incoming, list):
+        result = list(current)
+        seen = {_identity(item) for item in current}
+        for item in incoming:
+            identity = _identity(item)
+            if identity not in seen:
+                seen.add(identity)
+                result.append(copy.deepcopy(item))
+        return result
+    if isinstance(current, str) and isinstance(incoming, str):
+        current_key, incoming_key = normalize_text(current), normalize_text(incoming)
+        if not incoming_key or incoming_key in current_key:
+            return current
+        if not current_key or current_key in incoming_key:
+            return incoming
+        return f"{current}\n{incoming}"
+    return current if current not in (None, "", [], {}) else copy.deepcopy(incoming)
+
+
+def _identity(item: Any) -> str:
+    if isinstance(item, str):
+        return normalize_text(item)
+    if isinstance(item, dict):
+        for key in _IDENTITY_KEYS:
+            if normalize_text(item.get(key)):
+                return f"{key}:{normalize_text(item[key])}"
+    return json.dumps(item, sort_keys=True, default=str)
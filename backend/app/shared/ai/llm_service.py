@@ -3,6 +3,7 @@ LLM Service for document analysis, chat, and proposal generation.
 Uses unified AI service layer for provider abstraction.
 """
 
+import asyncio
 import json
 import logging
 import re
@@ -12,15 +13,25 @@ from typing import Any
 from openai import APIError, APITimeoutError, BadRequestError, RateLimitError
 
 from app.shared.ai import ChatMessage, get_ai_service
+from app.shared.ai.document_analysis import (
+    DOCUMENT_SEPARATOR,
+    merge_partial_states,
+    split_documents_by_budget,
+)
 from app.shared.ai.json_repair import (
     extract_json_candidate,
     parse_json_with_repair,
     repair_json_content,
 )
+from app.shared.ai.token_counter import TokenCounter
 from app.shared.config.app_settings import get_app_settings
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the document-analysis prompt changes so cached per-document
+# results produced by the old prompt are no longer reused.
+ANALYSIS_PROMPT_VERSION = "1"
+
 
 class LLMService:
     """Service for LLM operations in project workflow."""
@@ -29,22 +40,81 @@ class LLMService:
         self.ai_service = get_ai_service()
         self.app_settings = get_app_settings()
         self.model = self.ai_service.get_llm_model()
+        self._token_counter: TokenCounter | None = None
         logger.info(f"LLMService ready with model: {self.model}")
 
-    async def analyze_documents(self, document_texts: list[str]) -> dict[str, Any]:
+    async def analyze_documents(
+        self,
+        document_texts: list[str],
+        on_progress: Callable[[str, str | None], None] | None = None,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> dict[str, Any]:
         """
         Analyze documents and extract ProjectState structure.
 
+        Documents that exceed ``llm_analyze_chunk_tokens`` are analyzed as
+        token-budgeted chunks whose results are merged; smaller inputs keep the
+        single-call path. Every LLM call holds ``limiter``, which defaults to a
+        semaphore of ``llm_analyze_concurrency``.
+
         Args:
             document_texts: List of document text content
+            on_progress: Optional callback receiving (stage, detail) events
+            limiter: Semaphore shared by concurrent analyze calls so they stay
+                within one concurrency bound
 
         Returns:
             Dictionary representing ProjectState
         """
-        # Analysis document count log suppressed
+        chunks = split_documents_by_budget(
+            document_texts,
+            budget=self.app_settings.llm_analyze_chunk_tokens,
+            count_tokens=self._count_tokens,
+        )
+        if limiter is None:
+            limiter = asyncio.Semaphore(max(1, self.app_settings.llm_analyze_concurrency))
+        if len(chunks) <= 1:
+            async with limiter:
+                return await self._analyze_chunk(DOCUMENT_SEPARATOR.join(document_texts))
+
+        total = len(chunks)
+        logger.info(f"Analyzing {len(document_texts)} documents as {total} chunks")
+        self._report(on_progress, "analysis_started", f"Analyzing {total} document chunks")
+
+        completed = 0
+
+        async def _analyze(chunk: str) -> dict[str, Any]:
+            nonlocal completed
+            async with limiter:
+                partial = await self._analyze_chunk(chunk)
+            completed += 1
+            self._report(on_progress, "analysis_chunk", f"Analyzed chunk {completed}/{total}")
+            return partial
+
+        # gather keeps chunk order, so the merge is independent of completion order
+        partials = await asyncio.gather(*(_analyze(chunk) for chunk in chunks))
+        merged = merge_partial_states(list(partials))
+        self._report(
+            on_progress,
+            "analysis_merged",
+            f"Merged {len(merged['requirements'])} requirements from {total} chunks",
+        )
+        return merged
 
-        combined_text = "\n\n---\n\n".join(document_texts)
+    def _count_tokens(self, text: str) -> int:
+        if self._token_counter is None:
+            self._token_counter = TokenCounter(self.model)
+        return self._token_counter.count_tokens(text)
 
+    @staticmethod
+    def _report(
+        on_progress: Callable[[str, str | None], None] | None, stage: str, detail: str
+    ) -> None:
+        if on_progress is not None:
+            on_progress(stage, detail)
+
+    async def _analyze_chunk(self, combined_text: str) -> dict[str, Any]:
+        """Run the extraction prompt over one block of document text."""
         system_prompt = """You are an Azure Architecture Assistant performing thorough document analysis.
 
 Your task: Extract a comprehensive, exhaustive inventory of ALL information from the provided project documents.
@@ -15,6 +15,7 @@ from app.shared.config.settings import (
     AgentsSettingsMixin,
     AISettingsMixin,
     AsyncTimingsMixin,
+    DatabaseSettingsMixin,
     DiagramSettingsMixin,
     IngestionQueueDefaults,
     IngestionSettingsMixin,
@@ -82,6 +83,7 @@ def _read_secretkeeper_secret(key: str) -> str | None:
 class AppSettings(
     ServerSettingsMixin,
     StorageSettingsMixin,
+    DatabaseSettingsMixin,
     AgentsSettingsMixin,
     AISettingsMixin,
     LLMTuningSettingsMixin,
@@ -6,6 +6,7 @@ Each module contains one ``*Mixin`` class that groups related fields.
 from .agents import AgentsSettingsMixin
 from .ai import AISettingsMixin
 from .async_timings import AsyncTimingsMixin
+from .database import DatabaseSettingsMixin
 from .diagram import DiagramSettingsMixin
 from .ingestion import IngestionQueueDefaults, IngestionSettingsMixin, KBDefaultsSettings
 from .llm_tuning import LLMTuningSettingsMixin
@@ -18,6 +19,7 @@ __all__ = [
     "AISettingsMixin",
     "AgentsSettingsMixin",
     "AsyncTimingsMixin",
+    "DatabaseSettingsMixin",
     "DiagramSettingsMixin",
     "IngestionQueueDefaults",
     "IngestionSettingsMixin",
@@ -26,6 +26,18 @@ class AgentsSettingsMixin(BaseModel):
         default=True,
         description="Enable LangGraph checkpointer for thread-scoped conversation memory",
     )
+    aaa_thread_memory_max_checkpoints: int = Field(
+        default=20,
+        ge=1,
+        le=1000,
+        description="Checkpoints retained per thread; older ones are pruned on write",
+    )
+    aaa_thread_memory_ttl_hours: int = Field(
+        default=168,
+        ge=1,
+        le=8760,
+        description="Evict thread checkpoints older than this many hours",
+    )
     aaa_context_compaction_enabled: bool = Field(
         default=True,
         description="Enable conversation summarization / compaction",
@@ -5,6 +5,8 @@ that were previously hardcoded as magic floats throughout service code.
 """
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -22,6 +24,14 @@ class AsyncTimingsMixin(BaseModel):
         default=2.0,
         description="Sleep duration (s) before cancelling remaining tasks on cleanup",
     )
+    ingestion_progress_flush_interval: float = Field(
+        default=2.0,
+        description="Max seconds buffered chunk progress waits before being written",
+    )
+    ingestion_progress_flush_every: int = Field(
+        default=50,
+        description="Buffered progress updates that trigger an early flush",
+    )
 
     # ── AI service ────────────────────────────────────────────────────────────
     ai_reinit_grace_sleep: float = Field(
@@ -46,6 +56,44 @@ class AsyncTimingsMixin(BaseModel):
         default=2.0,
         description="Politeness delay (s) between consecutive website page fetches",
     )
+    web_crawl_mode: Literal["sync", "async"] = Field(
+        default="sync",
+        description="Website crawler used for start_url sources (per-KB 'crawl_mode' overrides)",
+    )
+    web_crawl_use_sitemap: bool = Field(
+        default=True,
+        description="Use sitemap.xml as the crawl frontier when it covers the start URL (per-KB 'use_sitemap' overrides)",
+    )
+    web_crawl_concurrency: int = Field(
+        default=8,
+        description="Concurrent page fetches in async crawl mode",
+    )
+    web_crawl_host_rate: float = Field(
+        default=2.0,
+        description="Requests/s per host in async crawl mode when robots.txt sets no crawl-delay",
+    )
+    web_crawl_parse_workers: int = Field(
+        default=2,
+        description="Processes parsing HTML in async crawl mode (0 parses in threads)",
+    )
+
+    # ── Project document uploads ──────────────────────────────────────────────
+    project_document_parse_workers: int = Field(
+        default=2,
+        description="Processes parsing PDF/Excel uploads (0 parses in threads)",
+    )
+    project_document_parse_timeout: float = Field(
+        default=120.0,
+        description="Seconds a single upload may spend in a parse worker before it is killed",
+    )
+    project_document_parse_memory_mb: int = Field(
+        default=2048,
+        description="Heap limit (MiB) for each parse worker process (0 disables; POSIX only)",
+    )
+    project_document_upload_chunk_size: int = Field(
+        default=1024 * 1024,
+        description="Bytes read per chunk when streaming an upload to disk",
+    )
 
     @property
     def ingestion_cancel_timeout(self) -> float:
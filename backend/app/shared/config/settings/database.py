@@ -0,0 +1,46 @@
+"""SQLite connection-profile settings mixin."""
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class DatabaseSettingsMixin(BaseModel):
+    # ── SQLite profile (projects, ingestion and diagrams databases) ───────────
+    sqlite_journal_mode: Literal["WAL", "DELETE"] = Field(
+        default="WAL",
+        description="Journal mode; WAL lets readers proceed while a writer is active",
+    )
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL"] = Field(
+        default="NORMAL",
+        description="PRAGMA synchronous; NORMAL is durable across app crashes in WAL mode",
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000,
+        ge=0,
+        description="Milliseconds a connection waits on a locked database before failing",
+    )
+    sqlite_cache_size_kib: int = Field(
+        default=65536,
+        ge=0,
+        description="Per-connection page cache size in KiB",
+    )
+    sqlite_mmap_size_mb: int = Field(
+        default=256,
+        ge=0,
+        description="Bytes of the database file memory-mapped per connection, in MiB (0 disables)",
+    )
+    sqlite_reader_pool_size: int = Field(
+        default=4,
+        ge=0,
+        description="Read-only connections per database; 0 routes all sessions to the writer",
+    )
+    sqlite_writer_pool_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description=(
+            "Seconds a projects-database session waits for the single writer connection "
+            "before failing with a pool TimeoutError"
+        ),
+    )
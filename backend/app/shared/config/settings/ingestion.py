@@ -37,6 +37,15 @@ class KBDefaultsSettings(BaseModel):
     chunking_strategy: str = Field("semantic", description="Chunking strategy")
     embedder_type: str = Field("openai", description="Embedder type")
     index_type: str = Field("vector", description="Index type")
+    vector_store: str = Field(
+        "simple", description="Vector store backend: 'simple' (LlamaIndex JSON) or 'mmap'"
+    )
+    embedding_batch_size: int = Field(
+        64, description="Chunks per embedding request (1 disables micro-batching)"
+    )
+    embedding_concurrency: int = Field(
+        4, description="Embedding micro-batches in flight per ingestion job"
+    )
 
 
 def _load_ingestion_queue() -> IngestionQueueDefaults:
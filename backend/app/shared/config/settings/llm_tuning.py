@@ -14,6 +14,18 @@ class LLMTuningSettingsMixin(BaseModel):
         default=12000, ge=512, le=32768,
         description="Max completion tokens used for document analysis extraction",
     )
+    llm_analyze_chunk_tokens: int = Field(
+        default=24000, ge=1000, le=200000,
+        description="Input token budget per document-analysis call; larger inputs are map-reduced",
+    )
+    llm_analyze_concurrency: int = Field(
+        default=4, ge=1, le=32,
+        description="Document-analysis chunk calls running concurrently",
+    )
+    llm_analyze_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse cached per-document analysis for unchanged documents",
+    )
     llm_json_repair_min_tokens: int = Field(
         default=1500, ge=256, le=16384,
         description="Minimum token budget for JSON repair retries",
@@ -6,6 +6,8 @@ literals across ``multi_query.py``, ``query_service.py``, and routers.
 """
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -31,6 +33,70 @@ class SearchSettingsMixin(BaseModel):
         description="Minimum number of results to retrieve initially, regardless of top_k",
     )
 
+    # ── Multi-KB fan-out ──────────────────────────────────────────────────────
+    kb_query_deadline_seconds: float = Field(
+        default=20.0,
+        description=(
+            "Per-request deadline for concurrent multi-KB queries; KBs that have "
+            "not answered by then are dropped from the response"
+        ),
+    )
+
+    # ── KB index cache ───────────────────────────────────────────────────────
+    kb_index_cache_max_mb: int = Field(
+        default=2048,
+        ge=0,
+        description=(
+            "Memory budget for loaded KB indexes, estimated from their on-disk size "
+            "(0 = unbounded). Least recently used indexes are evicted first"
+        ),
+    )
+    kb_index_cache_max_entries: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum number of loaded KB indexes (0 = no count limit)",
+    )
+    kb_index_warmup_count: int = Field(
+        default=2,
+        ge=0,
+        description="Number of top-priority active KBs loaded at startup; others load on first query",
+    )
+    kb_index_warmup_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Threads used to load KB indexes in parallel during startup warm-up",
+    )
+
+    # ── Query result cache ───────────────────────────────────────────────────
+    kb_query_cache_enabled: bool = Field(
+        default=True,
+        description="Cache multi-KB query results (exact and embedding-similarity levels)",
+    )
+    kb_query_cache_max_entries: int = Field(
+        default=512,
+        ge=0,
+        description="Maximum cached query results per cache level (LRU eviction)",
+    )
+    kb_query_cache_similarity_threshold: float = Field(
+        default=0.97,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity for a semantic cache hit",
+    )
+
+    # ── Answer synthesis ─────────────────────────────────────────────────────
+    kb_synthesis_mode_chat: Literal["per_kb", "single"] = Field(
+        default="single",
+        description=(
+            "CHAT profile answer mode: 'single' merges nodes from all KBs and makes "
+            "one LLM call; 'per_kb' answers per KB and concatenates the answers"
+        ),
+    )
+    kb_synthesis_mode_proposal: Literal["per_kb", "single"] = Field(
+        default="per_kb",
+        description="PROPOSAL profile answer mode ('single' or 'per_kb')",
+    )
+
     # ── Per-profile top-k defaults ────────────────────────────────────────────
     kb_top_k_chat: int = Field(
         default=3,
@@ -60,3 +126,7 @@ class SearchSettingsMixin(BaseModel):
         default=50,
         description="Default page size for conversation messages",
     )
+    state_log_pagination_limit: int = Field(
+        default=100,
+        description="Default page size for state log families (mcpQueries, iterationEvents, ...)",
+    )
@@ -6,11 +6,22 @@ from pathlib import Path
 
 from pydantic import ValidationError
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.models.project import Base
 from app.shared.config.app_settings import get_app_settings
+from app.shared.db.sqlite_profile import (
+    RoutingSession,
+    SQLiteProfile,
+    install_sqlite_pragmas,
+    is_file_database,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,13 +46,44 @@ DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 logger.info("Projects database: %s", DB_PATH.absolute())
 
 DATABASE_URL = f"sqlite+aiosqlite:///{DB_PATH}"
+SQLITE_PROFILE = SQLiteProfile.from_settings()
+
+# A single pooled writer connection serialises writer sessions (each waits for
+# the connection instead of interleaving on a shared one); WAL lets the reader
+# pool serve workspace reads while an agent turn is writing. A session holds the
+# writer from its first write until commit, so writers must commit before long
+# awaits (LLM calls); others wait up to ``writer_pool_timeout_seconds`` for it
+# and then fail with a pool TimeoutError.
 engine = create_async_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=1,
+    max_overflow=0,
+    pool_timeout=SQLITE_PROFILE.writer_pool_timeout_seconds,
     echo=False,
 )
-AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+install_sqlite_pragmas(engine.sync_engine, SQLITE_PROFILE)
+
+read_engine: AsyncEngine | None = None
+if SQLITE_PROFILE.reader_pool_size > 0 and is_file_database(DATABASE_URL):
+    read_engine = create_async_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=SQLITE_PROFILE.reader_pool_size,
+        max_overflow=SQLITE_PROFILE.reader_pool_size,
+        echo=False,
+    )
+    install_sqlite_pragmas(read_engine.sync_engine, SQLITE_PROFILE, read_only=True)
+
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    writer_bind=engine.sync_engine,
+    reader_bind=read_engine.sync_engine if read_engine is not None else None,
+)
 
 
 async def init_database() -> None:
@@ -54,6 +96,9 @@ async def init_database() -> None:
 
 def _run_additive_schema_migrations(sync_conn) -> None:
     _ensure_documents_status_columns(sync_conn)
+    _ensure_project_state_write_tracking_columns(sync_conn)
+    _ensure_message_keyset_index(sync_conn)
+    _ensure_checklist_latest_status_columns(sync_conn)
 
 
 def _ensure_documents_status_columns(sync_conn) -> None:
@@ -77,6 +122,86 @@ def _ensure_documents_status_columns(sync_conn) -> None:
         )
 
 
+def _ensure_project_state_write_tracking_columns(sync_conn) -> None:
+    additive_columns = (
+        ("project_states", "version", "INTEGER NOT NULL DEFAULT 1"),
+        ("project_state_components", "content_hash", "TEXT"),
+    )
+    for table_name, column_name, column_type in additive_columns:
+        result = sync_conn.execute(text(f"PRAGMA table_info({table_name})"))
+        existing_columns = {str(row[1]) for row in result.fetchall()}
+        if not existing_columns or column_name in existing_columns:
+            continue
+        sync_conn.execute(
+            text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}")
+        )
+        logger.info(
+            "Applied additive migration on %s table: added column %s",
+            table_name,
+            column_name,
+        )
+
+
+def _ensure_message_keyset_index(sync_conn) -> None:
+    result = sync_conn.execute(text("PRAGMA table_info(messages)"))
+    if not result.fetchall():
+        return
+    sync_conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_messages_project_thread_timestamp "
+            "ON messages (project_id, thread_id, timestamp)"
+        )
+    )
+
+
+def _ensure_checklist_latest_status_columns(sync_conn) -> None:
+    result = sync_conn.execute(text("PRAGMA table_info(checklist_items)"))
+    existing_columns = {str(row[1]) for row in result.fetchall()}
+    if not existing_columns:
+        return
+    additive_columns = (
+        ("latest_status", "TEXT NOT NULL DEFAULT 'OPEN'"),
+        ("latest_evaluated_at", "DATETIME"),
+    )
+    added = False
+    for column_name, column_type in additive_columns:
+        if column_name in existing_columns:
+            continue
+        sync_conn.execute(
+            text(f"ALTER TABLE checklist_items ADD COLUMN {column_name} {column_type}")
+        )
+        added = True
+        logger.info(
+            "Applied additive migration on checklist_items table: added column %s",
+            column_name,
+        )
+    if added:
+        # Backfill from the newest evaluation of each item.
+        sync_conn.execute(
+            text(
+                """
+                UPDATE checklist_items
+                SET latest_status = COALESCE((
+                        SELECT e.status FROM checklist_item_evaluations e
+                        WHERE e.item_id = checklist_items.id
+                        ORDER BY e.created_at DESC LIMIT 1
+                    ), latest_status),
+                    latest_evaluated_at = (
+                        SELECT e.created_at FROM checklist_item_evaluations e
+                        WHERE e.item_id = checklist_items.id
+                        ORDER BY e.created_at DESC LIMIT 1
+                    )
+                """
+            )
+        )
+    sync_conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_item_checklist_latest_status "
+            "ON checklist_items (checklist_id, latest_status, severity)"
+        )
+    )
+
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         try:
@@ -90,5 +215,7 @@ async def get_db():
 
 
 async def close_database() -> None:
+    if read_engine is not None:
+        await read_engine.dispose()
     await engine.dispose()
     logger.info("Database connections closed")
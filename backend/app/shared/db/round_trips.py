@@ -0,0 +1,55 @@
+"""Per-scope counters of SQL statements sent to the database.
+
+``count_round_trips`` installs a counter in a context variable; every statement
+executed by any engine while it is active (including from tasks spawned inside
+the scope) is counted. Named events such as full project-state reads can be
+recorded alongside with ``record_round_trip_event``.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+
+@dataclass
+class RoundTripCounter:
+    statements: int = 0
+    events: Counter[str] = field(default_factory=Counter)
+
+    def as_dict(self) -> dict[str, int]:
+        return {"statements": self.statements, **self.events}
+
+
+_current_counter: ContextVar[RoundTripCounter | None] = ContextVar(
+    "db_round_trip_counter", default=None
+)
+
+
+@contextmanager
+def count_round_trips() -> Iterator[RoundTripCounter]:
+    counter = RoundTripCounter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+def record_round_trip_event(name: str) -> None:
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.events[name] += 1
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(*_args: Any) -> None:
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.statements += 1
@@ -0,0 +1,138 @@
+"""Production SQLite profile: WAL, tuned pragmas and read/write session routing.
+
+Each database gets one writer engine and, for file-backed databases, a small
+pool of ``query_only`` reader connections. ``RoutingSession`` sends plain
+SELECTs to the reader pool until the session first writes (or flushes), after
+which every statement of that transaction goes to the writer so it reads its
+own changes. Once the transaction commits or rolls back the session reads from
+the pool again, so a committed writer session does not hold the writer
+connection while it only reads.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import ValidationError
+from pydantic_settings import SettingsError
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import TextClause
+
+from app.shared.config.app_settings import get_app_settings
+
+logger = logging.getLogger(__name__)
+
+_USED_WRITER = "sqlite_profile.used_writer"
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """Connection pragmas and pool sizing shared by the SQLite databases."""
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    cache_size_kib: int = 65536
+    mmap_size_bytes: int = 256 * 1024 * 1024
+    reader_pool_size: int = 4
+    writer_pool_timeout_seconds: float = 30.0
+
+    @classmethod
+    def from_settings(cls) -> SQLiteProfile:
+        try:
+            settings = get_app_settings()
+        except (ValidationError, SettingsError, ValueError, FileNotFoundError):
+            return cls()
+        return cls(
+            journal_mode=settings.sqlite_journal_mode,
+            synchronous=settings.sqlite_synchronous,
+            busy_timeout_ms=settings.sqlite_busy_timeout_ms,
+            cache_size_kib=settings.sqlite_cache_size_kib,
+            mmap_size_bytes=settings.sqlite_mmap_size_mb * 1024 * 1024,
+            reader_pool_size=settings.sqlite_reader_pool_size,
+            writer_pool_timeout_seconds=settings.sqlite_writer_pool_timeout_seconds,
+        )
+
+    def pragmas(self, *, read_only: bool = False) -> list[str]:
+        statements = [
+            f"PRAGMA busy_timeout = {self.busy_timeout_ms}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            # Negative cache_size is in KiB rather than pages
+            f"PRAGMA cache_size = -{self.cache_size_kib}",
+            f"PRAGMA mmap_size = {self.mmap_size_bytes}",
+        ]
+        if read_only:
+            statements.append("PRAGMA query_only = ON")
+        else:
+            # journal_mode is persistent in the file; only the writer sets it
+            statements.insert(0, f"PRAGMA journal_mode = {self.journal_mode}")
+        return statements
+
+
+def is_file_database(url: str) -> bool:
+    """Readers only make sense when other connections can open the same file."""
+    return ":memory:" not in url and "mode=memory" not in url and not url.endswith("://")
+
+
+def install_sqlite_pragmas(
+    sync_engine: Engine,
+    profile: SQLiteProfile,
+    *,
+    read_only: bool = False,
+) -> None:
+    """Apply ``profile`` pragmas to every new DBAPI connection of ``sync_engine``."""
+    statements = profile.pragmas(read_only=read_only)
+
+    @event.listens_for(sync_engine, "connect")
+    def _apply_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def is_read_statement(clause: Any) -> bool:
+    if isinstance(clause, Select):
+        return True
+    if isinstance(clause, TextClause):
+        return clause.text.lstrip().upper().startswith("SELECT")
+    return False
+
+
+class RoutingSession(Session):
+    """Session that reads from ``reader_bind`` until it writes, then sticks to ``writer_bind`` until commit."""
+
+    def __init__(
+        self,
+        *args: Any,
+        writer_bind: Engine,
+        reader_bind: Engine | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._writer_bind = writer_bind
+        self._reader_bind = reader_bind
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        if (
+            self._reader_bind is None
+            or self.info.get(_USED_WRITER)
+            or self._flushing
+            or not is_read_statement(clause)
+        ):
+            self.info[_USED_WRITER] = True
+            return self._writer_bind
+        return self._reader_bind
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _release_writer(session: Session, transaction: Any) -> None:
+    # Savepoints end inside the outer transaction, which still needs the writer.
+    if transaction.parent is None:
+        session.info.pop(_USED_WRITER, None)
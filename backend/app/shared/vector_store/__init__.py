@@ -0,0 +1,27 @@
+"""Shared vector store backends for knowledge-base indexes."""
+
+import os
+from typing import Literal
+
+from .mmap_store import META_DB_FILE, VECTOR_FILE, MmapVectorStore
+
+VectorStoreBackend = Literal["simple", "mmap"]
+
+VECTOR_STORE_SIMPLE: VectorStoreBackend = "simple"
+VECTOR_STORE_MMAP: VectorStoreBackend = "mmap"
+
+
+def is_mmap_store_dir(storage_dir: str) -> bool:
+    """Return True when ``storage_dir`` holds an ``MmapVectorStore``."""
+    return os.path.exists(os.path.join(storage_dir, META_DB_FILE))
+
+
+__all__ = [
+    "META_DB_FILE",
+    "VECTOR_FILE",
+    "VECTOR_STORE_MMAP",
+    "VECTOR_STORE_SIMPLE",
+    "MmapVectorStore",
+    "VectorStoreBackend",
+    "is_mmap_store_dir",
+]
@@ -0,0 +1,444 @@
+"""File-backed vector store: memory-mapped float32 matrix plus SQLite metadata.
+
+Vectors are appended as unit-normalised float32 rows to ``vectors.f32`` and read
+back through ``numpy.memmap``; node payloads, metadata and tombstones live in
+``vector_meta.sqlite3``. Appends and deletes touch only the affected rows, so
+persist time and startup memory scale with the change, not the corpus.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from llama_index.core.schema import BaseNode
+from llama_index.core.vector_stores.types import (
+    BasePydanticVectorStore,
+    FilterCondition,
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+    VectorStoreQuery,
+    VectorStoreQueryResult,
+)
+from llama_index.core.vector_stores.utils import metadata_dict_to_node, node_to_metadata_dict
+from pydantic import PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+VECTOR_FILE = "vectors.f32"
+META_DB_FILE = "vector_meta.sqlite3"
+_FLOAT_BYTES = 4
+_MATRIX_NDIM = 2
+
+_SQL_COMPARISONS: dict[FilterOperator, str] = {
+    FilterOperator.EQ: "=",
+    FilterOperator.NE: "!=",
+    FilterOperator.GT: ">",
+    FilterOperator.GTE: ">=",
+    FilterOperator.LT: "<",
+    FilterOperator.LTE: "<=",
+}
+
+
+class MmapVectorStore(BasePydanticVectorStore):
+    """Local vector store supporting incremental appends and deletes."""
+
+    stores_text: bool = True
+    is_embedding_query: bool = True
+    persist_dir: str
+
+    _connection: sqlite3.Connection = PrivateAttr()
+    _lock: threading.RLock = PrivateAttr()
+    _dim: int | None = PrivateAttr(default=None)
+    _row_count: int = PrivateAttr(default=0)
+    _live: np.ndarray = PrivateAttr()
+    _matrix: np.memmap | None = PrivateAttr(default=None)
+    _append_handle: Any = PrivateAttr(default=None)
+    _data_version: int = PrivateAttr(default=0)
+
+    def __init__(self, persist_dir: str, **kwargs: Any) -> None:
+        super().__init__(persist_dir=persist_dir, **kwargs)
+        os.makedirs(persist_dir, exist_ok=True)
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(
+            os.path.join(persist_dir, META_DB_FILE), check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS nodes (
+                row INTEGER PRIMARY KEY,
+                node_id TEXT NOT NULL,
+                ref_doc_id TEXT,
+                payload TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                deleted INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS ix_nodes_node_id ON nodes (node_id);
+            CREATE INDEX IF NOT EXISTS ix_nodes_ref_doc_id ON nodes (ref_doc_id);
+            """
+        )
+        self._connection.commit()
+        self._load_state()
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "MmapVectorStore"
+
+    @property
+    def client(self) -> None:
+        return None
+
+    @property
+    def vector_path(self) -> str:
+        return os.path.join(self.persist_dir, VECTOR_FILE)
+
+    # ── State ────────────────────────────────────────────────────────────────
+
+    def _load_state(self) -> None:
+        row = self._connection.execute(
+            "SELECT value FROM store_meta WHERE key = 'dim'"
+        ).fetchone()
+        self._dim = int(row[0]) if row else None
+        # Rows past the last committed metadata row are uncommitted (or orphaned by an
+        # interrupted write); they are ignored here and overwritten by the next append.
+        committed = self._connection.execute("SELECT COALESCE(MAX(row) + 1, 0) FROM nodes").fetchone()[0]
+        self._row_count = min(int(committed), self._file_rows())
+        self._data_version = self._read_data_version()
+        self._live = np.zeros(self._row_count, dtype=bool)
+        live_rows = [
+            r[0]
+            for r in self._connection.execute(
+                "SELECT row FROM nodes WHERE deleted = 0 AND row < ?", (self._row_count,)
+            )
+        ]
+        if live_rows:
+            self._live[np.asarray(live_rows, dtype=np.int64)] = True
+        self._matrix = None
+
+    def _file_rows(self) -> int:
+        if self._dim is None or not os.path.exists(self.vector_path):
+            return 0
+        return os.path.getsize(self.vector_path) // (self._dim * _FLOAT_BYTES)
+
+    def _read_data_version(self) -> int:
+        return int(self._connection.execute("PRAGMA data_version").fetchone()[0])
+
+    def _refresh_if_changed(self) -> None:
+        """Reload row state when another connection (e.g. an ingestion job) committed."""
+        if self._append_handle is None and self._read_data_version() != self._data_version:
+            self._load_state()
+
+    def _truncate_vector_file(self, rows: int) -> None:
+        if self._dim is None or not os.path.exists(self.vector_path):
+            return
+        expected = rows * self._dim * _FLOAT_BYTES
+        if os.path.getsize(self.vector_path) != expected:
+            with open(self.vector_path, "r+b") as f:
+                f.truncate(expected)
+
+    def _get_matrix(self) -> np.memmap | None:
+        if self._row_count == 0 or self._dim is None:
+            return None
+        if self._matrix is None or self._matrix.shape[0] != self._row_count:
+            if self._append_handle is not None:
+                self._append_handle.flush()
+            self._matrix = np.memmap(
+                self.vector_path, dtype=np.float32, mode="r", shape=(self._row_count, self._dim)
+            )
+        return self._matrix
+
+    @property
+    def node_count(self) -> int:
+        """Number of live (non-deleted) nodes."""
+        return int(self._live.sum())
+
+    def contains(self, node_id: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM nodes WHERE node_id = ? AND deleted = 0 LIMIT 1", (node_id,)
+            ).fetchone()
+        return row is not None
+
+    # ── Writes ───────────────────────────────────────────────────────────────
+
+    def add(self, nodes: Sequence[BaseNode], **add_kwargs: Any) -> list[str]:
+        """Append nodes; changes become durable on ``persist``."""
+        if not nodes:
+            return []
+        with self._lock:
+            vectors = np.asarray([node.get_embedding() for node in nodes], dtype=np.float32)
+            if vectors.ndim != _MATRIX_NDIM:
+                raise ValueError("All nodes must carry embeddings of equal dimension")
+            if self._dim is None:
+                self._dim = int(vectors.shape[1])
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('dim', ?)", (str(self._dim),)
+                )
+            elif vectors.shape[1] != self._dim:
+                raise ValueError(f"Embedding dimension {vectors.shape[1]} != store dimension {self._dim}")
+
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1.0, norms)
+
+            node_ids = [node.node_id for node in nodes]
+            self._mark_deleted("node_id", node_ids)
+
+            if self._append_handle is None:
+                self._truncate_vector_file(self._row_count)
+                self._append_handle = open(self.vector_path, "ab")  # noqa: SIM115
+            self._append_handle.write(vectors.tobytes())
+
+            first_row = self._row_count
+            self._connection.executemany(
+                "INSERT INTO nodes (row, node_id, ref_doc_id, payload, metadata) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        first_row + offset,
+                        node.node_id,
+                        node.ref_doc_id,
+                        json.dumps(node_to_metadata_dict(node, remove_text=False, flat_metadata=False)),
+                        json.dumps(node.metadata, default=str),
+                    )
+                    for offset, node in enumerate(nodes)
+                ],
+            )
+            self._row_count += len(nodes)
+            self._live = np.concatenate([self._live, np.ones(len(nodes), dtype=bool)])
+            return node_ids
+
+    def delete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
+        with self._lock:
+            self._mark_deleted("ref_doc_id", [ref_doc_id])
+
+    def delete_nodes(
+        self,
+        node_ids: list[str] | None = None,
+        filters: MetadataFilters | None = None,
+        **delete_kwargs: Any,
+    ) -> None:
+        with self._lock:
+            if node_ids:
+                self._mark_deleted("node_id", node_ids)
+            if filters is not None:
+                where, params = _filters_to_sql(filters)
+                rows = [
+                    r[0]
+                    for r in self._connection.execute(
+                        f"SELECT row FROM nodes WHERE deleted = 0 AND ({where})", params  # noqa: S608
+                    )
+                ]
+                self._mark_rows_deleted(rows)
+
+    def _mark_deleted(self, column: str, values: list[str]) -> None:
+        rows: list[int] = []
+        for value in values:
+            rows.extend(
+                r[0]
+                for r in self._connection.execute(
+                    f"SELECT row FROM nodes WHERE {column} = ? AND deleted = 0", (value,)  # noqa: S608
+                )
+            )
+        self._mark_rows_deleted(rows)
+
+    def _mark_rows_deleted(self, rows: list[int]) -> None:
+        if not rows:
+            return
+        self._connection.executemany("UPDATE nodes SET deleted = 1 WHERE row = ?", [(row,) for row in rows])
+        self._live[np.asarray(rows, dtype=np.int64)] = False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._close_vector_handles()
+            self._connection.execute("DELETE FROM nodes")
+            self._connection.commit()
+            if os.path.exists(self.vector_path):
+                os.remove(self.vector_path)
+            self._row_count = 0
+            self._live = np.zeros(0, dtype=bool)
+
+    def persist(self, persist_path: str | None = None, fs: Any | None = None) -> None:
+        """Flush appended vectors to disk, then commit metadata."""
+        with self._lock:
+            if self._append_handle is not None:
+                self._append_handle.flush()
+                os.fsync(self._append_handle.fileno())
+            self._connection.commit()
+
+    def compact(self) -> int:
+        """Rewrite the vector file without tombstoned rows. Returns rows dropped."""
+        with self._lock:
+            self.persist()
+            matrix = self._get_matrix()
+            if matrix is None:
+                return 0
+            live_rows = np.flatnonzero(self._live)
+            dropped = self._row_count - len(live_rows)
+            if dropped == 0:
+                return 0
+
+            tmp_path = f"{self.vector_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                for start in range(0, len(live_rows), 4096):
+                    f.write(np.asarray(matrix[live_rows[start : start + 4096]]).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            self._close_vector_handles()
+
+            self._connection.execute("DELETE FROM nodes WHERE deleted = 1")
+            self._connection.executemany(
+                "UPDATE nodes SET row = ? WHERE row = ?",
+                [(new_row, int(old_row)) for new_row, old_row in enumerate(live_rows)],
+            )
+            os.replace(tmp_path, self.vector_path)
+            self._connection.commit()
+            self._load_state()
+            logger.info("Compacted vector store %s: dropped %d rows", self.persist_dir, dropped)
+            return dropped
+
+    def close(self) -> None:
+        with self._lock:
+            self.persist()
+            self._close_vector_handles()
+            self._connection.close()
+
+    def _close_vector_handles(self) -> None:
+        if self._append_handle is not None:
+            self._append_handle.close()
+            self._append_handle = None
+        self._matrix = None
+
+    # ── Reads ────────────────────────────────────────────────────────────────
+
+    def get_nodes(
+        self,
+        node_ids: list[str] | None = None,
+        filters: MetadataFilters | None = None,
+    ) -> list[BaseNode]:
+        where = ["deleted = 0"]
+        params: list[Any] = []
+        if node_ids:
+            where.append(f"node_id IN ({', '.join('?' for _ in node_ids)})")
+            params.extend(node_ids)
+        if filters is not None:
+            clause, filter_params = _filters_to_sql(filters)
+            where.append(f"({clause})")
+            params.extend(filter_params)
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT payload FROM nodes WHERE {' AND '.join(where)} ORDER BY row", params  # noqa: S608
+            ).fetchall()
+        return [metadata_dict_to_node(json.loads(payload)) for (payload,) in rows]
+
+    def query(self, query: VectorStoreQuery, **kwargs: Any) -> VectorStoreQueryResult:
+        if query.query_embedding is None:
+            raise ValueError("MmapVectorStore requires a query embedding")
+
+        with self._lock:
+            self._refresh_if_changed()
+            matrix = self._get_matrix()
+            if matrix is None:
+                return VectorStoreQueryResult(nodes=[], similarities=[], ids=[])
+
+            candidates = self._candidate_rows(query)
+            if candidates.size == 0:
+                return VectorStoreQueryResult(nodes=[], similarities=[], ids=[])
+
+            query_vector = np.asarray(query.query_embedding, dtype=np.float32)
+            norm = float(np.linalg.norm(query_vector))
+            if norm > 0:
+                query_vector = query_vector / norm
+
+            scores = np.asarray(matrix[candidates] @ query_vector)
+            top_k = min(query.similarity_top_k, candidates.size)
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+            top = top[np.argsort(-scores[top])]
+            top_rows = [int(candidates[i]) for i in top]
+
+            payloads = dict(
+                self._connection.execute(
+                    f"SELECT row, payload FROM nodes WHERE row IN ({', '.join('?' for _ in top_rows)})",  # noqa: S608
+                    top_rows,
+                ).fetchall()
+            )
+
+        nodes = [metadata_dict_to_node(json.loads(payloads[row])) for row in top_rows]
+        return VectorStoreQueryResult(
+            nodes=nodes,
+            similarities=[float(scores[i]) for i in top],
+            ids=[node.node_id for node in nodes],
+        )
+
+    def _candidate_rows(self, query: VectorStoreQuery) -> np.ndarray:
+        if not (query.filters or query.doc_ids or query.node_ids):
+            return np.flatnonzero(self._live)
+
+        where = ["deleted = 0"]
+        params: list[Any] = []
+        if query.doc_ids:
+            where.append(f"ref_doc_id IN ({', '.join('?' for _ in query.doc_ids)})")
+            params.extend(query.doc_ids)
+        if query.node_ids:
+            where.append(f"node_id IN ({', '.join('?' for _ in query.node_ids)})")
+            params.extend(query.node_ids)
+        if query.filters is not None:
+            clause, filter_params = _filters_to_sql(query.filters)
+            where.append(f"({clause})")
+            params.extend(filter_params)
+        rows = [
+            r[0]
+            for r in self._connection.execute(
+                f"SELECT row FROM nodes WHERE {' AND '.join(where)} AND row < ?",  # noqa: S608
+                [*params, self._row_count],
+            )
+        ]
+        return np.asarray(sorted(rows), dtype=np.int64)
+
+
+def _filters_to_sql(filters: MetadataFilters) -> tuple[str, list[Any]]:
+    """Translate LlamaIndex metadata filters to a SQLite JSON1 WHERE clause."""
+    clauses: list[str] = []
+    params: list[Any] = []
+    for item in filters.filters:
+        if isinstance(item, MetadataFilters):
+            clause, nested_params = _filters_to_sql(item)
+        else:
+            clause, nested_params = _filter_to_sql(item)
+        clauses.append(f"({clause})")
+        params.extend(nested_params)
+
+    if not clauses:
+        return "1 = 1", []
+    if filters.condition == FilterCondition.NOT:
+        return f"NOT ({' AND '.join(clauses)})", params
+    joiner = " OR " if filters.condition == FilterCondition.OR else " AND "
+    return joiner.join(clauses), params
+
+
+def _filter_to_sql(metadata_filter: MetadataFilter) -> tuple[str, list[Any]]:
+    key_path = "$." + json.dumps(metadata_filter.key)
+    field = "json_extract(metadata, ?)"
+    operator = metadata_filter.operator
+    value = metadata_filter.value
+
+    if operator in _SQL_COMPARISONS:
+        return f"{field} {_SQL_COMPARISONS[operator]} ?", [key_path, value]
+    if operator in (FilterOperator.IN, FilterOperator.NIN):
+        values = list(value) if isinstance(value, list) else [value]
+        placeholders = ", ".join("?" for _ in values) or "NULL"
+        negation = "NOT " if operator == FilterOperator.NIN else ""
+        return f"{field} {negation}IN ({placeholders})", [key_path, *values]
+    if operator == FilterOperator.IS_EMPTY:
+        return f"{field} IS NULL", [key_path]
+    if operator in (FilterOperator.TEXT_MATCH, FilterOperator.TEXT_MATCH_INSENSITIVE):
+        return f"{field} LIKE ?", [key_path, f"%{value}%"]
+    raise NotImplementedError(f"Filter operator {operator} is not supported by MmapVectorStore")
@@ -0,0 +1,37 @@
+"""add_document_analysis_cache
+
+Revision ID: 20260410_0004
+Revises: 20260402_0003
+Create Date: 2026-04-10
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260410_0004"
+down_revision: str | None = "20260402_0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the per-document analysis result cache table."""
+    op.create_table(
+        "document_analysis_cache",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("prompt_version", sa.String(length=32), nullable=False),
+        sa.Column("model", sa.String(length=128), nullable=False),
+        sa.Column("result_json", sa.Text(), nullable=False),
+        sa.Column("document_id", sa.String(length=36), nullable=True),
+        sa.Column("analysis_run_id", sa.String(length=36), nullable=False),
+        sa.Column("created_at", sa.String(length=30), nullable=False),
+        sa.PrimaryKeyConstraint("content_hash", "prompt_version", "model"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-document analysis result cache table."""
+    op.drop_table("document_analysis_cache")
@@ -0,0 +1,35 @@
+"""add_project_state_write_tracking
+
+Revision ID: 20260412_0005
+Revises: 20260410_0004
+Create Date: 2026-04-12
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260412_0005"
+down_revision: str | None = "20260410_0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the optimistic version column and per-component content hashes."""
+    with op.batch_alter_table("project_states") as batch_op:
+        batch_op.add_column(
+            sa.Column("version", sa.Integer(), nullable=False, server_default="1")
+        )
+    with op.batch_alter_table("project_state_components") as batch_op:
+        batch_op.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the optimistic version column and per-component content hashes."""
+    with op.batch_alter_table("project_state_components") as batch_op:
+        batch_op.drop_column("content_hash")
+    with op.batch_alter_table("project_states") as batch_op:
+        batch_op.drop_column("version")
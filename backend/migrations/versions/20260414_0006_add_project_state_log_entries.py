@@ -0,0 +1,47 @@
+"""add_project_state_log_entries
+
+Revision ID: 20260414_0006
+Revises: 20260412_0005
+Create Date: 2026-04-14
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260414_0006"
+down_revision: str | None = "20260412_0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the append-only ProjectState log entry table."""
+    op.create_table(
+        "project_state_log_entries",
+        sa.Column("seq", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("project_id", sa.String(length=36), nullable=False),
+        sa.Column("family", sa.String(length=64), nullable=False),
+        sa.Column("entry_id", sa.String(length=255), nullable=False),
+        sa.Column("payload_json", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.String(length=30), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("seq"),
+        sa.UniqueConstraint("project_id", "family", "entry_id", name="uq_project_state_log_entry"),
+    )
+    op.create_index(
+        "ix_project_state_log_entries_project_created",
+        "project_state_log_entries",
+        ["project_id", "family", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the append-only ProjectState log entry table."""
+    op.drop_index(
+        "ix_project_state_log_entries_project_created",
+        table_name="project_state_log_entries",
+    )
+    op.drop_table("project_state_log_entries")
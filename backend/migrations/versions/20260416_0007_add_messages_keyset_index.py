@@ -0,0 +1,30 @@
+"""add_messages_keyset_index
+
+Revision ID: 20260416_0007
+Revises: 20260414_0006
+Create Date: 2026-04-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20260416_0007"
+down_revision: str | None = "20260414_0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index messages for keyset pagination per project thread."""
+    op.create_index(
+        "ix_messages_project_thread_timestamp",
+        "messages",
+        ["project_id", "thread_id", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the messages keyset pagination index."""
+    op.drop_index("ix_messages_project_thread_timestamp", table_name="messages")
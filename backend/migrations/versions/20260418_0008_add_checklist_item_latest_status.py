@@ -0,0 +1,54 @@
+"""add_checklist_item_latest_status
+
+Revision ID: 20260418_0008
+Revises: 20260416_0007
+Create Date: 2026-04-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260418_0008"
+down_revision: str | None = "20260416_0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Denormalize the newest evaluation status onto checklist items."""
+    with op.batch_alter_table("checklist_items") as batch_op:
+        batch_op.add_column(
+            sa.Column("latest_status", sa.String(length=32), nullable=False, server_default="OPEN")
+        )
+        batch_op.add_column(sa.Column("latest_evaluated_at", sa.DateTime(), nullable=True))
+    op.execute(
+        """
+        UPDATE checklist_items
+        SET latest_status = COALESCE((
+                SELECT e.status FROM checklist_item_evaluations e
+                WHERE e.item_id = checklist_items.id
+                ORDER BY e.created_at DESC LIMIT 1
+            ), latest_status),
+            latest_evaluated_at = (
+                SELECT e.created_at FROM checklist_item_evaluations e
+                WHERE e.item_id = checklist_items.id
+                ORDER BY e.created_at DESC LIMIT 1
+            )
+        """
+    )
+    op.create_index(
+        "ix_item_checklist_latest_status",
+        "checklist_items",
+        ["checklist_id", "latest_status", "severity"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the denormalized latest evaluation columns."""
+    op.drop_index("ix_item_checklist_latest_status", table_name="checklist_items")
+    with op.batch_alter_table("checklist_items") as batch_op:
+        batch_op.drop_column("latest_evaluated_at")
+        batch_op.drop_column("latest_status")
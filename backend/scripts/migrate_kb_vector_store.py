@@ -0,0 +1,105 @@
+"""Convert knowledge-base indexes from the JSON SimpleVectorStore to MmapVectorStore.
+
+Usage:
+  - Run from repo root with activated venv.
+  - Pass KB IDs to convert; without arguments every KB still on "simple" is converted.
+  - Add --dry-run to report what would be migrated without writing anything.
+
+The existing docstore/vector-store JSON files are left in place so the KB can be
+rolled back by setting "vector_store" back to "simple" in config.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# Ensure backend package is on sys.path
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = REPO_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from llama_index.core import StorageContext  # noqa: E402
+from llama_index.core.schema import BaseNode  # noqa: E402
+
+from app.features.knowledge.infrastructure import KBManager  # noqa: E402
+from app.shared.vector_store import (  # noqa: E402
+    VECTOR_STORE_MMAP,
+    MmapVectorStore,
+    is_mmap_store_dir,
+)
+
+BATCH_SIZE = 1000
+
+
+def _flush(store: MmapVectorStore, nodes: list[BaseNode]) -> int:
+    if not nodes:
+        return 0
+    store.add(nodes)
+    count = len(nodes)
+    nodes.clear()
+    return count
+
+
+def migrate_kb(manager: KBManager, kb_id: str, dry_run: bool = False) -> int:
+    storage_dir = manager.get_kb_storage_path(kb_id)
+    if is_mmap_store_dir(storage_dir):
+        print(f"[{kb_id}] already uses the mmap vector store - skipping")
+        return 0
+
+    storage_context = StorageContext.from_defaults(persist_dir=storage_dir)
+    embeddings = storage_context.vector_store.data.embedding_dict  # type: ignore[attr-defined]
+    docs = storage_context.docstore.docs
+    print(f"[{kb_id}] {len(docs)} nodes, {len(embeddings)} embeddings")
+    if dry_run:
+        return len(embeddings)
+
+    store = MmapVectorStore(persist_dir=storage_dir)
+    batch: list[BaseNode] = []
+    migrated = 0
+    missing = 0
+    for node_id, node in docs.items():
+        embedding = embeddings.get(node_id)
+        if embedding is None:
+            missing += 1
+            continue
+        node.embedding = embedding
+        # The indexer addresses mmap nodes by content hash (exists/delete_chunks).
+        content_hash = node.metadata.get("content_hash")
+        if content_hash:
+            node.id_ = str(content_hash)
+        batch.append(node)
+        if len(batch) >= BATCH_SIZE:
+            migrated += _flush(store, batch)
+    migrated += _flush(store, batch)
+    store.persist()
+    store.close()
+
+    kb_config = manager.get_kb_config(kb_id)
+    kb_config["vector_store"] = VECTOR_STORE_MMAP
+    manager.update_kb_config(kb_id, kb_config)
+
+    print(f"[{kb_id}] migrated {migrated} nodes ({missing} without embeddings skipped)")
+    return migrated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("kb_ids", nargs="*", help="KB IDs to migrate (default: all simple KBs)")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    manager = KBManager()
+    kb_ids = args.kb_ids or [
+        kb["id"]
+        for kb in manager.list_kbs()
+        if manager.get_kb_config(kb["id"]).get("vector_store", "simple") != VECTOR_STORE_MMAP
+    ]
+    for kb_id in kb_ids:
+        migrate_kb(manager, kb_id, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
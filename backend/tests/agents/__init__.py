@@ -12,8 +12,8 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents_system.memory.telemetry import emit_trace_event
-from app.agents_system.memory.token_counter import TokenCounter
 from app.features.checklists.infrastructure.service import get_checklist_service
+from app.shared.ai.token_counter import TokenCounter
 from app.shared.config.app_settings import get_app_settings
 
 from ....models.project import ConversationMessage
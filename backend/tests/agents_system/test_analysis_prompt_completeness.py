@@ -14,10 +14,10 @@ class TestAnalysisPromptCompleteness:
 
     def _get_analysis_system_prompt(self) -> str:
         """Extract the system prompt used by analyze_documents."""
-        # The prompt is defined inline in LLMService.analyze_documents;
-        # We verify it contains the expected extraction directives.
+        # The prompt is defined inline in LLMService._analyze_chunk (run per chunk
+        # by analyze_documents); we verify it contains the expected extraction directives.
         import inspect
-        source = inspect.getsource(LLMService.analyze_documents)
+        source = inspect.getsource(LLMService._analyze_chunk)
         return source
 
     def test_prompt_requests_exhaustive_requirements(self) -> None:
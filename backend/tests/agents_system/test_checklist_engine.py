@@ -2,15 +2,18 @@
 Integration tests for ChecklistEngine with database.
 """
 
-from uuid import uuid4
+from datetime import datetime
+from uuid import UUID, uuid4
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, select, update
 
+from app.agents_system.checklists.read_assembler import ChecklistReadAssembler
 from app.models.checklist import (
     Checklist,
     ChecklistItem,
     ChecklistItemEvaluation,
+    EvaluationStatus,
 )
 from app.models.project import Project
 
@@ -112,6 +115,48 @@ async def test_engine_sync_creates_evaluation_rows(test_engine, test_db_session)
     assert evaluation.status == "fixed"
     assert evaluation.evaluator == "SecurityAgent"
 
+
+@pytest.mark.asyncio
+async def test_engine_sync_orders_evaluations_of_one_item_by_payload(test_engine, test_db_session):
+    """Several evaluations of one item in a sync get increasing timestamps; the last one is latest."""
+    project_id = str(uuid4())
+    test_db_session.add(Project(id=project_id, name="Ordered Evaluations"))
+    await test_db_session.commit()
+
+    statuses = ["open", "in_progress", "fixed"]
+    state = {
+        "wafChecklist": {
+            "template": "azure-waf-v1",
+            "items": [
+                {
+                    "id": "sec-01",
+                    "evaluations": [{"status": status, "evidence": status} for status in statuses],
+                }
+            ],
+        }
+    }
+    await test_engine.sync_project_state_to_db(project_id, state)
+
+    evaluations = (
+        await test_db_session.execute(
+            select(ChecklistItemEvaluation)
+            .join(ChecklistItem)
+            .join(Checklist)
+            .where(Checklist.project_id == project_id)
+            .order_by(ChecklistItemEvaluation.created_at)
+        )
+    ).scalars().all()
+    assert [evaluation.status for evaluation in evaluations] == statuses
+    assert len({evaluation.created_at for evaluation in evaluations}) == len(statuses)
+
+    item = (
+        await test_db_session.execute(
+            select(ChecklistItem).join(Checklist).where(Checklist.project_id == project_id)
+        )
+    ).scalar_one()
+    assert item.latest_status == EvaluationStatus.FIXED
+    assert item.latest_evaluated_at == evaluations[-1].created_at
+
 @pytest.mark.asyncio
 async def test_engine_compute_progress(test_engine, test_db_session):
     """Test progress computation."""
@@ -192,3 +237,134 @@ async def test_engine_ensure_project_checklist_bootstraps_template_items(
     )
     items = items_result.scalars().all()
     assert len(items) == 2
+
+
+@pytest.mark.asyncio
+async def test_engine_sync_is_set_based_and_idempotent(test_engine, test_db_session):
+    """Sync issues a bounded number of statements and never duplicates evaluations."""
+    project_id = str(uuid4())
+    test_db_session.add(Project(id=project_id, name="Bulk Sync"))
+    await test_db_session.commit()
+
+    state = {
+        "wafChecklist": {
+            "template": "azure-waf-v1",
+            "items": [
+                {"id": f"item-{index}", "evaluations": [{"status": "open", "evidence": f"e-{index}"}]}
+                for index in range(200)
+            ],
+        }
+    }
+    statements: list[str] = []
+
+    @event.listens_for(test_db_session.bind.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, *_):
+        statements.append(statement)
+
+    result = await test_engine.sync_project_state_to_db(project_id, state)
+    assert result["evaluations_synced"] == 200
+    assert len(statements) < 20
+
+    result = await test_engine.sync_project_state_to_db(project_id, state)
+    assert result["evaluations_synced"] == 0
+
+    evaluations = await test_db_session.execute(
+        select(ChecklistItemEvaluation).where(ChecklistItemEvaluation.project_id == project_id)
+    )
+    assert len(evaluations.scalars().all()) == 200
+
+
+@pytest.mark.asyncio
+async def test_engine_latest_status_is_maintained_and_reconciled(test_engine, test_db_session):
+    """Evaluations keep item latest status current; reconcile rebuilds it from history."""
+    project_id = str(uuid4())
+    test_db_session.add(Project(id=project_id, name="Latest Status"))
+    await test_db_session.commit()
+
+    state = {
+        "wafChecklist": {
+            "template": "azure-waf-v1",
+            "items": [
+                {"id": "sec-01", "evaluations": [{"status": "open", "evidence": "todo"}]},
+                {"id": "rel-01", "evaluations": [{"status": "in_progress", "evidence": "wip"}]},
+            ],
+        }
+    }
+    await test_engine.sync_project_state_to_db(project_id, state)
+
+    actions = await test_engine.list_next_actions(project_id)
+    assert [action["template_item_id"] for action in actions] == ["rel-01", "sec-01"]
+    assert actions[0]["latest_status"] == "in_progress"
+    assert actions[0]["last_evaluated"] is not None
+
+    sec_item = (
+        await test_db_session.execute(
+            select(ChecklistItem).join(Checklist).where(
+                Checklist.project_id == project_id, ChecklistItem.template_item_id == "sec-01"
+            )
+        )
+    ).scalar_one()
+    await test_engine.evaluate_item(project_id, sec_item.id, {"status": "fixed"})
+
+    progress = await test_engine.compute_progress(project_id)
+    assert progress["completed_items"] == 1
+    assert progress["status_breakdown"] == {"fixed": 1, "in_progress": 1}
+    assert progress["severity_breakdown"]["high"] == {"total": 1, "completed": 1}
+    actions = await test_engine.list_next_actions(project_id)
+    assert [action["template_item_id"] for action in actions] == ["rel-01"]
+
+    await test_db_session.execute(
+        update(ChecklistItem)
+        .where(ChecklistItem.checklist_id == sec_item.checklist_id)
+        .values(latest_status=EvaluationStatus.OPEN, latest_evaluated_at=None)
+    )
+    await test_db_session.commit()
+    assert (await test_engine.compute_progress(project_id))["completed_items"] == 0
+
+    assert await test_engine.reconcile_latest_status(project_id) == 2
+    progress = await test_engine.compute_progress(project_id)
+    assert progress["status_breakdown"] == {"fixed": 1, "in_progress": 1}
+
+
+
+@pytest.mark.asyncio
+async def test_reconcile_and_read_agree_on_latest_when_timestamps_tie(test_engine, test_db_session):
+    """Evaluations with equal created_at resolve to the higher id everywhere."""
+    project_id = str(uuid4())
+    test_db_session.add(Project(id=project_id, name="Tied Evaluations"))
+    await test_db_session.commit()
+    state = {
+        "wafChecklist": {
+            "template": "azure-waf-v1",
+            "items": [{"id": "sec-01", "evaluations": [{"status": "open", "evidence": "todo"}]}],
+        }
+    }
+    await test_engine.sync_project_state_to_db(project_id, state)
+    item = (
+        await test_db_session.execute(
+            select(ChecklistItem).join(Checklist).where(Checklist.project_id == project_id)
+        )
+    ).scalar_one()
+
+    tied_at = datetime(2100, 1, 1)
+    tied = {"item_id": item.id, "project_id": project_id, "evaluator": "agent", "source_type": "test", "created_at": tied_at}
+    test_db_session.add_all(
+        [
+            ChecklistItemEvaluation(id=UUID(int=2), status=EvaluationStatus.FIXED, **tied),
+            ChecklistItemEvaluation(id=UUID(int=1), status=EvaluationStatus.IN_PROGRESS, **tied),
+        ]
+    )
+    await test_db_session.commit()
+
+    await test_engine.reconcile_latest_status(project_id)
+    await test_db_session.refresh(item)
+    assert item.latest_status == EvaluationStatus.FIXED
+
+    evaluations = (
+        await test_db_session.execute(
+            select(ChecklistItemEvaluation).where(ChecklistItemEvaluation.item_id == item.id)
+        )
+    ).scalars().all()
+    latest = ChecklistReadAssembler._latest_evaluation(list(reversed(evaluations)))
+    assert latest is not None
+    assert latest.id == UUID(int=2)
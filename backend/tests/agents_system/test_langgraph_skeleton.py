@@ -22,11 +22,30 @@ from app.shared.config.settings.agents import AgentsSettingsMixin
 
 def test_graph_can_be_compiled():
     """Test that the advanced graph can be compiled without errors."""
-    mock_db = MagicMock()
-    graph = build_project_chat_graph(db=mock_db)
+    graph = build_project_chat_graph()
     assert graph is not None
 
 
+def test_compiled_graph_is_shared_per_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    builds: list[object] = []
+    settings = SimpleNamespace(aaa_thread_memory_enabled=False)
+
+    def fake_build():  # type: ignore[no-untyped-def]
+        builds.append(object())
+        return builds[-1]
+
+    monkeypatch.setattr(graph_factory_module, "_compiled_graphs", {})
+    monkeypatch.setattr(graph_factory_module, "get_app_settings", lambda: settings)
+    monkeypatch.setattr(graph_factory_module, "build_project_chat_graph", fake_build)
+
+    first = graph_factory_module.get_project_chat_graph()
+    assert graph_factory_module.get_project_chat_graph() is first
+
+    settings.aaa_thread_memory_enabled = True
+    assert graph_factory_module.get_project_chat_graph() is not first
+    assert len(builds) == 2
+
+
 def test_phase11_runtime_flags_default_to_enabled() -> None:
     class _Settings(AgentsSettingsMixin):
         pass
@@ -110,13 +129,13 @@ def test_graph_uses_checkpointer_when_thread_memory_enabled(
         "get_app_settings",
         lambda: SimpleNamespace(aaa_thread_memory_enabled=True),
     )
-    monkeypatch.setattr(graph_factory_module, "MemorySaver", lambda: "memory-saver")
+    monkeypatch.setattr(graph_factory_module, "get_thread_checkpointer", lambda: "sqlite-saver")
     monkeypatch.setattr(graph_factory_module.StateGraph, "compile", fake_compile)
 
-    graph = build_project_chat_graph(db=MagicMock())
+    graph = build_project_chat_graph()
 
     assert graph == "compiled-graph"
-    assert captured["checkpointer"] == "memory-saver"
+    assert captured["checkpointer"] == "sqlite-saver"
 
 
 @pytest.mark.asyncio
@@ -173,14 +192,15 @@ async def test_graph_classifies_stage_before_building_summary(
         lambda: SimpleNamespace(aaa_thread_memory_enabled=False),
     )
 
-    graph = build_project_chat_graph(db=MagicMock())
+    graph = build_project_chat_graph()
 
     await graph.ainvoke(
         {
             "project_id": "proj-1",
             "user_message": "validate this design",
             "success": False,
-        }
+        },
+        config={"configurable": {"db": MagicMock()}},
     )
 
     assert call_order[:3] == [
@@ -256,14 +276,15 @@ async def test_graph_routes_extract_requirements_to_stage_worker(
         lambda: SimpleNamespace(aaa_thread_memory_enabled=False),
     )
 
-    graph = build_project_chat_graph(db=MagicMock())
+    graph = build_project_chat_graph()
 
     result = await graph.ainvoke(
         {
             "project_id": "proj-1",
             "user_message": "continue",
             "success": False,
-        }
+        },
+        config={"configurable": {"db": MagicMock()}},
     )
 
     assert result["final_answer"] == "requirements extracted"
@@ -393,14 +414,15 @@ async def test_graph_routes_propose_candidate_through_research_worker_and_archit
         lambda: SimpleNamespace(aaa_thread_memory_enabled=False),
     )
 
-    graph = build_project_chat_graph(db=MagicMock())
+    graph = build_project_chat_graph()
 
     result = await graph.ainvoke(
         {
             "project_id": "proj-1",
             "user_message": "design the target architecture",
             "success": False,
-        }
+        },
+        config={"configurable": {"db": MagicMock()}},
     )
 
     assert str(result["final_answer"]).startswith("candidate ready")
@@ -527,14 +549,15 @@ async def test_graph_routes_pricing_stage_through_dedicated_cost_worker(
         lambda: SimpleNamespace(aaa_thread_memory_enabled=False),
     )
 
-    graph = build_project_chat_graph(db=MagicMock())
+    graph = build_project_chat_graph()
 
     result = await graph.ainvoke(
         {
             "project_id": "proj-1",
             "user_message": "How much would this run each month?",
             "success": False,
-        }
+        },
+        config={"configurable": {"db": MagicMock()}},
     )
 
     assert result["final_answer"] == "cost recorded"
@@ -660,14 +683,15 @@ async def test_graph_routes_iac_stage_through_dedicated_worker(
         lambda: SimpleNamespace(aaa_thread_memory_enabled=False),
     )
 
-    graph = build_project_chat_graph(db=MagicMock())
+    graph = build_project_chat_graph()
 
     result = await graph.ainvoke(
         {
             "project_id": "proj-1",
             "user_message": "Generate Bicep for this architecture",
             "success": False,
-        }
+        },
+        config={"configurable": {"db": MagicMock()}},
     )
 
     assert result["final_answer"] == "iac recorded"
@@ -749,14 +773,15 @@ async def test_graph_routes_export_to_dedicated_stage_worker(
         lambda: SimpleNamespace(aaa_thread_memory_enabled=False),
     )
 
-    graph = build_project_chat_graph(db=MagicMock())
+    graph = build_project_chat_graph()
 
     result = await graph.ainvoke(
         {
             "project_id": "proj-1",
             "user_message": "export the deliverable package",
             "success": False,
-        }
+        },
+        config={"configurable": {"db": MagicMock()}},
     )
 
     assert result["final_answer"] == "AAA_EXPORT\n```json\n{\"ok\":true}\n```"
@@ -897,14 +922,15 @@ async def test_graph_routes_validate_stage_through_validate_worker(
         lambda: SimpleNamespace(aaa_thread_memory_enabled=False),
     )
 
-    graph = build_project_chat_graph(db=MagicMock())
+    graph = build_project_chat_graph()
 
     result = await graph.ainvoke(
         {
             "project_id": "proj-1",
             "user_message": "validate this design against WAF",
             "success": False,
-        }
+        },
+        config={"configurable": {"db": MagicMock()}},
     )
 
     assert result["final_answer"] == "validation recorded"
@@ -1001,14 +1027,15 @@ async def test_graph_routes_manage_adr_stage_through_dedicated_worker(
         lambda: SimpleNamespace(aaa_thread_memory_enabled=False),
     )
 
-    graph = build_project_chat_graph(db=MagicMock())
+    graph = build_project_chat_graph()
 
     result = await graph.ainvoke(
         {
             "project_id": "proj-1",
             "user_message": "Create an ADR for the database decision",
             "success": False,
-        }
+        },
+        config={"configurable": {"db": MagicMock()}},
     )
 
     assert "cs-adr-1" in result["agent_output"]
@@ -22,31 +22,18 @@ async def test_execute_project_chat_uses_unified_advanced_graph(monkeypatch):
                 "intermediate_steps": [],
             }
 
-    def fake_build_advanced(
-        db,
-        response_message_id: str,
-        enable_stage_routing: bool,
-        enable_multi_agent: bool,
-    ):
-        captured["db"] = db
-        captured["response_message_id"] = response_message_id
-        captured["enable_stage_routing"] = enable_stage_routing
-        captured["enable_multi_agent"] = enable_multi_agent
-        return DummyGraph()
-
-    monkeypatch.setattr(
-        adapter_module, "build_project_chat_graph", fake_build_advanced
-    )
+    monkeypatch.setattr(adapter_module, "get_project_chat_graph", DummyGraph)
 
+    db = object()
     result = await adapter_module.execute_project_chat(
         project_id="proj-1",
         user_message="hello",
-        db=object(),
+        db=db,
     )
 
-    assert captured["enable_stage_routing"] is True
-    assert captured["enable_multi_agent"] is False
-    assert isinstance(captured.get("response_message_id"), str)
+    configurable = captured["config"]["configurable"]
+    assert configurable["db"] is db
+    assert isinstance(configurable["response_message_id"], str)
     assert captured["initial_state"]["project_id"] == "proj-1"
     assert captured["initial_state"]["user_message"] == "hello"
     assert result["success"] is True
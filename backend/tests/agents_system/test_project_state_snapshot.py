@@ -0,0 +1,93 @@
+"""Tests for the per-turn project state snapshot and DB round-trip counters."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.agents_system.langgraph.nodes.persist import apply_state_updates_node
+from app.agents_system.services.project_context import (
+    get_project_context_summary,
+    read_project_state,
+)
+from app.models.project import Base, Project, ProjectDocument, ProjectState
+from app.shared.db.round_trips import count_round_trips
+
+
+@pytest_asyncio.fixture
+async def db() -> AsyncGenerator[AsyncSession]:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add(Project(id="p1", name="Snapshot Project"))
+        session.add(
+            ProjectState(
+                project_id="p1",
+                state=json.dumps({"context": {"summary": "Original summary"}}),
+            )
+        )
+        session.add(
+            ProjectDocument(
+                id="d1",
+                project_id="p1",
+                file_name="brief.md",
+                mime_type="text/markdown",
+                raw_text="Brief text",
+                parse_status="parsed",
+            )
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_round_trip_counter_counts_statements_and_state_reads(db: AsyncSession) -> None:
+    with count_round_trips() as counter:
+        state = await read_project_state("p1", db)
+
+    assert state is not None
+    assert counter.events["project_state_reads"] == 1
+    assert counter.statements > 1
+
+
+@pytest.mark.asyncio
+async def test_context_summary_reuses_turn_snapshot(db: AsyncSession) -> None:
+    snapshot = await read_project_state("p1", db)
+
+    with count_round_trips() as counter:
+        summary = await get_project_context_summary("p1", db, project_state=snapshot)
+
+    assert "Original summary" in summary
+    assert counter.events["project_state_reads"] == 0
+
+
+@pytest.mark.asyncio
+async def test_apply_updates_refreshes_snapshot_without_full_reread(db: AsyncSession) -> None:
+    snapshot = await read_project_state("p1", db)
+    graph_state = {
+        "project_id": "p1",
+        "current_project_state": snapshot,
+        "combined_updates": {"nfrs": {"availability": "99.95%"}},
+        "agent_output": "Done",
+        "architect_choice_required_section": "skip uncovered topics",
+    }
+
+    with count_round_trips() as counter:
+        result = await apply_state_updates_node(graph_state, db)
+
+    assert counter.events["project_state_reads"] == 0
+    expected = await read_project_state("p1", db)
+    assert result["updated_project_state"] == expected
+    assert result["updated_project_state"]["referenceDocuments"][0]["id"] == "d1"
@@ -2,8 +2,8 @@ import pytest
 
 from app.agents_system.config.prompt_loader import PromptLoader
 from app.agents_system.langgraph.nodes.agent_native import _build_system_directives
-from app.agents_system.memory.token_counter import TokenCounter
 from app.agents_system.services.adr_drafter_worker import ADRDrafterWorker
+from app.shared.ai.token_counter import TokenCounter
 
 
 def test_load_prompt_from_specialized_file(tmp_path):
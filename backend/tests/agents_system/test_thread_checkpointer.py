@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+
+pytest.importorskip("langgraph")
+
+from langgraph.graph import END, StateGraph
+
+from app.agents_system.langgraph.checkpointer import SqliteThreadCheckpointer
+
+
+class _TurnState(TypedDict, total=False):
+    turns: Annotated[list[str], operator.add]
+    current_project_state: dict
+
+
+def _graph(checkpointer: SqliteThreadCheckpointer):  # type: ignore[no-untyped-def]
+    def respond(state: _TurnState) -> dict:
+        return {"turns": ["reply"], "current_project_state": {"large": "x" * 4096}}
+
+    workflow = StateGraph(_TurnState)
+    workflow.add_node("respond", respond)
+    workflow.set_entry_point("respond")
+    workflow.add_edge("respond", END)
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id, "db": object()}}
+
+
+@pytest.mark.asyncio
+async def test_thread_memory_survives_a_new_checkpointer(tmp_path) -> None:
+    path = tmp_path / "checkpoints.db"
+    saver = SqliteThreadCheckpointer(path)
+    await _graph(saver).ainvoke({"turns": ["hello"]}, config=_config("t-1"))
+    await saver.aclose()
+
+    resumed = SqliteThreadCheckpointer(path)
+    result = await _graph(resumed).ainvoke({"turns": ["again"]}, config=_config("t-1"))
+    assert result["turns"] == ["hello", "reply", "again", "reply"]
+
+    latest = await resumed.aget_tuple(_config("t-1"))
+    assert latest is not None
+    assert "current_project_state" not in latest.checkpoint["channel_values"]
+    await resumed.aclose()
+
+
+@pytest.mark.asyncio
+async def test_retention_and_ttl_bound_stored_checkpoints(tmp_path) -> None:
+    saver = SqliteThreadCheckpointer(tmp_path / "checkpoints.db", max_checkpoints=2)
+    graph = _graph(saver)
+    for _ in range(3):
+        await graph.ainvoke({"turns": ["hi"]}, config=_config("t-1"))
+
+    stored = [item async for item in saver.alist(_config("t-1"))]
+    assert len(stored) == 2
+
+    saver.ttl_seconds = -1
+    saver._last_sweep = 0.0
+    await graph.ainvoke({"turns": ["hi"]}, config=_config("t-2"))
+    assert [item async for item in saver.alist(_config("t-1"))] == []
+    await saver.aclose()
+
+
+@pytest.mark.asyncio
+async def test_alist_applies_thread_before_and_limit_filters(tmp_path) -> None:
+    saver = SqliteThreadCheckpointer(tmp_path / "checkpoints.db")
+    graph = _graph(saver)
+    await graph.ainvoke({"turns": ["hi"]}, config=_config("t-1"))
+    await graph.ainvoke({"turns": ["hi"]}, config=_config("t-2"))
+
+    newest, *older = [item async for item in saver.alist(_config("t-1"))]
+    assert older
+    before = [item async for item in saver.alist(_config("t-1"), before=newest.config)]
+    assert [item.config for item in before] == [item.config for item in older]
+    assert len([item async for item in saver.alist(_config("t-1"), limit=1)]) == 1
+
+    threads = {item.config["configurable"]["thread_id"] async for item in saver.alist(None)}
+    assert threads == {"t-1", "t-2"}
+    await saver.aclose()
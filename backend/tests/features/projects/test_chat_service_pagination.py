@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.features.projects.application.chat_service import ChatService
+from app.models.project import Base, ConversationMessage, Project, ProjectThread
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)() as session:
+        session.add(Project(id="p-1", name="Project"))
+        session.add(ProjectThread(id="t-1", project_id="p-1"))
+        # m-2 and m-3 share a timestamp: the id breaks the tie.
+        for index, timestamp in enumerate(["ts-1", "ts-2", "ts-3", "ts-3", "ts-4", "ts-5"]):
+            session.add(
+                ConversationMessage(
+                    id=f"m-{index}",
+                    project_id="p-1",
+                    thread_id="t-1" if index % 2 == 0 else None,
+                    role="user",
+                    content=f"message {index}",
+                    timestamp=timestamp,
+                )
+            )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+def _ids(messages: list[dict]) -> list[str]:
+    return [message["id"] for message in messages]
+
+
+@pytest.mark.asyncio
+async def test_default_page_is_newest_messages_in_order(session) -> None:
+    messages = await ChatService().get_conversation_messages("p-1", session, limit=2)
+    assert _ids(messages) == ["m-4", "m-5"]
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_do_not_skip_equal_timestamps(session) -> None:
+    service = ChatService()
+    older = await service.get_conversation_messages("p-1", session, before_id="m-3", limit=10)
+    assert _ids(older) == ["m-0", "m-1", "m-2"]
+
+    newer = await service.get_conversation_messages("p-1", session, since_id="m-2", limit=2)
+    assert _ids(newer) == ["m-3", "m-4"]
+
+
+@pytest.mark.asyncio
+async def test_thread_scoped_pages(session) -> None:
+    messages = await ChatService().get_conversation_messages(
+        "p-1", session, before_id="m-4", thread_id="t-1", limit=10
+    )
+    assert _ids(messages) == ["m-0", "m-2"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_project_raises(session) -> None:
+    with pytest.raises(ValueError, match="Project not found"):
+        await ChatService().get_conversation_messages("missing", session)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import Headers, UploadFile
+
+from app.features.projects.application.document_parsing_executor import (
+    DocumentParseTimeoutError,
+    DocumentParsingExecutor,
+    resource,
+)
+from app.features.projects.application.document_service import DocumentService
+from app.models import Project, ProjectDocument
+
+
+@pytest.mark.asyncio
+async def test_timed_out_parse_is_killed_and_pool_recovers() -> None:
+    executor = DocumentParsingExecutor(max_workers=1, timeout=60.0, memory_limit_mb=0)
+    try:
+        assert await executor.submit(pow, 2, 3) == 8  # Warm up: spawning the worker is slow
+
+        executor.timeout = 0.5
+        started = time.monotonic()
+        with pytest.raises(DocumentParseTimeoutError):
+            await executor.submit(time.sleep, 30)
+        assert time.monotonic() - started < 5
+
+        executor.timeout = 60.0
+        assert await executor.submit(pow, 2, 4) == 16
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.skipif(resource is None, reason="worker memory limits need the POSIX resource module")
+@pytest.mark.asyncio
+async def test_worker_memory_limit_fails_the_parse_not_the_host() -> None:
+    executor = DocumentParsingExecutor(max_workers=1, timeout=60.0, memory_limit_mb=256)
+    try:
+        with pytest.raises(MemoryError):
+            await executor.submit(bytearray, 1 << 30)
+        assert await executor.submit(pow, 2, 5) == 32
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_background_upload_returns_pending_then_parses(
+    test_db_session: AsyncSession, tmp_path: Path
+) -> None:
+    @asynccontextmanager
+    async def session_factory() -> AsyncIterator[AsyncSession]:
+        yield test_db_session
+
+    test_db_session.add(Project(id="proj-bg", name="Background"))
+    await test_db_session.commit()
+    service = DocumentService(
+        parsing_executor=DocumentParsingExecutor(max_workers=0, timeout=60.0, memory_limit_mb=0),
+        session_factory=session_factory,
+    )
+    service.document_store_dir = tmp_path
+    uploads = [
+        UploadFile(BytesIO(b"notes " * 1000), filename="notes.txt", headers=Headers({"content-type": "text/plain"})),
+        UploadFile(BytesIO(b"not a pdf"), filename="broken.pdf"),
+    ]
+
+    result = await service.upload_documents("proj-bg", uploads, test_db_session, wait_for_parsing=False)
+
+    assert {doc["parseStatus"] for doc in result["documents"]} == {"pending"}
+    assert result["uploadSummary"]["pendingDocuments"] == 2
+    stored = {Path(doc["storedPath"]).name.split("_", 1)[1]: doc for doc in result["documents"]}
+    assert Path(stored["notes.txt"]["storedPath"]).read_bytes() == b"notes " * 1000
+
+    for task in list(service._background_tasks):
+        await task
+
+    status = await service.get_parse_status("proj-bg", test_db_session)
+    by_name = {doc["fileName"]: doc for doc in status["documents"]}
+    assert by_name["notes.txt"]["parseStatus"] == "parsed"
+    assert by_name["broken.pdf"]["parseStatus"] == "parse_failed"
+    assert by_name["broken.pdf"]["analysisStatus"] == "skipped"
+    assert status["uploadSummary"]["pendingDocuments"] == 0
+    assert status["uploadSummary"]["parsedDocuments"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pending_parses_are_requeued_on_startup(
+    test_db_session: AsyncSession, tmp_path: Path
+) -> None:
+    @asynccontextmanager
+    async def session_factory() -> AsyncIterator[AsyncSession]:
+        yield test_db_session
+
+    stored = tmp_path / "doc-1_notes.txt"
+    stored.write_bytes(b"resumed notes")
+    test_db_session.add(Project(id="proj-resume", name="Resume"))
+    for doc_id, path in (("doc-1", stored), ("doc-2", tmp_path / "doc-2_gone.txt")):
+        test_db_session.add(
+            ProjectDocument(
+                id=doc_id,
+                project_id="proj-resume",
+                file_name=path.name.split("_", 1)[1],
+                mime_type="text/plain",
+                raw_text="",
+                stored_path=str(path),
+                parse_status="pending",
+                analysis_status="not_started",
+                uploaded_at="2026-01-01T00:00:00+00:00",
+            )
+        )
+    await test_db_session.commit()
+    service = DocumentService(
+        parsing_executor=DocumentParsingExecutor(max_workers=0, timeout=60.0, memory_limit_mb=0),
+        session_factory=session_factory,
+    )
+
+    assert await service.resume_pending_parses() == 1
+    for task in list(service._background_tasks):
+        await task
+
+    status = await service.get_parse_status("proj-resume", test_db_session)
+    by_name = {doc["fileName"]: doc for doc in status["documents"]}
+    assert by_name["notes.txt"]["parseStatus"] == "parsed"
+    assert by_name["gone.txt"]["parseStatus"] == "parse_failed"
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.features.projects.infrastructure.project_state_decomposition import (
+    compose_project_state,
+    sync_project_state,
+)
+from app.features.projects.infrastructure.project_state_log_repository import (
+    ProjectStateLogRepository,
+)
+from app.models.project import Base, Project, ProjectStateComponent, ProjectStateLogEntry
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)() as session:
+        session.add(Project(id="p-1", name="Project"))
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sync_appends_log_entries_and_strips_them_from_blob(session) -> None:
+    state = {
+        "requirements": [{"text": "a"}],
+        "mcpQueries": [{"id": "q-1", "query": "aks"}],
+        "iterationEvents": [{"id": "e-1"}, {"id": "e-2"}],
+    }
+    synced = await sync_project_state(
+        project_id="p-1", state=state, db=session, replace_missing=True, updated_at="t1"
+    )
+    assert "mcpQueries" not in synced.state
+    assert "iterationEvents" not in synced.state
+    assert {"mcpQueries", "iterationEvents"} <= set(synced.changed_keys)
+
+    # A composed state without logs must not delete stored entries.
+    synced = await sync_project_state(
+        project_id="p-1",
+        state={"requirements": [{"text": "a"}], "iterationEvents": [{"id": "e-3"}]},
+        db=session,
+        replace_missing=True,
+        updated_at="t2",
+    )
+    assert "mcpQueries" not in synced.changed_keys
+
+    composed = await compose_project_state(project_id="p-1", state={}, db=session)
+    assert "iterationEvents" not in composed
+    assert "mcpQueries" not in composed
+
+    composed = await compose_project_state(
+        project_id="p-1", state={}, db=session, include_logs={"iterationEvents"}
+    )
+    assert [event["id"] for event in composed["iterationEvents"]] == ["e-1", "e-2", "e-3"]
+    assert "mcpQueries" not in composed
+
+
+@pytest.mark.asyncio
+async def test_get_page_uses_keyset_cursor(session) -> None:
+    repository = ProjectStateLogRepository()
+    await repository.append_from_state(
+        project_id="p-1",
+        state={"traceabilityLinks": [{"id": f"l-{index}"} for index in range(5)]},
+        db=session,
+    )
+
+    first = await repository.get_page(
+        project_id="p-1", family="traceabilityLinks", db=session, limit=2
+    )
+    assert [item["id"] for item in first.items] == ["l-0", "l-1"]
+    assert first.next_cursor is not None
+
+    rest = await repository.get_page(
+        project_id="p-1",
+        family="traceabilityLinks",
+        db=session,
+        cursor=first.next_cursor,
+        limit=10,
+    )
+    assert [item["id"] for item in rest.items] == ["l-2", "l-3", "l-4"]
+    assert rest.next_cursor is None
+
+    with pytest.raises(ValueError):
+        await repository.get_page(project_id="p-1", family="adrs", db=session)
+
+
+@pytest.mark.asyncio
+async def test_legacy_component_rows_are_absorbed(session) -> None:
+    session.add(
+        ProjectStateComponent(
+            project_id="p-1",
+            component_key="mcpQueries",
+            payload_json=json.dumps([{"query": "no id"}, {"id": "q-2"}]),
+            updated_at="t0",
+        )
+    )
+    await session.flush()
+
+    logs = await ProjectStateLogRepository().get_logs(
+        project_id="p-1", families=["mcpQueries"], db=session
+    )
+    assert logs["mcpQueries"] == [{"query": "no id"}, {"id": "q-2"}]
+
+    components = (
+        await session.execute(select(ProjectStateComponent).where(ProjectStateComponent.project_id == "p-1"))
+    ).scalars().all()
+    assert components == []
+    entries = (await session.execute(select(ProjectStateLogEntry))).scalars().all()
+    assert {entry.created_at for entry in entries} == {"t0"}
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.features.projects.api.error_handlers import register_project_error_handlers
+from app.features.projects.infrastructure.project_state_store import (
+    ProjectStateConflictError,
+    ProjectStateStore,
+)
+from app.models.project import Base, Project, ProjectState, ProjectStateComponent
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        session.add(Project(id="p-1", name="Project"))
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+def _state(requirements: list[str]) -> dict:
+    return {
+        "context": {"summary": "Summary"},
+        "requirements": [{"text": text} for text in requirements],
+        "adrs": [{"id": "adr-1", "title": "Use AKS"}],
+        "notes": "blob-only field",
+    }
+
+
+def _count_writes(engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, *_):
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE")):
+            statements.append(statement)
+
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_persist_writes_only_changed_families(engine) -> None:
+    store = ProjectStateStore()
+    session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async with session_factory() as session:
+        await store.persist_composed_state(
+            project_id="p-1", state=_state(["a"]), db=session, replace_missing=True, updated_at="t1"
+        )
+        await session.commit()
+        record = await store.get_record(project_id="p-1", db=session)
+        assert record is not None
+        first_version = record.version
+
+    writes = _count_writes(engine)
+    async with session_factory() as session:
+        await store.persist_composed_state(
+            project_id="p-1", state=_state(["a"]), db=session, replace_missing=True, updated_at="t2"
+        )
+        await session.commit()
+    assert writes == []
+
+    async with session_factory() as session:
+        await store.persist_composed_state(
+            project_id="p-1", state=_state(["a", "b"]), db=session, replace_missing=True, updated_at="t3"
+        )
+        await session.commit()
+
+        rows = (
+            await session.execute(
+                select(ProjectStateComponent).where(ProjectStateComponent.project_id == "p-1")
+            )
+        ).scalars().all()
+        updated = {row.component_key: row.updated_at for row in rows}
+        assert updated == {"requirements": "t3", "adrs": "t1"}
+        record = (
+            await session.execute(select(ProjectState).where(ProjectState.project_id == "p-1"))
+        ).scalar_one()
+        assert record.version == first_version + 1
+        assert record.updated_at == "t3"
+    assert [s for s in writes if "project_state_components" in s] == [
+        next(s for s in writes if "project_state_components" in s)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writer_is_detected(engine) -> None:
+    store = ProjectStateStore()
+    session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async with session_factory() as session:
+        await store.persist_composed_state(
+            project_id="p-1", state=_state(["a"]), db=session, replace_missing=True
+        )
+        await session.commit()
+
+    async with session_factory() as first, session_factory() as second:
+        await store.get_record(project_id="p-1", db=first)
+        await store.get_record(project_id="p-1", db=second)
+
+        await store.persist_composed_state(
+            project_id="p-1", state=_state(["a", "b"]), db=first, replace_missing=True
+        )
+        await first.commit()
+
+        with pytest.raises(ProjectStateConflictError):
+            await store.persist_composed_state(
+                project_id="p-1", state=_state(["a", "c"]), db=second, replace_missing=True
+            )
+        await second.rollback()
+
+
+def test_conflict_is_reported_as_409() -> None:
+    app = FastAPI()
+    register_project_error_handlers(app)
+
+    @app.post("/state")
+    async def write_state() -> None:
+        raise ProjectStateConflictError("p-1")
+
+    response = TestClient(app).post("/state")
+    assert response.status_code == 409
+    assert "p-1" in response.json()["detail"]
+    # Routers map ValueError to 400/404, so a conflict must not be one.
+    assert not issubclass(ProjectStateConflictError, ValueError)
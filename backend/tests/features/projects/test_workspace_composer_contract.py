@@ -4,7 +4,10 @@ from typing import Any
 
 import pytest
 
-from app.features.projects.application.workspace_composer import ProjectWorkspaceComposer
+from app.features.projects.application.workspace_composer import (
+    ProjectWorkspaceComposer,
+    WorkspaceProjection,
+)
 
 
 class StubWorkspaceRepository:
@@ -117,4 +120,102 @@ async def test_workspace_composer_returns_structured_workspace_view() -> None:
     assert "projectState" not in dumped
     assert dumped["inputs"]["context"] == {"summary": "Composed state", "targetUsers": "Architects"}
     assert dumped["documents"]["items"] == [{"id": "doc-1", "title": "Reference Architecture"}]
-    assert dumped["artifacts"]["requirements"] == [{"id": "req-1", "text": "Keep behavior stable"}]
\ No newline at end of file
+    assert dumped["artifacts"]["requirements"] == [{"id": "req-1", "text": "Keep behavior stable"}]
+
+class FingerprintedWorkspaceRepository(StubWorkspaceRepository):
+    def __init__(self) -> None:
+        self.fingerprint: tuple[str, ...] | None = ("version-1",)
+
+    async def get_workspace_fingerprint(
+        self,
+        *,
+        project_id: str,
+        db: object,
+    ) -> tuple[str, ...] | None:
+        return self.fingerprint
+
+
+class RecordingStateProvider(StubStateProvider):
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    async def get_project_state(
+        self,
+        project_id: str,
+        db: object,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        self.calls.append(kwargs)
+        return await super().get_project_state(project_id, db)
+
+
+class FailingChecklistProvider:
+    async def list_checklists(self, *, project_id: str, db: object) -> list[dict[str, Any]]:
+        raise AssertionError("checklists were not requested")
+
+
+def _composer(
+    repository: StubWorkspaceRepository,
+    state_provider: StubStateProvider,
+    checklist_provider: object | None = None,
+) -> ProjectWorkspaceComposer:
+    return ProjectWorkspaceComposer(
+        repository=repository,
+        state_provider=state_provider,
+        architecture_inputs_provider=StubArchitectureInputsProvider(),
+        checklist_provider=checklist_provider or StubChecklistProvider(),
+        knowledge_provider=StubKnowledgeProvider(),
+        settings_provider=StubSettingsProvider(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_workspace_projection_skips_unrequested_sources() -> None:
+    state_provider = RecordingStateProvider()
+    composer = _composer(
+        FingerprintedWorkspaceRepository(),
+        state_provider,
+        checklist_provider=FailingChecklistProvider(),
+    )
+    projection = WorkspaceProjection.parse(sections="project", fields="requirements,mcpQueries")
+
+    workspace = await composer.compose(
+        project_id="project-123",
+        db="db-session",
+        projection=projection,
+    )
+
+    assert state_provider.calls == [{"include_logs": ("mcpQueries",), "include_waf_checklist": False}]
+    assert workspace.model_dump(by_alias=True, include=projection.include()) == {
+        "project": workspace.project.model_dump(by_alias=True),
+        "artifacts": {"requirements": [{"id": "req-1", "text": "Keep behavior stable"}], "mcpQueries": []},
+    }
+
+
+def test_workspace_projection_rejects_unknown_names() -> None:
+    with pytest.raises(ValueError, match="section"):
+        WorkspaceProjection.parse(sections="project,bogus", fields=None)
+    with pytest.raises(ValueError, match="field"):
+        WorkspaceProjection.parse(sections=None, fields="bogus")
+
+
+@pytest.mark.asyncio
+async def test_workspace_etag_tracks_fingerprint_and_projection() -> None:
+    repository = FingerprintedWorkspaceRepository()
+    composer = _composer(repository, StubStateProvider())
+    full = await composer.compute_etag(project_id="project-123", db="db-session")
+    projected = await composer.compute_etag(
+        project_id="project-123",
+        db="db-session",
+        projection=WorkspaceProjection.parse(sections="artifacts", fields=None),
+    )
+
+    assert full is not None and full.startswith('"')
+    assert full == await composer.compute_etag(project_id="project-123", db="db-session")
+    assert projected != full
+
+    repository.fingerprint = ("version-2",)
+    assert await composer.compute_etag(project_id="project-123", db="db-session") != full
+
+    repository.fingerprint = None
+    assert await composer.compute_etag(project_id="project-123", db="db-session") is None
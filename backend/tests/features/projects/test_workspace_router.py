@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.features.projects.api.workspace_router import get_workspace_composer_dep, router
+from app.features.projects.application import WorkspaceProjection
+from app.features.projects.contracts.workspace import (
+    AgentWorkspaceSummary,
+    ProjectWorkspaceArtifacts,
+    ProjectWorkspaceProjectSummary,
+    ProjectWorkspaceSettingsSummary,
+    ProjectWorkspaceStateSummary,
+    ProjectWorkspaceView,
+)
+from app.shared.db.projects_database import get_db
+
+
+class StubWorkspaceComposer:
+    def __init__(self) -> None:
+        self.compose_calls = 0
+
+    async def compute_etag(
+        self,
+        *,
+        project_id: str,
+        db: object,
+        projection: WorkspaceProjection | None = None,
+    ) -> str | None:
+        if project_id != "project-123":
+            return None
+        return f'"etag-{projection.cache_key() if projection else "*"}"'
+
+    async def compose(
+        self,
+        *,
+        project_id: str,
+        db: object,
+        projection: WorkspaceProjection | None = None,
+    ) -> ProjectWorkspaceView:
+        self.compose_calls += 1
+        return ProjectWorkspaceView(
+            project=ProjectWorkspaceProjectSummary(
+                id=project_id,
+                name="Contoso Landing Zone",
+                created_at="2026-04-01T10:00:00Z",
+                text_requirements="",
+                document_count=0,
+            ),
+            state=ProjectWorkspaceStateSummary(),
+            artifacts=ProjectWorkspaceArtifacts(
+                requirements=[{"id": "req-1"}],
+                adrs=[{"id": "adr-1"}],
+            ),
+            agent=AgentWorkspaceSummary(message_count=0, thread_count=0),
+            settings=ProjectWorkspaceSettingsSummary(provider="copilot", model="gpt-5.4"),
+        )
+
+
+def _client(composer: StubWorkspaceComposer) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+
+    async def get_db_override():
+        yield "db-session"
+
+    app.dependency_overrides[get_db] = get_db_override
+    app.dependency_overrides[get_workspace_composer_dep] = lambda: composer
+    return TestClient(app)
+
+
+def test_workspace_returns_projection_and_304_for_matching_etag() -> None:
+    composer = StubWorkspaceComposer()
+    client = _client(composer)
+
+    response = client.get("/api/projects/project-123/workspace?fields=requirements")
+    assert response.status_code == 200
+    assert response.json() == {"artifacts": {"requirements": [{"id": "req-1"}]}}
+    etag = response.headers["ETag"]
+
+    cached = client.get(
+        "/api/projects/project-123/workspace?fields=requirements",
+        headers={"If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert composer.compose_calls == 1
+
+
+def test_workspace_rejects_unknown_sections_and_projects() -> None:
+    client = _client(StubWorkspaceComposer())
+
+    assert client.get("/api/projects/project-123/workspace?sections=bogus").status_code == 400
+    assert client.get("/api/projects/missing/workspace").status_code == 404
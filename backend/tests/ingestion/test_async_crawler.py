@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.features.ingestion.domain.sources.crawl_manifest import CrawlManifest
+from app.features.ingestion.domain.sources.website.async_crawler import (
+    AsyncCrawlOptions,
+    AsyncWebsiteCrawler,
+    TokenBucket,
+)
+
+BASE = 'https://docs.example.com'
+PARAGRAPH = 'Azure architecture guidance for resilient workloads. ' * 20
+
+
+def _page(title: str, links: list[str]) -> str:
+    anchors = ''.join(f'<a href="{link}">{link}</a>' for link in links)
+    return (
+        f'<html><head><title>{title}</title></head><body><article>'
+        f'<h1>{title}</h1><p>{title}: {PARAGRAPH}</p><nav>{anchors}</nav>'
+        '</article></body></html>'
+    )
+
+
+PAGES = {
+    '/docs/start': _page('Start', ['/docs/a', '/docs/b', '/docs/private', '/blog/post']),
+    '/docs/a': _page('Page A', ['/docs/b', '/docs/start#top']),
+    '/docs/b': _page('Page B', ['/docs/a']),
+    '/docs/private': _page('Private', []),
+}
+ROBOTS = 'User-agent: *\nDisallow: /docs/private\n'
+
+
+def _transport(requested: list[str]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        requested.append(path)
+        if path == '/robots.txt':
+            return httpx.Response(200, text=ROBOTS)
+        if path in PAGES:
+            return httpx.Response(200, text=PAGES[path], headers={'content-type': 'text/html'})
+        return httpx.Response(404)
+
+    return httpx.MockTransport(handler)
+
+
+def test_async_crawl_yields_document_batches_and_respects_robots() -> None:
+    requested: list[str] = []
+    crawler = AsyncWebsiteCrawler(
+        'kb-1',
+        options=AsyncCrawlOptions(
+            concurrency=4, host_rate=100.0, parse_workers=0, transport=_transport(requested)
+        ),
+    )
+
+    batches = list(crawler.crawl(f'{BASE}/docs/start', f'{BASE}/docs', max_pages=10, batch_size=2))
+
+    urls = sorted(doc.metadata['url'] for batch in batches for doc in batch)
+    assert urls == [f'{BASE}/docs/a', f'{BASE}/docs/b', f'{BASE}/docs/start']
+    assert all(len(batch) <= 2 for batch in batches)
+    # Once for sitemap discovery (none here, so links are crawled), once for politeness rules
+    assert requested.count('/robots.txt') == 2
+    assert '/sitemap.xml' in requested
+    assert '/docs/private' not in requested
+    assert '/blog/post' not in requested
+    assert sorted(p for p in requested if p.startswith('/docs')) == ['/docs/a', '/docs/b', '/docs/start']
+    doc_ids = sorted(doc.metadata['doc_id'] for batch in batches for doc in batch)
+    assert doc_ids == [1, 2, 3]
+
+
+def test_async_crawl_stops_at_max_pages() -> None:
+    crawler = AsyncWebsiteCrawler(
+        'kb-1',
+        options=AsyncCrawlOptions(
+            concurrency=2, host_rate=100.0, parse_workers=0, transport=_transport([])
+        ),
+    )
+
+    batches = list(crawler.crawl(f'{BASE}/docs/start', f'{BASE}/docs', max_pages=2, batch_size=10))
+
+    assert sum(len(batch) for batch in batches) == 2
+
+
+def test_incremental_crawl_skips_unchanged_pages_and_drops_removed_ones(tmp_path) -> None:
+    site = {
+        '/docs/start': _page('Start', ['/docs/a', '/docs/b']),
+        '/docs/a': _page('Page A', []),
+        '/docs/b': _page('Page B', []),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path not in site:
+            return httpx.Response(404)
+        etag = f'"{hash(site[path])}"'
+        if request.headers.get('If-None-Match') == etag:
+            return httpx.Response(304, headers={'ETag': etag})
+        return httpx.Response(200, text=site[path], headers={'ETag': etag, 'content-type': 'text/html'})
+
+    def crawl(manifest: CrawlManifest) -> list[str]:
+        crawler = AsyncWebsiteCrawler(
+            'kb-1',
+            options=AsyncCrawlOptions(
+                concurrency=2, host_rate=100.0, parse_workers=0, transport=httpx.MockTransport(handler)
+            ),
+        )
+        crawler.manifest = manifest
+        batches = crawler.crawl(f'{BASE}/docs/start', f'{BASE}/docs', max_pages=10, batch_size=10)
+        return sorted(doc.metadata['crawl_url'] for batch in batches for doc in batch)
+
+    first = CrawlManifest(str(tmp_path / 'crawl_manifest.json'))
+    assert crawl(first) == [f'{BASE}/docs/a', f'{BASE}/docs/b', f'{BASE}/docs/start']
+    for path, chunk_hashes in (('/docs/start', []), ('/docs/a', []), ('/docs/b', ['b-1'])):
+        first.assign_chunks(f'{BASE}{path}', chunk_hashes)
+    first.save()
+
+    site['/docs/start'] = _page('Start v2', ['/docs/a'])
+    del site['/docs/b']
+    second = CrawlManifest.load(first.path)
+
+    assert crawl(second) == [f'{BASE}/docs/start']
+    assert second.unchanged_count == 1
+    assert second.take_stale_hashes() == {'b-1'}
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests_at_rate() -> None:
+    bucket = TokenBucket(rate=20.0)
+
+    started = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+    # The first token is available immediately, the next three wait 50ms each
+    assert time.monotonic() - started >= 0.14
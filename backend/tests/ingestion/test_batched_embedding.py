@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from app.features.ingestion.application.chunk_processor import ChunkProcessor
+from app.features.ingestion.application.job_lifecycle import JobLifecycleManager
+from app.features.ingestion.application.pipeline_stage import PipelineContext
+from app.features.ingestion.application.policies import EmbeddingBatchPolicy, RetryPolicy
+from app.features.ingestion.application.stages.embedding_stage import (
+    EmbeddingIndexingStage,
+    EmbeddingProcessingDeps,
+)
+
+
+@dataclass(frozen=True)
+class FakeChunk:
+    content_hash: str
+    text: str = 'text'
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+class FakeEmbedder:
+    def __init__(self, failing_hashes: set[str] | None = None) -> None:
+        self.failing_hashes = failing_hashes or set()
+        self.batch_sizes: list[int] = []
+        self.single_calls: list[str] = []
+
+    async def embed_batch(self, chunks: list[FakeChunk]) -> list[dict[str, Any]]:
+        self.batch_sizes.append(len(chunks))
+        if any(chunk.content_hash in self.failing_hashes for chunk in chunks):
+            raise RuntimeError('provider rejected batch')
+        return [{'hash': chunk.content_hash} for chunk in chunks]
+
+    async def embed(self, chunk: FakeChunk) -> dict[str, Any]:
+        self.single_calls.append(chunk.content_hash)
+        if chunk.content_hash in self.failing_hashes:
+            raise RuntimeError('provider rejected chunk')
+        return {'hash': chunk.content_hash}
+
+
+class FakeIndexer:
+    def __init__(self, existing: set[str] | None = None) -> None:
+        self._existing = existing or set()
+        self.indexed: list[str] = []
+
+    def exists(self, kb_id: str, content_hash: str) -> bool:
+        return content_hash in self._existing
+
+    def index(self, kb_id: str, embedding: dict[str, Any]) -> None:
+        self.indexed.append(embedding['hash'])
+
+
+class FakePhaseRepo:
+    def start_phase(self, job_id: str, phase_name: str) -> None:
+        return None
+
+    def update_progress(self, job_id: str, phase_name: str, **kwargs: Any) -> None:
+        return None
+
+
+class FakeJobRepo:
+    def __init__(self) -> None:
+        self.job_updates: list[dict[str, Any]] = []
+
+    def update_job(self, job_id: str, *, checkpoint: dict[str, Any], counters: dict[str, int]) -> None:
+        self.job_updates.append(dict(checkpoint))
+
+
+def test_batch_policy_reads_kb_config() -> None:
+    policy = EmbeddingBatchPolicy.from_kb_config({'embedding_batch_size': 16, 'embedding_concurrency': 2})
+
+    assert policy.enabled is True
+    assert policy.window_size == 32
+    assert EmbeddingBatchPolicy.from_kb_config({'embedding_batch_size': 0}).enabled is False
+
+
+@pytest.mark.asyncio
+async def test_process_chunks_dedupes_and_batches() -> None:
+    embedder = FakeEmbedder()
+    indexer = FakeIndexer(existing={'b'})
+    processor = ChunkProcessor(RetryPolicy(max_attempts=1), embedder, indexer)  # type: ignore[arg-type]
+    chunks = [FakeChunk('a'), FakeChunk('b'), FakeChunk('c'), FakeChunk('a'), FakeChunk('d')]
+
+    results = await processor.process_chunks(
+        'kb1', chunks, EmbeddingBatchPolicy(micro_batch_size=2, max_in_flight=2)
+    )
+
+    assert [r['skipped'] for r in results] == [False, True, False, True, False]
+    assert all(r['success'] for r in results)
+    assert embedder.batch_sizes == [2]
+    assert embedder.single_calls == ['d']
+    assert indexer.indexed == ['a', 'c', 'd']
+
+
+@pytest.mark.asyncio
+async def test_process_chunks_splits_failed_batches() -> None:
+    embedder = FakeEmbedder(failing_hashes={'c'})
+    indexer = FakeIndexer()
+    processor = ChunkProcessor(RetryPolicy(max_attempts=1), embedder, indexer)  # type: ignore[arg-type]
+    chunks = [FakeChunk(h) for h in 'abcd']
+
+    results = await processor.process_chunks(
+        'kb1', chunks, EmbeddingBatchPolicy(micro_batch_size=4, max_in_flight=1)
+    )
+
+    assert [r['success'] for r in results] == [True, True, False, True]
+    assert embedder.batch_sizes == [4, 2, 2]
+    assert embedder.single_calls == ['c', 'd']
+    assert indexer.indexed == ['a', 'b', 'd']
+
+
+@pytest.mark.asyncio
+async def test_embedding_stage_batched_mode_checkpoints_per_window() -> None:
+    repo = FakeJobRepo()
+    indexer = FakeIndexer()
+    gate_calls: list[str] = []
+
+    async def gate_check(job_id: str, kb_id: str, _indexer: FakeIndexer) -> bool:
+        gate_calls.append(job_id)
+        return True
+
+    stage = EmbeddingIndexingStage(
+        phase_repo=FakePhaseRepo(),  # type: ignore[arg-type]
+        lifecycle=JobLifecycleManager(repo),  # type: ignore[arg-type]
+        processing_deps=EmbeddingProcessingDeps(
+            retry_policy=RetryPolicy(max_attempts=1),
+            embedder=FakeEmbedder(),  # type: ignore[arg-type]
+            indexer=indexer,  # type: ignore[arg-type]
+            gate_check=gate_check,  # type: ignore[arg-type]
+            is_shutdown_requested=lambda: False,
+            batch_policy=EmbeddingBatchPolicy(micro_batch_size=2, max_in_flight=2),
+        ),
+    )
+    context = PipelineContext(
+        kb_id='kb1',
+        job_id='job1',
+        config={},
+        checkpoint={},
+        counters={'chunks_processed': 0, 'chunks_skipped': 0, 'chunks_error': 0},
+        results={'chunks': [FakeChunk(str(i)) for i in range(6)], 'batch_id': 3, 'resume_chunk_index': 0},
+    )
+
+    await stage.execute(context)
+
+    assert indexer.indexed == ['1', '2', '3', '4', '5']
+    assert context.counters['chunks_processed'] == 5
+    assert len(gate_calls) == 2
+    assert [update['resume_chunk_index'] for update in repo.job_updates] == [4, 5]
+    assert context.should_continue() is True
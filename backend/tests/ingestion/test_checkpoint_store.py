@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from app.features.ingestion.domain.indexing import checkpoint_store
+from app.features.ingestion.domain.indexing.checkpoint_store import HashCheckpointStore
+
+
+def test_staged_hashes_are_only_visible_after_commit(tmp_path: Path) -> None:
+    log_path = tmp_path / 'kb1' / 'checkpoint.log'
+    store = HashCheckpointStore(str(log_path))
+    store.load()
+
+    store.stage('a')
+    store.stage('b')
+    assert HashCheckpointStore(str(log_path)).load() == set()
+
+    store.commit()
+    store.stage('c')
+    store.commit()
+
+    assert log_path.read_text(encoding='utf-8') == 'a\nb\nc\n'
+    assert HashCheckpointStore(str(log_path)).load() == {'a', 'b', 'c'}
+
+
+def test_torn_trailing_line_is_ignored(tmp_path: Path) -> None:
+    log_path = tmp_path / 'checkpoint.log'
+    log_path.write_text('a\nb\nhalf', encoding='utf-8')
+
+    assert HashCheckpointStore(str(log_path)).load() == {'a', 'b'}
+
+
+def test_commit_after_torn_tail_starts_on_a_fresh_line(tmp_path: Path) -> None:
+    log_path = tmp_path / 'checkpoint.log'
+    log_path.write_text('a\nb\nhalf', encoding='utf-8')
+
+    store = HashCheckpointStore(str(log_path))
+    store.load()
+    store.stage('c')
+    store.commit()
+
+    assert log_path.read_text(encoding='utf-8') == 'a\nb\nc\n'
+    assert HashCheckpointStore(str(log_path)).load() == {'a', 'b', 'c'}
+
+
+def test_legacy_json_is_migrated_and_removed(tmp_path: Path) -> None:
+    legacy_path = tmp_path / 'checkpoint.json'
+    legacy_path.write_text(json.dumps({'indexed_hashes': ['x', 'y']}), encoding='utf-8')
+    log_path = tmp_path / 'checkpoint.log'
+
+    store = HashCheckpointStore(str(log_path), legacy_json_path=str(legacy_path))
+
+    assert store.load() == {'x', 'y'}
+    assert not legacy_path.exists()
+    assert log_path.read_text(encoding='utf-8') == 'x\ny\n'
+
+
+def test_redundant_lines_trigger_compaction(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(checkpoint_store, 'COMPACTION_SLACK_LINES', 2)
+    log_path = tmp_path / 'checkpoint.log'
+    log_path.write_text('a\na\na\na\nb\n', encoding='utf-8')
+
+    assert HashCheckpointStore(str(log_path)).load() == {'a', 'b'}
+    assert log_path.read_text(encoding='utf-8') == 'a\nb\n'
+
+
+def test_clear_removes_log_and_pending(tmp_path: Path) -> None:
+    log_path = tmp_path / 'checkpoint.log'
+    store = HashCheckpointStore(str(log_path))
+    store.stage('a')
+    store.commit()
+    store.stage('b')
+
+    store.clear()
+
+    assert not log_path.exists()
+    assert store.pending_count == 0
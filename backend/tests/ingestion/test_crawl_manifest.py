@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.features.ingestion.application.pipeline_coordinator import PipelineCoordinator
+from app.features.ingestion.application.pipeline_stage import PipelineContext
+from app.features.ingestion.domain.embedding.embedder import EmbeddingResult
+from app.features.ingestion.domain.indexing import Indexer
+from app.features.ingestion.domain.sources.crawl_manifest import CrawlManifest
+from app.shared.vector_store import VECTOR_STORE_MMAP
+
+URL_A = 'https://docs.example.com/docs/a'
+URL_B = 'https://docs.example.com/docs/b'
+
+
+def _chunk(content_hash: str, url: str) -> SimpleNamespace:
+    return SimpleNamespace(content_hash=content_hash, metadata={'crawl_url': url})
+
+
+def _crawled_manifest(path: Path) -> CrawlManifest:
+    manifest = CrawlManifest(str(path))
+    manifest.record_page(URL_A, etag='"a1"', last_modified=None, content_hash='ha', links=[URL_B])
+    manifest.record_page(URL_B, etag=None, last_modified='Mon, 01 Jan 2024 00:00:00 GMT', content_hash='hb', links=[])
+    manifest.assign_chunks(URL_A, ['a-1', 'a-2'])
+    manifest.assign_chunks(URL_B, ['b-1'])
+    manifest.save()
+    return manifest
+
+
+def test_manifest_round_trips_validators_and_chunks(tmp_path: Path) -> None:
+    _crawled_manifest(tmp_path / 'crawl_manifest.json')
+
+    manifest = CrawlManifest.load(str(tmp_path / 'crawl_manifest.json'))
+
+    assert len(manifest) == 2
+    assert manifest.conditional_headers(URL_A) == {'If-None-Match': '"a1"'}
+    assert manifest.conditional_headers(URL_B) == {'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+    assert manifest.is_unchanged(URL_A, 'ha')
+    assert manifest.mark_unchanged(URL_A) == [URL_B]
+
+
+def test_changed_page_releases_only_chunks_it_no_longer_has(tmp_path: Path) -> None:
+    _crawled_manifest(tmp_path / 'crawl_manifest.json')
+    manifest = CrawlManifest.load(str(tmp_path / 'crawl_manifest.json'))
+
+    manifest.record_page(URL_A, etag='"a2"', last_modified=None, content_hash='ha2', links=[])
+
+    assert manifest.assign_chunks(URL_A, ['a-1', 'a-3']) == {'a-2'}
+    # Pages that were not re-recorded in this run keep their chunks
+    assert manifest.assign_chunks(URL_B, []) == set()
+
+
+def test_discarded_page_keeps_previous_entry_and_chunks(tmp_path: Path) -> None:
+    _crawled_manifest(tmp_path / 'crawl_manifest.json')
+    manifest = CrawlManifest.load(str(tmp_path / 'crawl_manifest.json'))
+
+    manifest.record_page(URL_A, etag='"a2"', last_modified=None, content_hash='ha2', links=[])
+    assert not manifest.is_unchanged(URL_A, 'ha2')
+    manifest.discard_page(URL_A)
+    manifest.save()
+
+    reloaded = CrawlManifest.load(str(tmp_path / 'crawl_manifest.json'))
+    assert reloaded.is_unchanged(URL_A, 'ha')
+    assert reloaded.conditional_headers(URL_A) == {'If-None-Match': '"a1"'}
+    assert manifest.assign_chunks(URL_A, ['a-3']) == set()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_commits_only_pages_whose_chunks_were_all_indexed(tmp_path: Path) -> None:
+    _crawled_manifest(tmp_path / 'crawl_manifest.json')
+    manifest = CrawlManifest.load(str(tmp_path / 'crawl_manifest.json'))
+    manifest.record_page(URL_A, etag=None, last_modified=None, content_hash='ha2', links=[])
+    manifest.record_page(URL_B, etag=None, last_modified=None, content_hash='hb2', links=[])
+
+    chunks = [_chunk('a-3', URL_A), _chunk('b-2', URL_B), _chunk('b-3', URL_B)]
+    context = PipelineContext(kb_id='kb1', job_id='job-1', config={}, checkpoint={}, counters={})
+    context.set_batch_state(
+        batch=[_chunk('', URL_A), _chunk('', URL_B)], batch_id=0, resume_active_batch=False, resume_chunk_index=-1
+    )
+    context.set_chunks(chunks)
+    context.record_failed_chunk(chunks[2])
+    indexer = MagicMock()
+
+    coordinator = PipelineCoordinator(MagicMock(), MagicMock(), MagicMock(), lambda: False, MagicMock())
+    await coordinator._commit_crawled_pages(context, manifest, indexer)
+
+    indexer.delete_chunks.assert_called_once_with('kb1', {'a-1', 'a-2'})
+    assert manifest.is_unchanged(URL_A, 'ha2')
+    assert manifest.is_unchanged(URL_B, 'hb')
+
+
+def test_completed_crawl_drops_pages_that_disappeared(tmp_path: Path) -> None:
+    _crawled_manifest(tmp_path / 'crawl_manifest.json')
+    manifest = CrawlManifest.load(str(tmp_path / 'crawl_manifest.json'))
+
+    manifest.mark_unchanged(URL_A)
+    manifest.complete_crawl()
+
+    assert manifest.take_stale_hashes() == {'b-1'}
+    assert manifest.take_stale_hashes() == set()
+    assert manifest.unchanged_count == 1
+    assert len(manifest) == 1
+
+
+def test_indexer_deletes_chunks_and_compacts_checkpoint(tmp_path: Path) -> None:
+    indexer = Indexer('kb1', storage_base_dir=str(tmp_path), vector_store=VECTOR_STORE_MMAP)
+    for content_hash in ('a-1', 'a-2', 'b-1'):
+        indexer.index(
+            'kb1',
+            EmbeddingResult(vector=[1.0, 0.0], content_hash=content_hash, text=content_hash, metadata={}),
+        )
+    indexer.persist()
+
+    assert indexer.delete_chunks('kb1', {'a-2', 'unknown'}) == 1
+    indexer.persist()
+
+    reloaded = Indexer('kb1', storage_base_dir=str(tmp_path), vector_store=VECTOR_STORE_MMAP)
+    assert not reloaded.exists('kb1', 'a-2')
+    assert reloaded.exists('kb1', 'a-1')
+    assert Path(indexer.checkpoint_file).read_text(encoding='utf-8') == 'a-1\nb-1\n'
+
+
+def test_delete_by_job_removes_crawl_manifest(tmp_path: Path) -> None:
+    indexer = Indexer('kb1', storage_base_dir=str(tmp_path))
+    _crawled_manifest(Path(indexer.crawl_manifest_file))
+
+    indexer.delete_by_job('job-1', 'kb1')
+
+    assert not Path(indexer.crawl_manifest_file).exists()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+
+from app.features.ingestion.application.job_control import JobControlPlane
+from app.features.ingestion.application.job_gate import JobGate
+from app.features.ingestion.application.job_lifecycle import JobLifecycleManager
+from app.features.ingestion.application.progress_writer import (
+    BufferedPhaseRepository,
+    ProgressWriter,
+)
+
+
+class FakeJobRepo:
+    def __init__(self) -> None:
+        self.status_updates: list[tuple[str, str]] = []
+        self.job_updates: list[tuple[str, dict[str, Any] | None, dict[str, Any] | None]] = []
+        self.heartbeats: list[str] = []
+        self.status_reads = 0
+
+    def get_job_status(self, job_id: str) -> str:
+        self.status_reads += 1
+        return 'running'
+
+    def set_job_status(self, job_id: str, *, status: str, **_kwargs: Any) -> None:
+        self.status_updates.append((job_id, status))
+
+    def update_job(
+        self,
+        job_id: str,
+        checkpoint: dict[str, Any] | None = None,
+        counters: dict[str, Any] | None = None,
+    ) -> None:
+        self.job_updates.append((job_id, checkpoint, counters))
+
+    def update_heartbeat(self, job_id: str) -> None:
+        self.heartbeats.append(job_id)
+
+
+class FakePhaseRepo:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+
+    def update_progress(self, job_id: str, phase_name: str, **kwargs: Any) -> None:
+        self.calls.append(('update_progress', phase_name, dict(kwargs)))
+
+    def complete_phase(self, job_id: str, phase_name: str) -> None:
+        self.calls.append(('complete_phase', phase_name, {}))
+
+
+class FakeIndexer:
+    def __init__(self) -> None:
+        self.deleted: list[tuple[str, str]] = []
+
+    def delete_by_job(self, job_id: str, kb_id: str) -> None:
+        self.deleted.append((job_id, kb_id))
+
+
+def _writer(repo: FakeJobRepo, phase_repo: FakePhaseRepo, **kwargs: Any) -> ProgressWriter:
+    kwargs.setdefault('flush_interval', 60.0)
+    kwargs.setdefault('flush_every', 1000)
+    return ProgressWriter(repo, phase_repo, **kwargs)  # type: ignore[arg-type]
+
+
+def test_chunk_progress_is_coalesced_until_batch_boundary() -> None:
+    repo, phase_repo = FakeJobRepo(), FakePhaseRepo()
+    writer = _writer(repo, phase_repo)
+    lifecycle = JobLifecycleManager(repo, progress_writer=writer)  # type: ignore[arg-type]
+    checkpoint: dict[str, Any] = {}
+    counters = {'chunks_processed': 0}
+
+    for chunk_index in range(10):
+        counters['chunks_processed'] += 1
+        lifecycle.record_chunk_progress('job-1', checkpoint, counters, batch_id=0, chunk_index=chunk_index)
+
+    assert repo.job_updates == []
+
+    lifecycle.mark_batch_completed('job-1', checkpoint, counters, batch_id=0)
+
+    assert repo.job_updates == [('job-1', {'last_batch_id': 0}, {'chunks_processed': 10})]
+    assert repo.heartbeats == ['job-1']
+    writer.close()
+
+
+def test_writer_flushes_on_count_cadence() -> None:
+    repo, phase_repo = FakeJobRepo(), FakePhaseRepo()
+    writer = _writer(repo, phase_repo, flush_every=3)
+
+    for index in range(3):
+        writer.submit_job_progress('job-1', {'resume_chunk_index': index}, {'chunks_processed': index})
+
+    deadline = time.monotonic() + 2.0
+    while not repo.job_updates and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert repo.job_updates == [('job-1', {'resume_chunk_index': 2}, {'chunks_processed': 2})]
+    writer.close()
+
+
+def test_phase_transition_flushes_pending_progress_first() -> None:
+    repo, phase_repo = FakeJobRepo(), FakePhaseRepo()
+    writer = _writer(repo, phase_repo)
+    buffered = BufferedPhaseRepository(phase_repo, writer)  # type: ignore[arg-type]
+
+    buffered.update_progress('job-1', 'embedding', items_processed=1)
+    buffered.update_progress('job-1', 'embedding', items_processed=2)
+    buffered.complete_phase('job-1', 'embedding')
+
+    assert phase_repo.calls == [
+        ('update_progress', 'embedding', {'items_processed': 2}),
+        ('complete_phase', 'embedding', {}),
+    ]
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_gate_reads_in_memory_status_and_stops_on_pushed_cancel() -> None:
+    repo = FakeJobRepo()
+    control_plane = JobControlPlane()
+    lifecycle = JobLifecycleManager(
+        repo,  # type: ignore[arg-type]
+        progress_writer=_writer(repo, FakePhaseRepo()),
+        control_plane=control_plane,
+    )
+    gate = JobGate(repo, lifecycle, control_plane)  # type: ignore[arg-type]
+    indexer = FakeIndexer()
+    control_plane.register_job('job-1')
+
+    assert await gate.check('job-1', 'kb-1', indexer) is True  # type: ignore[arg-type]
+
+    lifecycle.request_cancel('job-1')
+
+    assert await gate.check('job-1', 'kb-1', indexer) is False  # type: ignore[arg-type]
+    assert repo.status_reads == 0
+    assert indexer.deleted == [('job-1', 'kb-1')]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import gzip
+
+import httpx
+
+from app.features.ingestion.domain.sources.crawl_manifest import CrawlManifest
+from app.features.ingestion.domain.sources.website.async_crawler import (
+    AsyncCrawlOptions,
+    AsyncWebsiteCrawler,
+)
+from app.features.ingestion.domain.sources.website.sitemap import SitemapEntry, SitemapReader
+
+BASE = 'https://docs.example.com'
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+PARAGRAPH = 'Azure architecture guidance for resilient workloads. ' * 20
+
+
+def _urlset(entries: list[tuple[str, str | None]]) -> str:
+    urls = ''.join(
+        f'<url><loc>{BASE}{path}</loc>' + (f'<lastmod>{lastmod}</lastmod>' if lastmod else '') + '</url>'
+        for path, lastmod in entries
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {NS}>{urls}</urlset>'
+
+
+def _sitemap_index(paths: list[str]) -> str:
+    sitemaps = ''.join(f'<sitemap><loc>{BASE}{path}</loc></sitemap>' for path in paths)
+    return f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex {NS}>{sitemaps}</sitemapindex>'
+
+
+def _page(title: str) -> str:
+    return (
+        f'<html><head><title>{title}</title></head><body><article>'
+        f'<h1>{title}</h1><p>{title}: {PARAGRAPH}</p><a href="/docs/unlisted">more</a>'
+        '</article></body></html>'
+    )
+
+
+def test_reader_follows_robots_declared_index_and_gzip_children() -> None:
+    files = {
+        '/robots.txt': f'User-agent: *\nSitemap: {BASE}/sitemap_index.xml\n'.encode(),
+        '/sitemap_index.xml': _sitemap_index(['/docs.xml.gz', '/blog.xml', '/docs.xml.gz']).encode(),
+        '/docs.xml.gz': gzip.compress(_urlset([('/docs/a', '2024-05-01'), ('/docs/b', None)]).encode()),
+        '/blog.xml': _urlset([('/blog/post', '2024-05-02T10:00:00Z')]).encode(),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = files.get(request.url.path)
+        return httpx.Response(200, content=body) if body else httpx.Response(404)
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        reader = SitemapReader(client)
+        sitemaps = reader.discover(f'{BASE}/docs/start')
+        entries = list(reader.iter_entries(sitemaps))
+
+    assert sitemaps == [f'{BASE}/sitemap_index.xml']
+    assert entries == [
+        SitemapEntry(f'{BASE}/docs/a', '2024-05-01'),
+        SitemapEntry(f'{BASE}/docs/b', None),
+        SitemapEntry(f'{BASE}/blog/post', '2024-05-02T10:00:00Z'),
+    ]
+
+
+def test_reader_defaults_to_sitemap_xml_and_tolerates_missing_sitemap() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        reader = SitemapReader(client)
+        sitemaps = reader.discover(f'{BASE}/docs/start')
+
+        assert sitemaps == [f'{BASE}/sitemap.xml']
+        assert list(reader.iter_entries(sitemaps)) == []
+
+
+def test_manifest_freshness_compares_lastmod_dates() -> None:
+    manifest = CrawlManifest('unused.json')
+    manifest.record_page(f'{BASE}/docs/a', etag=None, last_modified=None, content_hash='h', links=[])
+    manifest.set_lastmod(f'{BASE}/docs/a', '2024-05-01T12:00:00+02:00')
+    assert not manifest.is_fresh(f'{BASE}/docs/a', '2024-05-01T10:00:00Z')
+    manifest.assign_chunks(f'{BASE}/docs/a', [])
+
+    assert manifest.is_fresh(f'{BASE}/docs/a', '2024-05-01T10:00:00Z')
+    assert not manifest.is_fresh(f'{BASE}/docs/a', '2024-05-02')
+    assert not manifest.is_fresh(f'{BASE}/docs/a', None)
+    assert not manifest.is_fresh(f'{BASE}/docs/unknown', '2020-01-01')
+
+
+def test_sitemap_frontier_skips_fresh_pages_without_fetching(tmp_path) -> None:
+    lastmods = {'/docs/a': '2024-05-01', '/docs/b': '2024-05-01'}
+    pages = {'/docs/a': _page('Page A'), '/docs/b': _page('Page B')}
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        requested.append(path)
+        if path == '/robots.txt':
+            return httpx.Response(200, text='User-agent: *\nAllow: /\n')
+        if path == '/sitemap.xml':
+            return httpx.Response(200, text=_urlset([*lastmods.items(), ('/blog/x', None)]))
+        if path in lastmods:
+            return httpx.Response(200, text=pages[path], headers={'content-type': 'text/html'})
+        return httpx.Response(404)
+
+    def crawl(manifest: CrawlManifest) -> list[str]:
+        requested.clear()
+        crawler = AsyncWebsiteCrawler(
+            'kb-1',
+            options=AsyncCrawlOptions(
+                concurrency=2, host_rate=100.0, parse_workers=0, transport=httpx.MockTransport(handler)
+            ),
+        )
+        crawler.manifest = manifest
+        batches = crawler.crawl(f'{BASE}/docs/a', f'{BASE}/docs', max_pages=10, batch_size=10)
+        return sorted(doc.metadata['crawl_url'] for batch in batches for doc in batch)
+
+    first = CrawlManifest(str(tmp_path / 'crawl_manifest.json'))
+    assert crawl(first) == [f'{BASE}/docs/a', f'{BASE}/docs/b']
+    # Sitemap mode does not follow links out of the listed pages
+    assert '/docs/unlisted' not in requested
+    for path in lastmods:
+        first.assign_chunks(f'{BASE}{path}', [])
+    first.save()
+
+    lastmods['/docs/b'] = '2024-06-01'
+    pages['/docs/b'] = _page('Page B v2')
+    second = CrawlManifest.load(first.path)
+
+    assert crawl(second) == [f'{BASE}/docs/b']
+    assert '/docs/a' not in requested
+    assert second.unchanged_count == 1
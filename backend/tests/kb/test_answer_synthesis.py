@@ -0,0 +1,98 @@
+"""Tests for single-synthesis multi-KB answers."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from llama_index.core.schema import NodeWithScore, TextNode
+
+from app.features.knowledge.application.answer_synthesis import RankedNode, merge_ranked_nodes
+from app.features.knowledge.application.query_service import MultiKBQueryService, QueryProfile
+from app.features.knowledge.infrastructure import QueryResultCache
+
+_SVC_MODULE = "app.features.knowledge.application.query_service"
+
+
+def _ranked(kb_id, text, score):
+    return RankedNode(
+        kb_id=kb_id,
+        kb_name=kb_id.upper(),
+        node=NodeWithScore(node=TextNode(text=text, metadata={"url": f"{kb_id}/{text}"}), score=score),
+    )
+
+
+def test_merge_applies_quota_dedupes_and_caps():
+    waf = [_ranked("waf", "a", 0.9), _ranked("waf", "b", 0.8), _ranked("waf", "c", 0.7)]
+    caf = [_ranked("caf", "A ", 0.85), _ranked("caf", "d", 0.6)]
+
+    merged = merge_ranked_nodes([waf, caf], per_kb_quota=2, max_nodes=3)
+
+    assert [(r.kb_id, r.node.node.get_content()) for r in merged] == [
+        ("waf", "a"),
+        ("waf", "b"),
+        ("caf", "d"),
+    ]
+
+
+class FakeKBService:
+    def __init__(self, kb_id, nodes):
+        self.kb_id = kb_id
+        self.kb_name = kb_id.upper()
+        self._nodes = nodes
+
+    def retrieve(self, question, top_k=5, metadata_filters=None, query_embedding=None):
+        return self._nodes
+
+    async def aretrieve(self, question, top_k=5, metadata_filters=None, query_embedding=None):
+        return self._nodes
+
+    def query(self, *args, **kwargs):
+        raise AssertionError("per-KB generation must not run in single mode")
+
+    aquery = query
+
+
+def _service():
+    kb_services = {
+        "waf": FakeKBService("waf", [NodeWithScore(node=TextNode(text="w1"), score=0.9)]),
+        "caf": FakeKBService("caf", [NodeWithScore(node=TextNode(text="c1"), score=0.8)]),
+    }
+    manager = Mock()
+    manager.get_kbs_for_profile.return_value = [
+        SimpleNamespace(id=kb_id, embedding_model="embed-1") for kb_id in kb_services
+    ]
+    service = MultiKBQueryService(manager, query_cache=QueryResultCache())
+    service._get_kb_service = lambda kb_config: kb_services[kb_config.id]
+    service._synthesis_mode = lambda profile: "single"
+    service._embed_question = Mock(return_value={"embed-1": [0.1]})
+    service._aembed_question = AsyncMock(return_value={"embed-1": [0.1]})
+    return service
+
+
+def test_single_mode_makes_one_llm_call():
+    llm = Mock()
+    llm.complete.return_value = SimpleNamespace(text=" merged answer ")
+
+    with patch(f"{_SVC_MODULE}.Settings") as settings:
+        settings.llm = llm
+        result = _service().query_profile("q", QueryProfile.CHAT)
+
+    assert llm.complete.call_count == 1
+    prompt = llm.complete.call_args.args[0]
+    assert "[Source 1 - WAF]\nw1" in prompt and "[Source 2 - CAF]\nc1" in prompt
+    assert result["answer"] == "merged answer"
+    assert result["kbs_queried"] == ["waf", "caf"]
+    assert [source["kb_id"] for source in result["sources"]] == ["waf", "caf"]
+
+
+@pytest.mark.asyncio
+async def test_async_single_mode_makes_one_llm_call():
+    llm = Mock()
+    llm.acomplete = AsyncMock(return_value=SimpleNamespace(text="merged"))
+
+    with patch(f"{_SVC_MODULE}.Settings") as settings:
+        settings.llm = llm
+        result = await _service().aquery_profile("q", QueryProfile.CHAT, deadline_seconds=5)
+
+    assert llm.acomplete.await_count == 1
+    assert result["kb_count"] == 2
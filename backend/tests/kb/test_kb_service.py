@@ -1,32 +1,43 @@
 """Unit tests for KnowledgeBaseService with mocked LlamaIndex."""
 
-import os
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from app.features.knowledge.infrastructure.index_cache import IndexCache
+from app.features.knowledge.infrastructure.service import (
+    KnowledgeBaseService,
+    clear_index_cache,
+    get_cached_index_count,
+)
+
 _SVC_MODULE = "app.features.knowledge.infrastructure.service"
 
 
+def _index_cache(**entries):
+    cache = IndexCache()
+    for storage_dir, index in entries.items():
+        cache.put(storage_dir, f"kb-{storage_dir}", index)
+    return cache
+
+
 def _make_kb_config(**overrides):
     """Create a mock KBConfig with sensible defaults."""
     cfg = Mock()
     cfg.id = overrides.get("id", "test-kb")
     cfg.name = overrides.get("name", "Test KB")
-    cfg.index_path = overrides.get("index_path", "/tmp/test-kb/index")
+    cfg.index_path = overrides.get("index_path", "test-kb/index")
     cfg.embedding_model = overrides.get("embedding_model", "text-embedding-3-small")
     cfg.generation_model = overrides.get("generation_model", "gpt-4o-mini")
     return cfg
 
 
 class TestKnowledgeBaseService:
-    @patch(f"{_SVC_MODULE}._INDEX_CACHE", {})
+    @patch(f"{_SVC_MODULE}.get_index_cache", return_value=_index_cache())
     @patch(f"{_SVC_MODULE}.load_index_from_storage")
     @patch(f"{_SVC_MODULE}.StorageContext")
     @patch("os.path.exists", return_value=True)
-    def test_get_index_loads_and_caches(self, mock_exists, mock_sc, mock_load):
-        from app.features.knowledge.infrastructure.service import KnowledgeBaseService, _INDEX_CACHE
-
+    def test_get_index_loads_and_caches(self, mock_exists, mock_sc, mock_load, mock_get_cache):
         mock_sc_instance = MagicMock()
         mock_sc.from_defaults.return_value = mock_sc_instance
         fake_index = MagicMock()
@@ -38,29 +49,27 @@ class TestKnowledgeBaseService:
         index = svc.get_index()
 
         assert index is fake_index
-        assert cfg.index_path in _INDEX_CACHE
+        assert cfg.index_path in mock_get_cache.return_value
         mock_load.assert_called_once_with(mock_sc_instance)
 
-    @patch(f"{_SVC_MODULE}._INDEX_CACHE")
-    def test_get_index_returns_cached(self, mock_cache):
-        from app.features.knowledge.infrastructure.service import KnowledgeBaseService
-
+    def test_get_index_returns_cached(self, tmp_path):
+        index_path = str(tmp_path / "test-kb" / "index")
         cached_index = MagicMock()
-        mock_cache.__contains__ = Mock(return_value=True)
-        mock_cache.__getitem__ = Mock(return_value=cached_index)
+        cache = _index_cache()
+        cache.put(index_path, "test-kb", cached_index)
 
-        cfg = _make_kb_config()
+        cfg = _make_kb_config(index_path=index_path)
         svc = KnowledgeBaseService(cfg)
         svc._settings_configured = True
-        index = svc.get_index()
+        with patch(f"{_SVC_MODULE}.get_index_cache", return_value=cache):
+            index = svc.get_index()
 
         assert index is cached_index
+        assert cache.stats()["indexes"][0]["hits"] == 1
 
-    @patch(f"{_SVC_MODULE}._INDEX_CACHE", {})
+    @patch(f"{_SVC_MODULE}.get_index_cache", return_value=_index_cache())
     @patch("os.path.exists", return_value=False)
-    def test_get_index_missing_dir_raises(self, mock_exists):
-        from app.features.knowledge.infrastructure.service import KnowledgeBaseService
-
+    def test_get_index_missing_dir_raises(self, mock_exists, mock_get_cache):
         cfg = _make_kb_config()
         svc = KnowledgeBaseService(cfg)
         svc._settings_configured = True
@@ -71,8 +80,6 @@ class TestKnowledgeBaseService:
 
 class TestIsIndexReady:
     def test_ready_when_docstore_exists(self, tmp_path):
-        from app.features.knowledge.infrastructure.service import KnowledgeBaseService
-
         storage = tmp_path / "index"
         storage.mkdir()
         (storage / "docstore.json").write_text("{}")
@@ -82,15 +89,11 @@ class TestIsIndexReady:
         assert svc.is_index_ready() is True
 
     def test_not_ready_when_dir_missing(self, tmp_path):
-        from app.features.knowledge.infrastructure.service import KnowledgeBaseService
-
         cfg = _make_kb_config(index_path=str(tmp_path / "nope"))
         svc = KnowledgeBaseService(cfg)
         assert svc.is_index_ready() is False
 
     def test_not_ready_when_no_docstore(self, tmp_path):
-        from app.features.knowledge.infrastructure.service import KnowledgeBaseService
-
         storage = tmp_path / "index"
         storage.mkdir()
 
@@ -100,23 +103,60 @@ class TestIsIndexReady:
 
 
 class TestCacheHelpers:
-    @patch(f"{_SVC_MODULE}._INDEX_CACHE", {"a": MagicMock(), "b": MagicMock()})
-    def test_clear_specific(self):
-        from app.features.knowledge.infrastructure.service import _INDEX_CACHE, clear_index_cache
-
+    @patch(f"{_SVC_MODULE}.get_index_cache", return_value=_index_cache(a=MagicMock(), b=MagicMock()))
+    def test_clear_specific(self, mock_get_cache):
         clear_index_cache(kb_id="kb-a", storage_dir="a")
-        assert "a" not in _INDEX_CACHE
-        assert "b" in _INDEX_CACHE
-
-    @patch(f"{_SVC_MODULE}._INDEX_CACHE", {"a": MagicMock(), "b": MagicMock()})
-    def test_clear_all(self):
-        from app.features.knowledge.infrastructure.service import _INDEX_CACHE, clear_index_cache
+        assert "a" not in mock_get_cache.return_value
+        assert "b" in mock_get_cache.return_value
 
+    @patch(f"{_SVC_MODULE}.get_index_cache", return_value=_index_cache(a=MagicMock(), b=MagicMock()))
+    def test_clear_all(self, mock_get_cache):
         clear_index_cache()
-        assert len(_INDEX_CACHE) == 0
-
-    @patch(f"{_SVC_MODULE}._INDEX_CACHE", {"x": MagicMock()})
-    def test_get_cached_count(self):
-        from app.features.knowledge.infrastructure.service import get_cached_index_count
+        assert len(mock_get_cache.return_value) == 0
 
+    @patch(f"{_SVC_MODULE}.get_index_cache", return_value=_index_cache(x=MagicMock()))
+    def test_get_cached_count(self, mock_get_cache):
         assert get_cached_index_count() == 1
+
+
+class TestIndexCache:
+    def _write(self, root, name, size):
+        storage = root / name
+        storage.mkdir()
+        (storage / "docstore.json").write_bytes(b"x" * size)
+        return str(storage)
+
+    def test_evicts_least_recently_used_over_budget(self, tmp_path):
+        cache = IndexCache(max_bytes=250)
+        a = self._write(tmp_path, "a", 100)
+        b = self._write(tmp_path, "b", 100)
+        c = self._write(tmp_path, "c", 100)
+        cache.put(a, "kb-a", MagicMock())
+        cache.put(b, "kb-b", MagicMock())
+        cache.get(a)
+        cache.put(c, "kb-c", MagicMock())
+
+        assert a in cache and c in cache and b not in cache
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["total_bytes"] == 200
+        assert [entry["kb_id"] for entry in stats["indexes"]] == ["kb-c", "kb-a"]
+
+    def test_oversized_index_is_kept_alone(self, tmp_path):
+        cache = IndexCache(max_bytes=50)
+        cache.put(self._write(tmp_path, "a", 10), "kb-a", MagicMock())
+        big = self._write(tmp_path, "big", 100)
+        cache.put(big, "kb-big", MagicMock())
+
+        assert len(cache) == 1 and big in cache
+
+    def test_get_or_load_loads_once(self):
+        cache = IndexCache()
+        loader = Mock(return_value=MagicMock())
+
+        first = cache.get_or_load("/nope", "kb", loader)
+        second = cache.get_or_load("/nope", "kb", loader)
+
+        assert first is second
+        loader.assert_called_once()
+        assert cache.stats()["indexes"][0]["load_seconds"] >= 0
@@ -188,3 +188,33 @@ class TestEdgeCases:
         active = mgr.get_active_kbs()
         assert all(kb.id != "inactive-kb" for kb in active)
 
+
+
+class TestWarmUp:
+    def test_warm_up_loads_only_top_priority_kbs(self, kb_env):
+        mgr, config_path, _ = kb_env
+        _write_config(
+            config_path,
+            [
+                _sample_kb("low", priority=5),
+                _sample_kb("high", priority=1),
+                _sample_kb("mid", priority=2),
+            ],
+        )
+        from app.features.knowledge.infrastructure.knowledge_base_manager import KBManager
+
+        mgr = KBManager(config_path=str(config_path))
+
+        loaded: list[str] = []
+
+        def fake_get_index(service):
+            loaded.append(service.kb_id)
+            if service.kb_id == "mid":
+                raise FileNotFoundError("not indexed")
+
+        with patch(f"{_MODULE}.KnowledgeBaseService.get_index", fake_get_index):
+            timing = mgr.warm_up_indices(max_kbs=2, max_workers=2)
+
+        assert sorted(loaded) == ["high", "mid"]
+        assert timing["high"] >= 0
+        assert timing["mid"] == -1.0
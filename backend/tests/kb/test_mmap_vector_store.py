@@ -0,0 +1,112 @@
+"""Tests for the memory-mapped vector store backend."""
+
+import importlib
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from llama_index.core import StorageContext, VectorStoreIndex
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.schema import TextNode
+from llama_index.core.vector_stores.types import (
+    MetadataFilter,
+    MetadataFilters,
+    VectorStoreQuery,
+)
+
+from app.features.ingestion.domain.indexing.indexer import Indexer
+from app.shared.vector_store import MmapVectorStore, is_mmap_store_dir
+
+
+def _node(node_id, embedding, **metadata):
+    return TextNode(id_=node_id, text=f"text {node_id}", metadata=metadata, embedding=embedding)
+
+
+def test_query_ranks_by_cosine_similarity(tmp_path):
+    store = MmapVectorStore(persist_dir=str(tmp_path))
+    store.add([_node("a", [1.0, 0.0]), _node("b", [0.0, 1.0]), _node("c", [1.0, 1.0])])
+    store.persist()
+
+    result = store.query(VectorStoreQuery(query_embedding=[1.0, 0.0], similarity_top_k=2))
+
+    assert result.ids == ["a", "c"]
+    assert result.similarities[0] == 1.0
+    assert result.nodes[0].get_content() == "text a"
+
+
+def test_persisted_rows_are_visible_to_other_instances(tmp_path):
+    writer = MmapVectorStore(persist_dir=str(tmp_path))
+    reader = MmapVectorStore(persist_dir=str(tmp_path))
+    assert reader.node_count == 0
+
+    writer.add([_node("a", [1.0, 0.0])])
+    writer.persist()
+
+    assert reader.contains("a")
+    assert reader.query(VectorStoreQuery(query_embedding=[1.0, 0.0])).ids == ["a"]
+    assert is_mmap_store_dir(str(tmp_path))
+
+
+def test_metadata_filters_and_delete(tmp_path):
+    store = MmapVectorStore(persist_dir=str(tmp_path))
+    store.add(
+        [
+            _node("a", [1.0, 0.0], source="waf"),
+            _node("b", [0.9, 0.1], source="caf"),
+            _node("c", [0.8, 0.2], source="waf"),
+        ]
+    )
+    store.persist()
+
+    filters = MetadataFilters(filters=[MetadataFilter(key="source", value="waf")])
+    query = VectorStoreQuery(query_embedding=[1.0, 0.0], similarity_top_k=5, filters=filters)
+    assert store.query(query).ids == ["a", "c"]
+
+    store.delete_nodes(node_ids=["a"])
+    store.persist()
+    assert store.query(query).ids == ["c"]
+    assert store.compact() == 1
+    assert store.node_count == 2
+
+
+def test_indexer_writes_mmap_store(tmp_path):
+    indexer = Indexer(kb_id="kb1", storage_base_dir=str(tmp_path), vector_store="mmap")
+    indexer.index(
+        "kb1",
+        SimpleNamespace(content_hash="h1", text="hello", metadata={"url": "u"}, vector=[0.1, 0.2]),
+    )
+    indexer.persist()
+
+    reopened = Indexer(kb_id="kb1", storage_base_dir=str(tmp_path), vector_store="mmap")
+    assert reopened.exists("kb1", "h1")
+    assert MmapVectorStore(persist_dir=indexer.storage_dir).get_nodes(["h1"])[0].metadata == {"url": "u"}
+
+
+def test_migration_keys_nodes_by_content_hash(tmp_path):
+    storage_context = StorageContext.from_defaults()
+    VectorStoreIndex(
+        nodes=[_node("uuid-1", [1.0, 0.0], content_hash="hash-1")],
+        storage_context=storage_context,
+        embed_model=MockEmbedding(embed_dim=2),
+    )
+    storage_context.persist(persist_dir=str(tmp_path))
+
+    kb_config = {"vector_store": "simple"}
+    manager = SimpleNamespace(
+        get_kb_storage_path=lambda _kb_id: str(tmp_path),
+        get_kb_config=lambda _kb_id: kb_config,
+        update_kb_config=lambda _kb_id, config: kb_config.update(config),
+    )
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+    try:
+        migrate_script = importlib.import_module("migrate_kb_vector_store")
+    finally:
+        sys.path.pop(0)
+
+    assert migrate_script.migrate_kb(manager, "kb-1") == 1
+
+    store = MmapVectorStore(persist_dir=str(tmp_path))
+    assert store.contains("hash-1")
+    store.delete_nodes(node_ids=["hash-1"])
+    assert store.node_count == 0
+    assert kb_config["vector_store"] == "mmap"
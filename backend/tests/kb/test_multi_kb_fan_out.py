@@ -0,0 +1,81 @@
+"""Tests for the concurrent multi-KB query path."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from app.features.knowledge.application.query_service import MultiKBQueryService, QueryProfile
+from app.features.knowledge.infrastructure import QueryResultCache
+
+
+class FakeKBService:
+    def __init__(self, kb_id, delay=0.0, error=None):
+        self.kb_id = kb_id
+        self.delay = delay
+        self.error = error
+        self.embeddings = []
+
+    async def aquery(self, question, top_k=5, metadata_filters=None, query_embedding=None):
+        self.embeddings.append(query_embedding)
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return {
+            "answer": f"answer from {self.kb_id}",
+            "sources": [{"url": self.kb_id, "score": 0.9, "kb_id": self.kb_id}],
+            "scores": [0.9],
+            "has_results": True,
+            "kb_id": self.kb_id,
+            "kb_name": self.kb_id.upper(),
+        }
+
+
+def _service(kb_services):
+    manager = Mock()
+    manager.get_kbs_for_profile.return_value = [
+        SimpleNamespace(id=kb_id, embedding_model="embed-1", is_active=True)
+        for kb_id in kb_services
+    ]
+    service = MultiKBQueryService(manager, query_cache=QueryResultCache())
+    service._get_kb_service = lambda kb_config: kb_services[kb_config.id]
+    embed_calls = []
+
+    async def fake_embed(question, kb_configs):
+        embed_calls.append(question)
+        return {"embed-1": [0.1, 0.2]}
+
+    service._aembed_question = fake_embed
+    service._synthesis_mode = lambda profile: "per_kb"
+    return service, embed_calls
+
+
+@pytest.mark.asyncio
+async def test_fan_out_embeds_once_and_runs_kbs_concurrently():
+    kb_services = {f"kb{i}": FakeKBService(f"kb{i}", delay=0.1) for i in range(5)}
+    service, embed_calls = _service(kb_services)
+
+    started = asyncio.get_running_loop().time()
+    result = await service.aquery_profile("q", QueryProfile.CHAT, deadline_seconds=5)
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert elapsed < 0.4
+    assert embed_calls == ["q"]
+    assert all(kb.embeddings == [[0.1, 0.2]] for kb in kb_services.values())
+    assert result["kbs_queried"] == ["kb0", "kb1", "kb2", "kb3", "kb4"]
+
+
+@pytest.mark.asyncio
+async def test_slow_and_failing_kbs_are_dropped_at_deadline():
+    kb_services = {
+        "fast": FakeKBService("fast"),
+        "slow": FakeKBService("slow", delay=5),
+        "broken": FakeKBService("broken", error=RuntimeError("boom")),
+    }
+    service, _ = _service(kb_services)
+
+    result = await service.aquery_profile("q", QueryProfile.CHAT, deadline_seconds=0.2)
+
+    assert result["has_results"] is True
+    assert result["kbs_queried"] == ["fast"]
@@ -0,0 +1,92 @@
+"""Tests for the two-level KB query result cache."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from app.features.knowledge.application.query_service import MultiKBQueryService, QueryProfile
+from app.features.knowledge.infrastructure import QueryCacheKey, QueryResultCache
+from app.features.knowledge.infrastructure import query_cache as query_cache_module
+from app.features.knowledge.infrastructure.service import clear_index_cache
+
+RESULT = {"answer": "a", "sources": [], "has_results": True, "kbs_queried": ["waf"]}
+
+
+def _key(question, kb_ids=("waf",), top_k=3):
+    return QueryCacheKey.build(list(kb_ids), question, top_k, None, "profile:chat")
+
+
+def test_exact_hit_normalizes_question_and_kb_order():
+    cache = QueryResultCache()
+    cache.put(_key("What is  WAF?", kb_ids=("waf", "caf")), RESULT)
+
+    hit = cache.get(_key("what is waf?", kb_ids=("caf", "waf")))
+
+    assert hit == RESULT
+    assert hit is not cache.get(_key("what is waf?", kb_ids=("caf", "waf")))
+    assert cache.stats()["exact_hits"] == 2
+
+
+def test_semantic_hit_respects_threshold_and_partition():
+    cache = QueryResultCache(similarity_threshold=0.95)
+    cache.put(_key("reliability pillar"), RESULT, "embed-1", [1.0, 0.0])
+
+    assert cache.get_similar(_key("the reliability pillar"), "embed-1", [0.99, 0.05]) == RESULT
+    assert cache.get_similar(_key("cost pillar"), "embed-1", [0.5, 0.5]) is None
+    assert cache.get_similar(_key("reliability", top_k=5), "embed-1", [1.0, 0.0]) is None
+    assert cache.get_similar(_key("reliability"), "embed-2", [1.0, 0.0]) is None
+
+    stats = cache.stats()
+    assert stats["semantic_hits"] == 1
+    assert stats["misses"] == 3
+
+
+def test_lru_eviction_and_per_kb_invalidation():
+    cache = QueryResultCache(max_entries=2)
+    cache.put(_key("q1"), RESULT)
+    cache.put(_key("q2", kb_ids=("caf",)), RESULT)
+    cache.put(_key("q3"), RESULT)
+    assert cache.get(_key("q1")) is None
+
+    assert cache.invalidate("waf") == 1
+    assert cache.get(_key("q3")) is None
+    assert cache.get(_key("q2", kb_ids=("caf",))) == RESULT
+
+
+def test_clear_index_cache_invalidates_query_cache(monkeypatch, tmp_path):
+    cache = QueryResultCache()
+    cache.put(_key("q1"), RESULT)
+    cache.put(_key("q2", kb_ids=("caf",)), RESULT)
+    monkeypatch.setattr(query_cache_module, "get_query_cache", lambda: cache)
+
+    clear_index_cache(kb_id="waf", storage_dir=str(tmp_path / "waf" / "index"))
+    assert cache.get(_key("q1")) is None
+    assert cache.get(_key("q2", kb_ids=("caf",))) == RESULT
+
+    clear_index_cache()
+    assert cache.stats()["exact_entries"] == 0
+
+
+def test_repeated_profile_query_skips_retrieval_and_generation():
+    kb_service = Mock()
+    kb_service.kb_id, kb_service.kb_name = "waf", "WAF"
+    kb_service.retrieve.return_value = [
+        SimpleNamespace(score=0.9, node=SimpleNamespace(get_content=lambda: "t", metadata={}))
+    ]
+    manager = Mock()
+    manager.get_kbs_for_profile.return_value = [SimpleNamespace(id="waf", embedding_model="embed-1")]
+    service = MultiKBQueryService(manager, query_cache=QueryResultCache())
+    service._get_kb_service = lambda kb_config: kb_service
+    service._embed_question = Mock(return_value={"embed-1": [0.1, 0.2]})
+    service._synthesis_mode = lambda profile: "single"
+    llm = Mock()
+    llm.complete.return_value = SimpleNamespace(text="answer")
+
+    with patch("app.features.knowledge.application.query_service.Settings") as settings:
+        settings.llm = llm
+        first = service.query_profile("What is WAF?", QueryProfile.CHAT)
+        second = service.query_profile("what is waf?", QueryProfile.CHAT)
+
+    assert first == second
+    assert llm.complete.call_count == 1
+    assert kb_service.retrieve.call_count == 1
+    assert service._embed_question.call_count == 1
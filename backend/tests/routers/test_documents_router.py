@@ -6,6 +6,7 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.features.projects.api import get_document_service_dep
 from app.main import app
 from app.models import Project, ProjectDocument, ProjectState
 from app.shared.db.projects_database import get_db
@@ -23,6 +24,26 @@ async def async_client(test_db_session: AsyncSession):
     app.dependency_overrides.clear()
 
 
+@pytest.mark.asyncio
+async def test_upload_documents_reads_files_field_and_background_flag(async_client: AsyncClient) -> None:
+    captured: dict[str, object] = {}
+
+    class _StubDocumentService:
+        async def upload_documents(self, project_id, files, db, *, wait_for_parsing):  # type: ignore[no-untyped-def]
+            captured.update(names=[upload.filename for upload in files], wait_for_parsing=wait_for_parsing)
+            return {"documents": [], "uploadSummary": {}}
+
+    app.dependency_overrides[get_document_service_dep] = _StubDocumentService
+    response = await async_client.post(
+        "/api/projects/proj-1/documents",
+        params={"background": "true"},
+        files=[("files", ("a.txt", b"a", "text/plain"))],
+    )
+
+    assert response.status_code == 200
+    assert captured == {"names": ["a.txt"], "wait_for_parsing": False}
+
+
 @pytest.mark.asyncio
 async def test_upload_documents_returns_summary_and_persists_statuses(
     async_client: AsyncClient,
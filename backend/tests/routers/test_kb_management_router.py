@@ -105,3 +105,24 @@ async def test_health_check(async_client: AsyncClient) -> None:
     data = response.json()
     assert data["overall_status"] == "healthy"
     assert len(data["knowledge_bases"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_query_cache_stats(async_client: AsyncClient, mock_management_service) -> None:
+    mock_management_service.get_query_cache_stats = Mock(return_value={
+        "enabled": True,
+        "exact_hits": 3,
+        "semantic_hits": 1,
+        "misses": 4,
+        "invalidations": 0,
+        "hit_rate": 0.5,
+        "exact_entries": 4,
+        "semantic_entries": 4,
+        "max_entries": 512,
+        "similarity_threshold": 0.97,
+    })
+    response = await async_client.get("/api/kb/query-cache/stats")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["exact_hits"] == 3
+    assert data["hit_rate"] == 0.5
@@ -1,6 +1,6 @@
 """Tests for KB query router endpoints."""
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -18,7 +18,7 @@ from app.shared.db.projects_database import get_db
 @pytest.fixture
 def mock_query_service():
     svc = Mock()
-    svc.query_with_profile = Mock(return_value={
+    svc.query_with_profile = AsyncMock(return_value={
         "answer": "Test answer",
         "sources": [{"url": "https://example.com", "title": "Example", "section": "s1", "score": 0.9}],
         "has_results": True,
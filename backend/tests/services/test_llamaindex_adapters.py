@@ -0,0 +1,94 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from llama_index.core.base.llms.types import ChatMessage, MessageRole
+
+from app.shared.ai.adapters import AIServiceEmbedding, AIServiceLLM
+from app.shared.ai.ai_service import AIService
+from app.shared.ai.interfaces import LLMResponse
+
+
+class _FakeAIService(AIService):
+    def __init__(self) -> None:
+        self.config = SimpleNamespace(default_temperature=0.0, default_max_tokens=64)
+        self.loops: list[asyncio.AbstractEventLoop] = []
+        self.batch_calls: list[list[str]] = []
+
+    def get_llm_model(self) -> str:
+        return "fake-llm"
+
+    def get_embedding_model(self) -> str:
+        return "fake-embed"
+
+    async def complete(self, prompt, temperature=None, max_tokens=None, **kwargs):
+        self.loops.append(asyncio.get_running_loop())
+        return f"completed: {prompt}"
+
+    async def chat(self, messages, temperature=None, max_tokens=None, **kwargs):
+        self.loops.append(asyncio.get_running_loop())
+        return LLMResponse(content=f"echo: {messages[-1].content}", model="fake-llm")
+
+    async def embed_text(self, text):
+        self.loops.append(asyncio.get_running_loop())
+        return [float(len(text)), 1.0]
+
+    async def embed_batch(self, texts, batch_size=100):
+        self.batch_calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_async_methods_run_on_the_callers_loop():
+    service = _FakeAIService()
+    llm = AIServiceLLM(service)
+    caller_loop = asyncio.get_running_loop()
+
+    completion = await llm.acomplete("hi")
+    chat = await llm.achat([ChatMessage(role=MessageRole.USER, content="ping")])
+
+    assert completion.text == "completed: hi"
+    assert chat.message.content == "echo: ping"
+    assert service.loops == [caller_loop, caller_loop]
+
+
+@pytest.mark.asyncio
+async def test_sync_shims_use_bridge_loop_inside_running_loop():
+    service = _FakeAIService()
+    llm = AIServiceLLM(service)
+    embedding = AIServiceEmbedding(service)
+
+    assert llm.complete("hi").text == "completed: hi"
+    assert embedding.get_query_embedding("abc") == [3.0, 1.0]
+
+    caller_loop = asyncio.get_running_loop()
+    assert len(set(service.loops)) == 1
+    assert service.loops[0] is not caller_loop
+
+
+@pytest.mark.asyncio
+async def test_sync_calls_from_worker_threads_do_not_serialize():
+    class _SlowAIService(_FakeAIService):
+        async def complete(self, prompt, temperature=None, max_tokens=None, **kwargs):
+            await asyncio.sleep(0.2)
+            return prompt
+
+    llm = AIServiceLLM(_SlowAIService())
+
+    started = asyncio.get_running_loop().time()
+    results = await asyncio.gather(*(asyncio.to_thread(llm.complete, f"q{i}") for i in range(4)))
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert [r.text for r in results] == ["q0", "q1", "q2", "q3"]
+    assert elapsed < 0.6
+
+
+@pytest.mark.asyncio
+async def test_async_batch_embedding_uses_single_call():
+    service = _FakeAIService()
+    embedding = AIServiceEmbedding(service)
+
+    vectors = await embedding.aget_text_embedding_batch(["a", "bb"])
+
+    assert vectors == [[1.0, 1.0], [2.0, 1.0]]
+    assert service.batch_calls == [["a", "bb"]]
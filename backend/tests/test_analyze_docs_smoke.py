@@ -30,7 +30,9 @@ async def test_analyze_docs_persists_ingestion_stats_and_requirements(monkeypatc
         await conn.run_sync(Base.metadata.create_all)
 
     class _StubLlmService:
-        async def analyze_documents(self, document_texts: list[str]) -> dict:
+        model = "stub-model"
+
+        async def analyze_documents(self, document_texts: list[str], limiter: object = None) -> dict:
             return {
                 "context": {
                     "summary": "Architecture summary",
@@ -0,0 +1,157 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.features.projects.application.document_service import DocumentService
+from app.models import DocumentAnalysisCacheEntry, Project, ProjectDocument
+from app.models.project import Base
+
+
+class _CountingLlmService:
+    model = "stub-model"
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    async def analyze_documents(self, document_texts: list[str], limiter: object = None) -> dict:
+        self.calls.append(document_texts)
+        header, _, body = document_texts[0].partition("\n---\n")
+        document_id = header.split("\n", 1)[0].removeprefix("DocumentId: ")
+        return {
+            "context": {"summary": "Summary"},
+            "requirements": [
+                {
+                    "category": "functional",
+                    "text": f"Requirement from {body}",
+                    "sources": [{"documentId": document_id, "fileName": f"{document_id}.txt"}],
+                }
+            ],
+            "clarificationQuestions": [],
+        }
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reanalysis_only_calls_llm_for_new_or_changed_documents(
+    monkeypatch: pytest.MonkeyPatch, session_factory
+) -> None:
+    stub = _CountingLlmService()
+    from app.shared.ai import llm_service  # noqa: PLC0415
+
+    monkeypatch.setattr(llm_service, "get_llm_service", lambda: stub)
+
+    async with session_factory() as session:
+        session.add(Project(id="p-1", name="Workshop"))
+        session.add_all(
+            [
+                ProjectDocument(id="d-1", project_id="p-1", file_name="d-1.txt", mime_type="text/plain", raw_text="alpha"),
+                ProjectDocument(id="d-2", project_id="p-1", file_name="d-2.txt", mime_type="text/plain", raw_text="beta"),
+            ]
+        )
+        await session.commit()
+
+        service = DocumentService()
+        first = await service.analyze_documents("p-1", session)
+        assert len(stub.calls) == 2
+        assert first["analysisSummary"]["cachedDocuments"] == 0
+        first_run = first["analysisSummary"]["runId"]
+
+        session.add(
+            ProjectDocument(id="d-3", project_id="p-1", file_name="d-3.txt", mime_type="text/plain", raw_text="gamma")
+        )
+        await session.commit()
+        second = await service.analyze_documents("p-1", session)
+
+        assert len(stub.calls) == 3
+        assert stub.calls[-1][0].startswith("DocumentId: d-3")
+        assert second["analysisSummary"]["cachedDocuments"] == 2
+        assert [r["text"] for r in second["requirements"]] == [
+            "Requirement from alpha",
+            "Requirement from beta",
+            "Requirement from gamma",
+        ]
+        reused = await session.get(ProjectDocument, "d-1")
+        assert reused is not None
+        assert reused.last_analysis_run_id == first_run
+
+        changed = await session.get(ProjectDocument, "d-2")
+        assert changed is not None
+        changed.raw_text = "beta v2"
+        await session.commit()
+        await service.analyze_documents("p-1", session)
+
+        assert len(stub.calls) == 4
+        assert stub.calls[-1][0].startswith("DocumentId: d-2")
+        cache_rows = (await session.execute(select(DocumentAnalysisCacheEntry))).scalars().all()
+        assert len(cache_rows) == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_result_is_rebound_to_reuploaded_document(
+    monkeypatch: pytest.MonkeyPatch, session_factory
+) -> None:
+    stub = _CountingLlmService()
+    from app.shared.ai import llm_service  # noqa: PLC0415
+
+    monkeypatch.setattr(llm_service, "get_llm_service", lambda: stub)
+
+    async with session_factory() as session:
+        session.add(Project(id="p-1", name="Workshop"))
+        session.add(
+            ProjectDocument(id="d-1", project_id="p-1", file_name="old.txt", mime_type="text/plain", raw_text="alpha")
+        )
+        await session.commit()
+        service = DocumentService()
+        await service.analyze_documents("p-1", session)
+
+        await session.delete(await session.get(ProjectDocument, "d-1"))
+        session.add(
+            ProjectDocument(id="d-9", project_id="p-1", file_name="new.txt", mime_type="text/plain", raw_text="alpha")
+        )
+        await session.commit()
+        state = await service.analyze_documents("p-1", session)
+
+        assert len(stub.calls) == 1
+        assert state["requirements"][0]["sources"][0]["documentId"] == "d-9"
+        assert state["requirements"][0]["sources"][0]["fileName"] == "new.txt"
+
+
+@pytest.mark.asyncio
+async def test_llm_calls_run_outside_a_database_transaction(
+    monkeypatch: pytest.MonkeyPatch, session_factory
+) -> None:
+    open_transactions: list[bool] = []
+
+    async with session_factory() as session:
+
+        class _TransactionCheckingLlmService(_CountingLlmService):
+            async def analyze_documents(self, document_texts: list[str], limiter: object = None) -> dict:
+                open_transactions.append(session.in_transaction())
+                return await super().analyze_documents(document_texts, limiter)
+
+        from app.shared.ai import llm_service  # noqa: PLC0415
+
+        monkeypatch.setattr(llm_service, "get_llm_service", _TransactionCheckingLlmService)
+
+        session.add(Project(id="p-1", name="Workshop"))
+        session.add(
+            ProjectDocument(id="d-1", project_id="p-1", file_name="d-1.txt", mime_type="text/plain", raw_text="alpha")
+        )
+        await session.commit()
+
+        await DocumentService().analyze_documents("p-1", session)
+
+    assert open_transactions == [False]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.shared.ai.document_analysis import merge_partial_states, split_documents_by_budget
+from app.shared.ai.llm_service import LLMService
+
+
+def _words(text: str) -> int:
+    return len(text.split())
+
+
+def _doc(doc_id: str, body: str) -> str:
+    return f"DocumentId: {doc_id}\nFileName: {doc_id}.md\n---\n{body}"
+
+
+def test_split_keeps_small_documents_whole_and_repeats_header_for_large_ones() -> None:
+    small = _doc("a", "one two three")
+    large = _doc("b", "\n\n".join(f"paragraph {i} " + "word " * 8 for i in range(6)))
+
+    chunks = split_documents_by_budget([small, large], budget=30, count_tokens=_words)
+
+    assert len(chunks) > 2
+    assert chunks[0].startswith(small)
+    assert all(_words(chunk) <= 30 for chunk in chunks)
+    assert all("DocumentId: b" in chunk for chunk in chunks[1:])
+
+
+def test_merge_dedupes_requirements_and_remaps_question_indexes() -> None:
+    first = {
+        "context": {"summary": "Retail platform"},
+        "requirements": [
+            {"text": "Must support SSO.", "priority": "medium", "sources": [{"documentId": "a"}]},
+        ],
+        "clarificationQuestions": [
+            {"question": "Which IdP?", "relatedRequirementIndexes": [0], "priority": 2},
+        ],
+    }
+    second = {
+        "context": {"summary": "Retail platform"},
+        "requirements": [
+            {"text": "Store data in EU", "priority": "high", "sources": [{"documentId": "b"}]},
+            {"text": "must support sso", "priority": "high", "sources": [{"documentId": "b"}]},
+        ],
+        "clarificationQuestions": [
+            {"question": "which IdP", "relatedRequirementIndexes": [1], "priority": 1},
+        ],
+    }
+
+    merged = merge_partial_states([first, second])
+
+    assert [r["text"] for r in merged["requirements"]] == ["Must support SSO.", "Store data in EU"]
+    assert merged["requirements"][0]["priority"] == "high"
+    assert merged["requirements"][0]["sources"] == [{"documentId": "a"}, {"documentId": "b"}]
+    assert merged["clarificationQuestions"] == [
+        {"question": "Which IdP?", "relatedRequirementIndexes": [0], "priority": 1}
+    ]
+    assert merged["context"] == {"summary": "Retail platform"}
+
+
+@pytest.mark.asyncio
+async def test_analyze_documents_runs_chunks_with_bounded_concurrency(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ai_service = SimpleNamespace(get_llm_model=lambda: "gpt-test")
+    settings = SimpleNamespace(llm_analyze_chunk_tokens=10, llm_analyze_concurrency=2)
+    monkeypatch.setattr("app.shared.ai.llm_service.get_ai_service", lambda: ai_service)
+    monkeypatch.setattr("app.shared.ai.llm_service.get_app_settings", lambda: settings)
+
+    service = LLMService()
+    service._token_counter = SimpleNamespace(count_tokens=_words)
+    in_flight = 0
+    peak = 0
+
+    async def fake_chunk(text: str) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        doc_id = text.split("\n", 1)[0].removeprefix("DocumentId: ")
+        # later chunks finish first; the merge must still follow chunk order
+        await asyncio.sleep(0.01 * (5 - int(doc_id)))
+        in_flight -= 1
+        return {"requirements": [{"text": f"req {doc_id}", "sources": [{"documentId": doc_id}]}]}
+
+    monkeypatch.setattr(service, "_analyze_chunk", fake_chunk)
+    events: list[tuple[str, str | None]] = []
+
+    docs = [_doc(str(i), "alpha beta gamma delta") for i in range(5)]
+    result = await service.analyze_documents(docs, lambda stage, detail=None: events.append((stage, detail)))
+
+    assert peak == 2
+    assert [r["text"] for r in result["requirements"]] == [f"req {i}" for i in range(5)]
+    stages = [stage for stage, _ in events]
+    assert stages[0] == "analysis_started"
+    assert stages.count("analysis_chunk") == 5
+    assert stages[-1] == "analysis_merged"
+
+
+@pytest.mark.asyncio
+async def test_analyze_documents_single_chunk_keeps_single_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    ai_service = SimpleNamespace(get_llm_model=lambda: "gpt-test")
+    settings = SimpleNamespace(llm_analyze_chunk_tokens=1000, llm_analyze_concurrency=2)
+    monkeypatch.setattr("app.shared.ai.llm_service.get_ai_service", lambda: ai_service)
+    monkeypatch.setattr("app.shared.ai.llm_service.get_app_settings", lambda: settings)
+
+    service = LLMService()
+    service._token_counter = SimpleNamespace(count_tokens=_words)
+    calls: list[str] = []
+
+    async def fake_chunk(text: str) -> dict[str, Any]:
+        calls.append(text)
+        return {"requirements": []}
+
+    monkeypatch.setattr(service, "_analyze_chunk", fake_chunk)
+
+    await service.analyze_documents([_doc("1", "a b"), _doc("2", "c d")])
+
+    assert calls == [f"{_doc('1', 'a b')}\n\n---\n\n{_doc('2', 'c d')}"]
+
+
+@pytest.mark.asyncio
+async def test_shared_limiter_bounds_concurrent_analyze_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    ai_service = SimpleNamespace(get_llm_model=lambda: "gpt-test")
+    settings = SimpleNamespace(llm_analyze_chunk_tokens=10, llm_analyze_concurrency=2)
+    monkeypatch.setattr("app.shared.ai.llm_service.get_ai_service", lambda: ai_service)
+    monkeypatch.setattr("app.shared.ai.llm_service.get_app_settings", lambda: settings)
+
+    service = LLMService()
+    service._token_counter = SimpleNamespace(count_tokens=_words)
+    in_flight = 0
+    peak = 0
+
+    async def fake_chunk(text: str) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"requirements": []}
+
+    monkeypatch.setattr(service, "_analyze_chunk", fake_chunk)
+
+    limiter = asyncio.Semaphore(2)
+    multi_chunk = [_doc(str(i), "alpha beta gamma delta") for i in range(3)]
+    await asyncio.gather(
+        *(service.analyze_documents(multi_chunk, limiter=limiter) for _ in range(3)),
+        service.analyze_documents([_doc("9", "a b")], limiter=limiter),
+    )
+
+    assert peak == 2
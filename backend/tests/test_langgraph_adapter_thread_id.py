@@ -36,12 +36,13 @@ def _parse_sse_event(event: str) -> tuple[str, dict[str, object]]:
 @pytest.mark.asyncio
 async def test_execute_project_chat_generates_thread_id_when_missing(monkeypatch) -> None:
     graph = _ProjectChatGraphStub()
-    monkeypatch.setattr(adapter_module, "build_project_chat_graph", lambda *_args: graph)
+    monkeypatch.setattr(adapter_module, "get_project_chat_graph", lambda: graph)
+    db = object()
 
     payload = await adapter_module.execute_project_chat(
         "proj-1",
         "Help me design this system",
-        db=object(),  # type: ignore[arg-type]
+        db=db,  # type: ignore[arg-type]
         thread_id=None,
     )
 
@@ -57,7 +58,13 @@ async def test_execute_project_chat_generates_thread_id_when_missing(monkeypatch
                 "success": False,
                 "retry_count": 0,
             },
-            {"configurable": {"thread_id": payload["thread_id"]}},
+            {
+                "configurable": {
+                    "thread_id": payload["thread_id"],
+                    "db": db,
+                    "response_message_id": graph.calls[0][1]["configurable"]["response_message_id"],
+                }
+            },
         )
     ]
 
@@ -65,14 +72,15 @@ async def test_execute_project_chat_generates_thread_id_when_missing(monkeypatch
 @pytest.mark.asyncio
 async def test_execute_project_chat_stream_generates_thread_id_when_missing(monkeypatch) -> None:
     graph = _ProjectChatGraphStub()
-    monkeypatch.setattr(adapter_module, "build_project_chat_graph", lambda *_args: graph)
+    monkeypatch.setattr(adapter_module, "get_project_chat_graph", lambda: graph)
+    db = object()
 
     events = [
         chunk
         async for chunk in adapter_module.execute_project_chat_stream(
             "proj-1",
             "Stream a response",
-            db=object(),  # type: ignore[arg-type]
+            db=db,  # type: ignore[arg-type]
             thread_id=None,
         )
     ]
@@ -95,6 +103,8 @@ async def test_execute_project_chat_stream_generates_thread_id_when_missing(monk
             {
                 "configurable": {
                     "thread_id": final_payload["thread_id"],
+                    "db": db,
+                    "response_message_id": graph.calls[0][1]["configurable"]["response_message_id"],
                     "event_callback": graph.calls[0][1]["configurable"]["event_callback"],
                 }
             },
@@ -36,3 +36,91 @@ def test_documents_additive_migration_is_idempotent() -> None:
         assert "analyzed_at" in columns
         assert "last_analysis_run_id" in columns
 
+
+
+def test_project_state_write_tracking_migration_is_idempotent() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE documents (id TEXT PRIMARY KEY)"))
+        connection.execute(
+            text("CREATE TABLE project_states (project_id TEXT PRIMARY KEY, state TEXT, updated_at TEXT)")
+        )
+        connection.execute(text("INSERT INTO project_states VALUES ('p-1', '{}', 't')"))
+        connection.execute(
+            text(
+                "CREATE TABLE project_state_components "
+                "(project_id TEXT, component_key TEXT, payload_json TEXT, updated_at TEXT)"
+            )
+        )
+
+        _run_additive_schema_migrations(connection)
+        _run_additive_schema_migrations(connection)
+
+        version = connection.execute(text("SELECT version FROM project_states")).scalar_one()
+        assert version == 1
+        columns = {
+            str(row[1])
+            for row in connection.execute(text("PRAGMA table_info(project_state_components)")).fetchall()
+        }
+        assert "content_hash" in columns
+
+
+def test_message_keyset_index_migration_is_idempotent() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE documents (id TEXT PRIMARY KEY)"))
+        connection.execute(
+            text(
+                "CREATE TABLE messages "
+                "(id TEXT PRIMARY KEY, project_id TEXT, thread_id TEXT, timestamp TEXT)"
+            )
+        )
+
+        _run_additive_schema_migrations(connection)
+        _run_additive_schema_migrations(connection)
+
+        indexes = {
+            str(row[1]) for row in connection.execute(text("PRAGMA index_list(messages)")).fetchall()
+        }
+        assert "ix_messages_project_thread_timestamp" in indexes
+
+
+def test_checklist_latest_status_migration_backfills_and_is_idempotent() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE documents (id TEXT PRIMARY KEY)"))
+        connection.execute(
+            text("CREATE TABLE checklist_items (id TEXT PRIMARY KEY, checklist_id TEXT, severity TEXT)")
+        )
+        connection.execute(
+            text(
+                "CREATE TABLE checklist_item_evaluations "
+                "(id TEXT PRIMARY KEY, item_id TEXT, status TEXT, created_at DATETIME)"
+            )
+        )
+        connection.execute(
+            text("INSERT INTO checklist_items VALUES ('i-1', 'c-1', 'HIGH'), ('i-2', 'c-1', 'LOW')")
+        )
+        connection.execute(
+            text(
+                "INSERT INTO checklist_item_evaluations VALUES "
+                "('e-1', 'i-1', 'OPEN', '2026-04-01 10:00:00'), "
+                "('e-2', 'i-1', 'FIXED', '2026-04-02 10:00:00')"
+            )
+        )
+
+        _run_additive_schema_migrations(connection)
+        _run_additive_schema_migrations(connection)
+
+        rows = connection.execute(
+            text("SELECT id, latest_status, latest_evaluated_at FROM checklist_items ORDER BY id")
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [
+            ("i-1", "FIXED", "2026-04-02 10:00:00"),
+            ("i-2", "OPEN", None),
+        ]
+        indexes = {
+            str(row[1])
+            for row in connection.execute(text("PRAGMA index_list(checklist_items)")).fetchall()
+        }
+        assert "ix_item_checklist_latest_status" in indexes
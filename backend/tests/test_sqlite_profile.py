@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.shared.db.sqlite_profile import (
+    RoutingSession,
+    SQLiteProfile,
+    install_sqlite_pragmas,
+    is_file_database,
+)
+
+PROFILE = SQLiteProfile(reader_pool_size=2)
+
+
+def _engines(db_path):
+    url = f"sqlite:///{db_path}"
+    writer = create_engine(url, pool_size=1, max_overflow=0)
+    reader = create_engine(url, pool_size=2)
+    install_sqlite_pragmas(writer, PROFILE)
+    install_sqlite_pragmas(reader, PROFILE, read_only=True)
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    return writer, reader
+
+
+def test_pragmas_are_applied_per_connection(tmp_path) -> None:
+    writer, reader = _engines(tmp_path / "profile.db")
+
+    with writer.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == PROFILE.busy_timeout_ms
+    with reader.connect() as conn:
+        assert conn.execute(text("PRAGMA query_only")).scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO items (name) VALUES ('x')"))
+
+
+def test_routing_session_reads_from_pool_until_it_writes(tmp_path) -> None:
+    writer, reader = _engines(tmp_path / "routing.db")
+    factory = sessionmaker(class_=RoutingSession, writer_bind=writer, reader_bind=reader)
+    items = text("SELECT count(*) FROM items")
+
+    with factory() as session:
+        assert session.get_bind(clause=select(1)) is reader
+        assert session.execute(items).scalar() == 0
+
+        session.execute(text("INSERT INTO items (name) VALUES ('a')"))
+        # Sticky to the writer, so the session sees its own uncommitted row
+        assert session.get_bind(clause=select(1)) is writer
+        assert session.execute(items).scalar() == 1
+        session.commit()
+        # The committed session no longer needs the writer for reads
+        assert session.get_bind(clause=select(1)) is reader
+
+    with factory() as session:
+        assert session.execute(items).scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_wal_readers_are_not_blocked_by_open_write_transaction(tmp_path) -> None:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'async.db'}"
+    writer = create_async_engine(
+        url, poolclass=AsyncAdaptedQueuePool, pool_size=1, max_overflow=0
+    )
+    reader = create_async_engine(url, poolclass=AsyncAdaptedQueuePool, pool_size=2)
+    install_sqlite_pragmas(writer.sync_engine, PROFILE)
+    install_sqlite_pragmas(reader.sync_engine, PROFILE, read_only=True)
+    factory = async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        writer_bind=writer.sync_engine,
+        reader_bind=reader.sync_engine,
+    )
+    async with writer.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+
+    async with factory() as writing, factory() as reading:
+        await writing.execute(text("INSERT INTO items (name) VALUES ('a')"))
+        count = await reading.execute(text("SELECT count(*) FROM items"))
+        assert count.scalar() == 0
+        await writing.commit()
+
+    async with factory() as reading:
+        assert (await reading.execute(text("SELECT count(*) FROM items"))).scalar() == 1
+
+    await reader.dispose()
+    await writer.dispose()
+
+
+def test_in_memory_databases_have_no_reader_pool() -> None:
+    assert not is_file_database("sqlite+aiosqlite:///:memory:")
+    assert is_file_database("sqlite+aiosqlite:////tmp/projects.db")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+"""Compare per-item and set-based checklist sync on a synthetic template.
+
+Runs both write paths of ``ChecklistSyncWriter`` against a fresh temporary
+SQLite database and reports SQL statement counts and wall time for a first
+sync (all inserts) and a repeat sync (no changes).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+
+def _ensure_backend_on_path() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    backend_path = repo_root / "backend"
+    if str(backend_path) not in sys.path:
+        sys.path.insert(0, str(backend_path))
+
+
+_ensure_backend_on_path()
+
+from app.features.checklists.infrastructure.registry import ChecklistRegistry  # noqa: E402
+from app.features.checklists.infrastructure.sync_writer import (  # noqa: E402
+    ChecklistSyncTarget,
+    ChecklistSyncWriter,
+)
+from app.features.checklists.infrastructure.template_resolver import (  # noqa: E402
+    ChecklistTemplateResolver,
+)
+from app.models.checklist import ChecklistTemplate  # noqa: E402
+from app.models.project import Base, Project  # noqa: E402
+from app.shared.config.app_settings import get_app_settings  # noqa: E402
+
+_TEMPLATE_SLUG = "benchmark-waf"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--evaluations-per-item", type=int, default=2)
+    return parser.parse_args()
+
+
+def _template(item_count: int) -> ChecklistTemplate:
+    return ChecklistTemplate(
+        slug=_TEMPLATE_SLUG,
+        title="Benchmark WAF",
+        description="Synthetic template for sync benchmarks",
+        version="1.0",
+        source="benchmark",
+        source_url="https://example.com",
+        source_version="1.0",
+        content={
+            "items": [
+                {
+                    "id": f"item-{index}",
+                    "title": f"Item {index}",
+                    "pillar": "Reliability",
+                    "severity": "medium",
+                }
+                for index in range(item_count)
+            ]
+        },
+    )
+
+
+def _item_payloads(item_count: int, evaluations_per_item: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"item-{index}",
+            "evaluations": [
+                {"id": f"eval-{index}-{n}", "status": "open", "evidence": f"evidence {index}/{n}"}
+                for n in range(evaluations_per_item)
+            ],
+        }
+        for index in range(item_count)
+    ]
+
+
+async def _run_path(
+    *,
+    bulk: bool,
+    item_count: int,
+    evaluations_per_item: int,
+    work_dir: Path,
+) -> dict[str, Any]:
+    settings = get_app_settings()
+    database_path = work_dir / f"{'bulk' if bulk else 'per_item'}.db"
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, *_):
+        nonlocal statements
+        statements += 1
+
+    cache_dir = work_dir / "templates"
+    cache_dir.mkdir(exist_ok=True)
+    registry = ChecklistRegistry(cache_dir=cache_dir, settings=settings)
+    template = _template(item_count)
+    registry.register_template(template)
+    resolver = ChecklistTemplateResolver(registry)
+    writer = ChecklistSyncWriter(resolver, namespace_uuid=uuid4())
+    payloads = _item_payloads(item_count, evaluations_per_item)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    project_id = str(uuid4())
+    async with session_factory() as session:
+        session.add(Project(id=project_id, name="Benchmark"))
+        await session.commit()
+
+    runs: dict[str, Any] = {}
+    for label in ("first_sync", "repeat_sync"):
+        statements = 0
+        started = time.perf_counter()
+        async with session_factory() as session:
+            template_record = await writer.get_or_create_template_record(session, template)
+            checklist = await writer.get_or_create_checklist(session, project_id, template_record)
+            if bulk:
+                created = await writer.sync_items_bulk(
+                    session=session,
+                    target=ChecklistSyncTarget(checklist, template, project_id),
+                    item_payloads=payloads,
+                    chunk_size=int(settings.waf_sync_chunk_size),
+                )
+            else:
+                created = 0
+                for payload in payloads:
+                    created += await writer.sync_item_from_payload(
+                        session=session,
+                        checklist=checklist,
+                        item_payload=payload,
+                        template=template,
+                        project_id=project_id,
+                    )
+                await session.flush()
+            await session.commit()
+        runs[label] = {
+            "statements": statements,
+            "seconds": round(time.perf_counter() - started, 4),
+            "evaluationsCreated": created,
+        }
+
+    await engine.dispose()
+    return runs
+
+
+async def _main() -> int:
+    args = _parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        per_item = await _run_path(
+            bulk=False,
+            item_count=args.items,
+            evaluations_per_item=args.evaluations_per_item,
+            work_dir=work_dir,
+        )
+        bulk = await _run_path(
+            bulk=True,
+            item_count=args.items,
+            evaluations_per_item=args.evaluations_per_item,
+            work_dir=work_dir,
+        )
+
+    print(
+        json.dumps(
+            {
+                "items": args.items,
+                "evaluationsPerItem": args.evaluations_per_item,
+                "perItem": per_item,
+                "bulk": bulk,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(_main()))
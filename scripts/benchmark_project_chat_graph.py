@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Measure per-turn project chat graph setup cost.
+
+Compares building and compiling the LangGraph project chat graph on every
+turn against reusing the shared compiled graph.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+
+def _ensure_backend_on_path() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    backend_path = repo_root / "backend"
+    if str(backend_path) not in sys.path:
+        sys.path.insert(0, str(backend_path))
+
+
+_ensure_backend_on_path()
+
+from app.agents_system.langgraph.graph_factory import (  # noqa: E402
+    build_project_chat_graph,
+    get_project_chat_graph,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=200)
+    return parser.parse_args()
+
+
+def _per_turn_ms(build, turns: int) -> float:  # type: ignore[no-untyped-def]
+    started = time.perf_counter()
+    for _ in range(turns):
+        build()
+    return (time.perf_counter() - started) * 1000 / turns
+
+
+def main() -> int:
+    args = _parse_args()
+    get_project_chat_graph()
+    rebuild_ms = _per_turn_ms(build_project_chat_graph, args.turns)
+    shared_ms = _per_turn_ms(get_project_chat_graph, args.turns)
+    print(
+        json.dumps(
+            {
+                "turns": args.turns,
+                "rebuildPerTurnMs": round(rebuild_ms, 3),
+                "sharedPerTurnMs": round(shared_ms, 5),
+                "savedPerTurnMs": round(rebuild_ms - shared_ms, 3),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -117,6 +117,13 @@ async def _cmd_cleanup(args: argparse.Namespace) -> int:
     return 0
 
 
+async def _cmd_reconcile_latest_status(args: argparse.Namespace) -> int:
+    engine = _build_engine()
+    updated = await engine.reconcile_latest_status(args.project_id)
+    print({"project_id": args.project_id, "items_reconciled": updated})
+    return 0
+
+
 async def _cmd_refresh_templates(_: argparse.Namespace) -> int:
     settings = get_settings()
     registry = ChecklistRegistry(Path(settings.waf_template_cache_dir), settings)
@@ -141,6 +148,13 @@ def _build_parser() -> argparse.ArgumentParser:
     cleanup.add_argument("--dry-run", action="store_true")
     cleanup.set_defaults(handler=_cmd_cleanup)
 
+    reconcile = subparsers.add_parser(
+        "reconcile-latest-status",
+        help="Rebuild denormalized item latest status from evaluations.",
+    )
+    reconcile.add_argument("--project-id", type=str, default=None)
+    reconcile.set_defaults(handler=_cmd_reconcile_latest_status)
+
     refresh_templates = subparsers.add_parser("refresh-templates", help="Reload local template cache.")
     refresh_templates.set_defaults(handler=_cmd_refresh_templates)
 
@@ -0,0 +1,178 @@
+"""Backfill append-only ProjectState log families into project_state_log_entries.
+
+Moves ``mcpQueries``, ``iterationEvents``, ``traceabilityLinks`` and
+``traceabilityIssues`` out of ``project_state_components`` rows (and legacy
+``project_states.state`` blobs) into one row per entry.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BACKEND_ROOT = REPO_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.features.projects.infrastructure.project_state_log_repository import (  # noqa: E402
+    PROJECT_STATE_LOG_FAMILIES,
+    log_entry_id,
+    strip_project_state_logs,
+)
+from app.shared.config.app_settings import get_app_settings  # noqa: E402
+
+# Filters are bound as JSON arrays so the statements stay fixed strings.
+_SELECT_LOG_COMPONENTS = """
+    SELECT project_id, component_key, payload_json, updated_at
+    FROM project_state_components
+    WHERE component_key IN (SELECT value FROM json_each(:families))
+      AND (:project_ids IS NULL OR project_id IN (SELECT value FROM json_each(:project_ids)))
+    ORDER BY project_id, component_key
+"""
+_SELECT_STATE_BLOBS = """
+    SELECT project_id, state, updated_at
+    FROM project_states
+    WHERE :project_ids IS NULL OR project_id IN (SELECT value FROM json_each(:project_ids))
+    ORDER BY project_id
+"""
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Backfill append-only ProjectState log families into project_state_log_entries."
+    )
+    parser.add_argument("--database", type=Path, default=None)
+    parser.add_argument("--project-id", action="append", dest="project_ids", default=[])
+    parser.add_argument(
+        "--prune-blob",
+        action="store_true",
+        help="Remove migrated log keys from project_states.state after backfill.",
+    )
+    return parser.parse_args()
+
+
+def _resolve_database_path(override: Path | None) -> Path:
+    if override is not None:
+        return override.resolve()
+
+    settings = get_app_settings()
+    if settings.projects_database is None:
+        raise ValueError("PROJECTS_DATABASE must be configured")
+    return settings.projects_database.resolve()
+
+
+def _project_filter(project_ids: list[str]) -> str | None:
+    return json.dumps(project_ids) if project_ids else None
+
+
+def _insert_entries(
+    connection: sqlite3.Connection,
+    *,
+    project_id: str,
+    family: str,
+    entries: list,
+    created_at: str,
+) -> int:
+    inserted = 0
+    for entry in entries:
+        cursor = connection.execute(
+            """
+            INSERT INTO project_state_log_entries (
+                project_id,
+                family,
+                entry_id,
+                payload_json,
+                created_at
+            ) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(project_id, family, entry_id) DO NOTHING
+            """,
+            (project_id, family, log_entry_id(entry), json.dumps(entry), created_at),
+        )
+        inserted += cursor.rowcount
+    return inserted
+
+
+def main() -> int:
+    args = _parse_args()
+    database_path = _resolve_database_path(args.database)
+    project_filter = _project_filter(args.project_ids)
+
+    migrated_components = 0
+    migrated_entries = 0
+    pruned_blobs = 0
+
+    with sqlite3.connect(database_path) as connection:
+        connection.row_factory = sqlite3.Row
+
+        # Component rows first: they are newer than any copy left in the blob.
+        component_rows = connection.execute(
+            _SELECT_LOG_COMPONENTS,
+            {"families": json.dumps(list(PROJECT_STATE_LOG_FAMILIES)), "project_ids": project_filter},
+        ).fetchall()
+        for row in component_rows:
+            entries = json.loads(row["payload_json"])
+            if isinstance(entries, list):
+                migrated_entries += _insert_entries(
+                    connection,
+                    project_id=row["project_id"],
+                    family=row["component_key"],
+                    entries=entries,
+                    created_at=row["updated_at"],
+                )
+            connection.execute(
+                "DELETE FROM project_state_components WHERE project_id = ? AND component_key = ?",
+                (row["project_id"], row["component_key"]),
+            )
+            migrated_components += 1
+
+        state_rows = connection.execute(
+            _SELECT_STATE_BLOBS, {"project_ids": project_filter}
+        ).fetchall()
+        for row in state_rows:
+            state = json.loads(row["state"])
+            if not isinstance(state, dict):
+                continue
+            if not any(family in state for family in PROJECT_STATE_LOG_FAMILIES):
+                continue
+
+            for family in PROJECT_STATE_LOG_FAMILIES:
+                entries = state.get(family)
+                if isinstance(entries, list):
+                    migrated_entries += _insert_entries(
+                        connection,
+                        project_id=row["project_id"],
+                        family=family,
+                        entries=entries,
+                        created_at=row["updated_at"],
+                    )
+
+            if args.prune_blob:
+                connection.execute(
+                    "UPDATE project_states SET state = ?, version = version + 1 WHERE project_id = ?",
+                    (json.dumps(strip_project_state_logs(state)), row["project_id"]),
+                )
+                pruned_blobs += 1
+
+        connection.commit()
+
+    print(
+        json.dumps(
+            {
+                "database": str(database_path),
+                "migratedComponents": migrated_components,
+                "migratedEntries": migrated_entries,
+                "prunedBlobs": pruned_blobs,
+                "prunedBlob": args.prune_blob,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())